@@ -0,0 +1,226 @@
+"""Compressed storage of a finished debate's JSON payload.
+
+A debate's transcript and scoreboard are written once, read whole, and are
+mostly prose, which compresses well. :class:`CompressedJSON`, the column type
+of ``Debate.transcript`` and ``Debate.argument_scores``, stores them as compact
+JSON compressed with the ``DEBATE_COMPRESSION`` codec:
+
+* ``zlib`` (the default; standard library);
+* ``zstd``, with the newest dictionary trained on this archive's own debates
+  (:func:`train_dictionary`, kept in the ``compression_dictionaries`` table,
+  so every row stays readable after a retrain); needs the optional
+  ``zstandard`` package;
+* ``none``: the JSON as is.
+
+:class:`CompressedBytes` stores bytes the same way: ``Debate.detail``, the
+detail endpoint's response body, serialized when the debate is saved.
+
+Every stored value says what it is: a zstd frame starts with the zstd magic
+number and names its dictionary, a zlib stream with its header, and no JSON
+document starts with either. So :func:`decode` reads any of them, and the
+JSON text written before the column was compressed, whatever the current
+setting; ``python main.py compress-debates`` rewrites the older rows
+(``debate_repository.recompress_debates``).
+"""
+import json
+import threading
+import zlib
+from typing import Any, Optional
+
+from sqlalchemy import LargeBinary, text
+from sqlalchemy.types import TypeDecorator
+
+from api import db
+from config import DEBATE_COMPRESSION
+
+try:
+    import zstandard
+except ImportError:  # optional: only DEBATE_COMPRESSION=zstd (and its rows) need it
+    zstandard = None
+
+CODECS = ("zlib", "zstd", "none")
+_ZLIB_LEVEL = 6
+_ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# The zstd dictionaries of ``db.engine``'s database: (engine, {dictionary id:
+# dictionary}, id of the newest, 0 if none). Reloaded when the engine is
+# repointed (tests, benchmarks), after a training, and when a frame names a
+# dictionary not loaded yet (another worker trained it).
+_dictionaries: Optional[tuple] = None
+_lock = threading.Lock()
+# Per-thread zstd (de)compressors, which aren't safe to share: the writer
+# thread encodes while the threadpool decodes.
+_local = threading.local()
+
+
+def check_codec(codec: Optional[str] = None) -> None:
+    """Raise ``ValueError`` unless ``codec`` (by default
+    ``DEBATE_COMPRESSION``) can be used here."""
+    codec = codec or DEBATE_COMPRESSION
+    if codec not in CODECS:
+        raise ValueError(f"Unknown DEBATE_COMPRESSION '{codec}'. Must be one of: {', '.join(CODECS)}")
+    if codec == "zstd" and zstandard is None:
+        raise ValueError("DEBATE_COMPRESSION=zstd needs the zstandard package (pip install zstandard)")
+
+
+def _load(refresh: bool = False) -> tuple:
+    global _dictionaries
+    with _lock:
+        if refresh or _dictionaries is None or _dictionaries[0] is not db.engine:
+            with db.engine.connect() as connection:
+                rows = connection.execute(text(
+                    "SELECT id, data FROM compression_dictionaries ORDER BY created_at, id"
+                )).all()
+            loaded = {}
+            for row in rows:
+                dictionary = zstandard.ZstdCompressionDict(bytes(row.data))
+                dictionary.precompute_compress(level=_ZSTD_LEVEL)
+                loaded[row.id] = dictionary
+            _dictionaries = (db.engine, loaded, rows[-1].id if rows else 0)
+        return _dictionaries
+
+
+def _state() -> tuple:
+    state = _dictionaries
+    if state is None or state[0] is not db.engine:
+        state = _load()
+    if getattr(_local, "state", None) is not state:
+        _local.state, _local.compressor, _local.decompressors = state, None, {}
+    return state
+
+
+def reload_dictionaries() -> None:
+    """Pick up a dictionary just added to ``compression_dictionaries``."""
+    _load(refresh=True)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    _, dictionaries, newest = _state()
+    if _local.compressor is None:
+        _local.compressor = zstandard.ZstdCompressor(
+            level=_ZSTD_LEVEL, dict_data=dictionaries.get(newest))
+    return _local.compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    if zstandard is None:
+        raise ValueError("Reading a zstd-compressed debate needs the zstandard package")
+    dictionary_id = zstandard.get_frame_parameters(data).dict_id
+    _, dictionaries, _ = _state()
+    if dictionary_id and dictionary_id not in dictionaries:
+        _load(refresh=True)
+        _, dictionaries, _ = _state()
+        if dictionary_id not in dictionaries:
+            raise ValueError(f"zstd dictionary {dictionary_id} is not in compression_dictionaries")
+    decompressor = _local.decompressors.get(dictionary_id)
+    if decompressor is None:
+        decompressor = _local.decompressors[dictionary_id] = zstandard.ZstdDecompressor(
+            dict_data=dictionaries.get(dictionary_id))
+    return decompressor.decompress(data)
+
+
+def _is_zlib(data: bytes) -> bool:
+    # Deflate with a 32K window: 0x78, then a check byte making the pair a
+    # multiple of 31. JSON never starts with "x".
+    return len(data) > 1 and data[0] == 0x78 and (data[0] << 8 | data[1]) % 31 == 0
+
+
+def dumps(value: Any) -> bytes:
+    """``value`` as compact UTF-8 JSON, the bytes that are compressed."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def compress(data: bytes, codec: Optional[str] = None) -> bytes:
+    """``data`` as stored with ``codec`` (by default ``DEBATE_COMPRESSION``)."""
+    codec = codec or DEBATE_COMPRESSION
+    if codec == "zlib":
+        return zlib.compress(data, _ZLIB_LEVEL)
+    if codec == "zstd":
+        return _zstd_compress(data)
+    if codec == "none":
+        return data
+    check_codec(codec)
+
+
+def decompress(data: bytes) -> bytes:
+    """Stored bytes back as they were given to :func:`compress`, whichever
+    codec wrote them."""
+    data = bytes(data)
+    if data.startswith(_ZSTD_MAGIC):
+        return _zstd_decompress(data)
+    if _is_zlib(data):
+        return zlib.decompress(data)
+    return data
+
+
+def encode(value: Any, codec: Optional[str] = None) -> Optional[bytes]:
+    """``value`` as stored with ``codec`` (by default ``DEBATE_COMPRESSION``);
+    ``None`` stays SQL ``NULL``."""
+    if value is None:
+        return None
+    return compress(dumps(value), codec)
+
+
+def decode(value: Any) -> Any:
+    """A stored value back as JSON data, whichever way it was stored."""
+    if value is None:
+        return None
+    if isinstance(value, str):  # the JSON text of an uncompressed column
+        return json.loads(value)
+    return json.loads(decompress(value))
+
+
+def is_current(value: Any, codec: Optional[str] = None) -> bool:
+    """Whether a stored value is already what :func:`encode` would write now
+    (for zstd: with the newest dictionary), so rewriting it gains nothing."""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return False
+    codec = codec or DEBATE_COMPRESSION
+    data = bytes(value)
+    if codec == "zstd":
+        return (data.startswith(_ZSTD_MAGIC)
+                and zstandard.get_frame_parameters(data).dict_id == _state()[2])
+    if codec == "zlib":
+        return _is_zlib(data)
+    return not data.startswith(_ZSTD_MAGIC) and not _is_zlib(data)
+
+
+def train_dictionary(samples: list[bytes], size: int) -> tuple[int, bytes]:
+    """Train a zstd dictionary of up to ``size`` bytes on ``samples`` (stored
+    values as :func:`dumps` writes them); its id and bytes. ``ValueError``
+    if zstd can't make one of them (too few samples)."""
+    check_codec("zstd")
+    try:
+        dictionary = zstandard.train_dictionary(size, samples, level=_ZSTD_LEVEL)
+    except zstandard.ZstdError as error:  # typically too few samples
+        raise ValueError(f"cannot train a dictionary on {len(samples)} value(s): {error}") from error
+    return dictionary.dict_id(), dictionary.as_bytes()
+
+
+class CompressedJSON(TypeDecorator):
+    """A JSON value stored compressed (see the module docstring)."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return encode(value)
+
+    def process_result_value(self, value, dialect):
+        return decode(value)
+
+
+class CompressedBytes(TypeDecorator):
+    """Bytes (already serialized JSON, say) stored compressed the same way."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else compress(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else decompress(value)
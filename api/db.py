@@ -15,9 +15,9 @@ module globals at call time, which is what makes that monkeypatch take effect.
 """
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Iterator
+from typing import Iterator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import JSON, LargeBinary, create_engine, event, inspect, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from config import DATABASE_URL
@@ -36,17 +36,152 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-# check_same_thread=False lets the one-off write that finalises a debate run on a
-# worker thread (asyncio.to_thread) while reads happen on the event loop.
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """A datetime from outside (a query string, a CLI flag) as the naive UTC
+    the DB stores; one without an offset is taken to be UTC already."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# check_same_thread=False lets writes run on worker threads (asyncio.to_thread,
+# the write-behind writer) while reads happen on the event loop.
 _connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 engine = create_engine(DATABASE_URL, connect_args=_connect_args)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _sqlite_synchronous(dbapi_connection, _record) -> None:
+        """In WAL mode (see ``init_db``), sync the log at checkpoints rather
+        than on every commit: a commit survives the process crashing, and a
+        power cut can lose only the last few."""
+        dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+
+
+# Columns added to an existing table after its first release, with the DDL
+# type (or a SQLAlchemy type, compiled for the dialect) and the statement that
+# fills them in for rows written before (if the default doesn't). ``create_all`` only creates missing tables, so
+# ``init_db`` adds these.
+_ADDED_COLUMNS = {
+    "debates": {
+        # json_array_length exists in both SQLite (JSON1) and PostgreSQL.
+        "message_count": (
+            "INTEGER NOT NULL DEFAULT 0",
+            "UPDATE debates SET message_count = json_array_length(transcript)",
+        ),
+        "detail": (LargeBinary(), None),
+        "detail_etag": ("VARCHAR", None),
+        # Rows saved before are numbered in completed order.
+        "saved_seq": (
+            "INTEGER",
+            "UPDATE debates SET saved_seq = r.seq FROM (SELECT id, ROW_NUMBER()"
+            " OVER (ORDER BY completed_at, id) AS seq FROM debates) AS r"
+            " WHERE debates.id = r.id",
+        ),
+    },
+    "debate_checkpoints": {
+        "status": ("VARCHAR NOT NULL DEFAULT 'in_progress'", None),
+        "driver_token": ("VARCHAR", None),
+    },
+}
+
+
+# debate_turns starts out filled from the JSON transcripts of the debates
+# and checkpoints written before it existed, per dialect.
+_TURNS_FROM_TRANSCRIPTS = {
+    "sqlite": (
+        "INSERT OR IGNORE INTO debate_turns (debate_id, seq, speaker, phase, content)"
+        " SELECT s.id, CAST(t.key AS INTEGER), json_extract(t.value, '$.speaker'),"
+        " json_extract(t.value, '$.phase'), json_extract(t.value, '$.content')"
+        " FROM {source} AS s, json_each(s.transcript) AS t"
+        # Compressed transcripts (see api/compression.py) are blobs.
+        " WHERE typeof(s.transcript) = 'text'"
+    ),
+    "postgresql": (
+        "INSERT INTO debate_turns (debate_id, seq, speaker, phase, content)"
+        " SELECT s.id, t.seq - 1, t.value->>'speaker', t.value->>'phase', t.value->>'content'"
+        " FROM {source} AS s, json_array_elements(s.transcript) WITH ORDINALITY AS t(value, seq)"
+        " ON CONFLICT DO NOTHING"
+    ),
+}
+
+
+# Columns stored as compressed JSON since (api/compression.py). SQLite keeps
+# any value in any column, so only PostgreSQL has their type changed; the
+# JSON text each holds is then read as is until ``compress-debates``
+# rewrites it.
+_BINARY_COLUMNS = {"debates": ("transcript", "argument_scores")}
+
+# Indexes since superseded (by a composite one leading with the same column).
+_DROPPED_INDEXES = ("ix_debates_completed_at",)
+# Columns no longer written (checkpoint transcripts are debate_turns rows now).
+_DROPPED_COLUMNS = {"debate_checkpoints": ("transcript",)}
+
+
+def _migrate(new_tables: set[str]) -> None:
+    """Bring an older database up to date: fill ``debate_turns`` if it is
+    among the ``new_tables`` just created, add (and backfill) the
+    ``_ADDED_COLUMNS`` it lacks, make the ``_BINARY_COLUMNS`` binary, create
+    any index declared since its tables were, and drop superseded indexes
+    and columns."""
+    inspector = inspect(engine)
+    columns = {table: {column["name"]: column["type"] for column in inspector.get_columns(table)}
+               for table in inspector.get_table_names()}
+    with engine.begin() as connection:
+        fill = _TURNS_FROM_TRANSCRIPTS.get(connection.dialect.name)
+        if "debate_turns" in new_tables and fill:
+            for source in ("debates", "debate_checkpoints"):
+                if "transcript" in columns[source]:
+                    connection.execute(text(fill.format(source=source)))
+        for table, added in _ADDED_COLUMNS.items():
+            for name, (ddl, backfill) in added.items():
+                if name not in columns[table]:
+                    if not isinstance(ddl, str):
+                        ddl = ddl.compile(dialect=connection.dialect)
+                    connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+                    if backfill:
+                        connection.execute(text(backfill))
+        if connection.dialect.name == "postgresql":
+            for table, binary in _BINARY_COLUMNS.items():
+                for name in binary:
+                    if isinstance(columns[table][name], JSON):
+                        connection.execute(text(
+                            f"ALTER TABLE {table} ALTER COLUMN {name} TYPE bytea"
+                            f" USING convert_to({name}::text, 'UTF8')"))
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+        for name in _DROPPED_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        for table, dropped in _DROPPED_COLUMNS.items():
+            for name in dropped:
+                if name in columns[table]:
+                    connection.execute(text(f"ALTER TABLE {table} DROP COLUMN {name}"))
+
 
 def init_db() -> None:
-    """Create the debate tables if they don't exist yet (idempotent)."""
+    """Create the debate tables (and the full-text search index) if they
+    don't exist yet, bring an older database up to date, and put SQLite in
+    WAL mode (idempotent).
+
+    WAL lets the readers — the archive endpoints, other workers — read while
+    a turn is being appended, and makes a commit a sequential append to the
+    log; the setting is stored in the database file, so it holds for every
+    later connection.
+    """
     import api.models  # noqa: F401 — imported for its side effect: registering models on Base
+    from api.compression import check_codec
+    from api.services.debate_search import create_index
+    check_codec()
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+    existing = set(inspect(engine).get_table_names())
     Base.metadata.create_all(bind=engine)
+    _migrate(set(Base.metadata.tables) - existing)
+    with engine.begin() as connection:
+        create_index(connection)
 
 
 def get_db() -> Iterator[Session]:
@@ -2,13 +2,16 @@ import asyncio
 import logging
 import os
 import sys
-from contextlib import asynccontextmanager, suppress
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from api.routes import debates, websocket
+from api.routes import admin, debates, tournaments, websocket
 from api.services.debate_service import debate_service
-from config import CORS_ORIGINS, AVAILABLE_STYLES
+from api.services.metrics import REGISTRY
+from api.services.warmup import warmup
+from config import CORS_ORIGINS, AVAILABLE_STYLES, CHECKPOINT_TTL_SECONDS, WARMUP_ON_STARTUP
 from messages import API_KEY_MISSING, STYLE_CONFIG_INVALID
 from src.prompts import validate_styles, StyleConfigError
 
@@ -22,17 +25,23 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """App startup/shutdown: require an API key, validate the style config,
-    create the DB schema, and run the background session sweeper.
+    create the DB schema, arm the session deadline scheduler, and (with
+    ``WARMUP_ON_STARTUP``) start the warm-up ``/health`` waits for; on
+    shutdown, drain the write-behind queue of finished debates.
 
     Refusing to start without ``ANTHROPIC_API_KEY`` fails fast and loud rather
     than letting the first debate die mid-stream. Likewise, validating that
     every ``AVAILABLE_STYLES`` entry has a matching ``PRO_STYLES``/
     ``CON_STYLES`` prompt here means a misconfigured env override is rejected
     at boot instead of raising deep inside a live debate. ``init_db`` is
-    idempotent, so creating the table on every boot is safe. The sweeper task
-    evicts orphan debate sessions (created via POST but never driven by a
-    WebSocket) once they exceed ``SESSION_TTL_SECONDS``; it's cancelled
-    cleanly on shutdown.
+    idempotent, so creating the table on every boot is safe; checkpoints of
+    unfinished debates older than ``CHECKPOINT_TTL_SECONDS`` are purged. The
+    deadline scheduler (orphan TTL, vote, idle and max-duration timeouts, plus
+    the shared-store sweep) is armed on startup and disarmed on shutdown.
+    The warm-up runs in the background (see ``api/services/warmup.py``), so
+    the server is already answering ``/health`` — with 503 — while it runs.
+    Finished debates a previous run spooled but never committed are saved
+    before serving (see ``api/services/debate_writer.py``).
     """
     if not os.environ.get("ANTHROPIC_API_KEY", "").strip():
         print(API_KEY_MISSING, file=sys.stderr)
@@ -42,17 +51,25 @@ async def lifespan(app: FastAPI):
     except StyleConfigError as error:
         print(STYLE_CONFIG_INVALID.format(error=error), file=sys.stderr)
         sys.exit(1)
-    # Create the debates table on startup if it isn't there yet (idempotent).
+    # Create the debates table on startup if it isn't there yet (idempotent),
+    # and drop checkpoints of unfinished debates nobody came back to resume.
     from api.db import init_db
+    from api.services.debate_repository import purge_stale_checkpoints
     init_db()
-    sweeper_task = asyncio.create_task(debate_service.run_session_sweeper())
+    purged = purge_stale_checkpoints(CHECKPOINT_TTL_SECONDS)
+    if purged:
+        logger.info("Purged %d stale debate checkpoint(s)", purged)
+    debate_service.writer.recover()
+    debate_service.start_deadlines()
+    if WARMUP_ON_STARTUP:
+        warmup.start()
     logger.info("API startup complete")
     try:
         yield
     finally:
-        sweeper_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await sweeper_task
+        await warmup.stop()
+        debate_service.deadlines.stop()
+        await asyncio.to_thread(debate_service.writer.stop)
         logger.info("API shutdown")
 
 
@@ -75,7 +92,9 @@ app.add_middleware(
 
 # Include routers
 app.include_router(debates.router)
+app.include_router(tournaments.router)
 app.include_router(websocket.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -86,5 +105,14 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Liveness probe (used by the Docker healthcheck)."""
+    """Readiness probe (used by the Docker healthcheck): 503 while the
+    start-up warm-up is still running, 200 once the worker can serve."""
+    if not warmup.ready:
+        return JSONResponse({"status": "warming_up"}, status_code=503)
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint (admission queue, active sessions, waits)."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
@@ -1,37 +1,206 @@
-"""ORM model for a persisted (finished) debate."""
+"""ORM models: persisted (finished) debates and style tournaments."""
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from api.compression import CompressedBytes, CompressedJSON
 from api.db import Base
 
 
 class Debate(Base):
     """A completed debate: its setup, full transcript, and the judge's scores.
 
-    The transcript and scores are stored as JSON columns. They are always read
-    and written whole (never queried field-by-field), so exploding them into
-    per-turn / per-argument tables would add joins without buying anything —
-    the only column we filter or sort on is ``completed_at``. ``winner`` is
-    denormalised out of the scores so the list view can show it without
-    deserialising the whole scoreboard.
+    The transcript and scores are stored as compressed JSON
+    (:class:`~api.compression.CompressedJSON`), the archive copy read whole by
+    the detail view; the same turns are also rows of
+    :class:`DebateTurn`, written one by one as the debate ran, which is what a
+    paged read of a long transcript uses. ``winner`` and
+    ``message_count`` are denormalised out of the scores and the transcript at
+    save time, so the list view reads neither JSON column; both are
+    ``deferred`` (loaded on first access, or up front with
+    ``undefer_group("payload")``) so an ORM query never drags them in by
+    accident.
+
+    The archive is paged newest-first by keyset on ``(completed_at, id)``
+    (see ``debate_repository.list_debates``). One composite index serves the
+    unfiltered walk; each filterable column leads one of its own, so a
+    filtered page is still a range read of ``limit`` entries. ``saved_seq``
+    orders the rows by when they were committed, which ``completed_at``
+    doesn't (saves are write-behind); the export resumes by it.
     """
 
     __tablename__ = "debates"
+    __table_args__ = (
+        Index("ix_debates_completed_at_id", "completed_at", "id"),
+        Index("ix_debates_winner_completed_at_id", "winner", "completed_at", "id"),
+        Index("ix_debates_pro_style_completed_at_id", "pro_style", "completed_at", "id"),
+        Index("ix_debates_con_style_completed_at_id", "con_style", "completed_at", "id"),
+        Index("ix_debates_saved_seq", "saved_seq", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     topic: Mapped[str] = mapped_column(String, nullable=False)
     pro_style: Mapped[str] = mapped_column(String, nullable=False)
     con_style: Mapped[str] = mapped_column(String, nullable=False)
     winner: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    transcript: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
-    argument_scores: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    transcript: Mapped[list] = mapped_column(
+        CompressedJSON, nullable=False, default=list, deferred=True, deferred_group="payload"
+    )
+    argument_scores: Mapped[Optional[dict]] = mapped_column(
+        CompressedJSON, nullable=True, deferred=True, deferred_group="payload"
+    )
+    # The GET /api/debates/{id} body, serialized at save time, and its ETag
+    # (see debate_repository.stored_detail); NULL on rows saved before until
+    # ``compress-debates`` fills them.
+    detail: Mapped[Optional[bytes]] = mapped_column(CompressedBytes, nullable=True, deferred=True)
+    detail_etag: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Increases with every save, in commit order (see
+    # debate_repository.save_completed_debates); the bulk export's cursor.
+    saved_seq: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+
+# A debate's status: DebateCheckpoint.status while it is unfinished; a
+# finished debate has no checkpoint, it is a Debate row.
+IN_PROGRESS = "in_progress"
+FAILED = "failed"
+COMPLETED = "completed"
+
+
+class DebateTurn(Base):
+    """One completed turn of a debate, in transcript order (``seq`` from 0).
+
+    Appended as each turn completes (see ``debate_repository.save_checkpoint``),
+    so the durable cost of a turn is one short row however long the debate
+    already is, and a transcript can be read a page at a time by range on the
+    primary key. The rows of a debate outlive its checkpoint: once it
+    finishes they are the paged view of the saved :class:`Debate`.
+    """
+
+    __tablename__ = "debate_turns"
+
+    debate_id: Mapped[str] = mapped_column(String, primary_key=True)
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    speaker: Mapped[str] = mapped_column(String, nullable=False)
+    phase: Mapped[str] = mapped_column(String, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+
+    def entry(self) -> dict:
+        """The turn as a transcript entry (see ``DebateState.add_to_transcript``)."""
+        return {"speaker": self.speaker, "content": self.content, "phase": self.phase}
+
+
+class DebateCheckpoint(Base):
+    """The durable state of a debate that has not finished.
+
+    Upserted with each completed turn, which is appended to
+    :class:`DebateTurn` in the same transaction, so a server restart (or a
+    failed turn) can resume the debate from where it stopped instead of
+    starting over; ``len(transcript)`` is the engine position to resume at.
+    ``status`` is ``in_progress`` while a run is going and ``failed`` once
+    one stopped on an error or a deadline (still resumable). Deleted in the
+    same transaction that saves the finished :class:`Debate`.
+    """
+
+    __tablename__ = "debate_checkpoints"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    topic: Mapped[str] = mapped_column(String, nullable=False)
+    pro_style: Mapped[str] = mapped_column(String, nullable=False)
+    con_style: Mapped[str] = mapped_column(String, nullable=False)
+    phase: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String, nullable=False, default=IN_PROGRESS, server_default=IN_PROGRESS
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # The live session's driver token (see DebateSession), kept across a restart.
+    driver_token: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    turns: Mapped[list[DebateTurn]] = relationship(
+        primaryjoin="foreign(DebateTurn.debate_id) == DebateCheckpoint.id",
+        order_by=DebateTurn.seq,
+        viewonly=True,
+    )
 
     @property
-    def message_count(self) -> int:
-        """Number of transcript entries — surfaced in the list view summary."""
-        return len(self.transcript or [])
+    def transcript(self) -> list[dict]:
+        return [turn.entry() for turn in self.turns]
+
+
+class CompressionDictionary(Base):
+    """A zstd dictionary trained on stored debates (see api/compression.py).
+
+    Keyed by the id zstd writes into every frame compressed with it; the
+    newest is used for new rows, and older ones are kept for the rows still
+    compressed with them.
+    """
+
+    __tablename__ = "compression_dictionaries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class Tournament(Base):
+    """A style tournament (see ``src/tournament.py``) and its latest standings.
+
+    ``standings`` is the leaderboard snapshot (Elo ratings, W/L/T records, win
+    matrix) rewritten in the same transaction as each match result, so the API
+    reads it in one row instead of replaying every match. The match rows below
+    remain the source of truth the snapshot is rebuilt from on restart.
+    """
+
+    __tablename__ = "tournaments"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    styles: Mapped[list] = mapped_column(JSON, nullable=False)
+    topics: Mapped[list] = mapped_column(JSON, nullable=False)
+    total_matches: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_matches: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    standings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class TournamentMatch(Base):
+    """One played (or failed) tournament matchup — the checkpoint record.
+
+    A failed matchup is re-run on restart, and its row is overwritten with the
+    new outcome, hence the uniqueness on ``(tournament_id, matchup_key)``.
+    ``id`` increases in arrival order, which is the order Elo is replayed in.
+    """
+
+    __tablename__ = "tournament_matches"
+    __table_args__ = (UniqueConstraint("tournament_id", "matchup_key"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    tournament_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tournaments.id"), nullable=False, index=True
+    )
+    matchup_key: Mapped[str] = mapped_column(String, nullable=False)
+    pro_style: Mapped[str] = mapped_column(String, nullable=False)
+    con_style: Mapped[str] = mapped_column(String, nullable=False)
+    topic: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    winner: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    transcript: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    argument_scores: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
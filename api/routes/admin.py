@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+
+from api.schemas.admin import DeadlineSnapshot, SessionMemoryReport
+from api.services.debate_service import debate_service
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.get("/deadlines", response_model=DeadlineSnapshot)
+async def get_deadlines(limit: int = Query(100, ge=1, le=1000)):
+    """This worker's pending session deadlines: counts per kind and the
+    ``limit`` soonest (orphan TTL, vote, idle, max duration, store sweep)."""
+    return debate_service.deadlines.snapshot(limit)
+
+
+@router.get("/sessions", response_model=SessionMemoryReport)
+async def get_session_memory(limit: int = Query(20, ge=1, le=1000)):
+    """This worker's estimated session memory against its budget, and the
+    ``limit`` largest live sessions by footprint."""
+    return debate_service.memory_snapshot(limit)
@@ -1,19 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from api.db import get_db
+from api.db import get_db, naive_utc
+from api.models import COMPLETED
 from api.schemas.debate import (
     DebateCreateRequest,
     DebateCreateResponse,
     DebateDetail,
+    DebatePage,
+    DebateSearchHit,
     DebateSummary,
     StylesResponse,
     StyleInfo
 )
-from api.services import debate_repository
+from api.services import debate_export, debate_repository, debate_search
 from api.services.debate_service import debate_service, SessionLimitExceeded
-from config import AVAILABLE_STYLES
-from messages import STYLE_DESCRIPTIONS, INVALID_STYLE, TOO_MANY_DEBATES, DEBATE_NOT_FOUND
+from config import AVAILABLE_STYLES, DEBATE_DETAIL_MAX_AGE_SECONDS
+from messages import (
+    STYLE_DESCRIPTIONS,
+    INVALID_STYLE,
+    TOO_MANY_DEBATES,
+    DEBATE_NOT_FOUND,
+    INVALID_CURSOR,
+    SEARCH_UNAVAILABLE,
+)
 
 router = APIRouter(prefix="/api", tags=["debates"])
 
@@ -50,30 +64,172 @@ async def create_debate(request: DebateCreateRequest):
             con_style=request.con_style
         )
     except SessionLimitExceeded:
-        # Too many live sessions right now — back-pressure the client instead of
-        # accepting work that would grow memory without bound.
+        # The admission queue itself is full — back-pressure the client instead
+        # of accepting work that would grow memory without bound.
         raise HTTPException(status_code=429, detail=TOO_MANY_DEBATES)
 
+    # Below the queue bound the debate is always accepted; if every generating
+    # slot is busy the client learns its likely place up front, and the socket
+    # streams QUEUE_POSITION updates until it is admitted.
+    position, wait = debate_service.queue_estimate()
     return DebateCreateResponse(
         debate_id=session.debate_id,
         topic=session.topic,
         pro_style=session.pro_style,
-        con_style=session.con_style
+        con_style=session.con_style,
+        queue_position=position,
+        estimated_wait_seconds=wait,
+        driver_token=session.driver_token,
     )
 
 
 # Sync endpoints (run in FastAPI's threadpool) backed by the SQLite store. These
 # read finished debates; the live debate streams over the WebSocket.
-@router.get("/debates", response_model=list[DebateSummary])
-def list_debates(db_session: Session = Depends(get_db)):
-    """List previously completed debates, most recently finished first."""
-    return debate_repository.list_debates(db_session)
+def _debate_filters(
+    winner: Optional[Literal["PRO", "CON", "TIE"]] = None,
+    pro_style: Optional[str] = None,
+    con_style: Optional[str] = None,
+    completed_after: Optional[datetime] = None,
+    completed_before: Optional[datetime] = None,
+) -> debate_repository.DebateFilters:
+    """The archive filters shared by the list and the export, as query
+    parameters (a datetime without an offset is taken to be UTC)."""
+    return debate_repository.DebateFilters(
+        winner=winner,
+        pro_style=pro_style,
+        con_style=con_style,
+        completed_after=naive_utc(completed_after),
+        completed_before=naive_utc(completed_before),
+    )
+
+
+@router.get("/debates", response_model=DebatePage)
+def list_debates(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    filters: debate_repository.DebateFilters = Depends(_debate_filters),
+    db_session: Session = Depends(get_db),
+):
+    """List previously completed debates, most recently finished first.
+
+    Paged by cursor: pass a page's ``next_cursor`` back as ``cursor`` (with
+    the same filters) for the next one.
+    """
+    try:
+        rows, next_cursor = debate_repository.page_debates(
+            db_session, limit, cursor=cursor, filters=filters
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+    return DebatePage(
+        items=[DebateSummary.model_validate(row) for row in rows],
+        next_cursor=next_cursor,
+        total=debate_repository.count_debates(db_session, filters),
+    )
+
+
+# Declared before /debates/{debate_id}, which would otherwise match "search".
+@router.get("/debates/search", response_model=list[DebateSearchHit])
+def search_debates(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db_session: Session = Depends(get_db),
+):
+    """Full-text search over finished debates' topics, transcripts and
+    argument summaries, best match first (see api/services/debate_search.py)."""
+    if not debate_search.available(db_session.connection()):
+        raise HTTPException(status_code=501, detail=SEARCH_UNAVAILABLE)
+    return debate_search.search(db_session, q, limit)
+
+
+# Also declared before /debates/{debate_id}.
+@router.get("/debates/export")
+def export_debates(
+    since: Optional[str] = None,
+    gzip: bool = False,
+    filters: debate_repository.DebateFilters = Depends(_debate_filters),
+    db_session: Session = Depends(get_db),
+):
+    """Stream every finished debate matching the filters as NDJSON, in the
+    order they were saved, one ``GET /api/debates/{id}`` body per line; gzip-compressed with
+    ``gzip=true``.
+
+    The ``X-Export-Cursor`` header names where the export ends: pass it back
+    as ``since`` (with the same filters) to export only the debates saved
+    after it. Rows are read in batches off one cursor (see
+    api/services/debate_export.py), so memory stays flat whatever the size of
+    the archive.
+    """
+    try:
+        until = debate_export.export_cursor(db_session, filters, since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+    headers = {"X-Export-Cursor": until} if until is not None else {}
+    if gzip:
+        headers["Content-Disposition"] = 'attachment; filename="debates.ndjson.gz"'
+    return StreamingResponse(
+        debate_export.stream(filters, since, until, gzip=gzip),
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header names ``etag`` (compared weakly,
+    as RFC 9110 has it for this header)."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or f'"{etag}"' in tags
+
+
+def _detail_headers(etag: str) -> dict:
+    return {
+        "ETag": f'"{etag}"',
+        "Cache-Control": f"public, max-age={DEBATE_DETAIL_MAX_AGE_SECONDS}, immutable",
+    }
 
 
 @router.get("/debates/{debate_id}", response_model=DebateDetail)
-def get_debate(debate_id: str, db_session: Session = Depends(get_db)):
-    """Return one previously completed debate in full (transcript + scores)."""
-    debate = debate_repository.get_debate(db_session, debate_id)
-    if debate is None:
+def get_debate(
+    debate_id: str,
+    turns_from: int = Query(0, ge=0),
+    turns_limit: Optional[int] = Query(None, ge=1, le=500),
+    if_none_match: Optional[str] = Header(None),
+    db_session: Session = Depends(get_db),
+):
+    """Return one debate — finished, or still in progress or failed (see
+    ``status``) — with its transcript and scores.
+
+    The whole transcript by default; with ``turns_limit``, that many turns
+    from ``turns_from`` on, and ``next_turn`` to pass as ``turns_from`` for
+    the next page. A debate that has finished but is still queued for
+    writing is served from the write-behind writer, so it is readable the
+    moment it completes: a client whose streamed copy fails the
+    ``debate_complete`` digest reloads it from here before it is committed.
+
+    A whole saved debate never changes, so it is sent as the body stored
+    when it was saved (from an in-process LRU when hot), with a strong
+    ``ETag`` and a long ``Cache-Control``; ``If-None-Match`` with that ETag
+    gets a 304.
+    """
+    if turns_from == 0 and turns_limit is None:
+        # One lookup answers both: a miss reads the row once and caches it,
+        # so the 304 check costs no second cache miss or SELECT.
+        stored = debate_repository.get_stored_detail(db_session, debate_id)
+        if stored is not None:
+            etag, body = stored
+            if if_none_match is not None and _etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=_detail_headers(etag))
+            return Response(body, media_type="application/json", headers=_detail_headers(etag))
+    # The writer's queue is read before the archive: a debate it commits in
+    # between is then found in the archive. Read the other way round, each
+    # read is its own snapshot, so a commit between them would miss it in both.
+    pending = debate_service.writer.get(debate_id)
+    if pending is not None:
+        turns, next_turn = debate_repository.slice_turns(
+            pending["transcript"], turns_from, turns_limit
+        )
+        return {**pending, "status": COMPLETED, "transcript": turns, "next_turn": next_turn}
+    detail = debate_repository.get_debate_detail(db_session, debate_id, turns_from, turns_limit)
+    if detail is None:
         raise HTTPException(status_code=404, detail=DEBATE_NOT_FOUND)
-    return debate
+    return detail
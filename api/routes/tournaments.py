@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from api.db import get_db
+from api.schemas.tournament import TournamentDetail, TournamentMatchSummary, TournamentSummary
+from api.services import tournament_repository
+from messages import TOURNAMENT_NOT_FOUND
+from src.tournament import EloLeaderboard
+
+router = APIRouter(prefix="/api", tags=["tournaments"])
+
+
+# Sync, read-only endpoints over the checkpoint that ``main.py tournament``
+# writes; they run in FastAPI's threadpool like the past-debates endpoints.
+@router.get("/tournaments", response_model=list[TournamentSummary])
+def list_tournaments(db_session: Session = Depends(get_db)):
+    """List style tournaments, most recently updated first."""
+    return tournament_repository.list_tournaments(db_session)
+
+
+@router.get("/tournaments/{tournament_id}", response_model=TournamentDetail)
+def get_tournament(tournament_id: str, db_session: Session = Depends(get_db)):
+    """Return a tournament's Elo leaderboard and win matrix."""
+    tournament = tournament_repository.get_tournament(db_session, tournament_id)
+    if tournament is None:
+        raise HTTPException(status_code=404, detail=TOURNAMENT_NOT_FOUND)
+    # Before the first result lands there is no snapshot yet: serve the
+    # all-initial-ratings board for the tournament's styles.
+    standings = tournament.standings or EloLeaderboard(tournament.styles).to_dict()
+    return TournamentDetail(
+        id=tournament.id,
+        styles=tournament.styles,
+        topics=tournament.topics,
+        total_matches=tournament.total_matches,
+        completed_matches=tournament.completed_matches,
+        created_at=tournament.created_at,
+        updated_at=tournament.updated_at,
+        standings=standings["standings"],
+        win_matrix=standings["win_matrix"],
+    )
+
+
+@router.get("/tournaments/{tournament_id}/matches", response_model=list[TournamentMatchSummary])
+def list_tournament_matches(
+    tournament_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db_session: Session = Depends(get_db),
+):
+    """Page through a tournament's matches, most recent first."""
+    if tournament_repository.get_tournament(db_session, tournament_id) is None:
+        raise HTTPException(status_code=404, detail=TOURNAMENT_NOT_FOUND)
+    return tournament_repository.list_matches(
+        db_session, tournament_id, limit=limit, offset=offset
+    )
@@ -1,13 +1,27 @@
 import asyncio
-import json
 import logging
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import secrets
+from contextlib import suppress
+from typing import Optional
 
-from api.services.debate_service import debate_service, VOTE_TIMEOUT_SECONDS
+from fastapi import APIRouter, WebSocket
+
+from api.services.deadlines import DeadlineKind
+from api.services.debate_service import (
+    debate_service,
+    DebateSession,
+    SessionLimitExceeded,
+)
+from api.services.broadcast import BroadcastHub
+from api.services.socket_sender import SocketSender
+from api.services.wire import Codec, negotiate
 from api.schemas.debate import WSMessageType
 from messages import (
     DEBATE_SESSION_NOT_FOUND,
     DEBATE_ALREADY_RUNNING,
+    DEBATE_HOST_LEFT,
+    DEBATE_TIMED_OUT,
+    TOO_MANY_DEBATES,
     WS_UNEXPECTED_ERROR,
 )
 
@@ -18,84 +32,175 @@ VALID_VOTES = {"PRO", "CON", "TIE"}
 router = APIRouter()
 
 
+def _parse_vote(vote_data: Optional[dict]) -> str:
+    """The side a client's decoded vote reply names; TIE for anything unrecognised."""
+    if not vote_data or vote_data.get("type") != "vote":
+        return "TIE"
+    raw = vote_data.get("vote", "TIE")
+    return raw if raw in VALID_VOTES else "TIE"
+
+
+async def _read_client(websocket: WebSocket, session: DebateSession, hub: BroadcastHub,
+                       sender: SocketSender) -> None:
+    """Read what a client sends until it disconnects.
+
+    The driver's reply while the audience vote is open is its vote (garbage
+    counts as TIE); anything else, and everything a spectator sends, is
+    dropped. A silent driver is covered by the session's VOTE deadline,
+    which submits TIE.
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        if (hub.driver is sender and hub.vote_prompt is not None
+                and not session.vote_event.is_set()):
+            vote = _parse_vote(sender.codec.decode(message))
+            debate_service.submit_vote(session.debate_id, vote)
+
+
+def _frame(debate_id: str, kind: WSMessageType, data: dict) -> dict:
+    return {"type": kind.value, "debate_id": debate_id, "data": data}
+
+
+async def _refuse(websocket: WebSocket, codec: Codec, debate_id: str, message: str) -> None:
+    """Send a connecting client one error frame and close."""
+    payload = codec.encode(_frame(debate_id, WSMessageType.ERROR, {"message": message}))
+    if codec.binary:
+        await websocket.send_bytes(payload)
+    else:
+        await websocket.send_text(payload)
+    await websocket.close()
+
+
+async def _run(session: DebateSession, hub: BroadcastHub) -> None:
+    """Run the debate to completion, publishing every event to ``hub``.
+
+    This is the session's own task, independent of any socket: the driver
+    can drop and reattach without the debate stopping. Its deadlines (see
+    ``DebateService``) end it by cancelling this task — including the
+    RECONNECT grace while no driver is attached.
+    """
+    debate_id = session.debate_id
+    events = debate_service.run_debate(session)
+    try:
+        # Events — QUEUE_POSITION updates first if the debate has to wait
+        # for room to generate, then the debate itself once it is admitted.
+        # Only the driver votes, so only it is sent the prompt.
+        # Each event dict is fresh, so it's published as is — only its type
+        # tag is swapped for the plain string the codecs encode.
+        async for event in events:
+            driver_only = event["type"] == WSMessageType.VOTE_REQUIRED
+            event["type"] = WSMessageType(event["type"]).value
+            hub.publish(event, driver_only=driver_only)
+    except asyncio.CancelledError:
+        # A deadline ended a debate still waiting for admission (run_debate
+        # reports those that fire once it is running itself).
+        if session.expired is None:
+            raise
+        asyncio.current_task().uncancel()
+        message = DEBATE_HOST_LEFT if session.expired == DeadlineKind.RECONNECT else DEBATE_TIMED_OUT
+        hub.publish(_frame(debate_id, WSMessageType.ERROR, {"message": message}))
+    except Exception:
+        logger.exception("Unhandled error running debate_id=%s", debate_id)
+        hub.publish(_frame(debate_id, WSMessageType.ERROR, {"message": WS_UNEXPECTED_ERROR}))
+    finally:
+        hub.close()
+        session.hub = None
+        await events.aclose()
+
+
+async def _attach(websocket: WebSocket, codec: Codec, session: DebateSession,
+                  hub: BroadcastHub, *, driver: bool, last_seq: Optional[int]) -> None:
+    """Stream a live debate to one socket until it ends or the socket leaves.
+
+    What the socket missed comes first (see ``BroadcastHub.attach``). When
+    the driver leaves mid-debate, the RECONNECT grace starts.
+    """
+    sender = SocketSender(websocket, codec=codec)
+    sender.start()
+    if driver:
+        debate_service.driver_joined(session.debate_id)
+        session.outbox = sender
+    hub.attach(sender, driver=driver, last_seq=last_seq)
+    listen = asyncio.ensure_future(_read_client(websocket, session, hub, sender))
+    ended = asyncio.ensure_future(hub.done.wait())
+    try:
+        await asyncio.wait({listen, ended}, return_when=asyncio.FIRST_COMPLETED)
+        if ended.done():
+            with suppress(Exception):
+                await sender.flush()
+                await websocket.close()
+    finally:
+        listen.cancel()
+        ended.cancel()
+        hub.detach(sender)
+        sender.close()
+        if driver:
+            session.outbox = None
+            if not hub.done.is_set():
+                logger.info("Driver left live debate_id=%s; awaiting reconnect", session.debate_id)
+                debate_service.driver_left(session.debate_id)
+
+
+def _holds_token(session: DebateSession, driver_token: Optional[str]) -> bool:
+    """Whether a connecting client presented the session's driver token."""
+    return driver_token is not None and secrets.compare_digest(
+        driver_token.encode(), session.driver_token.encode()
+    )
+
+
 @router.websocket("/ws/debates/{debate_id}")
-async def debate_websocket(websocket: WebSocket, debate_id: str):
-    """WebSocket endpoint for real-time debate streaming."""
-    await websocket.accept()
+async def debate_websocket(websocket: WebSocket, debate_id: str,
+                           last_seq: Optional[int] = None,
+                           driver_token: Optional[str] = None):
+    """WebSocket endpoint for real-time debate streaming.
+
+    ``last_seq`` is the ``seq`` of the last frame a reconnecting client saw;
+    it is sent only the frames after it, if they are still buffered.
+    ``driver_token`` (from the create response) is what makes a reconnect
+    the driver again. A
+    client that offers the ``debate.msgpack.v1`` subprotocol is streamed
+    compact MessagePack frames instead of JSON (see ``wire.py``).
+    """
+    codec = negotiate(websocket.scope.get("subprotocols", []))
+    await websocket.accept(subprotocol=codec.subprotocol)
 
     session = debate_service.get_session(debate_id)
+    if session is None:
+        # Not live in this process — it may be an unfinished debate that was
+        # checkpointed before a restart. Resume it rather than starting over.
+        try:
+            session = await debate_service.restore_session(debate_id)
+        except SessionLimitExceeded:
+            await _refuse(websocket, codec, debate_id, TOO_MANY_DEBATES)
+            return
     if not session:
-        await websocket.send_json({
-            "type": WSMessageType.ERROR.value,
-            "debate_id": debate_id,
-            "data": {"message": DEBATE_SESSION_NOT_FOUND}
-        })
-        await websocket.close()
+        await _refuse(websocket, codec, debate_id, DEBATE_SESSION_NOT_FOUND)
         return
 
-    # Refuse a second connection for a debate that is already running. try_start
-    # claims the session atomically (no await between check and set on the
-    # single-threaded loop), so a concurrent connect for the same debate_id can't
-    # drive a second run_debate over the SAME session — which would interleave
-    # transcript appends, race the vote event, and double-persist. The first
-    # runner owns the session; later ones get an error and a closed socket,
-    # leaving the live debate untouched.
-    if not session.try_start():
-        logger.info("Rejected concurrent connect for live debate_id=%s", debate_id)
-        await websocket.send_json({
-            "type": WSMessageType.ERROR.value,
-            "debate_id": debate_id,
-            "data": {"message": DEBATE_ALREADY_RUNNING}
-        })
-        await websocket.close()
-        return
+    # The first connection starts the debate in its own task and drives it;
+    # start_session claims the session atomically within this process (no
+    # await between check and set on the single-threaded loop), and across
+    # workers the session store admits it to exactly one owner (run_debate
+    # backs off with DEBATE_ALREADY_RUNNING otherwise). So a concurrent
+    # connect can never drive a second run_debate over the SAME session —
+    # which would interleave transcript appends, race the vote event, and
+    # double-persist. Later connections attach to the running debate: as its
+    # driver again if the driver dropped and this one presents the session's
+    # driver token (the driver reconnecting), otherwise as a read-only
+    # spectator — so no one else can take the vote during the grace. One
+    # running on another worker is refused.
+    if debate_service.start_session(session):
+        session.hub = hub = BroadcastHub(session)
+        session.task = asyncio.create_task(_run(session, hub))
+        driver = True
+    else:
+        hub = session.hub
+        if hub is None or hub.done.is_set():
+            logger.info("Rejected connect for debate_id=%s running elsewhere", debate_id)
+            await _refuse(websocket, codec, debate_id, DEBATE_ALREADY_RUNNING)
+            return
+        driver = hub.driver is None and _holds_token(session, driver_token)
 
-    try:
-        # Start the debate and stream events
-        async for event in debate_service.run_debate(session):
-            # Convert enum to string for JSON serialization
-            event_dict = {
-                "type": event["type"].value if hasattr(event["type"], "value") else event["type"],
-                "debate_id": event["debate_id"],
-                "data": event["data"]
-            }
-            await websocket.send_json(event_dict)
-
-            # If a vote is required, wait for the client's response — but never
-            # indefinitely. VOTE_TIMEOUT_SECONDS is the single authoritative
-            # bound on the audience vote (run_debate no longer guards it too); a
-            # client that receives the prompt and then goes silent, disconnects,
-            # or sends garbage defaults to TIE so the debate proceeds and its
-            # session is cleaned up rather than leaking. Every branch below
-            # submits exactly one vote so run_debate always unblocks.
-            if event["type"] == WSMessageType.VOTE_REQUIRED:
-                try:
-                    vote_data = await asyncio.wait_for(
-                        websocket.receive_json(), timeout=VOTE_TIMEOUT_SECONDS
-                    )
-                    raw = (
-                        vote_data.get("vote", "TIE")
-                        if vote_data.get("type") == "vote"
-                        else "TIE"
-                    )
-                    debate_service.submit_vote(debate_id, raw if raw in VALID_VOTES else "TIE")
-                except asyncio.TimeoutError:
-                    logger.info(
-                        "Audience vote timed out for debate_id=%s; recording TIE", debate_id
-                    )
-                    debate_service.submit_vote(debate_id, "TIE")
-                except (WebSocketDisconnect, json.JSONDecodeError):
-                    debate_service.submit_vote(debate_id, "TIE")
-                except Exception:
-                    logger.exception("Unexpected error reading vote for debate_id=%s", debate_id)
-                    debate_service.submit_vote(debate_id, "TIE")
-
-    except WebSocketDisconnect:
-        pass
-    except Exception:
-        logger.exception("Unhandled error during debate websocket for debate_id=%s", debate_id)
-        await websocket.send_json({
-            "type": WSMessageType.ERROR.value,
-            "debate_id": debate_id,
-            "data": {"message": WS_UNEXPECTED_ERROR}
-        })
+    await _attach(websocket, codec, session, hub, driver=driver, last_seq=last_seq)
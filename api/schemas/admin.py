@@ -0,0 +1,53 @@
+"""Pydantic response models for the operator-facing ``/api/admin`` endpoints."""
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DeadlineInfo(BaseModel):
+    """One pending deadline: whose it is, which kind, and when it fires."""
+    key: str
+    kind: str
+    due_in_seconds: float
+
+
+class DeadlineSnapshot(BaseModel):
+    """State of the session deadline scheduler (``api/services/deadlines.py``).
+
+    ``heap_size`` counts cancelled entries not yet discarded as well as
+    ``pending`` live ones; ``fired`` is the total expired since startup.
+    """
+    pending: int
+    heap_size: int
+    fired: int
+    by_kind: dict[str, int]
+    next_due_in_seconds: Optional[float]
+    deadlines: list[DeadlineInfo]
+
+
+class SessionFootprint(BaseModel):
+    """Estimated memory one live session holds (``DebateSession.footprint``)."""
+    debate_id: str
+    topic: str
+    phase: str
+    admitted: bool
+    transcript_bytes: int
+    agent_bytes: int
+    buffered_bytes: int
+    total_bytes: int
+
+
+class SessionMemoryReport(BaseModel):
+    """This worker's session memory against ``SESSION_MEMORY_BUDGET_BYTES``.
+
+    ``committed_bytes`` is what admission checks: admitted sessions count at
+    their projected peak until they outgrow it. ``capacity`` is how many fresh
+    debates (``projected_debate_bytes`` each) the budget holds at once.
+    """
+    budget_bytes: int
+    committed_bytes: int
+    in_use_bytes: int
+    projected_debate_bytes: int
+    capacity: int
+    sessions: int
+    largest: list[SessionFootprint]
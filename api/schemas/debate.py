@@ -8,7 +8,7 @@ every event streamed over the WebSocket. The TypeScript counterparts live in
 from datetime import datetime, timezone
 from enum import Enum
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
-from typing import Optional
+from typing import Literal, Optional
 # DebatePhase/Speaker carry no extra fields here, but their values travel in the
 # WebSocket payloads, so they're re-exported as part of this contract surface
 # (and imported from here by tests/test_schemas.py).
@@ -30,11 +30,23 @@ class DebateCreateRequest(BaseModel):
 
 
 class DebateCreateResponse(BaseModel):
-    """Reply to a created debate: its new id plus the setup echoed back."""
+    """Reply to a created debate: its new id plus the setup echoed back.
+
+    When every generating slot is taken the debate is queued: connecting its
+    WebSocket then streams ``queue_position`` events until it is admitted.
+    ``queue_position`` (0 = a slot is free now) and ``estimated_wait_seconds``
+    are the position and wait a socket connecting right now would get.
+    ``driver_token`` is this client's proof that it drives the debate: a
+    socket reconnecting with ``?driver_token=`` gets the vote back, any
+    other joins as a spectator.
+    """
     debate_id: str
     topic: str
     pro_style: str
     con_style: str
+    queue_position: int = 0
+    estimated_wait_seconds: float = 0.0
+    driver_token: str
 
 
 class StyleInfo(BaseModel):
@@ -53,8 +65,8 @@ class DebateSummary(BaseModel):
 
     Intentionally omits the (potentially large) transcript and scoreboard — the
     list view only needs the headline facts. ``from_attributes`` lets FastAPI
-    build this straight from the ``Debate`` ORM row, including its
-    ``message_count`` property.
+    build this straight from the summary rows ``list_debates`` projects,
+    including the denormalised ``message_count`` column.
     """
     model_config = ConfigDict(from_attributes=True)
 
@@ -68,7 +80,7 @@ class DebateSummary(BaseModel):
     completed_at: datetime
 
     @field_serializer("created_at", "completed_at")
-    def _serialize_utc(self, value: datetime) -> str:
+    def _serialize_utc(self, value: Optional[datetime]) -> Optional[str]:
         """Stamp with a UTC designator.
 
         ``value`` comes from ``api.db.utcnow()``, which is UTC but stored (and
@@ -77,13 +89,48 @@ class DebateSummary(BaseModel):
         bare string as local time instead of UTC, shifting displayed times by
         the viewer's UTC offset.
         """
+        if value is None:
+            return None
         return value.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+class DebatePage(BaseModel):
+    """One page of ``GET /api/debates``.
+
+    ``next_cursor`` is passed back as ``?cursor=`` for the following page and
+    is ``None`` on the last one. ``total`` counts every debate matching the
+    filters (cached briefly, so it may trail a just-finished debate).
+    """
+    items: list[DebateSummary]
+    next_cursor: Optional[str] = None
+    total: int
+
+
+class DebateSearchHit(DebateSummary):
+    """One ``GET /api/debates/search`` result, best first.
+
+    ``snippet`` is HTML: the best-matching passage, escaped, with the matched
+    terms wrapped in ``<mark>``. ``rank`` is FTS5's bm25 score (lower is a
+    better match).
+    """
+    snippet: str
+    rank: float
+
+
 class DebateDetail(DebateSummary):
-    """A persisted debate with its full transcript and structured scoreboard."""
+    """A persisted debate with its transcript and structured scoreboard.
+
+    ``status`` is ``completed`` for a finished debate; an ``in_progress`` or
+    ``failed`` one (read from its checkpoint) has no scores and no
+    ``completed_at`` yet. ``transcript`` is every turn, or one page of them
+    when ``turns_limit`` was given; ``next_turn`` is then the ``turns_from``
+    of the next page (``None`` on the last).
+    """
+    status: Literal["in_progress", "failed", "completed"] = "completed"
+    completed_at: Optional[datetime] = None
     transcript: list[dict]
     argument_scores: Optional[dict] = None
+    next_turn: Optional[int] = None
 
 
 # WebSocket message types
@@ -93,6 +140,7 @@ class WSMessageType(str, Enum):
     The client switches on these to drive the live UI (see ``App.handleWSMessage``
     and the mirrored ``WSMessageType`` union in the frontend types).
     """
+    QUEUE_POSITION = "queue_position"
     DEBATE_STARTED = "debate_started"
     PHASE_CHANGE = "phase_change"
     MESSAGE_START = "message_start"
@@ -0,0 +1,69 @@
+"""Pydantic response models for the style-tournament endpoints.
+
+Read-only views over the checkpoint written by ``main.py tournament`` (see
+``src/tournament.py`` and ``api/services/tournament_repository.py``).
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+
+def _utc_iso(value: datetime) -> str:
+    """Stamp a tz-naive UTC DB timestamp with a ``Z`` (see ``DebateSummary``)."""
+    return value.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class StyleStanding(BaseModel):
+    """One style's row on the leaderboard."""
+    style: str
+    rating: float
+    wins: int
+    losses: int
+    ties: int
+
+
+class TournamentSummary(BaseModel):
+    """A tournament as shown in the list view: setup and progress."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    styles: list[str]
+    topics: list[str]
+    total_matches: int
+    completed_matches: int
+    created_at: datetime
+    updated_at: datetime
+
+    @field_serializer("created_at", "updated_at")
+    def _serialize_utc(self, value: datetime) -> str:
+        return _utc_iso(value)
+
+
+class TournamentDetail(TournamentSummary):
+    """A tournament with its leaderboard and pro-vs-con win matrix.
+
+    ``win_matrix[pro_style][con_style]`` counts the judge's verdicts (``PRO`` /
+    ``CON`` / ``TIE``) over the debates between that pairing.
+    """
+    standings: list[StyleStanding]
+    win_matrix: dict[str, dict[str, dict[str, int]]]
+
+
+class TournamentMatchSummary(BaseModel):
+    """One played matchup (transcript omitted; see ``/api/debates`` for those)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    matchup_key: str
+    pro_style: str
+    con_style: str
+    topic: str
+    status: str
+    winner: Optional[str] = None
+    error: Optional[str] = None
+    argument_scores: Optional[dict] = None
+    completed_at: datetime
+
+    @field_serializer("completed_at")
+    def _serialize_utc(self, value: datetime) -> str:
+        return _utc_iso(value)
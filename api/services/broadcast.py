@@ -0,0 +1,235 @@
+"""Live-debate fan-out — one running debate streamed to its driver and any
+number of spectators, with replay for clients that reconnect.
+
+The first WebSocket to connect for a debate starts it. The debate runs in
+its own task and publishes every frame to the session's
+:class:`BroadcastHub`. Sockets only attach and detach: the **driver** (the
+one socket that casts the audience vote), and read-only **spectators**. A
+driver that drops doesn't stop the debate. It keeps generating, and a
+connection within the reconnect grace period that presents the session's
+driver token becomes the driver again.
+
+Each frame is encoded once per wire encoding in use (JSON, or MessagePack
+for clients that negotiated it — see ``wire.py``), in
+:meth:`BroadcastHub.publish`, and that same payload is queued on every
+attached :class:`~api.services.socket_sender.SocketSender` — so the
+per-frame cost of an audience is one queue append per socket, not one
+encode. Each
+socket keeps its own bounded send queue, so a slow one only coalesces or
+loses its own stream; it never holds up the debate or the other sockets.
+
+Every published frame carries a ``seq`` (1, 2, 3, ...) and is kept in a ring
+buffer of the last ``EVENT_BUFFER_SIZE`` frames. A client that attaches with
+the last ``seq`` it saw is sent only the frames after it, then the live
+stream. A client that has seen nothing, or whose gap has already left the
+ring, catches up instead: a ``debate_started`` frame carrying the transcript
+so far (the same shape a resumed debate sends), then the turn being
+streamed up to now. Only the driver is sent the vote prompt, and a driver
+re-attaching while the vote is open is prompted again.
+"""
+import asyncio
+import itertools
+import logging
+from collections import deque
+from typing import Optional
+
+from fastapi import WebSocketDisconnect
+
+from api.schemas.debate import WSMessageType
+from api.services.metrics import Counter, Gauge
+from api.services.socket_sender import SocketSender
+from api.services.wire import Codec, Payload
+from config import EVENT_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+_STARTED = WSMessageType.DEBATE_STARTED.value
+_PHASE = WSMessageType.PHASE_CHANGE.value
+_START = WSMessageType.MESSAGE_START.value
+_CHUNK = WSMessageType.MESSAGE_CHUNK.value
+_COMPLETE = WSMessageType.MESSAGE_COMPLETE.value
+_VOTE_REQUIRED = WSMessageType.VOTE_REQUIRED.value
+_VOTE_RECEIVED = WSMessageType.VOTE_RECEIVED.value
+_TURN_FRAMES = (_START, _CHUNK, _COMPLETE)
+_TERMINAL = (WSMessageType.DEBATE_COMPLETE.value, WSMessageType.ERROR.value)
+
+# Hubs of debates running in this process, for the gauges.
+_LIVE: set["BroadcastHub"] = set()
+
+Gauge(
+    "debate_spectators",
+    "Spectator WebSockets attached to live debates in this process.",
+    fn=lambda: sum(len(hub.subscribers) - (hub.driver is not None) for hub in _LIVE),
+)
+Gauge(
+    "debate_driverless_sessions",
+    "Live debates whose driving socket dropped and may still reconnect.",
+    fn=lambda: sum(hub.driver is None and hub.started is not None for hub in _LIVE),
+)
+FRAMES_BROADCAST = Counter(
+    "debate_frames_broadcast_total",
+    "Frames published by live debates (each encoded once for every socket).",
+)
+FRAMES_REPLAYED = Counter(
+    "debate_frames_replayed_total",
+    "Buffered frames re-sent to clients reconnecting with last_seq.",
+)
+
+
+class BroadcastHub:
+    """A live debate's attached sockets, its replay buffer, and the state a
+    client catches up from.
+
+    ``session`` is the running :class:`~api.services.debate_service.DebateSession`;
+    its transcript is the catch-up. The hub itself tracks only what the
+    transcript doesn't hold yet: whether the debate has started, its phase,
+    the partial turn currently streaming, and an open vote prompt.
+    """
+
+    def __init__(self, session, buffer_size: int = EVENT_BUFFER_SIZE):
+        self.session = session
+        self.subscribers: set[SocketSender] = set()
+        self.driver: Optional[SocketSender] = None
+        self.started: Optional[dict] = None
+        self.phase: Optional[str] = None
+        self.vote_prompt: Optional[dict] = None
+        self.ended = False
+        self.seq = 0
+        self._seqs = itertools.count(1)
+        # Turns started so far; turn frames carry theirs as ``turn``.
+        self.turn = 0
+        # (seq, frame, payloads by codec name, driver_only) of the last
+        # ``buffer_size`` frames. Payloads are encoded when first needed.
+        self._ring: deque[tuple[int, dict, dict[str, Payload], bool]] = deque(maxlen=buffer_size)
+        self._ring_bytes = 0
+        self._turn_speaker: Optional[str] = None
+        self._turn_chunks: list[str] = []
+        # Set once the debate is over and nothing more will be published.
+        self.done = asyncio.Event()
+        _LIVE.add(self)
+
+    def __len__(self) -> int:
+        return len(self.subscribers)
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Encoded bytes held for replay plus those queued on every attached socket."""
+        return self._ring_bytes + sum(sender.buffered_bytes for sender in self.subscribers)
+
+    def publish(self, frame: dict, *, driver_only: bool = False) -> None:
+        """Number ``frame``, keep it for replay, and queue it on every
+        attached socket (only the driver's, if ``driver_only``), encoded once
+        per codec.
+
+        A socket whose queue has given up (stuck or gone) is detached here.
+        """
+        self.seq = next(self._seqs)
+        frame["seq"] = self.seq
+        self._observe(frame)
+        if len(self._ring) == self._ring.maxlen:
+            self._ring_bytes -= sum(len(payload) for payload in self._ring[0][2].values())
+        payloads: dict[str, Payload] = {}
+        self._ring.append((self.seq, frame, payloads, driver_only))
+        FRAMES_BROADCAST.inc()
+        for sender in [self.driver] if driver_only else list(self.subscribers):
+            if sender is None:
+                continue
+            try:
+                sender.put(frame, self._encoded(frame, payloads, sender.codec))
+            except WebSocketDisconnect:
+                self.detach(sender)
+
+    def attach(self, sender: SocketSender, *, driver: bool,
+               last_seq: Optional[int] = None) -> None:
+        """Attach a socket, queueing what it missed first: the frames after
+        ``last_seq`` if the ring still holds them all, otherwise a catch-up."""
+        if not self._replay(sender, driver, last_seq):
+            self._catch_up(sender, driver)
+        self.subscribers.add(sender)
+        if driver:
+            self.driver = sender
+        logger.info("%s attached to debate_id=%s (%d sockets, last_seq=%s)",
+                    "Driver" if driver else "Spectator", self.session.debate_id,
+                    len(self.subscribers), last_seq)
+
+    def detach(self, sender: SocketSender) -> None:
+        self.subscribers.discard(sender)
+        if sender is self.driver:
+            self.driver = None
+
+    def close(self) -> None:
+        """The debate is over: no more frames will be published."""
+        self.done.set()
+        self._ring.clear()
+        self._ring_bytes = 0
+        _LIVE.discard(self)
+
+    def _replay(self, sender: SocketSender, driver: bool, last_seq: Optional[int]) -> bool:
+        if last_seq is None or last_seq > self.seq:
+            return False
+        if last_seq < self.seq and (not self._ring or self._ring[0][0] > last_seq + 1):
+            return False
+        replayed_prompt = False
+        skip = len(self._ring) - (self.seq - last_seq)
+        for _, frame, payloads, driver_only in itertools.islice(self._ring, skip, None):
+            if driver_only and not driver:
+                continue
+            replayed_prompt = replayed_prompt or frame["type"] == _VOTE_REQUIRED
+            sender.put(frame, self._encoded(frame, payloads, sender.codec))
+            FRAMES_REPLAYED.inc()
+        if driver and self.vote_prompt is not None and not replayed_prompt:
+            sender.put(self.vote_prompt)
+        return True
+
+    def _catch_up(self, sender: SocketSender, driver: bool) -> None:
+        if self.started is None:
+            return
+        debate_id = self.session.debate_id
+        transcript = list(self.session.transcript)
+        data = {**self.started, "resumed_from": len(transcript), "transcript": transcript}
+        if not driver:
+            data["spectator"] = True
+        # Catch-up frames carry the seq they bring the client up to.
+        sender.put({"type": _STARTED, "debate_id": debate_id, "seq": self.seq, "data": data})
+        if self.phase is not None:
+            sender.put({"type": _PHASE, "debate_id": debate_id, "seq": self.seq,
+                        "data": {"phase": self.phase}})
+        if self._turn_speaker is not None:
+            speaker = {"speaker": self._turn_speaker}
+            turn = {"debate_id": debate_id, "seq": self.seq, "turn": self.turn}
+            sender.put({"type": _START, **turn, "data": speaker})
+            if self._turn_chunks:
+                sender.put({"type": _CHUNK, **turn,
+                            "data": {**speaker, "chunk": "".join(self._turn_chunks)}})
+        if driver and self.vote_prompt is not None:
+            sender.put(self.vote_prompt)
+
+    def _encoded(self, frame: dict, payloads: dict[str, Payload], codec: Codec) -> Payload:
+        payload = payloads.get(codec.name)
+        if payload is None:
+            payload = payloads[codec.name] = codec.encode(frame)
+            self._ring_bytes += len(payload)
+        return payload
+
+    def _observe(self, frame: dict) -> None:
+        kind = frame["type"]
+        if kind == _START:
+            self.turn += 1
+        if kind in _TURN_FRAMES:
+            frame["turn"] = self.turn
+        if kind == _STARTED:
+            self.started = {k: v for k, v in frame["data"].items() if k != "transcript"}
+        elif kind == _PHASE:
+            self.phase = frame["data"]["phase"]
+        elif kind == _START:
+            self._turn_speaker, self._turn_chunks = frame["data"]["speaker"], []
+        elif kind == _CHUNK:
+            self._turn_chunks.append(frame["data"]["chunk"])
+        elif kind == _COMPLETE:
+            self._turn_speaker, self._turn_chunks = None, []
+        elif kind == _VOTE_REQUIRED:
+            self.vote_prompt = frame
+        elif kind == _VOTE_RECEIVED:
+            self.vote_prompt = None
+        elif kind in _TERMINAL:
+            self.ended = True
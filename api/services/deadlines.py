@@ -0,0 +1,197 @@
+"""Deadline scheduler — one owner for every per-session timeout.
+
+A live debate has several deadlines: the orphan TTL (created but never
+driven by a socket), the audience-vote timeout, the idle-socket bound (no
+event streamed for too long, e.g. a stalled LLM call), the maximum debate
+duration, and the reconnect grace after the driving socket drops. Plus one
+recurring job, sweeping a shared session store for records abandoned by dead
+workers. Rather than scan every session periodically, each deadline is an
+entry in a single min-heap keyed by due time:
+
+* **schedule** is O(log n); re-scheduling the same ``(key, kind)`` replaces
+  the old entry, which is just marked dead (lazy deletion).
+* **cancel** is O(1) — a dict lookup and a flag.
+* **expiry** pops only entries that are actually due, so a tick with nothing
+  due costs O(1) no matter how many sessions exist. Dead entries are dropped
+  as they surface, and the heap is compacted whenever they outnumber the
+  live ones, so memory stays proportional to live deadlines.
+
+Nothing polls: the scheduler keeps exactly one event-loop timer armed for the
+earliest live deadline and re-arms it as the head changes. Called from sync
+code (no running loop), it just records the entry; :meth:`expire_due` then
+runs on the next arm or when called explicitly. Handlers are plain callables
+registered per kind with :meth:`on`; a failing handler is logged, not raised.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineKind(str, Enum):
+    ORPHAN = "orphan"
+    VOTE = "vote"
+    IDLE = "idle"
+    MAX_DURATION = "max_duration"
+    RECONNECT = "reconnect"
+    STORE_SWEEP = "store_sweep"
+
+
+@dataclass(order=True)
+class _Entry:
+    when: float
+    seq: int
+    key: str = field(compare=False)
+    kind: DeadlineKind = field(compare=False)
+    live: bool = field(default=True, compare=False)
+
+
+class DeadlineScheduler:
+    """Min-heap of ``(key, kind)`` deadlines with one armed loop timer.
+
+    ``clock`` is a monotonic seconds source (``time.monotonic`` by default;
+    tests pass a fake one and call :meth:`expire_due` directly).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._heap: list[_Entry] = []
+        self._entries: dict[tuple[str, DeadlineKind], _Entry] = {}
+        self._handlers: dict[DeadlineKind, Callable[[str], None]] = {}
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer_when: Optional[float] = None
+        self._arming = False
+        self.fired = 0
+
+    def on(self, kind: DeadlineKind, handler: Callable[[str], None]) -> None:
+        """Register the callable run with the key when a ``kind`` deadline expires."""
+        self._handlers[kind] = handler
+
+    def schedule(self, key: str, kind: DeadlineKind, delay: float) -> None:
+        """Expire ``(key, kind)`` ``delay`` seconds from now, replacing any pending one."""
+        self._kill(key, kind)
+        entry = _Entry(self.clock() + delay, next(self._seq), key, kind)
+        self._entries[(key, kind)] = entry
+        heapq.heappush(self._heap, entry)
+        if self._timer_when is None or entry.when < self._timer_when or not self._armed_here():
+            self._arm()
+
+    def cancel(self, key: str, kind: Optional[DeadlineKind] = None) -> None:
+        """Drop ``key``'s ``kind`` deadline, or all of its deadlines. Idempotent."""
+        kinds = (kind,) if kind is not None else tuple(DeadlineKind)
+        for k in kinds:
+            self._kill(key, k)
+
+    def pending(self, key: str, kind: DeadlineKind) -> Optional[float]:
+        """Seconds until ``(key, kind)`` expires, or ``None`` if not scheduled."""
+        entry = self._entries.get((key, kind))
+        return None if entry is None else entry.when - self.clock()
+
+    def expire_due(self) -> int:
+        """Run the handler of every deadline that is due; return how many fired."""
+        now = self.clock()
+        fired = 0
+        while self._heap and self._heap[0].when <= now:
+            entry = heapq.heappop(self._heap)
+            if not entry.live:
+                continue
+            entry.live = False
+            del self._entries[(entry.key, entry.kind)]
+            fired += 1
+            handler = self._handlers.get(entry.kind)
+            if handler is None:
+                continue
+            try:
+                handler(entry.key)
+            except Exception:
+                logger.exception("Deadline handler failed: %s %s", entry.kind.value, entry.key)
+        self.fired += fired
+        return fired
+
+    def stop(self) -> None:
+        """Disarm the loop timer (app shutdown). Entries are kept."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._timer_loop = self._timer_when = None
+
+    def clear(self) -> None:
+        """Drop every deadline and disarm (tests reset the shared scheduler)."""
+        self.stop()
+        self._heap.clear()
+        self._entries.clear()
+
+    def snapshot(self, limit: int = 100) -> dict:
+        """Inspectable state: counts per kind and the ``limit`` soonest deadlines."""
+        now = self.clock()
+        soonest = heapq.nsmallest(limit, self._entries.values())
+        by_kind = {kind.value: 0 for kind in DeadlineKind}
+        for _, kind in self._entries:
+            by_kind[kind.value] += 1
+        return {
+            "pending": len(self._entries),
+            "heap_size": len(self._heap),
+            "fired": self.fired,
+            "by_kind": by_kind,
+            "next_due_in_seconds": round(soonest[0].when - now, 3) if soonest else None,
+            "deadlines": [
+                {"key": e.key, "kind": e.kind.value, "due_in_seconds": round(e.when - now, 3)}
+                for e in soonest
+            ],
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _kill(self, key: str, kind: DeadlineKind) -> None:
+        entry = self._entries.pop((key, kind), None)
+        if entry is None:
+            return
+        entry.live = False
+        # Lazy deletion leaves dead entries in the heap; rebuild once they are
+        # the majority, so the amortized cost per cancel stays O(1).
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [e for e in self._heap if e.live]
+            heapq.heapify(self._heap)
+
+    def _armed_here(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._timer_loop
+        except RuntimeError:
+            return True
+
+    def _arm(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._arming:
+            # A handler re-scheduling from inside expire_due below; the outer
+            # call arms for whatever the head is once expiry is done.
+            return
+        self._arming = True
+        try:
+            self.expire_due()
+        finally:
+            self._arming = False
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._timer_loop = self._timer_when = None
+        while self._heap and not self._heap[0].live:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return
+        head = self._heap[0].when
+        self._timer = loop.call_later(max(0.0, head - self.clock()), self._fire)
+        self._timer_loop, self._timer_when = loop, head
+
+    def _fire(self) -> None:
+        self._timer = self._timer_loop = self._timer_when = None
+        self._arm()
@@ -0,0 +1,158 @@
+"""Bulk export of finished debates as NDJSON, for analytics.
+
+One line per debate, in the order they were saved (``Debate.saved_seq``), and each line is
+that debate's ``GET /api/debates/{id}`` body: the one stored when it was
+saved (``Debate.detail``), copied out without being parsed, or for a row saved
+before bodies were, built as the endpoint would build it. Rows are read with
+``yield_per``, a batch at a time off one cursor, so an export holds one batch
+in memory however big the archive is. ``GET /api/debates/export`` streams it
+(:func:`stream`); ``python main.py export-debates`` writes it to a file
+(:func:`write`).
+
+Exports can be incremental. :func:`export_cursor` is the ``saved_seq`` of
+the last matching debate saved when an export starts, and the export stops
+there. Passed back as ``since``, it starts the next export strictly after it.
+``saved_seq`` is numbered at commit, in commit order, so a debate saved late
+(by another worker, after a retry, or replayed from the write-behind spool,
+all keeping their original ``completed_at``) still lands after every cursor
+handed out before it. A debate saved again is exported again.
+"""
+import zlib
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from api import db
+from api.models import Debate
+from api.services import debate_repository
+from api.services.debate_repository import DebateFilters
+
+# Lines are joined into chunks of about this many bytes before they are sent
+# or written (and gzip-compressed), rather than one per debate.
+_CHUNK_BYTES = 64 * 1024
+
+
+def decode_since(cursor: str) -> int:
+    """The ``saved_seq`` an export cursor names; ``ValueError`` if it isn't one."""
+    seq = int(cursor)
+    if seq < 0 or str(seq) != cursor:
+        raise ValueError(f"invalid export cursor: {cursor!r}")
+    return seq
+
+
+def export_cursor(
+    session: Session, filters: Optional[DebateFilters] = None, since: Optional[str] = None
+) -> Optional[str]:
+    """Where an export started now ends, and the next one should start: the
+    last saved debate matching ``filters``, or ``since`` itself when none was
+    saved after it (``None`` when nothing matches and there is no ``since``).
+    Raises ``ValueError`` for a malformed ``since``."""
+    start = decode_since(since) if since is not None else None
+    last = session.execute(
+        select(func.max(Debate.saved_seq)).where(*(filters or DebateFilters()).clauses())
+    ).scalar_one()
+    if last is None or (start is not None and last <= start):
+        return since
+    return str(last)
+
+
+def export_lines(
+    session: Session,
+    filters: Optional[DebateFilters] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    batch_size: int = 500,
+) -> Iterator[bytes]:
+    """The NDJSON line of each debate matching ``filters`` after the cursor
+    ``since`` and up to the cursor ``until``, in save order, read
+    ``batch_size`` rows at a time."""
+    stmt = select(Debate.id, Debate.detail).where(*(filters or DebateFilters()).clauses())
+    if since is not None:
+        stmt = stmt.where(Debate.saved_seq > decode_since(since))
+    if until is not None:
+        stmt = stmt.where(Debate.saved_seq <= decode_since(until))
+    stmt = stmt.order_by(Debate.saved_seq).execution_options(yield_per=batch_size)
+    for row in session.execute(stmt):
+        body = row.detail
+        if body is None:  # saved before bodies were; compress-debates fills it
+            body = debate_repository.detail_body(
+                debate_repository.get_debate_detail(session, row.id)
+            )
+        yield body + b"\n"
+
+
+def chunks(lines: Iterable[bytes], gzip: bool = False) -> Iterator[bytes]:
+    """``lines`` joined into chunks of about ``_CHUNK_BYTES``; with ``gzip``,
+    compressed as one gzip stream across all of them."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if gzip else None  # | 16: gzip framing
+    buffer: list[bytes] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= _CHUNK_BYTES:
+            data = b"".join(buffer)
+            buffer, size = [], 0
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                yield data
+    data = b"".join(buffer)
+    if compressor is not None:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
+
+
+def _lines_until(
+    session: Session,
+    filters: Optional[DebateFilters],
+    since: Optional[str],
+    until: Optional[str],
+    batch_size: int,
+) -> Iterable[bytes]:
+    """:func:`export_lines` up to ``until`` from :func:`export_cursor`, which
+    is ``None`` or ``since`` itself when there is nothing to export."""
+    if until is None or until == since:
+        return ()
+    return export_lines(session, filters, since, until, batch_size)
+
+
+def stream(
+    filters: Optional[DebateFilters] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    gzip: bool = False,
+    batch_size: int = 500,
+) -> Iterator[bytes]:
+    """The export up to ``until`` (from :func:`export_cursor`) as response
+    chunks, read in a session of its own that lives as long as the response
+    does (the request's session is closed by then)."""
+    with db.SessionLocal() as session:
+        yield from chunks(_lines_until(session, filters, since, until, batch_size), gzip)
+
+
+def write(
+    out: BinaryIO,
+    filters: Optional[DebateFilters] = None,
+    since: Optional[str] = None,
+    gzip: bool = False,
+    batch_size: int = 500,
+) -> tuple[int, Optional[str]]:
+    """Write the export to ``out``; return how many debates it holds and the
+    cursor to pass as ``since`` next time. Raises ``ValueError`` for a
+    malformed ``since``."""
+    count = 0
+
+    def counted(lines: Iterable[bytes]) -> Iterator[bytes]:
+        nonlocal count
+        for line in lines:
+            count += 1
+            yield line
+
+    with db.SessionLocal() as session:
+        until = export_cursor(session, filters, since)
+        for chunk in chunks(counted(_lines_until(session, filters, since, until, batch_size)), gzip):
+            out.write(chunk)
+    return count, until
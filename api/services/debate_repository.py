@@ -1,23 +1,142 @@
-"""Read/write access to persisted debates.
+"""Read/write access to persisted debates and in-progress checkpoints.
 
 These functions are deliberately thin and synchronous. SQLite is local and
 fast, and staying sync sidesteps the cross-event-loop pitfalls of async
-SQLAlchemy in a codebase that mixes a sync ``TestClient`` with async tests. The
-single write that finalises a debate runs off the event loop via
-``asyncio.to_thread`` (see :meth:`DebateService.run_debate`); the read endpoints
-run in FastAPI's threadpool.
+SQLAlchemy in a codebase that mixes a sync ``TestClient`` with async tests.
+Finished debates are written by the write-behind writer thread (see
+``api/services/debate_writer.py``), in batches; checkpoints are written off the
+event loop via ``asyncio.to_thread``; the read endpoints run in FastAPI's
+threadpool.
 """
-from datetime import datetime
+import base64
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, delete, func, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload, undefer_group
 
-from api import db
-from api.models import Debate
+from api import compression, db
+from api.models import (
+    COMPLETED,
+    IN_PROGRESS,
+    CompressionDictionary,
+    Debate,
+    DebateCheckpoint,
+    DebateTurn,
+)
+from api.schemas.debate import DebateDetail
+from api.services import debate_search
+from api.services.detail_cache import DetailCache
+from config import DEBATE_COUNT_CACHE_SECONDS, DEBATE_DETAIL_CACHE_BYTES
 
+# What the past-debates list shows: every column but the JSON payload.
+_SUMMARY_COLUMNS = (
+    Debate.id,
+    Debate.topic,
+    Debate.pro_style,
+    Debate.con_style,
+    Debate.winner,
+    Debate.message_count,
+    Debate.created_at,
+    Debate.completed_at,
+)
 
-def save_completed_debate(
+
+@dataclass(frozen=True)
+class DebateFilters:
+    """Which finished debates to list. Every field is optional; the date
+    bounds are naive UTC, like ``completed_at``. Hashable, so it keys the
+    count cache."""
+
+    winner: Optional[str] = None
+    pro_style: Optional[str] = None
+    con_style: Optional[str] = None
+    completed_after: Optional[datetime] = None
+    completed_before: Optional[datetime] = None
+
+    def clauses(self) -> list:
+        clauses = [
+            column == value
+            for column, value in (
+                (Debate.winner, self.winner),
+                (Debate.pro_style, self.pro_style),
+                (Debate.con_style, self.con_style),
+            )
+            if value is not None
+        ]
+        if self.completed_after is not None:
+            clauses.append(Debate.completed_at >= self.completed_after)
+        if self.completed_before is not None:
+            clauses.append(Debate.completed_at < self.completed_before)
+        return clauses
+
+
+def encode_cursor(completed_at: datetime, debate_id: str) -> str:
+    """An opaque page cursor: the sort key of the last row on a page."""
+    raw = json.dumps([completed_at.isoformat(), debate_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Invert :func:`encode_cursor`; ``ValueError`` if ``cursor`` isn't one."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        completed_at, debate_id = json.loads(raw)
+        return datetime.fromisoformat(completed_at), str(debate_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Malformed cursor: {cursor!r}") from e
+
+
+# ``count_debates`` results by filter: (monotonic time cached, count). Saves
+# in this process clear it; other workers' saves show up within the TTL.
+_count_cache: dict[DebateFilters, tuple[float, int]] = {}
+_count_lock = threading.Lock()
+
+# The hottest finished debates' detail bodies (see :func:`get_stored_detail`).
+_detail_cache = DetailCache(DEBATE_DETAIL_CACHE_BYTES)
+
+
+# Dialects with ``INSERT ... ON CONFLICT``, which upserts a batch in one
+# statement; elsewhere ``_upsert`` merges row by row.
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _upsert(session: Session, model: type, rows: list[dict], *, replace: bool = True) -> None:
+    """Insert ``rows`` of ``model``; one whose primary key exists already is
+    updated from the row (``replace``) or left as it is."""
+    insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is None:
+        for row in rows:
+            session.merge(model(**row))
+        session.flush()
+        return
+    stmt = insert(model.__table__)
+    keys = [column.name for column in model.__table__.primary_key]
+    if replace:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={name: stmt.excluded[name] for name in rows[0] if name not in keys},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+    session.execute(stmt, rows)
+
+
+def _turn_rows(debate_id: str, first_seq: int, entries: list[dict]) -> list[dict]:
+    return [
+        {"debate_id": debate_id, "seq": seq, "speaker": entry["speaker"],
+         "phase": entry["phase"], "content": entry["content"]}
+        for seq, entry in enumerate(entries, first_seq)
+    ]
+
+
+def debate_row(
     *,
     debate_id: str,
     topic: str,
@@ -27,32 +146,394 @@ def save_completed_debate(
     argument_scores: Optional[dict],
     winner: Optional[str],
     created_at: datetime,
-) -> None:
-    """Persist a finished debate.
+    completed_at: Optional[datetime] = None,
+) -> dict:
+    """A finished debate as the ``Debate`` column values
+    :func:`save_completed_debates` writes (``completed_at`` defaults to now)."""
+    return {
+        "id": debate_id,
+        "topic": topic,
+        "pro_style": pro_style,
+        "con_style": con_style,
+        "transcript": transcript,
+        "argument_scores": argument_scores,
+        "winner": winner,
+        "message_count": len(transcript),
+        "created_at": created_at,
+        "completed_at": completed_at or db.utcnow(),
+    }
+
+
+def detail_body(row: dict) -> bytes:
+    """A finished debate's whole ``GET /api/debates/{id}`` response body,
+    serialized through ``DebateDetail`` as the endpoint would; ``row`` as
+    from :func:`debate_row` or :func:`get_debate_detail`."""
+    return DebateDetail.model_validate(
+        {**row, "status": COMPLETED, "next_turn": None}
+    ).model_dump_json().encode()
 
-    Uses ``merge`` so re-saving the same ``debate_id`` is an idempotent upsert
-    rather than a primary-key collision.
+
+def stored_detail(row: dict) -> dict:
+    """The ``detail`` and ``detail_etag`` columns of a :func:`debate_row`: its
+    :func:`detail_body` and the SHA-256 of that body."""
+    body = detail_body(row)
+    return {"detail": body, "detail_etag": hashlib.sha256(body).hexdigest()}
+
+
+# Any constant shared by every saver: the key of the PostgreSQL advisory lock
+# that serialises them (see _next_saved_seq).
+_SAVE_LOCK_KEY = 0x646562617465
+
+
+def _next_saved_seq(session: Session) -> int:
+    """The ``saved_seq`` the rows of this save start at, one past the highest.
+
+    Called once this transaction holds the database's write lock: on SQLite
+    the checkpoint DELETE before it took the lock, which is held to commit,
+    and on PostgreSQL an advisory lock held to commit is taken here. Saves
+    are therefore numbered in commit order, so a reader that has seen
+    ``saved_seq`` N will see every later save numbered above it (the export's
+    ``since`` relies on this).
     """
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(select(func.pg_advisory_xact_lock(_SAVE_LOCK_KEY)))
+    return session.execute(select(func.coalesce(func.max(Debate.saved_seq), 0))).scalar_one() + 1
+
+
+def save_completed_debates(rows: list[dict]) -> None:
+    """Persist finished debates (:func:`debate_row` dicts) in one transaction
+    and drop their in-progress checkpoints.
+
+    An upsert — ``INSERT ... ON CONFLICT (id) DO UPDATE`` — so re-saving a
+    ``debate_id`` (a retried or replayed batch) replaces the row instead of
+    colliding, without a SELECT first. Any of their turns missing from
+    ``debate_turns`` (normally all are there, one checkpoint per turn) are
+    added. The checkpoints are deleted, and the debates (re)indexed for
+    search, in the same transaction, so a debate is always either resumable
+    or finished — never both, never neither — and searchable as soon as it
+    is listed. Each row's detail response is serialized here, once
+    (:func:`stored_detail`), and each is numbered by ``saved_seq`` in commit
+    order (:func:`_next_saved_seq`); a re-saved debate gets a new number.
+    """
+    if not rows:
+        return
+    ids = [row["id"] for row in rows]
     with db.session_scope() as session:
-        session.merge(Debate(
-            id=debate_id,
-            topic=topic,
-            pro_style=pro_style,
-            con_style=con_style,
-            transcript=transcript,
-            argument_scores=argument_scores,
-            winner=winner,
-            created_at=created_at,
-            completed_at=db.utcnow(),
-        ))
+        session.execute(delete(DebateCheckpoint).where(DebateCheckpoint.id.in_(ids)))
+        first = _next_saved_seq(session)
+        _upsert(session, Debate, [{**row, **stored_detail(row), "saved_seq": seq}
+                                  for seq, row in enumerate(rows, first)])
+        turns = [turn for row in rows for turn in _turn_rows(row["id"], 0, row["transcript"])]
+        if turns:
+            _upsert(session, DebateTurn, turns, replace=False)
+        debate_search.index_debates(session, rows)
+    with _count_lock:
+        _count_cache.clear()
+    _detail_cache.discard(ids)
+
+
+def save_completed_debate(**fields) -> None:
+    """Persist one finished debate now (``fields`` as for :func:`debate_row`).
+    The app saves through the write-behind writer instead."""
+    save_completed_debates([debate_row(**fields)])
+
+
+def list_debates(
+    session: Session,
+    limit: int = 50,
+    *,
+    cursor: Optional[str] = None,
+    filters: Optional[DebateFilters] = None,
+) -> list[Row]:
+    """Return summaries of finished debates, most recently completed first.
+
+    A column projection — rows carry the summary fields only, never the
+    transcript or scores — so the cost of the list doesn't grow with the
+    length of the debates in it. Paging is keyset on ``(completed_at, id)``:
+    ``cursor`` (from :func:`encode_cursor`) resumes strictly after the row it
+    names, so a page deep in the archive costs what the first one does, read
+    off the composite indexes on ``Debate``. Raises ``ValueError`` for a
+    malformed cursor.
+    """
+    stmt = select(*_SUMMARY_COLUMNS).where(*(filters or DebateFilters()).clauses())
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Debate.completed_at, Debate.id) < tuple_(*decode_cursor(cursor)))
+    stmt = stmt.order_by(Debate.completed_at.desc(), Debate.id.desc()).limit(limit)
+    return list(session.execute(stmt).all())
+
+
+def page_debates(
+    session: Session,
+    limit: int = 50,
+    *,
+    cursor: Optional[str] = None,
+    filters: Optional[DebateFilters] = None,
+) -> tuple[list[Row], Optional[str]]:
+    """One page of :func:`list_debates` and the cursor of the next, or
+    ``None`` on the last page (one extra row is read to tell)."""
+    rows = list_debates(session, limit + 1, cursor=cursor, filters=filters)
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_cursor(last.completed_at, last.id)
+
 
+def count_debates(session: Session, filters: Optional[DebateFilters] = None) -> int:
+    """How many finished debates match ``filters``, cached for
+    ``DEBATE_COUNT_CACHE_SECONDS`` — a ``COUNT(*)`` visits every matching
+    index entry, which a page fetch never does."""
+    filters = filters or DebateFilters()
+    now = time.monotonic()
+    with _count_lock:
+        cached = _count_cache.get(filters)
+    if cached is not None and now - cached[0] < DEBATE_COUNT_CACHE_SECONDS:
+        return cached[1]
+    total = session.execute(
+        select(func.count()).select_from(Debate).where(*filters.clauses())
+    ).scalar_one()
+    with _count_lock:
+        _count_cache[filters] = (now, total)
+    return total
 
-def list_debates(session: Session, limit: int = 50) -> list[Debate]:
-    """Return finished debates, most recently completed first."""
-    stmt = select(Debate).order_by(Debate.completed_at.desc()).limit(limit)
-    return list(session.execute(stmt).scalars().all())
+
+def _summary(debate: Debate) -> dict:
+    return {column.key: getattr(debate, column.key) for column in _SUMMARY_COLUMNS}
 
 
 def get_debate(session: Session, debate_id: str) -> Optional[Debate]:
-    """Return one debate by id, or ``None`` if it isn't persisted."""
-    return session.get(Debate, debate_id)
+    """Return one debate by id, transcript and scores included, or ``None``
+    if it isn't persisted."""
+    return session.get(Debate, debate_id, options=[undefer_group("payload")])
+
+
+def get_stored_detail(session: Session, debate_id: str) -> Optional[tuple[str, bytes]]:
+    """The ETag and stored response body of a finished debate (see
+    :func:`stored_detail`), or ``None`` if there is none: the debate isn't
+    saved, or was saved before bodies were. Served from the LRU when it is
+    there, and put there when it isn't; neither way is anything parsed."""
+    cached = _detail_cache.get(debate_id)
+    if cached is not None:
+        return cached
+    row = session.execute(
+        select(Debate.detail_etag, Debate.detail).where(Debate.id == debate_id)
+    ).one_or_none()
+    if row is None or row.detail is None:
+        return None
+    _detail_cache.put(debate_id, row.detail_etag, row.detail)
+    return row.detail_etag, row.detail
+
+
+def page_turns(
+    session: Session, debate_id: str, start: int = 0, limit: Optional[int] = None
+) -> tuple[list[dict], Optional[int]]:
+    """Up to ``limit`` turns of a debate (all with ``None``) from ``seq``
+    ``start`` on, and the ``seq`` the next page starts at (``None`` on the
+    last page) — a range read on the primary key, whatever the length of the
+    transcript."""
+    stmt = (select(DebateTurn)
+            .where(DebateTurn.debate_id == debate_id, DebateTurn.seq >= start)
+            .order_by(DebateTurn.seq))
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    turns = session.execute(stmt).scalars().all()
+    if limit is None or len(turns) <= limit:
+        return [turn.entry() for turn in turns], None
+    return [turn.entry() for turn in turns[:limit]], turns[limit].seq
+
+
+def slice_turns(
+    transcript: list[dict], start: int = 0, limit: Optional[int] = None
+) -> tuple[list[dict], Optional[int]]:
+    """:func:`page_turns` over a transcript already in memory."""
+    if limit is None or start + limit >= len(transcript):
+        return transcript[start:], None
+    return transcript[start:start + limit], start + limit
+
+
+def get_debate_detail(
+    session: Session, debate_id: str, start: int = 0, limit: Optional[int] = None
+) -> Optional[dict]:
+    """A debate for the detail view, finished or not, or ``None``.
+
+    The summary fields plus ``status``, ``argument_scores``, and its turns —
+    all of them, or with ``limit`` a page from ``start`` (see
+    :func:`page_turns`) and the ``next_turn`` after it. The whole transcript
+    of a finished debate is its archive JSON; a page is read from
+    ``debate_turns``, never loading the JSON. An unfinished debate comes from
+    its checkpoint, with no scores or ``completed_at`` yet.
+    """
+    if limit is None:
+        debate = get_debate(session, debate_id)
+        if debate is not None:
+            return {**_summary(debate), "status": COMPLETED, "transcript": debate.transcript,
+                    "argument_scores": debate.argument_scores, "next_turn": None}
+    else:
+        row = session.execute(
+            select(*_SUMMARY_COLUMNS, Debate.argument_scores).where(Debate.id == debate_id)
+        ).one_or_none()
+        if row is not None:
+            turns, next_turn = page_turns(session, debate_id, start, limit)
+            return {**row._asdict(), "status": COMPLETED, "transcript": turns,
+                    "next_turn": next_turn}
+    checkpoint = get_checkpoint(session, debate_id)
+    if checkpoint is None:
+        return None
+    turns, next_turn = page_turns(session, debate_id, start, limit)
+    return {
+        "id": checkpoint.id,
+        "topic": checkpoint.topic,
+        "pro_style": checkpoint.pro_style,
+        "con_style": checkpoint.con_style,
+        "winner": None,
+        "message_count": count_turns(session, debate_id),
+        "created_at": checkpoint.created_at,
+        "completed_at": None,
+        "status": checkpoint.status,
+        "transcript": turns,
+        "argument_scores": None,
+        "next_turn": next_turn,
+    }
+
+
+def count_turns(session: Session, debate_id: str) -> int:
+    """How many turns of a debate are stored."""
+    return session.execute(
+        select(func.count()).select_from(DebateTurn).where(DebateTurn.debate_id == debate_id)
+    ).scalar_one()
+
+
+def save_checkpoint(
+    *,
+    debate_id: str,
+    topic: str,
+    pro_style: str,
+    con_style: str,
+    phase: str,
+    turns: list[dict],
+    first_seq: int,
+    created_at: datetime,
+    driver_token: Optional[str] = None,
+) -> None:
+    """Record an in-progress debate's progress (after each turn): append
+    ``turns`` — the transcript entries from ``first_seq`` on, normally just
+    the one that completed — and upsert its checkpoint row, in one
+    transaction. The cost doesn't grow with the transcript. ``driver_token``
+    is kept so a restored session still hands the driver role back to its
+    creator only."""
+    with db.session_scope() as session:
+        _upsert(session, DebateCheckpoint, [{
+            "id": debate_id,
+            "topic": topic,
+            "pro_style": pro_style,
+            "con_style": con_style,
+            "phase": phase,
+            "status": IN_PROGRESS,
+            "created_at": created_at,
+            "updated_at": db.utcnow(),
+            "driver_token": driver_token,
+        }])
+        if turns:
+            _upsert(session, DebateTurn, _turn_rows(debate_id, first_seq, turns))
+
+
+def set_checkpoint_status(debate_id: str, status: str) -> None:
+    """Mark an unfinished debate ``in_progress`` or ``failed``."""
+    with db.session_scope() as session:
+        session.execute(
+            update(DebateCheckpoint)
+            .where(DebateCheckpoint.id == debate_id)
+            .values(status=status, updated_at=db.utcnow())
+        )
+
+
+def get_checkpoint(session: Session, debate_id: str) -> Optional[DebateCheckpoint]:
+    """The checkpoint row of an unfinished debate (without its turns), or
+    ``None``."""
+    return session.get(DebateCheckpoint, debate_id)
+
+
+def load_checkpoint(debate_id: str) -> Optional[DebateCheckpoint]:
+    """Return the checkpoint of an unfinished debate, its turns loaded (see
+    ``DebateCheckpoint.transcript``), or ``None``."""
+    with db.SessionLocal() as session:
+        return session.get(
+            DebateCheckpoint, debate_id, options=[selectinload(DebateCheckpoint.turns)]
+        )
+
+
+def purge_stale_checkpoints(max_age_seconds: float) -> int:
+    """Delete checkpoints not updated for ``max_age_seconds``, and their
+    turns; return how many.
+
+    A debate nobody came back to resume would otherwise keep its checkpoint
+    forever.
+    """
+    cutoff = db.utcnow() - timedelta(seconds=max_age_seconds)
+    stale = select(DebateCheckpoint.id).where(DebateCheckpoint.updated_at < cutoff)
+    with db.session_scope() as session:
+        session.execute(delete(DebateTurn).where(DebateTurn.debate_id.in_(stale)))
+        result = session.execute(
+            delete(DebateCheckpoint).where(DebateCheckpoint.updated_at < cutoff)
+        )
+        return result.rowcount
+
+
+def train_compression_dictionary(samples: int = 2000, size: int = 112_640) -> int:
+    """Train a zstd dictionary on the transcripts and scores of the
+    ``samples`` most recently completed debates, store it as the one new
+    rows are compressed with, and return its id (see api/compression.py)."""
+    with db.SessionLocal() as session:
+        rows = session.execute(
+            select(Debate.transcript, Debate.argument_scores)
+            .order_by(Debate.completed_at.desc())
+            .limit(samples)
+        ).all()
+    dictionary_id, data = compression.train_dictionary(
+        [compression.dumps(value) for row in rows for value in row if value is not None], size
+    )
+    with db.session_scope() as session:
+        session.merge(CompressionDictionary(id=dictionary_id, data=data, created_at=db.utcnow()))
+    compression.reload_dictionaries()
+    return dictionary_id
+
+
+def recompress_debates(batch_size: int = 500) -> int:
+    """Rewrite the stored transcript, scores and detail body of every debate
+    not yet stored the way ``DEBATE_COMPRESSION`` now writes them (or saved
+    before detail bodies were), ``batch_size`` rows per transaction; return
+    how many.
+
+    Walks the table by primary key, reading the stored bytes as they are,
+    so rows already current are skipped without decompressing them and a
+    stopped run picks up where it left off when rerun.
+    """
+    rewritten = 0
+    after = ""
+    while True:
+        with db.session_scope() as session:
+            rows = session.execute(
+                text("SELECT id, transcript, argument_scores, detail FROM debates"
+                     " WHERE id > :after ORDER BY id LIMIT :limit"),
+                {"after": after, "limit": batch_size},
+            ).all()
+            if not rows:
+                return rewritten
+            stale = [
+                row.id for row in rows
+                if row.detail is None
+                or not all(compression.is_current(value) for value in row[1:])
+            ]
+            if stale:
+                debates = session.scalars(
+                    select(Debate).options(undefer_group("payload")).where(Debate.id.in_(stale))
+                ).all()
+                columns = [{**_summary(debate), "transcript": debate.transcript,
+                            "argument_scores": debate.argument_scores} for debate in debates]
+                session.execute(update(Debate), [
+                    {"id": row["id"], "transcript": row["transcript"],
+                     "argument_scores": row["argument_scores"], **stored_detail(row)}
+                    for row in columns
+                ])
+        _detail_cache.discard(stale)
+        rewritten += len(stale)
+        after = rows[-1].id
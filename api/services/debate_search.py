@@ -0,0 +1,154 @@
+"""Full-text search over finished debates, on SQLite's FTS5.
+
+``debates_fts`` is an FTS5 table beside ``debates`` holding, per debate, its
+topic, the text of every turn, and the judge's argument summaries; its rowid
+is the debate row's rowid, so a hit joins back with a primary-key lookup.
+``save_completed_debates`` writes it in the same transaction as the debate
+(:func:`index_debates`), so the two never disagree. Rows saved before the
+table existed are indexed by ``python main.py search-backfill``
+(:func:`backfill`).
+
+Search runs in the database the debates already live in — no separate
+search service. It needs SQLite with FTS5 (standard in Python's ``sqlite3``);
+on any other ``DATABASE_URL`` it is disabled and :func:`available` says so.
+"""
+import html
+from typing import Optional
+
+from sqlalchemy import DateTime, text
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.orm import Session
+
+from api import db
+from api.compression import decode
+
+# Porter stemming, so "regulate" also finds "regulation"/"regulating". The
+# prefix indexes serve the short half-typed last word (see match_expression),
+# which would otherwise expand to every indexed term it begins.
+_CREATE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS debates_fts"
+    " USING fts5(topic, content, arguments, tokenize='porter unicode61', prefix='2 3')"
+)
+# bm25 weights per column, in table order: a topic hit outranks an argument
+# summary hit, which outranks a passing mention in the transcript.
+_RANK = "bm25(debates_fts, 10.0, 1.0, 3.0)"
+# Snippet delimiters no transcript contains; swapped for <mark> after escaping.
+_OPEN, _CLOSE = "\x02", "\x03"
+_SNIPPET_TOKENS = 16
+
+
+def available(connection: Connection) -> bool:
+    """Whether this database can hold the search index (SQLite only)."""
+    return connection.dialect.name == "sqlite"
+
+
+def create_index(connection: Connection) -> None:
+    """Create ``debates_fts`` if it isn't there yet (from ``init_db``)."""
+    if available(connection):
+        connection.execute(text(_CREATE))
+
+
+def _document(topic: str, transcript: list[dict], argument_scores: Optional[dict]) -> dict:
+    scores = argument_scores or {}
+    arguments = [
+        argument.get("summary", "")
+        for side in ("pro_arguments", "con_arguments")
+        for argument in scores.get(side) or []
+    ]
+    return {
+        "topic": topic,
+        "content": "\n".join(entry.get("content", "") for entry in transcript),
+        "arguments": "\n".join(arguments),
+    }
+
+
+def index_debates(session: Session, debates: list[dict]) -> None:
+    """(Re)index debates — ``Debate`` column dicts with ``id``, ``topic``,
+    ``transcript`` and ``argument_scores`` — in ``session``'s transaction.
+    Their rows must already be written (the rowid keys the index entry)."""
+    if not debates or not available(session.connection()):
+        return
+    session.execute(
+        text("INSERT OR REPLACE INTO debates_fts (rowid, topic, content, arguments)"
+             " SELECT rowid, :topic, :content, :arguments FROM debates WHERE id = :id"),
+        [{"id": debate["id"], **_document(debate["topic"], debate["transcript"],
+                                          debate["argument_scores"])}
+         for debate in debates],
+    )
+
+
+def backfill(batch_size: int = 500, rebuild: bool = False) -> int:
+    """Index every debate missing from ``debates_fts``, ``batch_size`` rows
+    per transaction; return how many. ``rebuild`` drops and recreates the
+    table first, reindexing everything with the current table options."""
+    indexed = 0
+    with db.engine.begin() as connection:
+        if not available(connection):
+            return 0
+        if rebuild:
+            connection.execute(text("DROP TABLE IF EXISTS debates_fts"))
+        create_index(connection)
+    last_rowid = 0
+    while True:
+        with db.engine.begin() as connection:
+            rows = connection.execute(
+                text("SELECT d.rowid AS rowid, d.topic, d.transcript, d.argument_scores"
+                     " FROM debates AS d LEFT JOIN debates_fts AS f ON f.rowid = d.rowid"
+                     " WHERE d.rowid > :after AND f.rowid IS NULL"
+                     " ORDER BY d.rowid LIMIT :limit"),
+                {"after": last_rowid, "limit": batch_size},
+            ).all()
+            if not rows:
+                return indexed
+            connection.execute(
+                text("INSERT INTO debates_fts (rowid, topic, content, arguments)"
+                     " VALUES (:rowid, :topic, :content, :arguments)"),
+                [{"rowid": row.rowid, **_document(row.topic, decode(row.transcript) or [],
+                                                  decode(row.argument_scores))}
+                 for row in rows],
+            )
+        indexed += len(rows)
+        last_rowid = rows[-1].rowid
+
+
+def match_expression(query: str) -> str:
+    """The user's words as an FTS5 query: each one quoted (so punctuation and
+    operators are just text), all required, the last matched as a prefix so
+    a half-typed word still finds results."""
+    terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _highlight(snippet: str) -> str:
+    """Escape the snippet for HTML, then mark the matched terms."""
+    return html.escape(snippet).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def search(session: Session, query: str, limit: int = 20) -> list[dict]:
+    """Debates matching ``query``, best first: each summary with a
+    ``snippet`` of the best-matching column (HTML-escaped, hits wrapped in
+    ``<mark>``) and its ``rank`` (bm25; lower is better)."""
+    expression = match_expression(query)
+    if not expression:
+        return []
+    # Two steps: rank every match by bm25 but keep only the rowids of the best
+    # ``limit``, then build snippets — the expensive part — for those alone,
+    # each a rowid lookup in the index (CROSS JOIN fixes that join order).
+    rows: list[Row] = session.execute(
+        text(
+            "WITH top AS MATERIALIZED ("
+            f" SELECT rowid, {_RANK} AS rank FROM debates_fts"
+            " WHERE debates_fts MATCH :expression ORDER BY rank LIMIT :limit)"
+            " SELECT d.id, d.topic, d.pro_style, d.con_style, d.winner, d.message_count,"
+            " d.created_at, d.completed_at,"
+            f" snippet(debates_fts, -1, :open, :close, '…', {_SNIPPET_TOKENS}) AS snippet,"
+            " top.rank"
+            " FROM top CROSS JOIN debates_fts ON debates_fts.rowid = top.rowid"
+            " CROSS JOIN debates AS d ON d.rowid = top.rowid"
+            " WHERE debates_fts MATCH :expression ORDER BY top.rank"
+        ).columns(created_at=DateTime, completed_at=DateTime),
+        {"expression": expression, "open": _OPEN, "close": _CLOSE, "limit": limit},
+    ).all()
+    return [{**row._asdict(), "snippet": _highlight(row.snippet)} for row in rows]
@@ -1,6 +1,9 @@
 import asyncio
+import heapq
 import logging
+import secrets
 import uuid
+from contextlib import suppress
 from datetime import timedelta
 from typing import AsyncGenerator, Optional
 
@@ -17,26 +20,79 @@ from src.debate_engine import (
     DEFAULT_WORD_LIMITS,
     format_audience_vote,
 )
+from src.judge_panel import JudgePanel
 from config import (
     NUM_REBUTTAL_ROUNDS,
+    JUDGE_PANEL_SIZE,
     MAX_LIVE_SESSIONS,
+    SESSION_MEMORY_BUDGET_BYTES,
+    AGENT_FOOTPRINT_BYTES,
+    ADMISSION_QUEUE_SIZE,
+    ADMISSION_POLL_SECONDS,
+    ADMISSION_DEFAULT_DEBATE_SECONDS,
     SESSION_TTL_SECONDS,
+    SESSION_IDLE_SECONDS,
+    MAX_DEBATE_SECONDS,
     SESSION_SWEEP_INTERVAL_SECONDS,
+    SESSION_STALE_SECONDS,
+    RECONNECT_GRACE_SECONDS,
 )
 from api import db
-from api.services.debate_repository import save_completed_debate
-from api.schemas.debate import Speaker, WSMessageType
-from messages import VOTE_PROMPT, AI_SERVICE_UNAVAILABLE
+from api.models import FAILED
+from api.services.debate_repository import (
+    debate_row,
+    load_checkpoint,
+    save_checkpoint,
+    set_checkpoint_status,
+)
+from api.services.debate_writer import DebateWriter
+from api.services.deadlines import DeadlineKind, DeadlineScheduler
+from api.services.metrics import Counter, Gauge, Histogram
+from api.services.session_store import (
+    WORKER_ID,
+    SessionRecord,
+    SessionStore,
+    build_session_store,
+)
+from api.schemas.debate import DebatePhase, Speaker, WSMessageType
+from messages import (
+    VOTE_PROMPT,
+    AI_SERVICE_UNAVAILABLE,
+    DEBATE_ALREADY_RUNNING,
+    DEBATE_HOST_LEFT,
+    DEBATE_TIMED_OUT,
+)
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# How long the WebSocket route waits for the audience vote before defaulting to
-# a tie (see api/routes/websocket.py). This is the single authoritative bound on
-# the audience vote; run_debate itself just blocks until the vote is submitted.
+# How long the audience has to vote before a tie is recorded for them. The
+# VOTE deadline (see DebateService) submits the TIE; run_debate just blocks
+# until a vote is submitted, and the WebSocket route stops waiting for the
+# client once one is.
 VOTE_TIMEOUT_SECONDS = 300
 
+# Scheduler key of the recurring shared-store sweep (not a debate id).
+_STORE_SWEEP_KEY = "*"
+
+# Footprint estimate constants (see DebateSession.footprint): the fixed cost of
+# a session object, the per-entry cost of a transcript dict beyond its text,
+# and the transcript size assumed for a debate until one has been measured.
+_SESSION_BASE_BYTES = 4 * 1024
+_ENTRY_OVERHEAD_BYTES = 256
+_TRANSCRIPT_PRIOR_BYTES = 64 * 1024
+
+ADMISSION_WAIT = Histogram(
+    "debate_admission_wait_seconds",
+    "Time a debate's socket waited in the admission queue before generating.",
+    buckets=(0.1, 1, 5, 15, 30, 60, 120, 300, 600, 1800),
+)
+ADMISSION_REJECTED = Counter(
+    "debate_admission_rejected_total",
+    "Debates refused with HTTP 429 because the admission queue was full.",
+)
+
 
 class DebateSession(DebateState):
     """Represents an active debate session.
@@ -53,18 +109,85 @@ class DebateSession(DebateState):
         self.pro_style = pro_style
         self.con_style = con_style
         self.created_at = db.utcnow()
+        # Handed to the client that created the debate; a socket reconnecting
+        # while the session has no driver gets the role back only with it.
+        self.driver_token = secrets.token_urlsafe(16)
         self.vote: Optional[str] = None
         self.vote_event = asyncio.Event()
         # ``started`` flips to True the moment a WebSocket drives this session via
         # ``run_debate`` (see below). A session that is created via POST but never
         # connected stays ``started=False`` and is reclaimed by the TTL sweeper.
         self.started = False
+        # How many transcript entries are in ``debate_turns`` (see _checkpoint).
+        self.checkpointed_turns = 0
         # Agents are built lazily in ``run_debate`` (``ensure_agents``), not here:
         # constructing the three ``ChatAnthropic`` clients up-front for a session
         # that may never be driven by a socket is exactly what leaked memory.
         self.pro_agent: Optional[DebateAgent] = None
         self.con_agent: Optional[DebateAgent] = None
         self.judge_agent: Optional[DebateAgent] = None
+        # Set once the admission queue lets this debate start generating (see
+        # ``DebateService._wait_for_admission``); ``admitted_at`` is loop time.
+        self.admitted = False
+        self.admitted_at: Optional[float] = None
+        # Deadline bookkeeping (see DebateService): the task driving the run,
+        # the deadline that ended it (if one did), and when it last streamed.
+        self.task: Optional[asyncio.Task] = None
+        self.expired: Optional[DeadlineKind] = None
+        self.last_active = 0.0
+        # Memory accounting (see ``footprint``): text of the turn being
+        # streamed, the transcript measured so far, and the projected peak
+        # this session was admitted against.
+        self.buffered_bytes = 0
+        self.reserved_bytes = 0
+        # What this session counts for in DebateService's running total, as
+        # of its last re-measure (see ``DebateService._charge``).
+        self.charged_bytes = 0
+        # The WebSocket route's SocketSender while a socket drives the
+        # session, and the BroadcastHub its spectators subscribe to; frames
+        # queued on either count as buffered too.
+        self.outbox = None
+        self.hub = None
+        self._measured_entries = 0
+        self._transcript_bytes = 0
+
+    @property
+    def agent_count(self) -> int:
+        """How many agent clients this session holds (0 until they are built)."""
+        if self.pro_agent is None:
+            return 0
+        judges = self.judge_agent.judges if isinstance(self.judge_agent, JudgePanel) else (1,)
+        return 2 + len(judges)
+
+    def footprint(self) -> dict[str, int]:
+        """Approximate bytes this session holds, by part.
+
+        Transcript text (one byte per character plus a per-entry overhead,
+        measured incrementally as turns are added), agent clients
+        (``AGENT_FOOTPRINT_BYTES`` each), and what is buffered for sockets —
+        the turn being streamed and frames queued for its driver and
+        spectators. An estimate for admission and the admin listing, not a
+        heap measurement.
+        """
+        entries = self.transcript
+        if len(entries) < self._measured_entries:
+            self._measured_entries = self._transcript_bytes = 0
+        for entry in entries[self._measured_entries:]:
+            self._transcript_bytes += (
+                _ENTRY_OVERHEAD_BYTES + len(entry["speaker"]) + len(entry["content"])
+            )
+        self._measured_entries = len(entries)
+        agents = AGENT_FOOTPRINT_BYTES * self.agent_count
+        buffered = self.buffered_bytes
+        for queue in (self.outbox, self.hub):
+            if queue is not None:
+                buffered += queue.buffered_bytes
+        return {
+            "transcript_bytes": self._transcript_bytes,
+            "agent_bytes": agents,
+            "buffered_bytes": buffered,
+            "total_bytes": _SESSION_BASE_BYTES + self._transcript_bytes + agents + buffered,
+        }
 
     def ensure_agents(self) -> None:
         """Build the Pro/Con/Judge agents on first use (idempotent)."""
@@ -91,92 +214,494 @@ class DebateSession(DebateState):
         self.started = True
         return True
 
+    def expire(self, kind: DeadlineKind) -> None:
+        """End the run because ``kind``'s deadline passed.
+
+        Cancels the task driving ``run_debate``, which turns the cancellation
+        into an error event (the WebSocket route's runner does the same if the
+        debate was still queued). Only the first call counts.
+        """
+        if self.expired is None and self.task is not None and not self.task.done():
+            self.expired = kind
+            self.task.cancel()
+
+    def to_record(self) -> SessionRecord:
+        """The shareable metadata of this session (see ``session_store``)."""
+        return SessionRecord(
+            debate_id=self.debate_id,
+            topic=self.topic,
+            pro_style=self.pro_style,
+            con_style=self.con_style,
+            created_at=self.created_at,
+            updated_at=self.created_at,
+        )
+
+    @classmethod
+    def from_record(cls, record: SessionRecord) -> "DebateSession":
+        """Rebuild a session another worker created, from its shared record."""
+        session = cls(record.debate_id, record.topic, record.pro_style, record.con_style)
+        session.created_at = record.created_at
+        session.started = record.started
+        return session
+
 
 class SessionLimitExceeded(Exception):
-    """Raised by :meth:`DebateService.create_debate` when the live-session cap
-    (``MAX_LIVE_SESSIONS``) is reached. The REST route turns this into HTTP 429."""
+    """Raised by :meth:`DebateService.create_debate` when the admission queue
+    (``ADMISSION_QUEUE_SIZE``) is full. The REST route turns this into HTTP 429."""
 
 
 class DebateService:
     """Service for managing debate sessions.
 
-    The live-session registry, the ``MAX_LIVE_SESSIONS`` cap, and the TTL sweeper
-    are all in-memory and **per-process** — they assume a single uvicorn worker.
-    Under multiple workers each process keeps its own registry, so a debate
-    created on one worker is invisible (and its cap uncounted) on another; run a
-    single worker or move to a shared store.
+    Two registries cooperate. ``sessions`` holds this process's live
+    :class:`DebateSession` objects (agents, vote event). ``store`` (a
+    :class:`~api.services.session_store.SessionStore`) holds the shareable
+    metadata: which debates exist, which are generating (at most
+    ``MAX_LIVE_SESSIONS``), the FIFO admission queue, and which worker is
+    running each one. With the default in-memory store everything is
+    per-process, as with a single uvicorn worker; with ``SESSION_STORE=sqlite``
+    the cap, the queue and ownership are shared, so a debate created on one
+    worker can be driven from another (see :meth:`get_session`).
+
+    Admission is bounded by memory: a debate starts generating only while
+    this process's sessions plus its projected peak footprint fit in
+    ``SESSION_MEMORY_BUDGET_BYTES`` (see :meth:`projected_footprint`), with
+    ``MAX_LIVE_SESSIONS`` as a ceiling on generating debates across workers.
+    A socket that connects while there is no room waits in the queue —
+    ``run_debate`` streams it ``QUEUE_POSITION`` events — instead of the client
+    being turned away and retrying in a tight loop. HTTP 429 is reserved for a
+    full queue (``ADMISSION_QUEUE_SIZE`` sessions not yet generating).
+
+    Every timeout a session has lives in one :class:`DeadlineScheduler`
+    (``deadlines``), keyed by debate id: ``ORPHAN`` from creation until a
+    socket drives it (``SESSION_TTL_SECONDS``); ``IDLE`` and ``MAX_DURATION``
+    from admission (``SESSION_IDLE_SECONDS`` without a streamed event,
+    ``MAX_DEBATE_SECONDS`` overall); ``VOTE`` while the audience vote is open
+    (``VOTE_TIMEOUT_SECONDS``); ``RECONNECT`` while the driving socket is gone
+    (``RECONNECT_GRACE_SECONDS``). Nothing scans the session registry.
+
+    Nor does admission: the memory committed by this process's sessions and
+    how many of them are generating are running totals, re-measured for a
+    session when it registers, is admitted, and completes a turn, and taken
+    off when it is dropped. Only the admin listing (``memory_snapshot``)
+    walks the sessions.
     """
 
-    def __init__(self):
+    def __init__(self, store: Optional[SessionStore] = None, worker_id: str = WORKER_ID,
+                 deadlines: Optional[DeadlineScheduler] = None,
+                 writer: Optional[DebateWriter] = None):
         self.sessions: dict[str, DebateSession] = {}
+        self._committed_bytes = 0
+        self._admitted = 0
+        self.store: SessionStore = store if store is not None else build_session_store()
+        # Who owns the runs this service admits (one per process in production).
+        self.worker_id = worker_id
+        self.deadlines = deadlines if deadlines is not None else DeadlineScheduler()
+        self.deadlines.on(DeadlineKind.ORPHAN, self._expire_orphan)
+        self.deadlines.on(DeadlineKind.VOTE, self._expire_vote)
+        self.deadlines.on(DeadlineKind.IDLE, self._expire_idle)
+        for kind in (DeadlineKind.MAX_DURATION, DeadlineKind.RECONNECT):
+            self.deadlines.on(kind, lambda debate_id, kind=kind: self._end_run(debate_id, kind))
+        self.deadlines.on(DeadlineKind.STORE_SWEEP, self._sweep_store)
+        # Saves finished debates write-behind (api/services/debate_writer.py).
+        self.writer = writer if writer is not None else DebateWriter()
+        self.orphans_expired = 0
+        # Set (and replaced) on every release, waking queued sockets so they
+        # re-check their place at once rather than at the next poll.
+        self._slot_freed = asyncio.Event()
+        # Moving average of how long an admitted debate runs, for wait estimates.
+        self._avg_run_seconds = ADMISSION_DEFAULT_DEBATE_SECONDS
+        # Moving average of a finished debate's transcript size, for projections.
+        self._avg_transcript_bytes = _TRANSCRIPT_PRIOR_BYTES
 
     def create_debate(self, topic: str, pro_style: str, con_style: str) -> DebateSession:
         """Create a new debate session.
 
-        Raises :class:`SessionLimitExceeded` if the number of live sessions has
-        reached ``MAX_LIVE_SESSIONS``. Expired orphans are swept first so a
-        backlog of abandoned sessions doesn't wrongly reject a fresh request.
+        Raises :class:`SessionLimitExceeded` if ``ADMISSION_QUEUE_SIZE``
+        sessions — across every worker sharing the store — are already waiting
+        to generate. Only when the queue looks full are overdue deadlines run
+        (and a shared store swept) before the one retry, so a backlog of
+        abandoned sessions doesn't wrongly reject a fresh request while the
+        common path never scans anything.
         """
-        self.sweep_expired_sessions()
-        if len(self.sessions) >= MAX_LIVE_SESSIONS:
+        debate_id = str(uuid.uuid4())
+        session = DebateSession(debate_id, topic, pro_style, con_style)
+        if not self.store.reserve(session.to_record(), ADMISSION_QUEUE_SIZE) and (
+            not self.sweep_expired_sessions()
+            or not self.store.reserve(session.to_record(), ADMISSION_QUEUE_SIZE)
+        ):
+            ADMISSION_REJECTED.inc()
             logger.warning(
-                "Debate rejected: live-session cap reached (%d/%d)",
-                len(self.sessions), MAX_LIVE_SESSIONS,
+                "Debate rejected: admission queue full (%d waiting)", ADMISSION_QUEUE_SIZE,
             )
             raise SessionLimitExceeded(
-                f"Live session cap of {MAX_LIVE_SESSIONS} reached"
+                f"Admission queue of {ADMISSION_QUEUE_SIZE} sessions is full"
             )
 
-        debate_id = str(uuid.uuid4())
-        session = DebateSession(debate_id, topic, pro_style, con_style)
-        self.sessions[debate_id] = session
+        self._register(session)
+        self.deadlines.schedule(debate_id, DeadlineKind.ORPHAN, SESSION_TTL_SECONDS)
         logger.info("Debate created: id=%s topic=%r", debate_id, topic)
         return session
 
     def get_session(self, debate_id: str) -> Optional[DebateSession]:
-        """Get an existing debate session."""
-        return self.sessions.get(debate_id)
+        """Get an existing debate session.
+
+        A debate created by another worker (its POST landed elsewhere) is
+        rebuilt here from the shared record; agents are built lazily, so this
+        is cheap. One already being run by another worker comes back with
+        ``started=True`` and is not registered locally — the caller refuses it.
+        """
+        session = self.sessions.get(debate_id)
+        if session is not None:
+            return session
+        record = self.store.get(debate_id)
+        if record is None:
+            return None
+        session = DebateSession.from_record(record)
+        if not record.started:
+            self._register(session)
+            age = (db.utcnow() - record.created_at).total_seconds()
+            self.deadlines.schedule(
+                debate_id, DeadlineKind.ORPHAN, max(0.0, SESSION_TTL_SECONDS - age)
+            )
+        return session
+
+    def start_session(self, session: DebateSession) -> bool:
+        """Claim ``session`` for a socket in this process; ``False`` if taken.
+
+        :meth:`DebateSession.try_start` settles races between sockets in this
+        process. Between workers, the store's atomic admission settles them:
+        only one worker's ``run_debate`` is ever admitted (see
+        :meth:`_wait_for_admission`).
+        """
+        return session.try_start()
+
+    def queue_estimate(self) -> tuple[int, float]:
+        """``(position, estimated_wait_seconds)`` for the debate just created.
+
+        Every session in the store — generating, queued, or created but not yet
+        connected — is counted as ahead of it. Position 0 means a generating
+        slot should be free when its socket connects.
+        """
+        position = max(0, self.store.count() - self.capacity())
+        return position, self._estimated_wait(position)
+
+    def _estimated_wait(self, position: int) -> float:
+        """Queue position -> seconds: every slot frees up about once per average
+        debate, so ``position`` waiters ahead clear at :meth:`capacity` per
+        average run."""
+        return round(position * self._avg_run_seconds / self.capacity(), 1)
+
+    def projected_footprint(self, session: Optional[DebateSession] = None) -> int:
+        """Bytes a debate is expected to peak at: its agents (two debaters and
+        ``JUDGE_PANEL_SIZE`` judges, or however many it already holds) plus
+        the larger of its current transcript and the recent average finished
+        one. Without ``session``, a fresh debate's projection."""
+        agents, transcript = 2 + JUDGE_PANEL_SIZE, self._avg_transcript_bytes
+        if session is not None:
+            agents = max(agents, session.agent_count)
+            transcript = max(transcript, session.footprint()["transcript_bytes"])
+        return _SESSION_BASE_BYTES + AGENT_FOOTPRINT_BYTES * agents + int(transcript)
+
+    def capacity(self) -> int:
+        """How many fresh debates this process's memory budget holds at once,
+        capped by ``MAX_LIVE_SESSIONS`` (never less than one)."""
+        fits = SESSION_MEMORY_BUDGET_BYTES // self.projected_footprint()
+        return max(1, min(MAX_LIVE_SESSIONS, fits))
+
+    def memory_committed(self) -> int:
+        """Bytes this process's sessions hold against the budget: an admitted
+        session counts at the larger of its footprint and the peak it was
+        admitted against, any other session at its footprint, each as of its
+        last re-measure (see :meth:`_charge`)."""
+        return self._committed_bytes
+
+    def _register(self, session: DebateSession) -> None:
+        self.sessions[session.debate_id] = session
+        self._charge(session)
+
+    def _charge(self, session: DebateSession) -> None:
+        """Re-measure what ``session`` holds against the budget and move the
+        running total by the difference (if it is still registered)."""
+        if self.sessions.get(session.debate_id) is not session:
+            return
+        charge = max(session.footprint()["total_bytes"], session.reserved_bytes)
+        self._committed_bytes += charge - session.charged_bytes
+        session.charged_bytes = charge
+
+    def _forget(self, debate_id: str) -> None:
+        """Drop a local session and take it off the running totals."""
+        session = self.sessions.pop(debate_id, None)
+        if session is not None:
+            self._committed_bytes -= session.charged_bytes
+            session.charged_bytes = 0
+            if session.admitted:
+                self._admitted -= 1
+
+    def clear_sessions(self) -> None:
+        """Drop every local session (the test suite resets the singleton with this)."""
+        self.sessions.clear()
+        self._committed_bytes = self._admitted = 0
+
+    def _fits_memory_budget(self, session: DebateSession) -> bool:
+        # With nothing generating here, admit regardless: a budget smaller
+        # than one debate must not wedge the queue.
+        if not self._admitted:
+            return True
+        committed = self._committed_bytes - session.charged_bytes
+        return committed + self.projected_footprint(session) <= SESSION_MEMORY_BUDGET_BYTES
+
+    def memory_snapshot(self, limit: int = 20) -> dict:
+        """Budget usage and the ``limit`` largest sessions in this process."""
+        footprints = [(session, session.footprint()) for session in self.sessions.values()]
+        largest = heapq.nlargest(limit, footprints, key=lambda pair: pair[1]["total_bytes"])
+        return {
+            "budget_bytes": SESSION_MEMORY_BUDGET_BYTES,
+            "committed_bytes": self.memory_committed(),
+            "in_use_bytes": sum(fp["total_bytes"] for _, fp in footprints),
+            "projected_debate_bytes": self.projected_footprint(),
+            "capacity": self.capacity(),
+            "sessions": len(footprints),
+            "largest": [
+                {
+                    "debate_id": session.debate_id,
+                    "topic": session.topic,
+                    "phase": session.phase.value,
+                    "admitted": session.admitted,
+                    **footprint,
+                }
+                for session, footprint in largest
+            ],
+        }
+
+    async def _in_store(self, method, *args):
+        """Call a store method from the event loop: inline for the in-memory
+        store (dict operations), off the loop for a shared one, whose SQLite
+        transactions can wait on other workers' (see api/services/session_store.py)."""
+        if self.store.shared:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def _release(self, debate_id: str) -> None:
+        self._forget(debate_id)
+        self.store.release(debate_id)
+        self.deadlines.cancel(debate_id)
+        self._slot_freed.set()
+        self._slot_freed = asyncio.Event()
+
+    async def _wait_for_admission(self, session: DebateSession) -> AsyncGenerator[dict, None]:
+        """Queue ``session`` for a generating slot; yield its position as it moves.
+
+        Returns once the store admits the session (``session.admitted``) or
+        reports that another worker admitted it first (``admitted`` stays
+        False). While its projected footprint doesn't fit this process's
+        memory budget it stays queued in FIFO order but is not admitted.
+        Re-checks whenever a session is released in this process and at least
+        every ``ADMISSION_POLL_SECONDS`` (releases on other workers). A
+        session admitted straight away yields nothing.
+        """
+        loop = asyncio.get_running_loop()
+        queued_since = loop.time()
+        last_position = None
+        while True:
+            fits = self._fits_memory_budget(session)
+            position = await self._in_store(
+                self.store.admit, session.debate_id, self.worker_id,
+                MAX_LIVE_SESSIONS if fits else 0, db.utcnow(),
+            )
+            if position is None:
+                return
+            if position == 0:
+                session.admitted = True
+                self._admitted += 1
+                session.reserved_bytes = self.projected_footprint(session)
+                self._charge(session)
+                session.admitted_at = loop.time()
+                ADMISSION_WAIT.observe(session.admitted_at - queued_since)
+                return
+            if position != last_position:
+                last_position = position
+                yield {
+                    "type": WSMessageType.QUEUE_POSITION,
+                    "debate_id": session.debate_id,
+                    "data": {
+                        "position": position,
+                        "estimated_wait_seconds": self._estimated_wait(position),
+                    },
+                }
+            slot_freed = self._slot_freed
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(slot_freed.wait(), ADMISSION_POLL_SECONDS)
+
+    async def restore_session(self, debate_id: str) -> Optional[DebateSession]:
+        """Rebuild a live session from its durable checkpoint, if it has one.
+
+        This is what lets a client reconnecting to ``/ws/debates/{id}`` after a
+        server restart (or after a failed turn) continue from the last
+        completed turn: the session comes back with its transcript, phase, and
+        original ``created_at``, and ``run_debate`` resumes the engine at
+        ``len(transcript)``. Returns ``None`` when there is no checkpoint.
+        Raises :class:`SessionLimitExceeded` if the admission queue is full.
+        """
+        checkpoint = await asyncio.to_thread(load_checkpoint, debate_id)
+        if checkpoint is None:
+            return None
+        # Another connection may have restored it while we were reading.
+        existing = self.get_session(debate_id)
+        if existing is not None:
+            return existing
+        session = DebateSession(
+            debate_id, checkpoint.topic, checkpoint.pro_style, checkpoint.con_style
+        )
+        session.transcript = list(checkpoint.transcript)
+        session.checkpointed_turns = len(session.transcript)
+        session.phase = DebatePhase(checkpoint.phase)
+        session.created_at = checkpoint.created_at
+        if checkpoint.driver_token is not None:
+            session.driver_token = checkpoint.driver_token
+        if not await self._in_store(self.store.reserve, session.to_record(), ADMISSION_QUEUE_SIZE):
+            raise SessionLimitExceeded(
+                f"Admission queue of {ADMISSION_QUEUE_SIZE} sessions is full"
+            )
+        existing = self.sessions.get(debate_id)  # restored while we reserved
+        if existing is not None:
+            return existing
+        self._register(session)
+        self.deadlines.schedule(debate_id, DeadlineKind.ORPHAN, SESSION_TTL_SECONDS)
+        logger.info(
+            "Debate restored from checkpoint: id=%s turns=%d",
+            debate_id, len(session.transcript),
+        )
+        return session
+
+    async def _checkpoint(self, session: DebateSession) -> None:
+        """Durably record the session's progress after a completed step.
+
+        Appends the turns completed since the last checkpoint (normally one)
+        to ``debate_turns``, off the event loop. A failed write is logged, not
+        raised: losing a checkpoint only costs resumability, never the live
+        debate, and its turns go out with the next one. Also marks the session
+        as making progress in the store, so it never looks stale, and
+        re-measures its memory charge now that its transcript has grown.
+        """
+        self._charge(session)
+        await self._in_store(self.store.touch, session.debate_id, db.utcnow())
+        first = session.checkpointed_turns
+        turns = session.transcript[first:]
+        try:
+            await asyncio.to_thread(
+                save_checkpoint,
+                debate_id=session.debate_id,
+                topic=session.topic,
+                pro_style=session.pro_style,
+                con_style=session.con_style,
+                phase=session.phase.value,
+                turns=turns,
+                first_seq=first,
+                created_at=session.created_at,
+                driver_token=session.driver_token,
+            )
+        except Exception:
+            logger.exception("Failed to checkpoint debate id=%s", session.debate_id)
+        else:
+            session.checkpointed_turns = first + len(turns)
+
+    async def _mark_failed(self, session: DebateSession) -> None:
+        """Record that this run stopped short (the debate stays resumable)."""
+        try:
+            await asyncio.to_thread(set_checkpoint_status, session.debate_id, FAILED)
+        except Exception:
+            logger.exception("Failed to mark debate failed id=%s", session.debate_id)
 
     def sweep_expired_sessions(self) -> int:
-        """Evict orphan sessions and return how many were removed.
-
-        An *orphan* is a session that was created (via ``POST /api/debates``) but
-        never driven by a WebSocket (``started is False``) and whose age exceeds
-        ``SESSION_TTL_SECONDS``. A live debate is never swept — once a socket
-        starts it, ``started`` is True and its cleanup is ``run_debate``'s
-        ``finally``. Runs synchronously with no ``await``, so it can't race a
-        concurrent create/run on the single-threaded event loop.
+        """Run overdue deadlines now and sweep a shared store; return how many
+        sessions were evicted.
+
+        Deadlines normally fire from the scheduler's own loop timer; running
+        them here as well makes the call correct from sync code and on the
+        create path. The store sweep (shared stores only) reclaims orphans
+        other workers created and sessions whose worker died mid-debate (no
+        progress for ``SESSION_STALE_SECONDS``) — records no local deadline
+        covers. A live debate is never evicted by its orphan deadline: that is
+        cancelled when a socket starts it, and its cleanup is ``run_debate``'s
+        ``finally``.
         """
-        cutoff = db.utcnow() - timedelta(seconds=SESSION_TTL_SECONDS)
-        expired = [
-            debate_id
-            for debate_id, session in self.sessions.items()
-            if not session.started and session.created_at < cutoff
-        ]
-        for debate_id in expired:
-            self.sessions.pop(debate_id, None)
-        if expired:
-            logger.info("Swept %d expired orphan session(s)", len(expired))
-        return len(expired)
-
-    async def run_session_sweeper(
-        self, interval: float = SESSION_SWEEP_INTERVAL_SECONDS
-    ) -> None:
-        """Background loop that periodically sweeps expired orphan sessions.
-
-        Started from the app lifespan and cancelled on shutdown. One failing
-        iteration is logged and swallowed so the loop keeps running.
+        before = self.orphans_expired
+        self.deadlines.expire_due()
+        evicted = self.orphans_expired - before
+        if self.store.shared:
+            now = db.utcnow()
+            swept = self.store.sweep(
+                unstarted_before=now - timedelta(seconds=SESSION_TTL_SECONDS),
+                stale_before=now - timedelta(seconds=SESSION_STALE_SECONDS),
+            )
+            for debate_id in swept:
+                self._release(debate_id)
+            evicted += len(swept)
+        if evicted:
+            logger.info("Swept %d expired session(s)", evicted)
+        return evicted
+
+    def start_deadlines(self) -> None:
+        """Arm the deadline scheduler on the running loop (app startup).
+
+        Fires anything already overdue and, with a shared store, starts the
+        recurring store sweep every ``SESSION_SWEEP_INTERVAL_SECONDS``.
         """
+        if self.store.shared:
+            self.deadlines.schedule(
+                _STORE_SWEEP_KEY, DeadlineKind.STORE_SWEEP, SESSION_SWEEP_INTERVAL_SECONDS
+            )
         logger.info(
-            "Session sweeper started: interval=%ss ttl=%ss",
-            interval, SESSION_TTL_SECONDS,
+            "Deadline scheduler started: ttl=%ss idle=%ss max=%ss vote=%ss",
+            SESSION_TTL_SECONDS, SESSION_IDLE_SECONDS, MAX_DEBATE_SECONDS,
+            VOTE_TIMEOUT_SECONDS,
         )
-        while True:
-            await asyncio.sleep(interval)
-            try:
-                self.sweep_expired_sessions()
-            except Exception:
-                logger.exception("Session sweeper iteration failed")
+
+    def _expire_orphan(self, debate_id: str) -> None:
+        session = self.sessions.get(debate_id)
+        if session is not None and not session.started:
+            logger.info("Orphan session expired: id=%s", debate_id)
+            self.orphans_expired += 1
+            self._release(debate_id)
+
+    def _expire_vote(self, debate_id: str) -> None:
+        logger.info("Audience vote timed out for debate_id=%s; recording TIE", debate_id)
+        self.submit_vote(debate_id, "TIE")
+
+    def _expire_idle(self, debate_id: str) -> None:
+        session = self.sessions.get(debate_id)
+        if session is None:
+            return
+        # Streaming only stamps ``last_active``; the deadline is pushed back
+        # lazily here rather than re-scheduled on every chunk.
+        remaining = session.last_active + SESSION_IDLE_SECONDS - self.deadlines.clock()
+        if remaining > 0:
+            self.deadlines.schedule(debate_id, DeadlineKind.IDLE, remaining)
+        else:
+            self._end_run(debate_id, DeadlineKind.IDLE)
+
+    def _end_run(self, debate_id: str, kind: DeadlineKind) -> None:
+        session = self.sessions.get(debate_id)
+        if session is not None:
+            logger.warning("Debate %s deadline passed: id=%s", kind.value, debate_id)
+            session.expire(kind)
+
+    def _sweep_store(self, _key: str) -> None:
+        self.sweep_expired_sessions()
+        self.deadlines.schedule(
+            _STORE_SWEEP_KEY, DeadlineKind.STORE_SWEEP, SESSION_SWEEP_INTERVAL_SECONDS
+        )
+
+    def driver_left(self, debate_id: str) -> None:
+        """The socket driving a live debate dropped: keep the run going, but
+        end it if no driver reattaches within ``RECONNECT_GRACE_SECONDS``."""
+        if debate_id in self.sessions:
+            self.deadlines.schedule(debate_id, DeadlineKind.RECONNECT, RECONNECT_GRACE_SECONDS)
+
+    def driver_joined(self, debate_id: str) -> None:
+        """A socket (re)attached as a live debate's driver."""
+        self.deadlines.cancel(debate_id, DeadlineKind.RECONNECT)
 
     def submit_vote(self, debate_id: str, vote: str):
         """Submit audience vote for a debate."""
@@ -207,16 +732,25 @@ class DebateService:
             "data": {"speaker": speaker.value}
         }
 
-        full_content = ""
+        # Joined once at the end of the turn, not grown chunk by chunk.
+        parts: list[str] = []
+        session.buffered_bytes = 0
         async for chunk in agent.astream_respond(session.get_transcript_text(), instruction):
-            full_content += chunk
+            session.last_active = self.deadlines.clock()
+            parts.append(chunk)
+            session.buffered_bytes += len(chunk)
             yield {
                 "type": WSMessageType.MESSAGE_CHUNK,
                 "debate_id": session.debate_id,
                 "data": {"speaker": speaker.value, "chunk": chunk}
             }
 
+        full_content = "".join(parts)
         session.add_to_transcript(speaker.value, full_content)
+        session.buffered_bytes = 0
+        # Checkpoint before announcing the turn complete, so a turn the client
+        # has seen finish is never regenerated after a restart.
+        await self._checkpoint(session)
 
         yield {
             "type": WSMessageType.MESSAGE_COMPLETE,
@@ -232,26 +766,64 @@ class DebateService:
         event — streaming agent turns token-by-token and waiting for the audience
         vote over the socket. ``DEFAULT_WORD_LIMITS`` keeps the per-phase word
         caps the web UI has always used.
+
+        The debate first waits for a generating slot; while queued it yields
+        ``QUEUE_POSITION`` events (see :meth:`_wait_for_admission`).
         """
-        # Mark the session as driven by a socket so the TTL sweeper leaves it
-        # alone — from here on, cleanup is this method's ``finally`` block. The
+        # Mark the session as driven by a socket and drop its orphan deadline —
+        # from here on, cleanup is this method's ``finally`` block. The
         # WebSocket route has already claimed the session atomically via
         # ``try_start`` (that's what rejects a concurrent second connect); this
         # idempotent set keeps direct callers (e.g. tests) correct too.
         session.started = True
-        logger.info("Debate started: id=%s", session.debate_id)
-
-        yield {
-            "type": WSMessageType.DEBATE_STARTED,
-            "debate_id": session.debate_id,
-            "data": {
-                "topic": session.topic,
-                "pro_style": session.pro_style,
-                "con_style": session.con_style
+        self.deadlines.cancel(session.debate_id, DeadlineKind.ORPHAN)
+        try:
+            async for event in self._wait_for_admission(session):
+                yield event
+        except BaseException:
+            # The socket went away while queued: give up the place in line.
+            self._release(session.debate_id)
+            raise
+        if not session.admitted:
+            # Another worker admitted this debate first; the store record is
+            # its to release, so only the local copy is dropped.
+            self._forget(session.debate_id)
+            yield {
+                "type": WSMessageType.ERROR,
+                "debate_id": session.debate_id,
+                "data": {"message": DEBATE_ALREADY_RUNNING}
             }
+            return
+
+        # Admitted: from here on the run is bounded by its IDLE and
+        # MAX_DURATION deadlines, which cancel this task when they pass.
+        session.task = asyncio.current_task()
+        session.last_active = self.deadlines.clock()
+        self.deadlines.schedule(session.debate_id, DeadlineKind.IDLE, SESSION_IDLE_SECONDS)
+        self.deadlines.schedule(session.debate_id, DeadlineKind.MAX_DURATION, MAX_DEBATE_SECONDS)
+
+        # A session restored from a checkpoint already holds the completed
+        # turns; the engine resumes right after them (see restore_session).
+        resume_at = len(session.transcript)
+        logger.info("Debate started: id=%s resume_at=%d", session.debate_id, resume_at)
+
+        started_data = {
+            "topic": session.topic,
+            "pro_style": session.pro_style,
+            "con_style": session.con_style,
+            "resumed_from": resume_at,
         }
-
+        if resume_at:
+            # Let a reconnecting client render the turns it missed.
+            started_data["transcript"] = list(session.transcript)
         try:
+            # Inside the try, so a socket closing right here is still cleaned up.
+            yield {
+                "type": WSMessageType.DEBATE_STARTED,
+                "debate_id": session.debate_id,
+                "data": started_data,
+            }
+
             # Build the agents now (deferred from __init__) — a session that never
             # reached this point never constructed any ChatAnthropic clients.
             session.ensure_agents()
@@ -264,7 +836,11 @@ class DebateService:
                 word_limits=DEFAULT_WORD_LIMITS,
             )
 
-            for event in engine.events():
+            # The scoreboard's dict form, serialized once for the ARGUMENT_SCORES
+            # event, the saved row, and DEBATE_COMPLETE.
+            scores: Optional[dict] = None
+            for event in engine.events(resume_at=resume_at):
+                session.last_active = self.deadlines.clock()
                 if isinstance(event, PhaseChange):
                     session.phase = event.phase
                     yield {
@@ -284,29 +860,37 @@ class DebateService:
                     session.argument_scores = await event.agent.ascore_arguments(
                         session.get_transcript_text(), event.instruction
                     )
+                    scores = session.argument_scores.model_dump()
                     yield {
                         "type": WSMessageType.ARGUMENT_SCORES,
                         "debate_id": session.debate_id,
-                        "data": {"scores": session.argument_scores.model_dump()}
+                        "data": {"scores": scores}
                     }
 
                 elif isinstance(event, Vote):
+                    # The vote has its own deadline; waiting on the audience is
+                    # not idleness. The VOTE deadline submits TIE for a silent
+                    # client, and the route submits TIE on a disconnect or a
+                    # garbage reply, so the wait below always unblocks.
+                    self.deadlines.cancel(session.debate_id, DeadlineKind.IDLE)
+                    self.deadlines.schedule(
+                        session.debate_id, DeadlineKind.VOTE, VOTE_TIMEOUT_SECONDS
+                    )
                     yield {
                         "type": WSMessageType.VOTE_REQUIRED,
                         "debate_id": session.debate_id,
                         "data": {"message": VOTE_PROMPT}
                     }
-
-                    # Block until the audience vote is submitted. The single
-                    # authoritative timeout lives in the WebSocket route
-                    # (VOTE_TIMEOUT_SECONDS): it collects the client's vote — or
-                    # submits TIE when the client stays silent, disconnects, or
-                    # errors — before resuming us, so this wait always unblocks
-                    # promptly and never hangs on a silent client.
                     await session.vote_event.wait()
+                    self.deadlines.cancel(session.debate_id, DeadlineKind.VOTE)
+                    session.last_active = self.deadlines.clock()
+                    self.deadlines.schedule(
+                        session.debate_id, DeadlineKind.IDLE, SESSION_IDLE_SECONDS
+                    )
 
                     vote_text = format_audience_vote(session.vote)
                     session.add_to_transcript("AUDIENCE", vote_text)
+                    await self._checkpoint(session)
 
                     yield {
                         "type": WSMessageType.VOTE_RECEIVED,
@@ -314,40 +898,41 @@ class DebateService:
                         "data": {"vote": session.vote, "message": vote_text}
                     }
 
-            # Debate finished successfully — persist it so it survives a restart
-            # and shows up in the "past debates" view. The write runs off the
-            # event loop (asyncio.to_thread), and a persistence failure must NOT
-            # sink a debate the user already watched, so it's logged, not raised.
-            try:
-                await asyncio.to_thread(
-                    save_completed_debate,
-                    debate_id=session.debate_id,
-                    topic=session.topic,
-                    pro_style=session.pro_style,
-                    con_style=session.con_style,
-                    transcript=session.transcript,
-                    argument_scores=(
-                        session.argument_scores.model_dump()
-                        if session.argument_scores else None
-                    ),
-                    winner=(session.argument_scores.winner if session.argument_scores else None),
-                    created_at=session.created_at,
-                )
-                logger.info("Debate persisted: id=%s", session.debate_id)
-            except Exception:
-                logger.exception("Failed to persist debate id=%s", session.debate_id)
+            transcript_bytes = session.footprint()["transcript_bytes"]
+            self._avg_transcript_bytes += 0.2 * (transcript_bytes - self._avg_transcript_bytes)
+
+            # Debate finished successfully — hand it to the write-behind writer
+            # so it survives a restart and shows up in the "past debates" view.
+            # That only queues it in memory: DEBATE_COMPLETE never waits on
+            # disk, and a failed write is retried in the background rather
+            # than sinking a debate the user already watched.
+            self.writer.enqueue(debate_row(
+                debate_id=session.debate_id,
+                topic=session.topic,
+                pro_style=session.pro_style,
+                con_style=session.con_style,
+                transcript=list(session.transcript),
+                argument_scores=scores,
+                winner=(session.argument_scores.winner if session.argument_scores else None),
+                created_at=session.created_at,
+            ))
 
             # Debate finished — the engine's final PhaseChange already moved the
-            # session to FINISHED (and emitted the phase_change above).
+            # session to FINISHED (and emitted the phase_change above). The
+            # client already has every entry from MESSAGE_COMPLETE (or the
+            # resume transcript), so the transcript itself isn't re-sent —
+            # only a digest to check it against. The row is only queued
+            # above, not committed, when this frame goes out: a client that
+            # fetches the full copy right away (GET /api/debates/{id}) gets it
+            # only because that endpoint falls back to ``self.writer.get()``
+            # for a debate still pending. The fallback must stay for as long
+            # as the digest replaces the transcript here.
             yield {
                 "type": WSMessageType.DEBATE_COMPLETE,
                 "debate_id": session.debate_id,
                 "data": {
-                    "transcript": session.transcript,
-                    "argument_scores": (
-                        session.argument_scores.model_dump()
-                        if session.argument_scores else None
-                    )
+                    "transcript_digest": session.transcript_digest(),
+                    "argument_scores": scores,
                 }
             }
             logger.info("Debate complete: id=%s", session.debate_id)
@@ -355,24 +940,66 @@ class DebateService:
         except AgentError:
             # A transient LLM failure interrupted the debate. Log the detail
             # server-side and send the client a clean, generic error event —
-            # never a raw exception string.
+            # never a raw exception string. The checkpoint is kept, so
+            # reconnecting resumes after the last completed turn.
             logger.exception("Debate failed (AI service error): id=%s", session.debate_id)
+            await self._mark_failed(session)
             yield {
                 "type": WSMessageType.ERROR,
                 "debate_id": session.debate_id,
                 "data": {"message": AI_SERVICE_UNAVAILABLE}
             }
 
+        except asyncio.CancelledError:
+            if session.expired is None:
+                raise
+            # An IDLE / MAX_DURATION / RECONNECT deadline ended the run (see
+            # DebateSession.expire): report it like any other failure rather
+            # than dropping the socket. The checkpoint is kept.
+            asyncio.current_task().uncancel()
+            logger.warning(
+                "Debate ended by %s deadline: id=%s", session.expired.value, session.debate_id
+            )
+            await self._mark_failed(session)
+            yield {
+                "type": WSMessageType.ERROR,
+                "debate_id": session.debate_id,
+                "data": {"message": (
+                    DEBATE_HOST_LEFT if session.expired == DeadlineKind.RECONNECT
+                    else DEBATE_TIMED_OUT
+                )}
+            }
+
         finally:
             # Evict the (started) session now that it's finished or errored. This
             # is the cleanup path for sessions a socket drove; orphans that never
-            # started are reclaimed by the TTL sweeper instead. Both stores are
-            # per-process (single-worker assumption — see the class docstring).
-            self.sessions.pop(session.debate_id, None)
+            # started are reclaimed by their ORPHAN deadline instead. Releasing
+            # the store record frees its slot under the (possibly shared) cap,
+            # drops the session's remaining deadlines, and wakes the sockets
+            # queued behind it.
+            run_seconds = asyncio.get_running_loop().time() - session.admitted_at
+            self._avg_run_seconds += 0.2 * (run_seconds - self._avg_run_seconds)
+            self._release(session.debate_id)
             logger.info("Session evicted: id=%s", session.debate_id)
 
 
-# Module-level singleton: the one in-memory registry of live sessions, shared by
-# the REST and WebSocket routes. Per-process only (single-worker assumption — see
-# the DebateService docstring). The app lifespan starts run_session_sweeper on it.
+# Module-level singleton: this process's registry of live sessions, shared by
+# the REST and WebSocket routes, over the store chosen by SESSION_STORE (see the
+# DebateService docstring). The app lifespan arms its deadline scheduler.
 debate_service = DebateService()
+
+Gauge(
+    "debate_admission_queue_length",
+    "Sockets waiting in the admission queue for a generating slot.",
+    fn=lambda: debate_service.store.queue_status()[1],
+)
+Gauge(
+    "debate_active_sessions",
+    "Debates currently generating (counted against MAX_LIVE_SESSIONS).",
+    fn=lambda: debate_service.store.queue_status()[0],
+)
+Gauge(
+    "debate_session_memory_committed_bytes",
+    "Estimated session bytes held against SESSION_MEMORY_BUDGET_BYTES in this process.",
+    fn=lambda: debate_service.memory_committed(),
+)
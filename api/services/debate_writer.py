@@ -0,0 +1,254 @@
+"""Write-behind persistence of finished debates.
+
+Saving a finished debate used to sit between the judge's verdict and the
+``debate_complete`` frame: the event loop waited for an SQLite commit before
+the client heard the debate was over. Now :meth:`DebateWriter.enqueue` just
+records the row in memory and wakes the worker's single writer thread, which
+
+1. appends new rows to this worker's spool file under ``DEBATE_SPOOL_DIR``
+   and fsyncs it, so a crash from here on loses nothing;
+2. commits up to ``DEBATE_WRITE_BATCH_SIZE`` rows per transaction with
+   :func:`~api.services.debate_repository.save_completed_debates` (an
+   ``INSERT ... ON CONFLICT`` upsert, so a replayed row is harmless);
+3. on failure, logs it and retries after ``DEBATE_WRITE_RETRY_SECONDS``,
+   doubling up to a minute, while new rows keep being spooled;
+4. once every row is committed, empties the spool file.
+
+Until its commit, a row is served from memory by :meth:`DebateWriter.get`, so
+``GET /api/debates/{id}`` finds a debate the moment it completes. On shutdown
+:meth:`DebateWriter.stop` drains what is left, trying for
+``DEBATE_WRITE_DRAIN_SECONDS``; a spool file that still holds rows after that
+(or after a crash) is replayed by :meth:`DebateWriter.recover` when a worker
+next starts. Each worker holds an exclusive ``flock`` on its own spool file,
+which is how a starting worker tells a dead worker's file from a live one's.
+
+The thread starts on the first :meth:`~DebateWriter.enqueue` and exits when it
+has nothing left to write, so an app driven without its lifespan (a
+``TestClient`` outside a ``with`` block) persists debates all the same.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from api.services.debate_repository import save_completed_debates
+from api.services.metrics import Counter, Gauge
+from config import (
+    DEBATE_SPOOL_DIR,
+    DEBATE_WRITE_BATCH_SIZE,
+    DEBATE_WRITE_DRAIN_SECONDS,
+    DEBATE_WRITE_RETRY_SECONDS,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, so every other spool file is taken as orphaned
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Ceiling on the doubling retry delay while the database keeps failing.
+_MAX_RETRY_SECONDS = 60.0
+_DATETIME_FIELDS = ("created_at", "completed_at")
+
+WRITE_PENDING = Gauge(
+    "debate_write_pending",
+    "Finished debates accepted by the write-behind writer but not yet committed.",
+)
+WRITE_FAILURES = Counter(
+    "debate_write_failures_total",
+    "Write-behind batches whose commit failed (each is retried).",
+)
+
+
+def _encode(row: dict) -> bytes:
+    fields = {**row, **{name: row[name].isoformat() for name in _DATETIME_FIELDS}}
+    return json.dumps(fields, separators=(",", ":")).encode() + b"\n"
+
+
+def _decode(line: bytes) -> dict:
+    row = json.loads(line)
+    return {**row, **{name: datetime.fromisoformat(row[name]) for name in _DATETIME_FIELDS}}
+
+
+def _lock(spool: BinaryIO) -> bool:
+    """Take the exclusive lock on a spool file; ``False`` if a live worker
+    holds it."""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(spool.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+class DebateWriter:
+    """One worker's write-behind queue of finished debates (see the module
+    docstring). Thread-safe; the event loop only ever takes its lock for
+    in-memory bookkeeping."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # Enqueued rows not yet committed, by debate id (a re-save replaces).
+        self._pending: dict[str, dict] = {}
+        # Enqueued rows not yet in the spool file.
+        self._unspooled: list[dict] = []
+        self._thread: Optional[threading.Thread] = None
+        # When the next commit may be tried (pushed back after a failure), and
+        # while stopping, when to give up.
+        self._retry_at = 0.0
+        self._deadline: Optional[float] = None
+        self._name = uuid.uuid4().hex
+        self._spool: Optional[BinaryIO] = None
+
+    def enqueue(self, row: dict) -> None:
+        """Accept a :func:`~api.services.debate_repository.debate_row` for
+        writing. Never blocks on disk."""
+        with self._cond:
+            self._pending[row["id"]] = row
+            self._unspooled.append(row)
+            WRITE_PENDING.set(len(self._pending))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="debate-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def get(self, debate_id: str) -> Optional[dict]:
+        """The row of a debate accepted but not yet committed, or ``None``."""
+        with self._cond:
+            return self._pending.get(debate_id)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything enqueued so far is committed (or
+        ``timeout`` passes); whether it was."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending, timeout)
+
+    def stop(self, timeout: float = DEBATE_WRITE_DRAIN_SECONDS) -> bool:
+        """Drain on shutdown: retry anything unsaved at once, and keep at it
+        for up to ``timeout`` seconds. Returns whether every debate was
+        committed; if not, the rows stay in the spool file for
+        :meth:`recover`."""
+        with self._cond:
+            self._deadline = time.monotonic() + timeout
+            self._retry_at = 0.0
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._deadline = None
+            left = len(self._pending)
+            if self._thread is None and self._spool is not None:
+                self._spool.close()
+                self._spool = None
+                if not left:
+                    self._spool_path().unlink(missing_ok=True)
+        if left:
+            logger.warning("%d finished debate(s) not saved; kept in %s for the next start",
+                           left, self._spool_path())
+        return not left
+
+    def recover(self) -> int:
+        """Commit the rows left in spool files of workers that are gone (a
+        crash, or a drain that timed out), delete those files, and return how
+        many rows there were. Called once at start-up."""
+        directory = Path(DEBATE_SPOOL_DIR)
+        if not directory.is_dir():
+            return 0
+        recovered = 0
+        for path in sorted(directory.glob("*.jsonl")):
+            if path == self._spool_path():
+                continue
+            with open(path, "rb") as spool:
+                if not _lock(spool):
+                    continue  # a live worker's
+                latest = {}
+                for line in spool:
+                    try:
+                        row = _decode(line)
+                    except ValueError:  # a write torn by the crash
+                        logger.warning("Skipping an unreadable line in %s", path)
+                        continue
+                    latest[row["id"]] = row
+                rows = list(latest.values())
+                for start in range(0, len(rows), DEBATE_WRITE_BATCH_SIZE):
+                    save_completed_debates(rows[start:start + DEBATE_WRITE_BATCH_SIZE])
+                path.unlink()
+            recovered += len(rows)
+        if recovered:
+            logger.info("Recovered %d finished debate(s) from the write-behind spool", recovered)
+        return recovered
+
+    def _spool_path(self) -> Path:
+        return Path(DEBATE_SPOOL_DIR) / f"{self._name}.jsonl"
+
+    def _append(self, rows: list[dict]) -> None:
+        if self._spool is None:
+            path = self._spool_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._spool = open(path, "ab")
+            _lock(self._spool)
+        self._spool.write(b"".join(_encode(row) for row in rows))
+        self._spool.flush()
+        os.fsync(self._spool.fileno())
+
+    def _run(self) -> None:
+        delay = DEBATE_WRITE_RETRY_SECONDS
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: not self._pending or self._unspooled
+                    or time.monotonic() >= self._retry_at,
+                    max(0.0, self._retry_at - time.monotonic()),
+                )
+                if not self._pending:
+                    self._thread = None
+                    self._cond.notify_all()
+                    return
+                # Rows committed (or replaced) since they were enqueued need
+                # no spooling.
+                spool = [row for row in self._unspooled if self._pending.get(row["id"]) is row]
+                self._unspooled = []
+                commit = time.monotonic() >= self._retry_at
+                batch = list(self._pending.values())[:DEBATE_WRITE_BATCH_SIZE]
+            if spool:
+                try:
+                    self._append(spool)
+                except OSError:
+                    logger.exception("Could not spool %d finished debate(s)", len(spool))
+            if not commit:
+                continue
+            try:
+                save_completed_debates(batch)
+            except Exception:
+                WRITE_FAILURES.inc()
+                logger.exception("Failed to persist %d debate(s); retrying in %.0fs",
+                                 len(batch), delay)
+                with self._cond:
+                    self._retry_at = time.monotonic() + delay
+                    if self._deadline is not None and self._retry_at >= self._deadline:
+                        # Stopping, and out of time: leave the rest to recover().
+                        self._thread = None
+                        self._cond.notify_all()
+                        return
+                delay = min(delay * 2, _MAX_RETRY_SECONDS)
+                continue
+            delay = DEBATE_WRITE_RETRY_SECONDS
+            logger.info("Persisted %d debate(s)", len(batch))
+            with self._cond:
+                for row in batch:
+                    if self._pending.get(row["id"]) is row:
+                        del self._pending[row["id"]]
+                idle = not self._pending
+                WRITE_PENDING.set(len(self._pending))
+                self._cond.notify_all()
+            if idle and self._spool is not None:
+                # Only this thread appends, so nothing new can be lost here.
+                self._spool.truncate(0)
@@ -0,0 +1,83 @@
+"""In-process LRU of finished debates' detail response bodies.
+
+``GET /api/debates/{id}`` serves a finished debate as the JSON body stored
+when it was saved (``Debate.detail``). The hottest of those bodies are kept
+here, least recently read evicted first, so that a repeat read costs neither
+a database round trip nor a decompression. The bound is on the bytes held,
+not on the number of debates, because one long debate can weigh as much as
+a hundred short ones. A body bigger than the whole budget is never cached.
+
+A finished debate doesn't change, so nothing expires; ``save_completed_debates``
+discards the ids it (re)writes all the same. The cache is per worker, like the
+count cache in ``debate_repository``.
+"""
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from api.services.metrics import Counter, Gauge
+
+CACHE_HITS = Counter(
+    "debate_detail_cache_hits_total",
+    "Debate detail reads answered from the in-process LRU.",
+)
+CACHE_MISSES = Counter(
+    "debate_detail_cache_misses_total",
+    "Debate detail reads that went to the database.",
+)
+CACHE_BYTES = Gauge(
+    "debate_detail_cache_bytes",
+    "Bytes of debate detail bodies held by the in-process LRU.",
+)
+
+
+class DetailCache:
+    """Debate id -> (ETag, body), bounded by ``max_bytes`` of bodies.
+    Thread-safe: the read endpoints run in FastAPI's threadpool."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, debate_id: str) -> Optional[tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(debate_id)
+            if entry is None:
+                CACHE_MISSES.inc()
+                return None
+            self._entries.move_to_end(debate_id)
+            CACHE_HITS.inc()
+            return entry
+
+    def put(self, debate_id: str, etag: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(debate_id)
+            self._entries[debate_id] = (etag, body)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+            CACHE_BYTES.set(self._bytes)
+
+    def discard(self, debate_ids: Iterable[str]) -> None:
+        with self._lock:
+            for debate_id in debate_ids:
+                self._remove(debate_id)
+            CACHE_BYTES.set(self._bytes)
+
+    @property
+    def size(self) -> int:
+        """Bytes of bodies held."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, debate_id: str) -> None:
+        entry = self._entries.pop(debate_id, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
@@ -0,0 +1,116 @@
+"""In-process metrics, exposed in the Prometheus text format at ``/metrics``.
+
+Deliberately tiny — counters, gauges and fixed-bucket histograms, nothing
+else — so the API needs no metrics client dependency. Every metric registers
+itself in :data:`REGISTRY` on construction; ``/metrics`` renders the lot.
+Values are per process: with several uvicorn workers, scrape each one (gauges
+that read the shared session store already report cluster-wide numbers).
+"""
+import math
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, registry: Optional["Registry"] = None):
+        self.name = name
+        self.help = help_text
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """This metric's lines of the exposition, its HELP and TYPE first."""
+
+
+class Counter(_Metric):
+    """A monotonically increasing count."""
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, registry: Optional["Registry"] = None):
+        super().__init__(name, help_text, registry)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def render(self) -> list[str]:
+        return self._header() + [f"{self.name} {_fmt(self.value)}"]
+
+
+class Gauge(_Metric):
+    """A value that goes up and down — set directly, or read from ``fn`` on scrape."""
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, fn: Optional[Callable[[], float]] = None,
+                 registry: Optional["Registry"] = None):
+        super().__init__(name, help_text, registry)
+        self.value = 0.0
+        self.fn = fn
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def get(self) -> float:
+        return self.fn() if self.fn is not None else self.value
+
+    def render(self) -> list[str]:
+        return self._header() + [f"{self.name} {_fmt(self.get())}"]
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative ``le`` buckets, plus sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...],
+                 registry: Optional["Registry"] = None):
+        super().__init__(name, help_text, registry)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for bound, count in zip(self.buckets, self.counts):
+            lines.append(f'{self.name}_bucket{{le="{_fmt(bound)}"}} {count}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {_fmt(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class Registry:
+    """The set of metrics one ``/metrics`` scrape renders."""
+
+    def __init__(self):
+        self.metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        self.metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _fmt(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+REGISTRY = Registry()
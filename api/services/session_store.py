@@ -0,0 +1,433 @@
+"""Where live-session *metadata* lives — per process, or shared across workers.
+
+A live :class:`~api.services.debate_service.DebateSession` holds agent clients
+and an ``asyncio.Event``; those can't leave the process that drives the
+debate. What several uvicorn workers *do* need to agree on is small: which
+debates exist, which worker is driving each one, how many are generating (the
+global ``MAX_LIVE_SESSIONS`` cap), and the FIFO admission queue of sockets
+waiting for a free slot. That is what a :class:`SessionStore` keeps.
+
+A session moves through three states: *pending* (created, no socket yet),
+*queued* (a socket is waiting: ``queued_at`` is set), and *active* (admitted:
+``started``, with an ``owner``). Only active sessions count against the cap;
+pending and queued ones are bounded separately (``ADMISSION_QUEUE_SIZE``).
+
+Two backends, picked by ``SESSION_STORE`` (see :func:`build_session_store`):
+
+* ``memory`` — a dict. Per-process, exactly the old behaviour; the default,
+  and right for a single worker.
+* ``sqlite`` — a small SQLite file (``SESSION_STORE_PATH``) in WAL mode that
+  every worker on the host opens. Reservation and admission run in
+  ``BEGIN IMMEDIATE`` transactions, so they are atomic across processes and
+  the queue is one FIFO for the whole host.
+
+Store calls are synchronous. The in-memory store's are dict operations and
+run inline on the event loop; the SQLite backend's can wait on another
+worker's transaction, so ``DebateService`` runs them off the loop with
+``asyncio.to_thread`` wherever it awaits.
+
+Because the WebSocket that drives a debate is also the one that delivers its
+audience vote, the worker that admitted it always receives the vote itself —
+no cross-worker vote channel is needed, and no sticky routing either: a socket
+that lands on another worker rebuilds the session from its record there.
+"""
+import os
+import socket
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional
+
+from config import SESSION_STORE, SESSION_STORE_PATH
+
+# Identifies this process as the owner of the sessions it admits. Host + pid
+# is unique among the workers sharing one local SQLite file.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class SessionRecord:
+    """The shareable part of a live debate session."""
+    debate_id: str
+    topic: str
+    pro_style: str
+    con_style: str
+    created_at: datetime
+    updated_at: datetime
+    started: bool = False
+    owner: Optional[str] = None
+    queued_at: Optional[datetime] = None
+
+
+class SessionStore(ABC):
+    """Registry of live debate sessions, the admission queue, and run ownership."""
+
+    #: Whether other processes see this store — only then can records outlive
+    #: the worker that created them and need periodic sweeping.
+    shared = False
+
+    @abstractmethod
+    def reserve(self, record: SessionRecord, max_pending: int) -> bool:
+        """Add ``record`` unless ``max_pending`` not-yet-active sessions exist.
+
+        Returns ``False`` (and adds nothing) when the bound is reached. Adding
+        an id that is already present is a no-op that returns ``True``.
+        """
+
+    @abstractmethod
+    def get(self, debate_id: str) -> Optional[SessionRecord]:
+        """Return one session's record, or ``None``."""
+
+    @abstractmethod
+    def admit(self, debate_id: str, owner: str, max_active: int,
+              now: datetime) -> Optional[int]:
+        """Try to move the session into the active set, in FIFO order.
+
+        The first call queues the session (stamps ``queued_at``). It is
+        admitted — marked started by ``owner`` — once it is within the free
+        slots (``max_active`` minus the active count) counted from the head
+        of the queue. Returns ``0`` when admitted (or already admitted by
+        ``owner``), its 1-based queue position while it must wait, and
+        ``None`` if it is gone or another owner admitted it. Every call
+        refreshes ``updated_at``, so a waiting socket never looks stale.
+        """
+
+    @abstractmethod
+    def queue_status(self) -> tuple[int, int]:
+        """``(active, queued)`` counts across every process sharing the store."""
+
+    @abstractmethod
+    def touch(self, debate_id: str, now: datetime) -> None:
+        """Record progress on a started session (keeps it from looking stale)."""
+
+    @abstractmethod
+    def release(self, debate_id: str) -> None:
+        """Forget a session (finished, failed, or swept). Idempotent."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """How many sessions exist, across every process sharing the store."""
+
+    @abstractmethod
+    def sweep(self, *, unstarted_before: datetime, stale_before: datetime) -> list[str]:
+        """Drop pending orphans created before ``unstarted_before``, and queued
+        or active sessions not touched since ``stale_before`` (their worker
+        died); return the ids."""
+
+
+class _FifoQueue:
+    """Queued debate ids in arrival order, with O(1) join and head check and
+    an O(log n) position lookup, however many sockets are polling.
+
+    Each id draws an increasing ticket on joining. Its position is its ticket
+    minus the head's, less the tickets between them that already left (an id
+    can leave from the middle: admitted into a spare slot, or released).
+    """
+
+    def __init__(self):
+        self._tickets: OrderedDict[str, int] = OrderedDict()
+        self._next_ticket = 0
+        self._left: list[int] = []  # sorted tickets that left from behind the head
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, debate_id: str) -> bool:
+        return debate_id in self._tickets
+
+    def join(self, debate_id: str) -> None:
+        if debate_id not in self._tickets:
+            self._tickets[debate_id] = self._next_ticket
+            self._next_ticket += 1
+
+    def leave(self, debate_id: str) -> None:
+        ticket = self._tickets.pop(debate_id, None)
+        if ticket is None:
+            return
+        if not self._tickets:
+            self._left.clear()
+            return
+        head = next(iter(self._tickets.values()))
+        if ticket > head:
+            insort(self._left, ticket)
+        else:  # the head left: forget the gaps now in front of the new head
+            del self._left[:bisect_left(self._left, head)]
+
+    def position(self, debate_id: str) -> int:
+        """0-based place of ``debate_id`` (which must be queued) in FIFO order."""
+        ticket = self._tickets[debate_id]
+        head = next(iter(self._tickets.values()))
+        return ticket - head - bisect_left(self._left, ticket)
+
+
+class InMemorySessionStore(SessionStore):
+    """Per-process store: a dict. Only correct with a single worker.
+
+    Running counts of pending (not started) and active sessions are kept up
+    to date by every state change, so neither a reservation nor an admission
+    nor ``queue_status`` ever walks the records.
+    """
+
+    def __init__(self):
+        self._records: dict[str, SessionRecord] = {}
+        self._queue = _FifoQueue()
+        self._pending = 0
+        self._active = 0
+
+    def reserve(self, record: SessionRecord, max_pending: int) -> bool:
+        if record.debate_id in self._records:
+            return True
+        if self._pending >= max_pending:
+            return False
+        self._records[record.debate_id] = record
+        self._pending += 1
+        return True
+
+    def get(self, debate_id: str) -> Optional[SessionRecord]:
+        return self._records.get(debate_id)
+
+    def admit(self, debate_id: str, owner: str, max_active: int,
+              now: datetime) -> Optional[int]:
+        record = self._records.get(debate_id)
+        if record is None:
+            return None
+        if record.started:
+            return 0 if record.owner == owner else None
+        record = replace(record, queued_at=record.queued_at or now, updated_at=now)
+        self._records[debate_id] = record
+        self._queue.join(debate_id)
+        ahead = self._queue.position(debate_id)
+        free = max_active - self._active
+        if ahead < free:
+            self._records[debate_id] = replace(record, started=True, owner=owner)
+            self._queue.leave(debate_id)
+            self._pending -= 1
+            self._active += 1
+            return 0
+        return ahead - max(free, 0) + 1
+
+    def queue_status(self) -> tuple[int, int]:
+        return self._active, len(self._queue)
+
+    def touch(self, debate_id: str, now: datetime) -> None:
+        record = self._records.get(debate_id)
+        if record is not None:
+            self._records[debate_id] = replace(record, updated_at=now)
+
+    def release(self, debate_id: str) -> None:
+        record = self._records.pop(debate_id, None)
+        if record is None:
+            return
+        if record.started:
+            self._active -= 1
+        else:
+            self._pending -= 1
+            self._queue.leave(debate_id)
+
+    def count(self) -> int:
+        return len(self._records)
+
+    def sweep(self, *, unstarted_before: datetime, stale_before: datetime) -> list[str]:
+        expired = [
+            debate_id
+            for debate_id, record in self._records.items()
+            if (not record.started and not record.queued_at
+                and record.created_at < unstarted_before)
+            or ((record.started or record.queued_at) and record.updated_at < stale_before)
+        ]
+        for debate_id in expired:
+            self.release(debate_id)
+        return expired
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS live_sessions (
+    debate_id  TEXT PRIMARY KEY,
+    topic      TEXT NOT NULL,
+    pro_style  TEXT NOT NULL,
+    con_style  TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    started    INTEGER NOT NULL DEFAULT 0,
+    owner      TEXT,
+    queued_at  TEXT
+)
+"""
+
+_COLUMNS = (
+    "debate_id, topic, pro_style, con_style, created_at, updated_at, started, owner, queued_at"
+)
+
+
+def _to_row(record: SessionRecord) -> tuple:
+    return (
+        record.debate_id, record.topic, record.pro_style, record.con_style,
+        record.created_at.isoformat(), record.updated_at.isoformat(),
+        int(record.started), record.owner,
+        record.queued_at.isoformat() if record.queued_at else None,
+    )
+
+
+def _from_row(row: tuple) -> SessionRecord:
+    return SessionRecord(
+        debate_id=row[0], topic=row[1], pro_style=row[2], con_style=row[3],
+        created_at=datetime.fromisoformat(row[4]),
+        updated_at=datetime.fromisoformat(row[5]),
+        started=bool(row[6]), owner=row[7],
+        queued_at=datetime.fromisoformat(row[8]) if row[8] else None,
+    )
+
+
+class SqliteSessionStore(SessionStore):
+    """Store shared by every worker on the host through one SQLite file.
+
+    Uses the stdlib ``sqlite3`` driver directly (not the SQLAlchemy engine of
+    ``api.db``): ``DATABASE_URL`` may point at another backend, and this file
+    holds only transient state. One connection per store, serialised by a
+    lock, in autocommit mode with explicit ``BEGIN IMMEDIATE`` where a read
+    must not race another worker's write.
+    """
+
+    shared = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _immediate(self, fn):
+        """Run ``fn(conn)`` in a write transaction taken up front."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def reserve(self, record: SessionRecord, max_pending: int) -> bool:
+        def insert(conn):
+            if conn.execute(
+                "SELECT 1 FROM live_sessions WHERE debate_id = ?", (record.debate_id,)
+            ).fetchone():
+                return True
+            (pending,) = conn.execute(
+                "SELECT COUNT(*) FROM live_sessions WHERE started = 0"
+            ).fetchone()
+            if pending >= max_pending:
+                return False
+            conn.execute(
+                f"INSERT INTO live_sessions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _to_row(record),
+            )
+            return True
+        return self._immediate(insert)
+
+    def get(self, debate_id: str) -> Optional[SessionRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM live_sessions WHERE debate_id = ?", (debate_id,)
+            ).fetchone()
+        return _from_row(row) if row is not None else None
+
+    def admit(self, debate_id: str, owner: str, max_active: int,
+              now: datetime) -> Optional[int]:
+        stamp = now.isoformat()
+
+        def try_admit(conn):
+            row = conn.execute(
+                "SELECT started, owner, queued_at FROM live_sessions WHERE debate_id = ?",
+                (debate_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            started, current_owner, queued_at = row
+            if started:
+                return 0 if current_owner == owner else None
+            queued_at = queued_at or stamp
+            conn.execute(
+                "UPDATE live_sessions SET queued_at = ?, updated_at = ? WHERE debate_id = ?",
+                (queued_at, stamp, debate_id),
+            )
+            (active,) = conn.execute(
+                "SELECT COUNT(*) FROM live_sessions WHERE started = 1"
+            ).fetchone()
+            (ahead,) = conn.execute(
+                "SELECT COUNT(*) FROM live_sessions WHERE started = 0"
+                " AND queued_at IS NOT NULL"
+                " AND (queued_at < ? OR (queued_at = ? AND debate_id < ?))",
+                (queued_at, queued_at, debate_id),
+            ).fetchone()
+            free = max_active - active
+            if ahead < free:
+                conn.execute(
+                    "UPDATE live_sessions SET started = 1, owner = ? WHERE debate_id = ?",
+                    (owner, debate_id),
+                )
+                return 0
+            return ahead - max(free, 0) + 1
+        return self._immediate(try_admit)
+
+    def queue_status(self) -> tuple[int, int]:
+        with self._lock:
+            active, queued = self._conn.execute(
+                "SELECT COALESCE(SUM(started = 1), 0),"
+                " COALESCE(SUM(started = 0 AND queued_at IS NOT NULL), 0)"
+                " FROM live_sessions"
+            ).fetchone()
+        return active, queued
+
+    def touch(self, debate_id: str, now: datetime) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE live_sessions SET updated_at = ? WHERE debate_id = ?",
+                (now.isoformat(), debate_id),
+            )
+
+    def release(self, debate_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM live_sessions WHERE debate_id = ?", (debate_id,))
+
+    def count(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM live_sessions").fetchone()
+        return count
+
+    def sweep(self, *, unstarted_before: datetime, stale_before: datetime) -> list[str]:
+        where = (
+            "(started = 0 AND queued_at IS NULL AND created_at < ?)"
+            " OR ((started = 1 OR queued_at IS NOT NULL) AND updated_at < ?)"
+        )
+        params = (unstarted_before.isoformat(), stale_before.isoformat())
+
+        def delete(conn):
+            ids = [row[0] for row in conn.execute(
+                f"SELECT debate_id FROM live_sessions WHERE {where}", params
+            )]
+            if ids:
+                conn.execute(f"DELETE FROM live_sessions WHERE {where}", params)
+            return ids
+        return self._immediate(delete)
+
+
+def build_session_store(kind: str = SESSION_STORE, path: str = SESSION_STORE_PATH) -> SessionStore:
+    """The store selected by ``SESSION_STORE`` (``memory`` or ``sqlite``)."""
+    if kind == "memory":
+        return InMemorySessionStore()
+    if kind == "sqlite":
+        return SqliteSessionStore(path)
+    raise ValueError(f"Unknown SESSION_STORE '{kind}'. Must be one of: memory, sqlite")
@@ -0,0 +1,227 @@
+"""Per-WebSocket send queue — decouples a client's read speed from generation.
+
+Sending each event inline (``await websocket.send_json``) lets one slow
+client back-pressure its own debate: the route stops pulling from the LLM
+stream while a send is parked, so the upstream Anthropic connection stays
+open for longer. A :class:`SocketSender` instead owns a writer task that
+drains a queue of frames to the socket, and the route only ever calls the
+non-blocking :meth:`SocketSender.put` — generation runs at full speed.
+
+The queue is bounded by a slow-consumer policy rather than by blocking:
+
+* **Coalescing.** Once ``max_frames`` frames are waiting, queued
+  ``MESSAGE_CHUNK`` frames from the same speaker are merged into one, and
+  new chunks are appended to the last queued chunk. The client still gets
+  every character, in order, just in fewer frames. Other frames (phase
+  changes, turn boundaries, the vote prompt) are never merged or dropped —
+  there are only a handful per debate.
+* **Disconnect.** A client that doesn't accept a single frame within
+  ``send_timeout`` seconds is stuck; the socket is closed with 1008 and the
+  socket is detached from its debate the same way a client hang-up is (the
+  client may reconnect and be replayed what it missed).
+
+Frames are encoded with the socket's :class:`~api.services.wire.Codec`
+(JSON unless the client negotiated MessagePack). They may be queued already
+encoded, so a frame broadcast to many sockets is encoded once (see
+``broadcast.py``); a frame queued without a payload, or one rebuilt by
+coalescing, is encoded on send.
+"""
+import asyncio
+import logging
+import weakref
+from collections import deque
+from contextlib import suppress
+from typing import Optional
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+
+from api.schemas.debate import WSMessageType
+from api.services.metrics import Counter, Gauge, Histogram
+from api.services.wire import JSON, Codec, Payload
+from config import WS_SEND_QUEUE_SIZE, WS_SEND_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_CHUNK = WSMessageType.MESSAGE_CHUNK.value
+# Rough per-frame cost beyond its text (the dict, the envelope, JSON framing).
+_FRAME_OVERHEAD_BYTES = 128
+
+# Senders with a live socket, for the current-depth gauge.
+_OPEN: "weakref.WeakSet[SocketSender]" = weakref.WeakSet()
+
+SEND_QUEUE_HIGH_WATER = Histogram(
+    "debate_ws_send_queue_high_water_frames",
+    "Deepest a WebSocket's send queue got over its lifetime (observed at close).",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024),
+)
+Gauge(
+    "debate_ws_send_queue_max_depth",
+    "Deepest send queue across the currently open WebSockets.",
+    fn=lambda: max((len(sender) for sender in _OPEN), default=0),
+)
+CHUNKS_COALESCED = Counter(
+    "debate_ws_chunks_coalesced_total",
+    "MESSAGE_CHUNK frames merged into a queued one because a client fell behind.",
+)
+SLOW_CONSUMERS_DISCONNECTED = Counter(
+    "debate_ws_slow_consumers_disconnected_total",
+    "WebSockets closed because the client stopped accepting frames.",
+)
+
+
+def _frame_bytes(frame: dict) -> int:
+    data = frame.get("data") or {}
+    return _FRAME_OVERHEAD_BYTES + len(data.get("chunk") or "") + len(data.get("content") or "")
+
+
+# A queued frame and its encoded payload (``None``: encode on send).
+_Queued = tuple[dict, Optional[Payload]]
+
+
+def _mergeable(earlier: dict, later: dict) -> bool:
+    return (
+        earlier["type"] == _CHUNK
+        and later["type"] == _CHUNK
+        and earlier["data"]["speaker"] == later["data"]["speaker"]
+    )
+
+
+def _merged(earlier: dict, later: dict) -> dict:
+    # The merged frame takes the later one's envelope, so its ``seq`` is the
+    # last one it carries and a reconnect replays nothing twice.
+    data = {**earlier["data"], "chunk": earlier["data"]["chunk"] + later["data"]["chunk"]}
+    return {**later, "data": data}
+
+
+class SocketSender:
+    """Bounded, coalescing send queue drained to ``websocket`` by a writer task.
+
+    Call :meth:`start` once the socket is accepted, :meth:`put` for every
+    frame, :meth:`flush` before closing normally, and :meth:`close` always.
+    """
+
+    def __init__(self, websocket: WebSocket, max_frames: int = WS_SEND_QUEUE_SIZE,
+                 send_timeout: float = WS_SEND_TIMEOUT_SECONDS, codec: Codec = JSON):
+        self.websocket = websocket
+        self.codec = codec
+        self.max_frames = max_frames
+        self.send_timeout = send_timeout
+        self._queue: deque[_Queued] = deque()
+        self._ready = asyncio.Event()
+        # Set while nothing is queued or being sent (what ``flush`` waits on).
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+        # Close code once the writer gave up (client gone or stuck).
+        self.closed_code: Optional[int] = None
+        self.high_water = 0
+        self.coalesced = 0
+        self.buffered_bytes = 0
+        # Queue length that triggers the next full coalescing pass; raised
+        # after a pass that leaves the queue long (unmergeable frames), so a
+        # full queue costs O(1) per put rather than a rescan each time.
+        self._coalesce_at = max_frames
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        _OPEN.add(self)
+
+    def put(self, frame: dict, payload: Optional[Payload] = None) -> None:
+        """Queue ``frame`` (encoded as ``payload``, if given) without waiting;
+        raise :class:`WebSocketDisconnect` if the writer has already given up
+        on the client."""
+        if self.closed_code is not None:
+            raise WebSocketDisconnect(self.closed_code)
+        if len(self._queue) >= self._coalesce_at:
+            self._coalesce()
+            self._coalesce_at = max(self.max_frames, 2 * len(self._queue))
+        elif len(self._queue) < self.max_frames:
+            self._coalesce_at = self.max_frames
+        if (len(self._queue) >= self.max_frames and self._queue
+                and _mergeable(self._queue[-1][0], frame)):
+            tail, _ = self._queue[-1]
+            self._queue[-1] = (_merged(tail, frame), None)
+            self.buffered_bytes += _frame_bytes(frame) - _FRAME_OVERHEAD_BYTES
+            self.coalesced += 1
+            CHUNKS_COALESCED.inc()
+            return
+        self._queue.append((frame, payload))
+        self.buffered_bytes += _frame_bytes(frame)
+        self.high_water = max(self.high_water, len(self._queue))
+        self._idle.clear()
+        self._ready.set()
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been sent.
+
+        Raises :class:`WebSocketDisconnect` if the client went away or was
+        disconnected as stuck before the queue drained.
+        """
+        await self._idle.wait()
+        if self.closed_code is not None:
+            raise WebSocketDisconnect(self.closed_code)
+
+    def close(self) -> None:
+        """Stop the writer (anything still queued is dropped) and record the
+        queue's high-water mark. Idempotent."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            SEND_QUEUE_HIGH_WATER.observe(self.high_water)
+        _OPEN.discard(self)
+
+    def _coalesce(self) -> None:
+        merged: deque[_Queued] = deque()
+        for frame, payload in self._queue:
+            if merged and _mergeable(merged[-1][0], frame):
+                merged[-1] = (_merged(merged[-1][0], frame), None)
+                self.coalesced += 1
+                CHUNKS_COALESCED.inc()
+            else:
+                merged.append((frame, payload))
+        self._queue = merged
+        self.buffered_bytes = sum(_frame_bytes(frame) for frame, _ in merged)
+
+    def _give_up(self, code: int) -> None:
+        self.closed_code = code
+        self._queue.clear()
+        self.buffered_bytes = 0
+        self._idle.set()
+        _OPEN.discard(self)
+
+    async def _run(self) -> None:
+        while True:
+            while not self._queue:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+            frame, payload = self._queue.popleft()
+            self.buffered_bytes -= _frame_bytes(frame)
+            if payload is None:
+                payload = self.codec.encode(frame)
+            try:
+                async with asyncio.timeout(self.send_timeout):
+                    if self.codec.binary:
+                        await self.websocket.send_bytes(payload)
+                    else:
+                        await self.websocket.send_text(payload)
+            except TimeoutError:
+                SLOW_CONSUMERS_DISCONNECTED.inc()
+                logger.warning(
+                    "Disconnecting stuck WebSocket: no frame accepted in %ss (%d queued)",
+                    self.send_timeout, len(self._queue),
+                )
+                self._give_up(status.WS_1008_POLICY_VIOLATION)
+                with suppress(Exception):
+                    await asyncio.wait_for(
+                        self.websocket.close(code=status.WS_1008_POLICY_VIOLATION),
+                        self.send_timeout,
+                    )
+                return
+            except Exception:
+                # The client hung up mid-send; the route finds out on its next put.
+                self._give_up(status.WS_1006_ABNORMAL_CLOSURE)
+                return
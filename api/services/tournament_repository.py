@@ -0,0 +1,117 @@
+"""Read/write access to style tournaments — the durable checkpoint.
+
+Same shape as ``debate_repository``: thin, synchronous functions over the
+shared SQLite store. The tournament runner (``main.py tournament``) writes one
+match row per result via :func:`record_match`, off the event loop; the
+``/api/tournaments`` read endpoints run in FastAPI's threadpool.
+"""
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from api import db
+from api.models import Tournament, TournamentMatch
+
+
+def ensure_tournament(
+    tournament_id: str, *, styles: list[str], topics: list[str], total_matches: int
+) -> bool:
+    """Create the tournament row if it doesn't exist yet.
+
+    Returns ``True`` if the tournament was created, ``False`` if it already
+    existed (a resumed run). A resumed run keeps the original setup — the
+    schedule is derived from the stored styles and topics, not the new call's.
+    """
+    with db.session_scope() as session:
+        if session.get(Tournament, tournament_id) is not None:
+            return False
+        now = db.utcnow()
+        session.add(Tournament(
+            id=tournament_id,
+            styles=styles,
+            topics=topics,
+            total_matches=total_matches,
+            completed_matches=0,
+            standings=None,
+            created_at=now,
+            updated_at=now,
+        ))
+        return True
+
+
+def get_tournament(session: Session, tournament_id: str) -> Optional[Tournament]:
+    """Return one tournament by id, or ``None``."""
+    return session.get(Tournament, tournament_id)
+
+
+def list_tournaments(session: Session, limit: int = 50) -> list[Tournament]:
+    """Return tournaments, most recently updated first."""
+    stmt = select(Tournament).order_by(Tournament.updated_at.desc()).limit(limit)
+    return list(session.execute(stmt).scalars().all())
+
+
+def completed_results(tournament_id: str) -> list[dict]:
+    """The rated results so far, in arrival order — what Elo is replayed from."""
+    with db.SessionLocal() as session:
+        rows = session.execute(
+            select(
+                TournamentMatch.matchup_key,
+                TournamentMatch.pro_style,
+                TournamentMatch.con_style,
+                TournamentMatch.winner,
+            )
+            .where(
+                TournamentMatch.tournament_id == tournament_id,
+                TournamentMatch.status == "completed",
+                TournamentMatch.winner.is_not(None),
+            )
+            .order_by(TournamentMatch.id)
+        ).all()
+    return [row._asdict() for row in rows]
+
+
+def record_match(tournament_id: str, record: dict, standings: dict) -> None:
+    """Checkpoint one result and the updated standings in a single transaction.
+
+    ``record`` is a batch-runner result record. A previous (failed) row for the
+    same matchup is replaced, so the new row takes its place at the end of the
+    arrival order.
+    """
+    with db.session_scope() as session:
+        session.execute(delete(TournamentMatch).where(
+            TournamentMatch.tournament_id == tournament_id,
+            TournamentMatch.matchup_key == record["id"],
+        ))
+        now = db.utcnow()
+        session.add(TournamentMatch(
+            tournament_id=tournament_id,
+            matchup_key=record["id"],
+            pro_style=record["pro_style"],
+            con_style=record["con_style"],
+            topic=record["topic"],
+            status=record["status"],
+            winner=record.get("winner"),
+            error=record.get("error"),
+            transcript=record.get("transcript"),
+            argument_scores=record.get("argument_scores"),
+            completed_at=now,
+        ))
+        tournament = session.get(Tournament, tournament_id)
+        tournament.standings = standings
+        tournament.completed_matches = standings["games"]
+        tournament.updated_at = now
+
+
+def list_matches(
+    session: Session, tournament_id: str, *, limit: int = 50, offset: int = 0
+) -> list[TournamentMatch]:
+    """Return a page of a tournament's matches, most recent first."""
+    stmt = (
+        select(TournamentMatch)
+        .where(TournamentMatch.tournament_id == tournament_id)
+        .order_by(TournamentMatch.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return list(session.execute(stmt).scalars().all())
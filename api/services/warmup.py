@@ -0,0 +1,73 @@
+"""Start-up warm-up and the readiness ``/health`` reports.
+
+The agent backends import lazily (see ``src/agents/base_agent.py``), so a
+cold worker starts fast but would pay the LangChain/SDK import, the prompt
+templates and the first TLS handshake on its first debate — on the event
+loop, stalling every other socket. With ``WARMUP_ON_STARTUP`` the lifespan
+starts :class:`WarmUp` instead: it builds a throwaway set of agents in a
+worker thread (importing the backend and compiling their prompt templates)
+and makes one free API request, which leaves a pooled connection for the
+first real debate. ``/health`` answers 503 until it finishes, so a load
+balancer or orchestrator routes nothing to the worker until then.
+
+Warm-up is best-effort: if the API can't be reached within
+``WARMUP_TIMEOUT_SECONDS`` the failure is logged and the worker reports
+ready anyway — a debate would surface the same error to its client.
+"""
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Optional
+
+from api.services.metrics import Gauge
+from config import DEFAULT_CON_STYLE, DEFAULT_PRO_STYLE, WARMUP_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUp:
+    """Runs the warm-up once, in the background, and tracks readiness.
+
+    Ready until :meth:`start` is called, so an app driven without its
+    lifespan (or with warm-up off) is ready from the start.
+    """
+
+    def __init__(self):
+        self.ready = True
+        self.seconds = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.ready = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        start = time.perf_counter()
+        try:
+            from src.agents.base_agent import build_agents
+            # Off the loop: the imports alone hold the GIL for over a second,
+            # but /health keeps answering between bytecodes.
+            pro, _, _ = await asyncio.to_thread(build_agents, DEFAULT_PRO_STYLE, DEFAULT_CON_STYLE)
+            await asyncio.wait_for(pro.awarm_up(), WARMUP_TIMEOUT_SECONDS)
+        except Exception:
+            logger.warning("Warm-up did not complete; serving cold", exc_info=True)
+        finally:
+            self.seconds = time.perf_counter() - start
+            self.ready = True
+        logger.info("Warm-up finished in %.2fs", self.seconds)
+
+
+# The process-wide instance the lifespan starts and ``/health`` reads.
+warmup = WarmUp()
+
+Gauge("api_ready", "1 once the worker has warmed up and /health reports ready.",
+      fn=lambda: float(warmup.ready))
+Gauge("api_warmup_seconds", "How long the start-up warm-up took.", fn=lambda: warmup.seconds)
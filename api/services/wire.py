@@ -0,0 +1,116 @@
+"""WebSocket wire encodings — JSON by default, MessagePack on request.
+
+Every frame the server streams is a dict, ``{"type", "debate_id", "seq",
+"data"}``, and a :class:`Codec` turns it into what goes on the wire. The
+default is its JSON text, one text message per frame. A client that offers
+the ``debate.msgpack.v1`` subprotocol (``Sec-WebSocket-Protocol``) gets
+binary MessagePack frames instead, laid out as compact arrays:
+
+* ``[tag, seq, data]`` for most frames;
+* ``[tag, seq, turn, data]`` for ``message_start`` and ``message_complete``;
+* ``[tag, seq, turn, chunk]`` for ``message_chunk``.
+
+``tag`` is the frame type's number in :data:`TAGS`. ``turn`` numbers the
+debate's turns (1, 2, 3, ...) and is established by ``message_start``, whose
+``data`` names the speaker, so a chunk carries only its turn and its text.
+The ``debate_id`` is left out: the client knows it from the URL. Client
+messages (the audience vote) are MessagePack maps with the same keys as the
+JSON ones.
+
+A frame streamed to many sockets is encoded once per codec in use (see
+``broadcast.py``), not once per socket.
+"""
+import json
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+import ormsgpack
+
+from api.schemas.debate import WSMessageType
+
+MSGPACK_SUBPROTOCOL = "debate.msgpack.v1"
+
+# Wire numbers for frame types. Append new types; never renumber.
+TAGS: dict[str, int] = {
+    WSMessageType.QUEUE_POSITION.value: 0,
+    WSMessageType.DEBATE_STARTED.value: 1,
+    WSMessageType.PHASE_CHANGE.value: 2,
+    WSMessageType.MESSAGE_START.value: 3,
+    WSMessageType.MESSAGE_CHUNK.value: 4,
+    WSMessageType.MESSAGE_COMPLETE.value: 5,
+    WSMessageType.VOTE_REQUIRED.value: 6,
+    WSMessageType.VOTE_RECEIVED.value: 7,
+    WSMessageType.ARGUMENT_SCORES.value: 8,
+    WSMessageType.DEBATE_COMPLETE.value: 9,
+    WSMessageType.ERROR.value: 10,
+}
+
+_CHUNK = WSMessageType.MESSAGE_CHUNK.value
+_TURN_FRAMES = (WSMessageType.MESSAGE_START.value, WSMessageType.MESSAGE_COMPLETE.value)
+
+Payload = Union[str, bytes]
+
+
+class Codec(ABC):
+    """Encodes frames for, and decodes messages from, one kind of client."""
+
+    name = ""
+    # Sent as the accepted subprotocol; ``None`` for the default encoding.
+    subprotocol: Optional[str] = None
+    # Binary frames go out with ``send_bytes``, text with ``send_text``.
+    binary = False
+
+    @abstractmethod
+    def encode(self, frame: dict) -> Payload:
+        """One frame as this encoding's wire payload."""
+
+    @abstractmethod
+    def decode(self, message: dict) -> Optional[dict]:
+        """The object in an ASGI ``websocket.receive`` message, or ``None``
+        if it isn't one this encoding can read."""
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, frame: dict) -> str:
+        return json.dumps(frame)
+
+    def decode(self, message: dict) -> Optional[dict]:
+        try:
+            decoded = json.loads(message.get("text") or "")
+        except json.JSONDecodeError:
+            return None
+        return decoded if isinstance(decoded, dict) else None
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+    subprotocol = MSGPACK_SUBPROTOCOL
+    binary = True
+
+    def encode(self, frame: dict) -> bytes:
+        kind = frame["type"]
+        head = [TAGS[kind], frame.get("seq")]
+        if kind == _CHUNK:
+            return ormsgpack.packb([*head, frame.get("turn"), frame["data"]["chunk"]])
+        if kind in _TURN_FRAMES:
+            return ormsgpack.packb([*head, frame.get("turn"), frame["data"]])
+        return ormsgpack.packb([*head, frame["data"]])
+
+    def decode(self, message: dict) -> Optional[dict]:
+        try:
+            decoded = ormsgpack.unpackb(message.get("bytes") or b"")
+        except ormsgpack.MsgpackDecodeError:
+            return None
+        return decoded if isinstance(decoded, dict) else None
+
+
+JSON = JsonCodec()
+MSGPACK = MsgpackCodec()
+
+
+def negotiate(subprotocols: list[str]) -> Codec:
+    """The codec for a client that offered ``subprotocols`` (JSON unless it
+    asked for MessagePack)."""
+    return MSGPACK if MSGPACK_SUBPROTOCOL in subprotocols else JSON
@@ -0,0 +1,2 @@
+"""Micro-benchmarks for the hot paths of the API. Run each from the repo root
+with ``python -m benchmarks.<name>``; they need no API key or network."""
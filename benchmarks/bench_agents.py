@@ -0,0 +1,152 @@
+"""Agent backends: per-chunk overhead, TTFT and import time, LangChain vs the SDK.
+
+Starts a stand-in Messages API in a subprocess. It answers every request
+with a canned SSE stream of ``--tokens`` text deltas, as the real API does,
+and both backends are pointed at it through ``ANTHROPIC_BASE_URL``. Each
+backend's :meth:`astream_respond` is then driven for ``--turns`` turns.
+Reported per backend:
+
+* ``ttft_ms`` — median wall time from the call to the first text chunk;
+* ``cpu_us_per_chunk`` — this process's CPU per streamed chunk (the server
+  runs in its own process, so none of its time is counted);
+* ``import_ms`` — median time to import the backend's module in a fresh
+  interpreter.
+
+    python -m benchmarks.bench_agents
+    python -m benchmarks.bench_agents --tokens 4096 --turns 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+_BACKENDS = {"langchain": "src.agents.base_agent", "anthropic": "src.agents.anthropic_agent"}
+
+
+def _sse(tokens: int) -> bytes:
+    def event(kind, **data):
+        return f"event: {kind}\ndata: {json.dumps({'type': kind, **data})}\n\n"
+
+    usage = {"input_tokens": 40, "output_tokens": 1,
+             "cache_read_input_tokens": 2000, "cache_creation_input_tokens": 0}
+    parts = [
+        event("message_start", message={
+            "id": "msg_bench", "type": "message", "role": "assistant", "model": "bench",
+            "content": [], "stop_reason": None, "stop_sequence": None, "usage": usage,
+        }),
+        event("content_block_start", index=0, content_block={"type": "text", "text": ""}),
+        *(event("content_block_delta", index=0, delta={"type": "text_delta", "text": f" tok{i}"})
+          for i in range(tokens)),
+        event("content_block_stop", index=0),
+        event("message_delta", delta={"stop_reason": "end_turn", "stop_sequence": None},
+              usage={"output_tokens": tokens}),
+        event("message_stop"),
+    ]
+    return "".join(parts).encode()
+
+
+def _serve(port: int, tokens: int) -> None:
+    """The stand-in Messages API (run in the subprocess)."""
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.responses import StreamingResponse
+    from starlette.routing import Route
+
+    body = _sse(tokens)
+
+    async def messages(request):
+        await request.body()
+
+        async def stream():
+            # In slices, as a real stream arrives over several reads.
+            for start in range(0, len(body), 4096):
+                yield body[start:start + 4096]
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    app = Starlette(routes=[Route("/v1/messages", messages, methods=["POST"])])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.05)
+    raise RuntimeError("stand-in API did not start")
+
+
+def _import_ms(module: str, runs: int = 5) -> float:
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    times = [float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True,
+                                  text=True).stdout) for _ in range(runs)]
+    return statistics.median(times) * 1000
+
+
+async def _drive(backend: str, turns: int, tokens: int) -> dict:
+    from src.agents.common import agent_class
+
+    agent = agent_class(backend)("Pro", "arguing FOR the topic", "Be persuasive.")
+    ttfts, cpu = [], []
+    # One untimed turn to open the connection pool.
+    [chunk async for chunk in agent.astream_respond("ctx", "instr")]
+    for _ in range(turns):
+        start, start_cpu, first, chunks = time.perf_counter(), time.process_time(), None, 0
+        async for _chunk in agent.astream_respond("ctx", "instr"):
+            if first is None:
+                first = time.perf_counter()
+            chunks += 1
+        cpu.append(time.process_time() - start_cpu)
+        ttfts.append(first - start)
+    assert chunks == tokens
+    return {
+        "ttft_ms": statistics.median(ttfts) * 1000,
+        "cpu_us_per_chunk": sum(cpu) / (turns * tokens) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=1024, help="text deltas per response")
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        _serve(args.serve, args.tokens)
+        return
+
+    port = _free_port()
+    server = subprocess.Popen([sys.executable, "-m", "benchmarks.bench_agents",
+                               "--serve", str(port), "--tokens", str(args.tokens)])
+    try:
+        _wait_for(port)
+        os.environ["ANTHROPIC_BASE_URL"] = os.environ["ANTHROPIC_API_URL"] = f"http://127.0.0.1:{port}"
+        os.environ.setdefault("ANTHROPIC_API_KEY", "bench")
+        results = {backend: {**asyncio.run(_drive(backend, args.turns, args.tokens)),
+                             "import_ms": _import_ms(module)}
+                   for backend, module in _BACKENDS.items()}
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{args.tokens} chunks per turn, {args.turns} turns")
+    print(f"{'':>18} {'langchain':>12} {'anthropic':>12}")
+    for key in results["langchain"]:
+        print(f"{key:>18} {results['langchain'][key]:>12,.2f} {results['anthropic'][key]:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
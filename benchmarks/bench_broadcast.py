@@ -0,0 +1,125 @@
+"""Spectator fan-out: one driver streaming a debate to N spectators.
+
+Replays a synthetic debate (phase changes, turns of small MESSAGE_CHUNKs)
+through a :class:`~api.services.broadcast.BroadcastHub` to ``--spectators``
+:class:`~api.services.socket_sender.SocketSender` queues on stand-in sockets,
+in one process, and reports how long the driver spends publishing (what a
+slow audience could otherwise steal from generation) and how long until
+every spectator has been sent every frame. ``--naive`` queues frames without
+pre-rendered text, so each spectator's writer serializes its own copy —
+the cost of fan-out before the hub serialized once.
+
+    python -m benchmarks.bench_broadcast --spectators 1000
+    python -m benchmarks.bench_broadcast --spectators 1000 --naive
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from api.services.broadcast import BroadcastHub
+from api.services.socket_sender import SocketSender
+
+
+class _Socket:
+    """Counts what it is sent; yields to the loop on every send like real I/O."""
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_text(self, text):
+        self.frames += 1
+        self.bytes += len(text)
+        await asyncio.sleep(0)
+
+    async def close(self, code=1000):
+        pass
+
+
+class _Session:
+    def __init__(self):
+        self.debate_id = "bench"
+        self.transcript: list[dict] = []
+
+
+def _debate_frames(turns: int, chunks: int):
+    """The driver's frames for a debate of ``turns`` turns of ``chunks`` chunks."""
+    def frame(kind, **data):
+        return {"type": kind, "debate_id": "bench", "data": data}
+
+    yield frame("debate_started", topic="Benchmark", pro_style="academic",
+                con_style="academic", resumed_from=0)
+    for turn in range(turns):
+        speaker = "PRO" if turn % 2 == 0 else "CON"
+        yield frame("phase_change", phase=f"phase-{turn}")
+        yield frame("message_start", speaker=speaker)
+        for i in range(chunks):
+            yield frame("message_chunk", speaker=speaker, chunk=f"tok{i} ")
+        yield frame("message_complete", speaker=speaker,
+                    content="".join(f"tok{i} " for i in range(chunks)), label=None)
+
+
+async def run(spectators: int, turns: int, chunks: int, naive: bool) -> dict:
+    session = _Session()
+    hub = BroadcastHub(session)
+    sockets = [_Socket() for _ in range(spectators)]
+    senders = [SocketSender(socket) for socket in sockets]
+    for sender in senders:
+        sender.start()
+        hub.attach(sender, driver=False)
+
+    publish_times = []
+    frames = 0
+    start = time.perf_counter()
+    for frame in _debate_frames(turns, chunks):
+        t0 = time.perf_counter()
+        if naive:
+            json.dumps(frame)  # the driver's own copy
+            for sender in senders:
+                sender.put(frame)
+        else:
+            hub.publish(frame)
+        publish_times.append(time.perf_counter() - t0)
+        frames += 1
+        # Let writers run between frames, as an LLM stream's awaits would.
+        await asyncio.sleep(0)
+    published = time.perf_counter() - start
+    await asyncio.gather(*(sender.flush() for sender in senders))
+    delivered = time.perf_counter() - start
+    for sender in senders:
+        sender.close()
+    hub.close()
+
+    publish_times.sort()
+    return {
+        "spectators": spectators,
+        "frames": frames,
+        "frames_sent": sum(socket.frames for socket in sockets),
+        "bytes_sent": sum(socket.bytes for socket in sockets),
+        "chunks_coalesced": sum(sender.coalesced for sender in senders),
+        "publish_p50_ms": statistics.median(publish_times) * 1000,
+        "publish_p99_ms": publish_times[int(len(publish_times) * 0.99)] * 1000,
+        "publish_total_s": published,
+        "delivered_s": delivered,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spectators", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=7)
+    parser.add_argument("--chunks", type=int, default=200, help="chunks per turn")
+    parser.add_argument("--naive", action="store_true",
+                        help="serialize per spectator instead of once per frame")
+    args = parser.parse_args()
+    result = asyncio.run(run(args.spectators, args.turns, args.chunks, args.naive))
+    mode = "naive (per-spectator json.dumps)" if args.naive else "hub (serialize once)"
+    print(f"mode: {mode}")
+    for key, value in result.items():
+        print(f"{key:>18}: {value:,.3f}" if isinstance(value, float) else f"{key:>18}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
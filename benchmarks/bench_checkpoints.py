@@ -0,0 +1,98 @@
+"""Per-turn checkpoint cost as a debate grows.
+
+Runs ``--debates`` debates of ``--turns`` turns (``--chars`` characters each)
+against a throwaway SQLite database and times each turn's checkpoint:
+
+* ``turns`` — ``save_checkpoint`` as the app calls it: the new turn appended
+  to ``debate_turns`` and the checkpoint row upserted, in WAL mode with
+  ``synchronous=NORMAL`` (what ``init_db`` and ``api.db`` set up);
+* ``--legacy`` — the old checkpoint: the whole transcript rewritten as one
+  JSON column after every turn, in SQLite's default rollback-journal mode.
+
+Reports the median time of the first and the last checkpoint of a debate,
+and the total per debate.
+
+    python -m benchmarks.bench_checkpoints
+    python -m benchmarks.bench_checkpoints --legacy --turns 200
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import JSON, Column, DateTime, MetaData, String, Table, create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from api import db
+from api.services import debate_repository
+
+_legacy = Table(
+    "legacy_checkpoints", MetaData(),
+    Column("id", String, primary_key=True),
+    Column("phase", String, nullable=False),
+    Column("transcript", JSON, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+
+def _legacy_checkpoint(debate_id: str, transcript: list[dict]) -> None:
+    with db.engine.begin() as connection:
+        connection.execute(_legacy.delete().where(_legacy.c.id == debate_id))
+        connection.execute(_legacy.insert().values(
+            id=debate_id, phase="rebuttal", transcript=transcript, updated_at=db.utcnow()))
+
+
+def run(debates: int, turns: int, chars: int, legacy: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db.engine = create_engine(f"sqlite:///{(Path(tmp) / 'bench.db').as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        if legacy:
+            _legacy.create(db.engine)
+        else:
+            event.listen(db.engine, "connect", db._sqlite_synchronous)
+            db.init_db()
+        per_turn = [[] for _ in range(turns)]
+        totals = []
+        for d in range(debates):
+            transcript = []
+            start = time.perf_counter()
+            for seq in range(turns):
+                transcript.append({"speaker": "PRO", "content": "x" * chars, "phase": "rebuttal"})
+                before = time.perf_counter()
+                if legacy:
+                    _legacy_checkpoint(f"debate-{d}", transcript)
+                else:
+                    debate_repository.save_checkpoint(
+                        debate_id=f"debate-{d}", topic="T", pro_style="passionate",
+                        con_style="academic", phase="rebuttal", turns=transcript[seq:],
+                        first_seq=seq, created_at=datetime(2025, 1, 1),
+                    )
+                per_turn[seq].append(time.perf_counter() - before)
+            totals.append(time.perf_counter() - start)
+        db.engine.dispose()
+    return {
+        "first_turn_ms": statistics.median(per_turn[0]) * 1000,
+        "last_turn_ms": statistics.median(per_turn[-1]) * 1000,
+        "per_debate_ms": statistics.median(totals) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=60)
+    parser.add_argument("--chars", type=int, default=2000, help="characters per turn")
+    parser.add_argument("--legacy", action="store_true",
+                        help="rewrite the whole transcript per turn (the old checkpoint)")
+    args = parser.parse_args()
+    mode = "legacy (JSON transcript rewrite)" if args.legacy else "turns (append, WAL)"
+    print(f"mode: {mode}, {args.debates} debates of {args.turns} turns x {args.chars} chars")
+    for key, value in run(args.debates, args.turns, args.chars, args.legacy).items():
+        print(f"{key:>14} {value:>10,.3f}")
+
+
+if __name__ == "__main__":
+    main()
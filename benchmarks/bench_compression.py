@@ -0,0 +1,156 @@
+"""Compressed debate storage: database size, and the cost on the read path.
+
+Fills a throwaway SQLite database with ``--debates`` finished debates saved
+as plain JSON text, the way they were stored before compression. Their turns
+are prose from a word-bigram chain over this repository's README and
+prompts, and each scoreboard has a handful of arguments per side. Then, for
+each codec in turn, it rewrites the archive with
+:func:`~api.services.debate_repository.recompress_debates` (timed), VACUUMs,
+and reports:
+
+* the size of the database file, and the stored payload per debate;
+* the median time to encode and to decode one debate's transcript and
+  scores;
+* the median time of ``get_debate`` (the detail read) on a fresh session.
+
+``zstd+dict`` first trains a dictionary on the archive with
+:func:`~api.services.debate_repository.train_compression_dictionary`. The
+zstd rows need the optional ``zstandard`` package.
+
+    python -m benchmarks.bench_compression
+    python -m benchmarks.bench_compression --debates 2000 --words 400
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from api import compression, db
+from api.services import debate_repository
+
+_CORPUS = ("README.md", "src/prompts.py")
+
+
+def _chain() -> dict[str, list[str]]:
+    words = []
+    for name in _CORPUS:
+        words += Path(name).read_text(encoding="utf-8").split()
+    chain: dict[str, list[str]] = {}
+    for current, following in zip(words, words[1:]):
+        chain.setdefault(current, []).append(following)
+    return chain
+
+
+def _prose(rng: random.Random, chain: dict[str, list[str]], words: int) -> str:
+    word = rng.choice(list(chain))
+    out = []
+    for _ in range(words):
+        out.append(word)
+        word = rng.choice(chain.get(word) or list(chain))
+    return " ".join(out)
+
+
+def _fill(debates: int, turns: int, words: int) -> None:
+    rng = random.Random(0)
+    chain = _chain()
+    start = datetime(2020, 1, 1)
+
+    def arguments():
+        return [{"summary": _prose(rng, chain, 20), "strength": rng.randint(1, 10),
+                 "evidence": rng.randint(1, 10), "rebutted": rng.random() < 0.3}
+                for _ in range(rng.randint(3, 6))]
+
+    def debate(i):
+        transcript = [{"speaker": "PRO" if turn % 2 == 0 else "CON",
+                       "content": _prose(rng, chain, words), "phase": f"phase-{turn}"}
+                      for turn in range(turns)]
+        scores = {"winner": "PRO", "pro_arguments": arguments(), "con_arguments": arguments(),
+                  "reasoning": _prose(rng, chain, 60)}
+        stamp = str(start + timedelta(minutes=i))
+        return (f"debate-{i:06d}", _prose(rng, chain, 8), "passionate", "academic", "PRO",
+                turns, json.dumps(transcript), json.dumps(scores), stamp, stamp)
+
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO debates (id, topic, pro_style, con_style, winner, message_count,"
+            " transcript, argument_scores, created_at, completed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [debate(i) for i in range(debates)],
+        )
+
+
+def _measure(path: Path, ids: list[str]) -> dict:
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.exec_driver_sql("VACUUM")
+        payload = connection.execute(text(
+            "SELECT AVG(length(transcript) + length(argument_scores)) FROM debates")).scalar()
+    encode, decode, detail = [], [], []
+    for debate_id in ids:
+        start = time.perf_counter()
+        with db.SessionLocal() as session:
+            row = debate_repository.get_debate(session, debate_id)
+        detail.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        stored = (compression.encode(row.transcript), compression.encode(row.argument_scores))
+        encode.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        compression.decode(stored[0]), compression.decode(stored[1])
+        decode.append(time.perf_counter() - start)
+    return {
+        "db_mb": path.stat().st_size / 1e6,
+        "payload_kb": payload / 1e3,
+        "encode_ms": statistics.median(encode) * 1000,
+        "decode_ms": statistics.median(decode) * 1000,
+        "get_debate_ms": statistics.median(detail) * 1000,
+    }
+
+
+def run(debates: int, turns: int, words: int, reads: int) -> dict[str, dict]:
+    codecs = ["none", "zlib"]
+    if compression.zstandard is not None:
+        codecs += ["zstd", "zstd+dict"]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        db.engine = create_engine(f"sqlite:///{path.as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        _fill(debates, turns, words)
+        ids = random.Random(1).sample([f"debate-{i:06d}" for i in range(debates)],
+                                      min(reads, debates))
+        compression.DEBATE_COMPRESSION = "none"
+        results["json text"] = {**_measure(path, ids), "migrate_s": 0.0}
+        for codec in codecs:
+            compression.DEBATE_COMPRESSION = codec.split("+")[0]
+            start = time.perf_counter()
+            if codec == "zstd+dict":
+                debate_repository.train_compression_dictionary()
+            debate_repository.recompress_debates(batch_size=500)
+            migrate = time.perf_counter() - start
+            results[codec] = {**_measure(path, ids), "migrate_s": migrate}
+        db.engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=20_000)
+    parser.add_argument("--turns", type=int, default=9)
+    parser.add_argument("--words", type=int, default=250, help="words per turn")
+    parser.add_argument("--reads", type=int, default=500, help="debates timed on the read path")
+    args = parser.parse_args()
+    print(f"{args.debates:,} debates of {args.turns} turns x {args.words} words")
+    for codec, result in run(args.debates, args.turns, args.words, args.reads).items():
+        print(f"{codec:>10}  " + "  ".join(f"{key}: {value:,.3f}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Debate detail: time per ``GET /api/debates/{id}`` for a finished debate.
+
+Saves ``--debates`` finished debates of ``--turns`` turns (``--chars``
+characters each) to a throwaway SQLite database, then times requests for
+them through the app in-process (``TestClient``), as the median over
+``--repeat`` passes of every debate:
+
+* ``rebuilt`` — the row's stored body removed, as for a debate saved before
+  bodies were stored: load the row, decompress and parse the JSON columns,
+  validate them into ``DebateDetail`` and serialize that again;
+* ``stored`` — the body stored at save time, read from the database with the
+  LRU off;
+* ``lru`` — the same body from a warm in-process LRU;
+* ``not_modified`` — ``If-None-Match`` with the ETag: a 304, no body;
+* ``floor`` — ``GET /api/config/styles``, which touches no database: the
+  cost of the in-process HTTP round trip itself.
+
+    python -m benchmarks.bench_debate_detail
+    python -m benchmarks.bench_debate_detail --turns 40 --chars 4000
+"""
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from api import db
+from api.services import debate_repository
+from api.services.detail_cache import DetailCache
+
+
+def _fill(debates: int, turns: int, chars: int) -> list[str]:
+    rows = [
+        debate_repository.debate_row(
+            debate_id=f"debate-{i:05d}", topic=f"Topic {i}", pro_style="passionate",
+            con_style="academic",
+            transcript=[{"speaker": "PRO" if turn % 2 == 0 else "CON",
+                         "content": f"{i} {turn} " + "lorem ipsum " * (chars // 12),
+                         "phase": f"phase-{turn}"} for turn in range(turns)],
+            argument_scores={"winner": "PRO", "pro_arguments": [], "con_arguments": []},
+            winner="PRO", created_at=datetime(2025, 1, 1),
+        )
+        for i in range(debates)
+    ]
+    for start in range(0, len(rows), 500):
+        debate_repository.save_completed_debates(rows[start:start + 500])
+    return [row["id"] for row in rows]
+
+
+def _time(client: TestClient, ids: list[str], repeat: int, headers=None, path=None) -> float:
+    passes = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for debate_id in ids:
+            client.get(path or f"/api/debates/{debate_id}", headers=(headers or {}).get(debate_id))
+        passes.append((time.perf_counter() - start) / len(ids))
+    return statistics.median(passes) * 1000
+
+
+def run(debates: int, turns: int, chars: int, repeat: int) -> dict:
+    os.environ.setdefault("ANTHROPIC_API_KEY", "bench")
+    from api.main import app
+
+    logging.disable(logging.INFO)  # the test client logs every request
+    client = TestClient(app)
+    with tempfile.TemporaryDirectory() as tmp:
+        db.engine = create_engine(f"sqlite:///{(Path(tmp) / 'bench.db').as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        ids = _fill(debates, turns, chars)
+        debate_repository._detail_cache = DetailCache(0)
+        result = {"stored_ms": _time(client, ids, repeat)}
+        etags = {debate_id: {"If-None-Match": client.get(f"/api/debates/{debate_id}").headers["etag"]}
+                 for debate_id in ids}
+        debate_repository._detail_cache = DetailCache(1 << 30)
+        _time(client, ids, 1)
+        result["lru_ms"] = _time(client, ids, repeat)
+        result["not_modified_ms"] = _time(client, ids, repeat, etags)
+        debate_repository._detail_cache = DetailCache(0)
+        with db.engine.begin() as connection:
+            connection.execute(text("UPDATE debates SET detail = NULL, detail_etag = NULL"))
+        result["rebuilt_ms"] = _time(client, ids, repeat)
+        result["floor_ms"] = _time(client, ids, repeat, path="/api/config/styles")
+        db.engine.dispose()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=500)
+    parser.add_argument("--turns", type=int, default=9)
+    parser.add_argument("--chars", type=int, default=2000, help="characters per turn")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(f"{args.debates:,} debates of {args.turns} turns x {args.chars} chars")
+    for key, value in run(args.debates, args.turns, args.chars, args.repeat).items():
+        print(f"{key:>16} {value:>10,.3f}")
+
+
+if __name__ == "__main__":
+    main()
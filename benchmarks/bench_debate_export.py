@@ -0,0 +1,113 @@
+"""Archive export: time and peak memory of an NDJSON export of every debate.
+
+Saves finished debates of ``--turns`` turns (``--chars`` characters each) to a
+throwaway SQLite database, growing it to each size in ``--debates``. At each
+size it exports the whole archive through ``debate_export.write`` (rows read
+``yield_per``, a batch at a time) into a sink that only counts bytes, plain
+and gzip. It reports the wall time and the peak Python heap of the export
+(``tracemalloc``, measured on a separate run). ``--naive`` exports by loading
+every row first (``.all()``), for comparison.
+
+    python -m benchmarks.bench_debate_export
+    python -m benchmarks.bench_debate_export --debates 1000 5000 20000 --naive
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from api import db
+from api.models import Debate
+from api.services import debate_export, debate_repository
+
+
+class _Sink:
+    """A binary file that keeps nothing but the count of bytes written."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data: bytes) -> int:
+        self.bytes += len(data)
+        return len(data)
+
+
+def _fill(start: int, stop: int, turns: int, chars: int) -> None:
+    first = datetime(2025, 1, 1)
+    for batch in range(start, stop, 500):
+        debate_repository.save_completed_debates([
+            debate_repository.debate_row(
+                debate_id=f"debate-{i:06d}", topic=f"Topic {i}", pro_style="passionate",
+                con_style="academic",
+                transcript=[{"speaker": "PRO" if turn % 2 == 0 else "CON",
+                             "content": f"{i} {turn} " + "lorem ipsum " * (chars // 12),
+                             "phase": f"phase-{turn}"} for turn in range(turns)],
+                argument_scores={"winner": "PRO", "pro_arguments": [], "con_arguments": []},
+                winner="PRO", created_at=first, completed_at=first + timedelta(minutes=i),
+            )
+            for i in range(batch, min(batch + 500, stop))
+        ])
+
+
+def _naive(out: _Sink, gzip: bool) -> None:
+    with db.SessionLocal() as session:
+        rows = session.execute(select(Debate.detail).order_by(Debate.saved_seq)).all()
+    data = b"".join(row.detail + b"\n" for row in rows)
+    out.write(zlib.compress(data, wbits=zlib.MAX_WBITS | 16) if gzip else data)
+
+
+def _export(naive: bool, gzip: bool) -> int:
+    out = _Sink()
+    if naive:
+        _naive(out, gzip)
+    else:
+        debate_export.write(out, gzip=gzip)
+    return out.bytes
+
+
+def _measure(naive: bool, gzip: bool) -> tuple[float, int, float]:
+    start = time.perf_counter()
+    size = _export(naive, gzip)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    _export(naive, gzip)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, size, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, nargs="+", default=[2000, 10000])
+    parser.add_argument("--turns", type=int, default=9)
+    parser.add_argument("--chars", type=int, default=2000, help="characters per turn")
+    parser.add_argument("--naive", action="store_true", help="also time loading every row first")
+    args = parser.parse_args()
+    print(f"{args.turns} turns x {args.chars} chars per debate")
+    print(f"{'debates':>8} {'path':>12} {'seconds':>8} {'output MB':>10} {'peak MB':>8}")
+    paths = [("stream", False, False), ("stream+gzip", False, True)]
+    if args.naive:
+        paths += [("naive", True, False), ("naive+gzip", True, True)]
+    with tempfile.TemporaryDirectory() as tmp:
+        db.engine = create_engine(f"sqlite:///{(Path(tmp) / 'bench.db').as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        saved = 0
+        for debates in sorted(args.debates):
+            _fill(saved, debates, args.turns, args.chars)
+            saved = debates
+            for name, naive, gzip in paths:
+                elapsed, size, peak = _measure(naive, gzip)
+                print(f"{debates:>8,} {name:>12} {elapsed:>8.2f} {size / 1e6:>10,.1f} {peak:>8,.1f}")
+        db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
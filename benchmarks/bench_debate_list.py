@@ -0,0 +1,110 @@
+"""Past-debates list: time per ``GET /api/debates`` with 10,000 stored debates.
+
+Fills a throwaway SQLite database with ``--debates`` finished debates of
+``--turns`` turns, once per transcript size in ``--chars`` (characters per
+turn), then times what the list endpoint does — ``list_debates`` plus the
+``DebateSummary`` serialisation of its 50 rows — as the median of
+``--repeat`` calls. ``--legacy`` times the old path instead: ``select(Debate)``
+with the transcript and scores loaded, and ``message_count`` computed as
+``len(transcript)``.
+
+    python -m benchmarks.bench_debate_list
+    python -m benchmarks.bench_debate_list --legacy --chars 100 1000 4000
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker, undefer_group
+
+from api import db
+from api.models import Debate
+from api.schemas.debate import DebateSummary
+from api.services import debate_repository
+
+
+def _fill(debates: int, turns: int, chars: int) -> None:
+    start = datetime(2025, 1, 1)
+    content = "x" * chars
+    transcript = [{"speaker": "PRO" if i % 2 == 0 else "CON", "content": content,
+                   "phase": f"phase-{i}"} for i in range(turns)]
+    scores = {"winner": "PRO", "pro_arguments": [], "con_arguments": []}
+    with db.session_scope() as session:
+        for batch in range(0, debates, 1000):
+            session.execute(insert(Debate), [
+                {"id": f"debate-{i:05d}", "topic": f"Topic {i}", "pro_style": "passionate",
+                 "con_style": "academic", "winner": "PRO", "message_count": turns,
+                 "transcript": transcript, "argument_scores": scores,
+                 "created_at": start + timedelta(minutes=i),
+                 "completed_at": start + timedelta(minutes=i, seconds=30)}
+                for i in range(batch, min(batch + 1000, debates))
+            ])
+
+
+class _LegacySummary:
+    """The old ``Debate.message_count`` property, over a fully loaded row."""
+
+    def __init__(self, debate: Debate):
+        self.__dict__.update({column: getattr(debate, column) for column in (
+            "id", "topic", "pro_style", "con_style", "winner", "created_at", "completed_at")})
+        self.message_count = len(debate.transcript or [])
+
+
+def _legacy_list(session) -> list:
+    stmt = (select(Debate).options(undefer_group("payload"))
+            .order_by(Debate.completed_at.desc()).limit(50))
+    return [_LegacySummary(debate) for debate in session.execute(stmt).scalars()]
+
+
+def _time_list(repeat: int, legacy: bool) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with db.SessionLocal() as session:
+            rows = _legacy_list(session) if legacy else debate_repository.list_debates(session)
+            summaries = [DebateSummary.model_validate(row).model_dump_json() for row in rows]
+        times.append(time.perf_counter() - start)
+    assert len(summaries) == 50
+    return statistics.median(times) * 1000
+
+
+def run(debates: int, turns: int, chars: int, repeat: int, legacy: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        db.engine = create_engine(f"sqlite:///{path.as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        _fill(debates, turns, chars)
+        result = {
+            "chars_per_turn": chars,
+            "db_mb": path.stat().st_size / 1e6,
+            "list_ms": _time_list(repeat, legacy),
+        }
+        db.engine.dispose()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=10_000)
+    parser.add_argument("--turns", type=int, default=9)
+    parser.add_argument("--chars", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--legacy", action="store_true",
+                        help="load whole rows and count the transcript (the old path)")
+    args = parser.parse_args()
+    print(f"mode: {'legacy (select(Debate), len(transcript))' if args.legacy else 'projection'}, "
+          f"{args.debates:,} debates of {args.turns} turns")
+    for chars in args.chars:
+        result = run(args.debates, args.turns, chars, args.repeat, args.legacy)
+        print("  ".join(f"{key}: {value:,.2f}" if isinstance(value, float) else f"{key}: {value:,}"
+                        for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
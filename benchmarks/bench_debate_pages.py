@@ -0,0 +1,113 @@
+"""Debate archive paging: time per page at a million stored debates.
+
+Fills a throwaway SQLite database with ``--debates`` finished debates (short
+transcripts: this measures the paging, see ``bench_debate_list`` for
+transcript size) and times, as the median of ``--repeat`` calls:
+
+* ``first_page`` — the newest 50;
+* ``deep_page`` — 50 rows from the far end of the archive, resumed from a
+  keyset cursor, and ``deep_offset`` — the same page by ``OFFSET``, for scale;
+* ``filtered_page`` — the newest 50 PRO wins in one style;
+* ``count_cold`` / ``count_cached`` — the total, uncached and cached.
+
+    python -m benchmarks.bench_debate_pages
+    python -m benchmarks.bench_debate_pages --debates 100000
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from api import db
+from api.models import Debate
+from api.services import debate_repository
+from api.services.debate_repository import DebateFilters
+
+_STYLES = ("passionate", "aggressive", "academic", "humorous")
+_WINNERS = ("PRO", "CON", "TIE")
+
+
+def _fill(debates: int) -> None:
+    start = datetime(2020, 1, 1)
+    rows = (
+        (f"debate-{i:07d}", f"Topic {i}", _STYLES[i % 4], _STYLES[(i // 4) % 4], _WINNERS[i % 3],
+         2, '[{"speaker":"PRO"},{"speaker":"CON"}]', None,
+         str(start + timedelta(seconds=i * 60)), str(start + timedelta(seconds=i * 60 + 30)))
+        for i in range(debates)
+    )
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO debates (id, topic, pro_style, con_style, winner, message_count,"
+            " transcript, argument_scores, created_at, completed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            list(rows),
+        )
+        connection.exec_driver_sql("ANALYZE")
+
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def run(debates: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db.engine = create_engine(f"sqlite:///{(Path(tmp) / 'bench.db').as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        _fill(debates)
+        session = db.SessionLocal()
+        # The cursor 50 rows before the oldest: the archive's last page.
+        with_key = (select(Debate.completed_at, Debate.id)
+                    .order_by(Debate.completed_at, Debate.id).offset(50).limit(1))
+        completed_at, debate_id = session.execute(with_key).one()
+        deep = debate_repository.encode_cursor(completed_at, debate_id)
+        filters = DebateFilters(winner="PRO", pro_style="academic")
+
+        def count_cold():
+            debate_repository._count_cache.clear()
+            debate_repository.count_debates(session)
+
+        def offset_page():
+            stmt = (select(*debate_repository._SUMMARY_COLUMNS)
+                    .order_by(Debate.completed_at.desc(), Debate.id.desc())
+                    .offset(debates - 100).limit(51))
+            return session.execute(stmt).all()
+
+        result = {
+            "first_page": _median_ms(lambda: debate_repository.page_debates(session), repeat),
+            "deep_page": _median_ms(
+                lambda: debate_repository.page_debates(session, cursor=deep), repeat),
+            "deep_offset": _median_ms(offset_page, max(repeat // 10, 3)),
+            "filtered_page": _median_ms(
+                lambda: debate_repository.page_debates(session, filters=filters), repeat),
+            "count_cold": _median_ms(count_cold, max(repeat // 10, 3)),
+            "count_cached": _median_ms(lambda: debate_repository.count_debates(session), repeat),
+        }
+        session.close()
+        db.engine.dispose()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    print(f"{args.debates:,} debates, median ms per call")
+    for key, value in run(args.debates, args.repeat).items():
+        print(f"{key:>14} {value:>10,.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Debate search: FTS5 query latency over 100,000 stored debates.
+
+Fills a throwaway SQLite database with ``--debates`` finished debates whose
+turns are drawn from a Zipf-ish vocabulary (so some words are everywhere and
+most are rare), indexes them with :func:`~api.services.debate_search.backfill`
+(timed), then reports the median time of ``--repeat`` searches — ranked,
+with snippets, 20 results — for queries of different selectivity.
+
+    python -m benchmarks.bench_debate_search
+    python -m benchmarks.bench_debate_search --debates 20000 --turns 9
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api import db
+from api.services import debate_search
+
+_QUERIES = {
+    "common word": "w1",
+    "rare word": "w4000",
+    "two words": "w3 w250",
+    "prefix": "w12",
+    "no match": "nothing",
+}
+
+
+def _fill(debates: int, turns: int, words: int, vocabulary: int) -> None:
+    rng = random.Random(0)
+    # Word i is drawn with weight 1/i: w1 is in nearly every debate, w4000 in few.
+    population = [f"w{i}" for i in range(1, vocabulary + 1)]
+    weights = [1 / i for i in range(1, vocabulary + 1)]
+    start = datetime(2020, 1, 1)
+
+    def debate(i):
+        transcript = [{"speaker": "PRO" if turn % 2 == 0 else "CON",
+                       "content": " ".join(rng.choices(population, weights, k=words)),
+                       "phase": f"phase-{turn}"} for turn in range(turns)]
+        scores = {"pro_arguments": [{"summary": " ".join(rng.choices(population, weights, k=8))}],
+                  "con_arguments": [], "winner": "PRO"}
+        stamp = str(start + timedelta(minutes=i))
+        return (f"debate-{i:06d}", " ".join(rng.choices(population, weights, k=6)), "passionate",
+                "academic", "PRO", turns, json.dumps(transcript), json.dumps(scores), stamp, stamp)
+
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO debates (id, topic, pro_style, con_style, winner, message_count,"
+            " transcript, argument_scores, created_at, completed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [debate(i) for i in range(debates)],
+        )
+
+
+def run(debates: int, turns: int, words: int, vocabulary: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        db.engine = create_engine(f"sqlite:///{path.as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        _fill(debates, turns, words, vocabulary)
+        start = time.perf_counter()
+        indexed = debate_search.backfill(batch_size=1000)
+        result = {"backfill_s": time.perf_counter() - start, "db_mb": path.stat().st_size / 1e6}
+        assert indexed == debates
+        with db.SessionLocal() as session:
+            for name, query in _QUERIES.items():
+                times = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    hits = debate_search.search(session, query)
+                    times.append(time.perf_counter() - start)
+                result[f"{name} ({len(hits)} hits) ms"] = statistics.median(times) * 1000
+        db.engine.dispose()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=100_000)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--words", type=int, default=40, help="words per turn")
+    parser.add_argument("--vocabulary", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    print(f"{args.debates:,} debates of {args.turns} turns x {args.words} words")
+    for key, value in run(args.debates, args.turns, args.words, args.vocabulary, args.repeat).items():
+        print(f"{key:>28} {value:>10,.2f}")
+
+
+if __name__ == "__main__":
+    main()
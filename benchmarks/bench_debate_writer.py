@@ -0,0 +1,82 @@
+"""Write-behind saves: what debate completion waits for, and write throughput.
+
+Saves ``--debates`` finished debates (``--turns`` turns of ``--chars``
+characters) to a throwaway SQLite database twice:
+
+* ``sync`` — one ``save_completed_debate`` per debate, as ``run_debate`` used
+  to await before sending ``debate_complete``;
+* ``write_behind`` — ``DebateWriter.enqueue`` per debate, then ``flush``; the
+  writer spools them and commits them in batches.
+
+For each it reports the median and p99 time the caller waited per debate and
+the total time until every debate was committed.
+
+    python -m benchmarks.bench_debate_writer
+    python -m benchmarks.bench_debate_writer --debates 5000 --chars 2000
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api import db
+from api.services import debate_repository, debate_writer
+
+
+def _fields(i: int, turns: int, chars: int) -> dict:
+    transcript = [{"speaker": "PRO" if turn % 2 == 0 else "CON", "content": "x" * chars,
+                   "phase": f"phase-{turn}"} for turn in range(turns)]
+    return dict(debate_id=f"debate-{i:06d}", topic=f"Topic {i}", pro_style="passionate",
+                con_style="academic", transcript=transcript,
+                argument_scores={"winner": "PRO", "pro_arguments": [], "con_arguments": []},
+                winner="PRO", created_at=datetime(2025, 1, 1))
+
+
+def _run(mode: str, debates: int, turns: int, chars: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db.engine = create_engine(f"sqlite:///{(Path(tmp) / 'bench.db').as_posix()}",
+                                  connect_args={"check_same_thread": False})
+        db.SessionLocal = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+        db.init_db()
+        debate_writer.DEBATE_SPOOL_DIR = str(Path(tmp) / "spool")
+        writer = debate_writer.DebateWriter()
+        waits = []
+        start = time.perf_counter()
+        for i in range(debates):
+            fields = _fields(i, turns, chars)
+            before = time.perf_counter()
+            if mode == "sync":
+                debate_repository.save_completed_debate(**fields)
+            else:
+                writer.enqueue(debate_repository.debate_row(**fields))
+            waits.append(time.perf_counter() - before)
+        assert writer.stop(timeout=600)
+        total = time.perf_counter() - start
+        db.engine.dispose()
+    waits.sort()
+    return {
+        "wait_median_ms": statistics.median(waits) * 1000,
+        "wait_p99_ms": waits[int(len(waits) * 0.99)] * 1000,
+        "all_committed_s": total,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=9)
+    parser.add_argument("--chars", type=int, default=1000, help="characters per turn")
+    args = parser.parse_args()
+    print(f"{args.debates:,} debates of {args.turns} turns x {args.chars} chars")
+    for mode in ("sync", "write_behind"):
+        result = _run(mode, args.debates, args.turns, args.chars)
+        print(f"{mode:>13}  " + "  ".join(f"{key}: {value:,.3f}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
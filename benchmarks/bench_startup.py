@@ -0,0 +1,70 @@
+"""Start-up cost: ``python -X importtime`` totals for the API and the CLI.
+
+Imports each entry point (``api.main``, ``main``) in a fresh interpreter
+under ``-X importtime`` and sums the per-module self times it reports — the
+import cost of that entry point, without the interpreter's own start-up.
+Reports the median over ``--runs`` runs and the modules that cost the most
+(cumulative, as imported at the top level). With ``--budget-ms`` the exit
+status is 1 if either total exceeds it, so CI can hold the line.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 9 --top 5 --budget-ms 1500
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+_ENTRY_POINTS = ("api.main", "main")
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _importtime(module: str) -> list[tuple[int, int, str]]:
+    """``(self_us, cumulative_us, name)`` per module ``module`` imported."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_ROOT, check=True, capture_output=True, text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(own), int(cumulative), name[1:].rstrip()))
+    return rows
+
+
+def run(module: str, runs: int, top: int) -> dict:
+    totals, heaviest = [], {}
+    for _ in range(runs):
+        rows = _importtime(module)
+        totals.append(sum(own for own, _, _ in rows) / 1000)
+        # Direct children of the entry point: indented by exactly two spaces.
+        for _, cumulative, name in rows:
+            if name.startswith("  ") and not name.startswith("   "):
+                heaviest.setdefault(name.strip(), []).append(cumulative / 1000)
+    ranked = sorted(((statistics.median(ms), name) for name, ms in heaviest.items()), reverse=True)
+    return {"total_ms": statistics.median(totals), "modules": len(rows), "heaviest": ranked[:top]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="heaviest imports to list")
+    parser.add_argument("--budget-ms", type=float, help="fail if an entry point exceeds this")
+    args = parser.parse_args()
+    over = False
+    for module in _ENTRY_POINTS:
+        result = run(module, args.runs, args.top)
+        print(f"{module}: {result['total_ms']:,.0f} ms across {result['modules']} modules")
+        for ms, name in result["heaviest"]:
+            print(f"  {name:<40} {ms:>8,.0f} ms")
+        over = over or (args.budget_ms is not None and result["total_ms"] > args.budget_ms)
+    if over:
+        print(f"over the {args.budget_ms:,.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
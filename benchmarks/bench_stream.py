@@ -0,0 +1,95 @@
+"""Stream accumulation: CPU per streamed turn, by response length.
+
+Feeds a :class:`~src.agents.base_agent.DebateAgent` a canned stream of
+LangChain ``AIMessageChunk``s shaped like langchain-anthropic's (one text
+delta per token, usage on the final ``message_delta`` chunk) and consumes it
+the way ``DebateService._stream_agent_response`` does, collecting the turn's
+text. Reports process CPU per turn at each ``--max-tokens`` length, for the
+current path and for ``--legacy`` — merging every chunk into an aggregate
+message and growing the turn's text with ``+=``, as before.
+
+    python -m benchmarks.bench_stream
+    python -m benchmarks.bench_stream --max-tokens 1024 8192 --turns 20
+"""
+import argparse
+import asyncio
+import time
+
+from langchain_core.messages import AIMessageChunk
+
+from src.agents.base_agent import DebateAgent
+
+
+def _chunks(tokens: int) -> list[AIMessageChunk]:
+    """A response of ``tokens`` tokens as langchain-anthropic streams it."""
+    chunks = [AIMessageChunk(content="")]
+    chunks += [AIMessageChunk(content=f" tok{i % 1000}") for i in range(tokens)]
+    chunks.append(AIMessageChunk(content="", usage_metadata={
+        "input_tokens": 40, "output_tokens": tokens, "total_tokens": 40 + tokens,
+        "input_token_details": {"cache_read": 2000, "cache_creation": 0},
+    }))
+    return chunks
+
+
+class _Chain:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def astream(self, payload):
+        for chunk in self.chunks:
+            yield chunk
+
+
+async def _legacy_stream(agent: DebateAgent):
+    aggregate = None
+    async for chunk in agent.chain.astream({}):
+        aggregate = chunk if aggregate is None else aggregate + chunk
+        if chunk.content:
+            yield chunk.content
+    agent._record_usage(getattr(aggregate, "usage_metadata", None))
+
+
+async def _turn(agent: DebateAgent, legacy: bool) -> str:
+    if legacy:
+        full_content = ""
+        async for chunk in _legacy_stream(agent):
+            full_content += chunk
+        return full_content
+    parts = []
+    async for chunk in agent.astream_respond("ctx", "instr"):
+        parts.append(chunk)
+    return "".join(parts)
+
+
+async def run(max_tokens: int, turns: int, legacy: bool) -> dict:
+    agent = DebateAgent("Pro", "arguing FOR", "Be persuasive.")
+    agent.chain = _Chain(_chunks(max_tokens))
+    cpu = []
+    for _ in range(turns):
+        start = time.process_time()
+        content = await _turn(agent, legacy)
+        cpu.append(time.process_time() - start)
+    assert len(content.split()) == max_tokens
+    return {
+        "max_tokens": max_tokens,
+        "cpu_ms_per_turn": sum(cpu) / turns * 1000,
+        "output_tokens_recorded": agent.usage["output"] // turns,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-tokens", type=int, nargs="+", default=[1024, 8192])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--legacy", action="store_true",
+                        help="merge chunks and grow the text with += (the old path)")
+    args = parser.parse_args()
+    print(f"mode: {'legacy (aggregate + chunk, +=)' if args.legacy else 'list + join'}")
+    for max_tokens in args.max_tokens:
+        result = asyncio.run(run(max_tokens, args.turns, args.legacy))
+        print("  ".join(f"{key}: {value:,.2f}" if isinstance(value, float) else f"{key}: {value:,}"
+                        for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
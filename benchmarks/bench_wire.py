@@ -0,0 +1,126 @@
+"""Wire encodings: bytes on the wire and server CPU per debate, JSON vs MessagePack.
+
+Streams a synthetic debate (phase changes, turns of token-sized
+MESSAGE_CHUNKs, a transcript-sized ``debate_complete``) through a
+:class:`~api.services.broadcast.BroadcastHub` to one
+:class:`~api.services.socket_sender.SocketSender` per encoding, on stand-in
+sockets that count what they are sent. Reports, per encoding, the bytes sent
+for the debate and the process CPU time spent publishing, encoding and
+draining it, averaged over ``--debates`` runs.
+
+    python -m benchmarks.bench_wire
+    python -m benchmarks.bench_wire --turns 9 --chunks 400
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from api.services.broadcast import BroadcastHub
+from api.services.socket_sender import SocketSender
+from api.services.wire import JSON, MSGPACK
+
+
+class _Socket:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_text(self, text):
+        self.frames += 1
+        self.bytes += len(text.encode())
+
+    async def send_bytes(self, data):
+        self.frames += 1
+        self.bytes += len(data)
+
+    async def close(self, code=1000):
+        pass
+
+
+class _Session:
+    def __init__(self, debate_id):
+        self.debate_id = debate_id
+        self.transcript: list[dict] = []
+
+
+def _debate_frames(debate_id: str, turns: int, chunks: int):
+    """What a debate of ``turns`` turns of ``chunks`` token-sized chunks streams."""
+    def frame(kind, **data):
+        return {"type": kind, "debate_id": debate_id, "data": data}
+
+    transcript = []
+    yield frame("debate_started", topic="Should cities ban cars from downtown?",
+                pro_style="academic", con_style="passionate", resumed_from=0)
+    for turn in range(turns):
+        speaker = "PRO" if turn % 2 == 0 else "CON"
+        yield frame("phase_change", phase=f"phase-{turn}")
+        yield frame("message_start", speaker=speaker)
+        tokens = [f" word{i % 97}" for i in range(chunks)]
+        for token in tokens:
+            yield frame("message_chunk", speaker=speaker, chunk=token)
+        content = "".join(tokens)
+        transcript.append({"speaker": speaker, "content": content, "phase": f"phase-{turn}"})
+        yield frame("message_complete", speaker=speaker, content=content, label=None)
+    yield frame("debate_complete", winner="PRO", transcript=transcript)
+
+
+async def _stream(codec, turns: int, chunks: int) -> tuple[int, int, float]:
+    debate_id = str(uuid.uuid4())
+    hub = BroadcastHub(_Session(debate_id))
+    socket = _Socket()
+    # Deep enough that nothing is coalesced: every frame goes on the wire.
+    sender = SocketSender(socket, max_frames=1 << 20, codec=codec)
+    sender.start()
+    hub.attach(sender, driver=True)
+    frames = list(_debate_frames(debate_id, turns, chunks))
+    start = time.process_time()
+    for frame in frames:
+        hub.publish(frame)
+    await sender.flush()
+    cpu = time.process_time() - start
+    sender.close()
+    hub.close()
+    return socket.frames, socket.bytes, cpu
+
+
+def _encoded_size(codec, frame: dict) -> int:
+    encoded = codec.encode(frame)
+    return len(encoded.encode() if isinstance(encoded, str) else encoded)
+
+
+async def run(debates: int, turns: int, chunks: int) -> dict:
+    # A chunk frame in isolation, for the per-token overhead.
+    chunk = {"type": "message_chunk", "debate_id": str(uuid.uuid4()), "seq": 1234, "turn": 3,
+             "data": {"speaker": "PRO", "chunk": " word"}}
+    results = {}
+    for codec in (JSON, MSGPACK):
+        runs = [await _stream(codec, turns, chunks) for _ in range(debates)]
+        frames, sent, _ = runs[0]
+        results[codec.name] = {
+            "frames": frames,
+            "bytes_per_debate": sent,
+            "bytes_per_chunk_frame": _encoded_size(codec, chunk),
+            "cpu_ms_per_debate": sum(cpu for *_, cpu in runs) / debates * 1000,
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=20, help="runs to average CPU over")
+    parser.add_argument("--turns", type=int, default=7)
+    parser.add_argument("--chunks", type=int, default=300, help="chunks per turn")
+    args = parser.parse_args()
+    results = asyncio.run(run(args.debates, args.turns, args.chunks))
+    keys = list(results[JSON.name])
+    print(f"{'':>22} {'json':>12} {'msgpack':>12} {'ratio':>8}")
+    for key in keys:
+        json_value, msgpack_value = results[JSON.name][key], results[MSGPACK.name][key]
+        fmt = "{:>12,.2f}" if isinstance(json_value, float) else "{:>12,}"
+        print(f"{key:>22} {fmt.format(json_value)} {fmt.format(msgpack_value)} "
+              f"{msgpack_value / json_value:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
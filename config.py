@@ -8,6 +8,11 @@ class Settings(BaseSettings):
     model_config = ConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     model_name: str = "claude-sonnet-4-6"
+    # How agents call the model (src/agents/common.py): "langchain" through a
+    # ChatPromptTemplate | ChatAnthropic chain, or "anthropic" straight through
+    # the Anthropic SDK — same prompt, caching, scoring and errors, with less
+    # per-chunk overhead and without importing LangChain.
+    agent_backend: str = "langchain"
     temperature_debaters: float = 0.7
     temperature_judge: float = 0.3
     max_tokens: int = 1024
@@ -18,25 +23,84 @@ class Settings(BaseSettings):
     # validation. Kept separate so raising it doesn't also inflate (and slow
     # down) every ordinary turn.
     scoring_max_tokens: int = 4096
+    # Judge panel (src/judge_panel.py): with more than one judge, every judge
+    # scores the finished debate concurrently and the scoreboards are merged
+    # (mean averages, majority winner). Models and temperatures are assigned
+    # round-robin from these lists; empty means MODEL_NAME / TEMPERATURE_JUDGE.
+    # The first judge also moderates and gives the verdict, as a lone judge does.
+    judge_panel_size: int = 1
+    judge_panel_models: Annotated[list[str], NoDecode] = []
+    judge_panel_temperatures: Annotated[list[float], NoDecode] = []
     num_rebuttal_rounds: int = 2
-    # Live in-memory debate sessions are held per-process (single uvicorn worker —
-    # see api.services.debate_service). Cap how many can exist at once so a flood
-    # of POST /api/debates calls that never open a WebSocket can't exhaust memory;
-    # the create endpoint returns HTTP 429 once this many are live.
-    max_live_sessions: int = 100
-    # A session created via POST but never driven by a WebSocket is an orphan; a
-    # background sweeper evicts orphans whose age exceeds this many seconds. A
-    # live debate (a socket is driving it) is never swept, so this can sit well
-    # below a debate's natural length.
+    # Ceiling on debates generating at once (admitted sessions — see
+    # api.services.session_store), across every worker sharing the store. The
+    # memory budget below is what normally binds; further sockets wait in a
+    # FIFO admission queue and are streamed QUEUE_POSITION events meanwhile.
+    max_live_sessions: int = 500
+    # A debate is admitted only while this process's sessions plus its
+    # projected peak footprint (DebateService.projected_footprint: transcript,
+    # agent clients, buffered frames) fit in this many bytes — so many light
+    # debates share a box that a few judge-panel debates would fill.
+    session_memory_budget_bytes: int = 1024 * 1024 * 1024
+    # Estimated resident cost of one agent (its ChatAnthropic client and HTTP
+    # pool); a debate holds two debaters plus JUDGE_PANEL_SIZE judges.
+    agent_footprint_bytes: int = 3 * 1024 * 1024
+    # Bound on sessions not yet generating (created, or queued for a slot), so
+    # a flood of POST /api/debates calls can't grow memory without limit; the
+    # create endpoint returns HTTP 429 once this many are waiting.
+    admission_queue_size: int = 200
+    # How often (seconds) a queued socket re-checks its place when no local
+    # slot release wakes it sooner (releases on other workers aren't signalled).
+    admission_poll_seconds: float = 1.0
+    # Prior for the queue wait estimate until this process has timed a debate.
+    admission_default_debate_seconds: float = 180.0
+    # A session created via POST but never driven by a WebSocket is an orphan;
+    # its deadline (api/services/deadlines.py) evicts it this many seconds after
+    # creation. A live debate (a socket is driving it) has no orphan deadline,
+    # so this can sit well below a debate's natural length.
     session_ttl_seconds: float = 900.0
-    # How often (seconds) the background sweeper wakes to evict expired orphans.
+    # A running debate that streams no event for this long (a stalled LLM call,
+    # a socket that stopped draining) is ended; the audience vote is exempt.
+    session_idle_seconds: float = 180.0
+    # Hard bound on a debate's wall time from admission to completion.
+    max_debate_seconds: float = 1800.0
+    # How often (seconds) a shared session store is swept for records whose
+    # worker died. Unused with the per-process "memory" store.
     session_sweep_interval_seconds: float = 60.0
+    # Where live-session metadata, the MAX_LIVE_SESSIONS count, and run
+    # ownership live (api/services/session_store.py): "memory" is per-process
+    # (one uvicorn worker); "sqlite" shares them through SESSION_STORE_PATH so
+    # the API can run with --workers N on one host.
+    session_store: str = "memory"
+    session_store_path: str = "./sessions.db"
+    # A started session whose worker stopped reporting progress for this long
+    # (it crashed mid-debate) is swept from a shared store, freeing its slot.
+    session_stale_seconds: float = 3600.0
+    # Each WebSocket gets a writer task fed by a send queue of this many frames
+    # (api/services/socket_sender.py), so a slow client never slows the LLM
+    # stream. Past the bound, queued MESSAGE_CHUNKs are merged into one frame.
+    ws_send_queue_size: int = 256
+    # A client that doesn't accept a frame within this many seconds is stuck
+    # and is disconnected (its debate stays resumable from the checkpoint).
+    ws_send_timeout_seconds: float = 30.0
+    # Each live debate keeps its last this-many streamed frames, numbered by
+    # ``seq``, so a client reconnecting with ``?last_seq=N`` is sent only what
+    # it missed (api/services/broadcast.py).
+    event_buffer_size: int = 4096
+    # After the driving socket drops, the debate keeps generating for this
+    # long waiting for it to reconnect before it is ended and evicted.
+    reconnect_grace_seconds: float = 60.0
     # Resilience for the LLM calls (see src/agents/base_agent.py).
     # request_timeout is seconds per request; max_retries is how many times the
     # Anthropic SDK retries transient failures (429 / 5xx / connection) with
     # exponential backoff before giving up.
     request_timeout: float = 60.0
     max_retries: int = 2
+    # Start-up warm-up (api/services/warmup.py): import the agent backend,
+    # build a set of agents and open the API connection pool before /health
+    # reports ready. Off by default; the upstream call is bounded by the timeout.
+    warmup_on_startup: bool = False
+    warmup_timeout_seconds: float = 10.0
     # The single source of truth for allowed CORS origins (used by api/main.py):
     # the Vite dev server, its preview server, and the 127.0.0.1 alias of the dev
     # server. ``NoDecode`` opts this list out of pydantic-settings' default JSON
@@ -60,8 +124,53 @@ class Settings(BaseSettings):
     # Where completed debates are persisted (see api/db.py). A local SQLite file
     # by default; override with the DATABASE_URL env var for another backend.
     database_url: str = "sqlite:///./debates.db"
+    # An unfinished debate is checkpointed after every turn so it can resume
+    # after a restart; checkpoints nobody resumed within this many seconds are
+    # purged at startup.
+    checkpoint_ttl_seconds: float = 86400.0
+    # How long GET /api/debates may serve a cached total count (per filter);
+    # a save in the same worker clears it at once.
+    debate_count_cache_seconds: float = 30.0
+    # Finished debates are saved write-behind (api/services/debate_writer.py):
+    # one writer thread per worker appends them to a spool file in this
+    # directory (fsynced, so a crash loses nothing), then commits them to the
+    # database up to DEBATE_WRITE_BATCH_SIZE per transaction. A failed commit
+    # is retried after DEBATE_WRITE_RETRY_SECONDS, doubling each time; on
+    # shutdown the writer keeps trying for DEBATE_WRITE_DRAIN_SECONDS, and
+    # whatever is still unsaved is replayed from the spool on the next start.
+    debate_spool_dir: str = "./debate-spool"
+    debate_write_batch_size: int = 100
+    debate_write_retry_seconds: float = 1.0
+    debate_write_drain_seconds: float = 10.0
+    # How a finished debate's transcript and scores are stored (api/compression.py):
+    # "zlib"; "zstd", with the newest dictionary trained on this archive by
+    # ``python main.py compress-debates --train-dictionary`` (needs the
+    # optional zstandard package); or "none" for plain JSON. Reads handle every
+    # encoding, so changing it only affects new saves until compress-debates
+    # rewrites the older rows.
+    debate_compression: str = "zlib"
+    # A finished debate never changes, so GET /api/debates/{id} serves the
+    # response body serialized when it was saved, with a strong ETag and a
+    # Cache-Control letting clients and proxies keep it this long. Each worker
+    # keeps the most recently read bodies in an LRU of up to this many bytes.
+    debate_detail_max_age_seconds: int = 365 * 24 * 3600
+    debate_detail_cache_bytes: int = 64 * 1024 * 1024
+    # Headless batch mode (``python main.py batch``): how many debates run at
+    # once. Each live debate holds three LLM clients and streams concurrently,
+    # so this is the knob that trades sweep wall-time against API rate limits.
+    batch_concurrency: int = 4
+    # Style tournament Elo (src/tournament.py): every style starts at the
+    # initial rating, and K bounds how far one result can move it.
+    tournament_elo_k: float = 32.0
+    tournament_elo_initial: float = 1500.0
 
-    @field_validator("cors_origins", "available_styles", mode="before")
+    @field_validator(
+        "cors_origins",
+        "available_styles",
+        "judge_panel_models",
+        "judge_panel_temperatures",
+        mode="before",
+    )
     @classmethod
     def _split_comma_separated_list(cls, value: object) -> object:
         """Accept these list settings as a comma-separated string as well as a list.
@@ -79,18 +188,50 @@ settings = Settings()
 
 # Re-export as module-level names so all existing imports work unchanged
 MODEL_NAME = settings.model_name
+AGENT_BACKEND = settings.agent_backend
 TEMPERATURE_DEBATERS = settings.temperature_debaters
 TEMPERATURE_JUDGE = settings.temperature_judge
 MAX_TOKENS = settings.max_tokens
 SCORING_MAX_TOKENS = settings.scoring_max_tokens
+JUDGE_PANEL_SIZE = settings.judge_panel_size
+JUDGE_PANEL_MODELS = settings.judge_panel_models
+JUDGE_PANEL_TEMPERATURES = settings.judge_panel_temperatures
 NUM_REBUTTAL_ROUNDS = settings.num_rebuttal_rounds
 MAX_LIVE_SESSIONS = settings.max_live_sessions
+SESSION_MEMORY_BUDGET_BYTES = settings.session_memory_budget_bytes
+AGENT_FOOTPRINT_BYTES = settings.agent_footprint_bytes
+ADMISSION_QUEUE_SIZE = settings.admission_queue_size
+ADMISSION_POLL_SECONDS = settings.admission_poll_seconds
+ADMISSION_DEFAULT_DEBATE_SECONDS = settings.admission_default_debate_seconds
 SESSION_TTL_SECONDS = settings.session_ttl_seconds
+SESSION_IDLE_SECONDS = settings.session_idle_seconds
+MAX_DEBATE_SECONDS = settings.max_debate_seconds
 SESSION_SWEEP_INTERVAL_SECONDS = settings.session_sweep_interval_seconds
+SESSION_STORE = settings.session_store
+SESSION_STORE_PATH = settings.session_store_path
+SESSION_STALE_SECONDS = settings.session_stale_seconds
+WS_SEND_QUEUE_SIZE = settings.ws_send_queue_size
+WS_SEND_TIMEOUT_SECONDS = settings.ws_send_timeout_seconds
+EVENT_BUFFER_SIZE = settings.event_buffer_size
+RECONNECT_GRACE_SECONDS = settings.reconnect_grace_seconds
 REQUEST_TIMEOUT = settings.request_timeout
 MAX_RETRIES = settings.max_retries
+WARMUP_ON_STARTUP = settings.warmup_on_startup
+WARMUP_TIMEOUT_SECONDS = settings.warmup_timeout_seconds
 CORS_ORIGINS = settings.cors_origins
 AVAILABLE_STYLES = settings.available_styles
 DEFAULT_PRO_STYLE = settings.default_pro_style
 DEFAULT_CON_STYLE = settings.default_con_style
 DATABASE_URL = settings.database_url
+CHECKPOINT_TTL_SECONDS = settings.checkpoint_ttl_seconds
+DEBATE_COUNT_CACHE_SECONDS = settings.debate_count_cache_seconds
+DEBATE_SPOOL_DIR = settings.debate_spool_dir
+DEBATE_WRITE_BATCH_SIZE = settings.debate_write_batch_size
+DEBATE_WRITE_RETRY_SECONDS = settings.debate_write_retry_seconds
+DEBATE_WRITE_DRAIN_SECONDS = settings.debate_write_drain_seconds
+DEBATE_COMPRESSION = settings.debate_compression
+DEBATE_DETAIL_MAX_AGE_SECONDS = settings.debate_detail_max_age_seconds
+DEBATE_DETAIL_CACHE_BYTES = settings.debate_detail_cache_bytes
+BATCH_CONCURRENCY = settings.batch_concurrency
+TOURNAMENT_ELO_K = settings.tournament_elo_k
+TOURNAMENT_ELO_INITIAL = settings.tournament_elo_initial
@@ -1,5 +1,10 @@
 # Root conftest.py — lets pytest find src/, api/, config.py from the project root,
 # and provides shared fixtures for mocking the LLM in web-layer tests.
+import asyncio
+import json
+import threading
+
+import ormsgpack
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -12,12 +17,22 @@ def _reset_debate_sessions():
 
     The REST/WebSocket layer shares one module-level ``debate_service`` singleton;
     a test that creates a debate without driving it to completion would otherwise
-    leak that session into the next test (and skew the MAX_LIVE_SESSIONS cap).
+    leak that session into the next test (and skew the MAX_LIVE_SESSIONS cap,
+    which is counted in its session store — so that is replaced too, and its
+    pending deadlines are dropped). Its write-behind writer is replaced, so no
+    debate queued in one test is written into the next one's database.
     """
     from api.services.debate_service import debate_service
-    debate_service.sessions.clear()
+    from api.services.debate_writer import DebateWriter
+    from api.services.session_store import InMemorySessionStore
+    debate_service.clear_sessions()
+    debate_service.store = InMemorySessionStore()
+    debate_service.deadlines.clear()
+    debate_service.writer = DebateWriter()
     yield
-    debate_service.sessions.clear()
+    debate_service.clear_sessions()
+    debate_service.store = InMemorySessionStore()
+    debate_service.deadlines.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -32,6 +47,9 @@ def _test_db(monkeypatch, tmp_path):
     from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
     from api import db
+    from api.services import debate_repository
+    from api.services.detail_cache import DetailCache
+    from config import DEBATE_DETAIL_CACHE_BYTES
 
     db_path = tmp_path / "test_debates.db"
     engine = create_engine(
@@ -44,7 +62,18 @@ def _test_db(monkeypatch, tmp_path):
         sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
     )
     db.init_db()  # reads the patched engine; creates the debates table
+    # Counts and bodies cached against another test's database would leak
+    # into this one.
+    monkeypatch.setattr(debate_repository, "_count_cache", {})
+    monkeypatch.setattr(debate_repository, "_detail_cache", DetailCache(DEBATE_DETAIL_CACHE_BYTES))
+    # The write-behind spool, likewise, goes in the test's own directory.
+    monkeypatch.setattr("api.services.debate_writer.DEBATE_SPOOL_DIR", str(tmp_path / "spool"))
     yield
+    # Let every write-behind writer (DebateService() instances included)
+    # finish, so none commits a debate into the next test's database.
+    for thread in threading.enumerate():
+        if thread.name == "debate-writer":
+            thread.join(5)
     engine.dispose()
 
 
@@ -104,3 +133,46 @@ def mock_build_agents(make_mock_agent):
 
     with patch("api.services.debate_service.build_agents", side_effect=factory) as m:
         yield m
+
+
+class FakeClock:
+    """A monotonic clock tests advance by hand (for deadline schedulers)."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+class FakeSocket:
+    """A WebSocket stand-in for send-queue tests: collects sent frames
+    (decoded — MessagePack ones as their arrays); ``gate`` holds each send
+    until set, ``hang`` never returns."""
+
+    def __init__(self, *, hang: bool = False):
+        self.sent: list[dict] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.hang = hang
+        self.closed_with = None
+
+    async def send_text(self, text: str) -> None:
+        if self.hang:
+            await asyncio.Event().wait()
+        await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self.send_text(json.dumps(ormsgpack.unpackb(data)))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
@@ -2,7 +2,36 @@ import { useState, useCallback, useRef } from 'react';
 import { useDebateStore } from './stores/debateStore';
 import { DebateSetup, DebateChat, PastDebates } from './components/debate';
 import { strings } from './constants/strings';
-import type { DebateScores, DebatePhase, Speaker, WSMessage, Vote } from './types/debate';
+import type { DebateMessage, DebateScores, DebatePhase, PastDebateDetail, QueueStatus, Speaker, TranscriptDigest, WSMessage, Vote } from './types/debate';
+
+const MAX_RECONNECTS = 3;
+const RECONNECT_DELAY_MS = 1000;
+
+// The digest debate_complete carries (see DebateState.transcript_digest).
+// crypto.subtle only exists in secure contexts; elsewhere just the count is
+// compared.
+async function matchesDigest(messages: DebateMessage[], digest: TranscriptDigest): Promise<boolean> {
+  if (messages.length !== digest.count) return false;
+  if (!globalThis.crypto?.subtle) return true;
+  const canonical = JSON.stringify(messages.map((m) => [m.speaker, m.content]));
+  const hash = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(canonical));
+  const hex = Array.from(new Uint8Array(hash), (b) => b.toString(16).padStart(2, '0')).join('');
+  return hex === digest.sha256;
+}
+
+// debate_complete doesn't repeat the transcript. If the copy assembled from
+// the stream doesn't match its digest, load the saved debate instead.
+async function verifyTranscript(debateId: string, digest: TranscriptDigest | undefined) {
+  if (!digest || await matchesDigest(useDebateStore.getState().messages, digest)) return;
+  try {
+    const response = await fetch(`/api/debates/${debateId}`);
+    if (!response.ok) return;
+    const saved: PastDebateDetail = await response.json();
+    useDebateStore.getState().replaceMessages(saved.transcript as DebateMessage[]);
+  } catch (err) {
+    console.error('Failed to reload the debate transcript', err);
+  }
+}
 
 function App() {
   const {
@@ -20,10 +49,14 @@ function App() {
     finishStreaming,
     addMessage,
     setScores,
+    setQueue,
   } = useDebateStore();
   const [isLoading, setIsLoading] = useState(false);
   const [view, setView] = useState<'setup' | 'history'>('setup');
   const wsRef = useRef<WebSocket | null>(null);
+  // Highest frame seq received, so a dropped socket can reconnect with
+  // ?last_seq= and be replayed only what it missed.
+  const lastSeqRef = useRef<number | null>(null);
 
   // Defined before handleStart so it can be a stable dependency of it. Every
   // dependency below is a Zustand action (stable identity), so this callback
@@ -37,8 +70,20 @@ function App() {
     const { type, data } = message;
 
     switch (type) {
+      case 'queue_position':
+        // Every generating slot is busy: keep the setup form locked and show
+        // the place in line until debate_started arrives.
+        setIsLoading(true);
+        setQueue(data as unknown as QueueStatus);
+        break;
+
       case 'debate_started':
         startDebate(message.debate_id, topic, proStyle, conStyle);
+        // A debate resumed from a server-side checkpoint replays the turns
+        // that were already completed before streaming continues.
+        for (const entry of (data.transcript as DebateMessage[] | undefined) ?? []) {
+          addMessage(entry);
+        }
         break;
 
       case 'phase_change':
@@ -78,13 +123,14 @@ function App() {
 
       case 'debate_complete':
         endDebate();
+        void verifyTranscript(message.debate_id, data.transcript_digest as TranscriptDigest | undefined);
         break;
 
       case 'error':
         setError(data.message as string);
         break;
     }
-  }, [startDebate, setPhase, startStreaming, appendStreamingChunk, finishStreaming, setIsWaitingForVote, addMessage, setScores, endDebate, setError]);
+  }, [startDebate, setPhase, startStreaming, appendStreamingChunk, finishStreaming, setIsWaitingForVote, addMessage, setScores, endDebate, setError, setQueue]);
 
   const handleStart = useCallback(async (topic: string, proStyle: string, conStyle: string) => {
     setIsLoading(true);
@@ -108,39 +154,74 @@ function App() {
 
       const data = await response.json();
       const newDebateId = data.debate_id;
+      const driverToken: string = data.driver_token;
 
-      // Connect WebSocket
+      // Connect WebSocket. If it drops before the debate ends, reconnect a
+      // few times: the server keeps the debate running for a grace period and
+      // replays the frames after the last seq we saw. The driver token is
+      // what gets this client the vote back; without it a reconnect would
+      // only spectate.
       const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-      const ws = new WebSocket(`${protocol}//${window.location.host}/ws/debates/${newDebateId}`);
-      wsRef.current = ws;
+      const baseUrl = `${protocol}//${window.location.host}/ws/debates/${newDebateId}`;
+      lastSeqRef.current = null;
+      let reconnects = 0;
 
-      ws.onopen = () => {
-        setIsLoading(false);
-      };
+      const connect = () => {
+        const lastSeq = lastSeqRef.current;
+        const ws = new WebSocket(lastSeq === null
+          ? baseUrl
+          : `${baseUrl}?last_seq=${lastSeq}&driver_token=${encodeURIComponent(driverToken)}`);
+        wsRef.current = ws;
+        let opened = false;
 
-      ws.onmessage = (event) => {
-        let message: WSMessage;
-        try {
-          message = JSON.parse(event.data);
-        } catch (err) {
-          console.error('Failed to parse WebSocket message', err);
-          return;
-        }
-        handleWSMessage(message, topic, proStyle, conStyle);
-      };
+        ws.onopen = () => {
+          opened = true;
+          setIsLoading(false);
+        };
 
-      ws.onerror = () => {
-        setError(strings.errors.websocket);
-        setIsLoading(false);
-      };
+        ws.onmessage = (event) => {
+          let message: WSMessage;
+          try {
+            message = JSON.parse(event.data);
+          } catch (err) {
+            console.error('Failed to parse WebSocket message', err);
+            return;
+          }
+          reconnects = 0;
+          if (typeof message.seq === 'number') {
+            lastSeqRef.current = Math.max(lastSeqRef.current ?? 0, message.seq);
+          }
+          handleWSMessage(message, topic, proStyle, conStyle);
+        };
+
+        ws.onerror = () => {
+          // A reconnect that fails is retried by onclose; only the first
+          // connection failing outright is reported here.
+          if (!opened && lastSeq === null) {
+            setError(strings.errors.websocket);
+            setIsLoading(false);
+          }
+        };
 
-      ws.onclose = () => {
-        if (useDebateStore.getState().phase !== 'finished') {
+        ws.onclose = () => {
+          const { phase, error } = useDebateStore.getState();
+          if (phase === 'finished' || error !== null || wsRef.current !== ws) {
+            return;
+          }
+          if (lastSeqRef.current !== null && reconnects < MAX_RECONNECTS) {
+            reconnects += 1;
+            window.setTimeout(() => {
+              if (wsRef.current === ws) connect();
+            }, RECONNECT_DELAY_MS * reconnects);
+            return;
+          }
           setError(strings.errors.connectionLost);
           setIsLoading(false);
-        }
+        };
       };
 
+      connect();
+
     } catch (err) {
       setError(err instanceof Error ? err.message : strings.errors.generic);
       setIsLoading(false);
@@ -29,8 +29,10 @@ class MockWebSocket {
   readyState = 1
   send = vi.fn()
   close = vi.fn().mockImplementation(() => { this.onclose?.() })
+  url: string
 
-  constructor() {
+  constructor(url: string) {
+    this.url = url
     // eslint-disable-next-line @typescript-eslint/no-this-alias -- capture the mock instance for assertions
     mockWs = this
   }
@@ -45,7 +47,7 @@ beforeEach(() => {
   ;(global as Record<string, unknown>).WebSocket = MockWebSocket
   vi.stubGlobal('fetch', vi.fn().mockResolvedValue({
     ok: true,
-    json: async () => ({ debate_id: 'test-debate-id' }),
+    json: async () => ({ debate_id: 'test-debate-id', driver_token: 'tok' }),
   }))
 })
 
@@ -112,6 +114,19 @@ describe('App – WebSocket message handling', () => {
     expect(useDebateStore.getState().isDebating).toBe(false)
   })
 
+  it('debate_complete reloads the saved transcript when the digest does not match', async () => {
+    await renderAndStart()
+    await fireMessage('debate_started')
+    const saved = [{ speaker: 'MODERATOR', content: 'Welcome', phase: 'introduction' }]
+    vi.mocked(fetch).mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ id: 'test-debate-id', transcript: saved }),
+    } as Response)
+    await fireMessage('debate_complete', { transcript_digest: { count: 1, sha256: 'x' } })
+    await waitFor(() => expect(useDebateStore.getState().messages).toEqual(saved))
+    expect(fetch).toHaveBeenLastCalledWith('/api/debates/test-debate-id')
+  })
+
   it('error message stores the error', async () => {
     await renderAndStart()
     await fireMessage('error', { message: 'Something went wrong' })
@@ -133,6 +148,34 @@ describe('App – WebSocket message handling', () => {
     expect(useDebateStore.getState().error).toBe('Connection to the debate was lost')
   })
 
+  it('ws.onclose reconnects with the last seq seen and resumes the stream', async () => {
+    await renderAndStart()
+    const first = mockWs!
+    await act(async () => {
+      for (const [seq, type, data] of [
+        [1, 'debate_started', {}],
+        [2, 'phase_change', { phase: 'opening_pro' }],
+      ] as const) {
+        first.onmessage?.({ data: JSON.stringify({ type, debate_id: 'test-debate-id', seq, data }) })
+      }
+    })
+
+    vi.useFakeTimers()
+    try {
+      await act(async () => { first.onclose?.() })
+      expect(useDebateStore.getState().error).toBeNull()
+      await act(async () => { vi.advanceTimersByTime(1000) })
+    } finally {
+      vi.useRealTimers()
+    }
+
+    expect(mockWs).not.toBe(first)
+    expect(mockWs!.url).toMatch(/\/ws\/debates\/test-debate-id\?last_seq=2&driver_token=tok$/)
+    await fireMessage('message_start', { speaker: 'PRO' })
+    expect(useDebateStore.getState().phase).toBe('opening_pro')
+    expect(useDebateStore.getState().error).toBeNull()
+  })
+
   it('ws.onclose does not surface an error once the debate has finished', async () => {
     await renderAndStart()
     await fireMessage('debate_started')
@@ -18,7 +18,7 @@ const styleIcons: Record<string, string> = {
 };
 
 export function DebateSetup({ onStart, isLoading, onViewHistory }: DebateSetupProps) {
-  const { topic, proStyle, conStyle, availableStyles, setTopic, setProStyle, setConStyle, setAvailableStyles } = useDebateStore();
+  const { topic, proStyle, conStyle, availableStyles, queue, setTopic, setProStyle, setConStyle, setAvailableStyles } = useDebateStore();
   const [localError, setLocalError] = useState<string | null>(null);
 
   useEffect(() => {
@@ -123,7 +123,7 @@ export function DebateSetup({ onStart, isLoading, onViewHistory }: DebateSetupPr
         </div>
 
         {/* Start Button */}
-        <div className="flex justify-center">
+        <div className="flex flex-col items-center gap-3">
           <button
             type="submit"
             disabled={isLoading || !topic.trim()}
@@ -147,6 +147,11 @@ export function DebateSetup({ onStart, isLoading, onViewHistory }: DebateSetupPr
               strings.setup.startDebate
             )}
           </button>
+          {queue && (
+            <p className="text-sm text-gray-600" role="status">
+              {strings.setup.queued(queue.position, queue.estimated_wait_seconds)}
+            </p>
+          )}
         </div>
       </form>
     </div>
@@ -1,6 +1,7 @@
 import { useEffect, useState } from 'react';
 import type {
   PastDebateSummary,
+  PastDebatePage,
   PastDebateDetail,
   Speaker,
   DebatePhase,
@@ -42,21 +43,31 @@ function WinnerTag({ winner }: { winner: string | null }) {
   );
 }
 
+function fetchPage(cursor: string | null): Promise<PastDebatePage> {
+  const url = cursor ? `/api/debates?cursor=${encodeURIComponent(cursor)}` : '/api/debates';
+  return fetch(url).then((res) => {
+    if (!res.ok) throw new Error('Failed to load past debates');
+    return res.json();
+  });
+}
+
 export function PastDebates({ onBack }: PastDebatesProps) {
   const [debates, setDebates] = useState<PastDebateSummary[] | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [total, setTotal] = useState(0);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selected, setSelected] = useState<PastDebateDetail | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [loadingDetail, setLoadingDetail] = useState(false);
 
   useEffect(() => {
     let active = true;
-    fetch('/api/debates')
-      .then((res) => {
-        if (!res.ok) throw new Error('Failed to load past debates');
-        return res.json();
-      })
-      .then((data: PastDebateSummary[]) => {
-        if (active) setDebates(data);
+    fetchPage(null)
+      .then((page) => {
+        if (!active) return;
+        setDebates(page.items);
+        setNextCursor(page.next_cursor);
+        setTotal(page.total);
       })
       .catch(() => {
         if (active) setError(strings.pastDebates.loadListError);
@@ -66,6 +77,19 @@ export function PastDebates({ onBack }: PastDebatesProps) {
     };
   }, []);
 
+  const loadMore = () => {
+    setLoadingMore(true);
+    setError(null);
+    fetchPage(nextCursor)
+      .then((page) => {
+        setDebates((current) => [...(current ?? []), ...page.items]);
+        setNextCursor(page.next_cursor);
+        setTotal(page.total);
+      })
+      .catch(() => setError(strings.pastDebates.loadListError))
+      .finally(() => setLoadingMore(false));
+  };
+
   const openDetail = (id: string) => {
     setLoadingDetail(true);
     setError(null);
@@ -103,7 +127,7 @@ export function PastDebates({ onBack }: PastDebatesProps) {
             <span className="px-2 py-1 bg-red-100 text-red-700 rounded font-medium capitalize">
               CON: {selected.con_style}
             </span>
-            <span className="ml-auto text-gray-500">{formatDate(selected.completed_at)}</span>
+            <span className="ml-auto text-gray-500">{selected.completed_at && formatDate(selected.completed_at)}</span>
           </div>
         </div>
 
@@ -175,6 +199,21 @@ export function PastDebates({ onBack }: PastDebatesProps) {
           ))}
         </ul>
       )}
+
+      {debates && debates.length > 0 && (
+        <div className="mt-4 flex items-center justify-between text-sm text-gray-500">
+          <span>{strings.pastDebates.showing(debates.length, total)}</span>
+          {nextCursor && (
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-4 py-2 text-blue-600 hover:text-blue-700 hover:underline disabled:opacity-60"
+            >
+              {strings.pastDebates.loadMore}
+            </button>
+          )}
+        </div>
+      )}
     </div>
   );
 }
@@ -93,6 +93,12 @@ export function Scoreboard({ scores }: ScoreboardProps) {
           <span className="text-gray-700">{scores.weakest_argument}</span>
         </div>
       </div>
+
+      {scores.panel && (
+        <p className="mt-3 text-xs text-gray-500">
+          {strings.scoreboard.panel(scores.panel.size, scores.panel.agreement, scores.panel.votes)}
+        </p>
+      )}
     </div>
   );
 }
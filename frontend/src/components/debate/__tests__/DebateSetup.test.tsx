@@ -40,4 +40,11 @@ describe('DebateSetup', () => {
 
     expect(onStart).toHaveBeenCalledWith('Cats vs dogs', 'passionate', 'passionate')
   })
+
+  it('shows the place in line while the debate is queued', () => {
+    useDebateStore.getState().setQueue({ position: 3, estimated_wait_seconds: 240 })
+    render(<DebateSetup onStart={vi.fn()} isLoading={true} />)
+
+    expect(screen.getByRole('status')).toHaveTextContent("you're #3 in line (about 4 min)")
+  })
 })
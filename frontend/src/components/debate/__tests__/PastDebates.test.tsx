@@ -16,6 +16,8 @@ const summary = {
 
 const detail = {
   ...summary,
+  status: 'completed',
+  next_turn: null,
   transcript: [
     { speaker: 'MODERATOR', content: 'Welcome to the debate', phase: 'introduction' },
     { speaker: 'PRO', content: 'Cats are independent', phase: 'opening_pro' },
@@ -32,7 +34,7 @@ function mockFetch(handler: (url: string) => { ok: boolean; body: unknown }) {
 
 beforeEach(() => {
   mockFetch((url) => {
-    if (url === '/api/debates') return { ok: true, body: [summary] }
+    if (url === '/api/debates') return { ok: true, body: { items: [summary], next_cursor: null, total: 1 } }
     if (url === '/api/debates/abc') return { ok: true, body: detail }
     return { ok: false, body: {} }
   })
@@ -64,8 +66,25 @@ describe('PastDebates', () => {
     expect(onBack).toHaveBeenCalledTimes(1)
   })
 
+  it('loads the next page with the cursor and appends it', async () => {
+    const older = { ...summary, id: 'old', topic: 'Tea vs coffee' }
+    mockFetch((url) => {
+      if (url === '/api/debates') return { ok: true, body: { items: [summary], next_cursor: 'c1', total: 2 } }
+      if (url === '/api/debates?cursor=c1') return { ok: true, body: { items: [older], next_cursor: null, total: 2 } }
+      return { ok: false, body: {} }
+    })
+    render(<PastDebates onBack={() => {}} />)
+    expect(await screen.findByText('Showing 1 of 2')).toBeInTheDocument()
+
+    await userEvent.click(screen.getByRole('button', { name: /load more/i }))
+    expect(await screen.findByText('Tea vs coffee')).toBeInTheDocument()
+    expect(screen.getByText('Cats vs dogs')).toBeInTheDocument()
+    expect(screen.getByText('Showing 2 of 2')).toBeInTheDocument()
+    expect(screen.queryByRole('button', { name: /load more/i })).not.toBeInTheDocument()
+  })
+
   it('shows an empty state when there are no past debates', async () => {
-    mockFetch(() => ({ ok: true, body: [] }))
+    mockFetch(() => ({ ok: true, body: { items: [], next_cursor: null, total: 0 } }))
     render(<PastDebates onBack={() => {}} />)
     expect(await screen.findByText(/no debates yet/i)).toBeInTheDocument()
   })
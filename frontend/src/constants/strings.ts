@@ -25,6 +25,9 @@ export const strings = {
     conStyleHeading: 'CON Agent Style',
     startDebate: 'Start Debate',
     startingDebate: 'Starting Debate...',
+    queued: (position: number, waitSeconds: number) =>
+      `All debate slots are busy — you're #${position} in line ` +
+      `(about ${Math.max(1, Math.round(waitSeconds / 60))} min).`,
   },
   chat: {
     newDebate: 'Start New Debate',
@@ -48,6 +51,9 @@ export const strings = {
     weakestArgument: 'Weakest argument: ',
     tie: "It's a tie",
     wins: (winner: string) => `${winner} wins`,
+    panel: (size: number, agreement: number, votes: Record<string, number>) =>
+      `Judge panel: ${size} judges, ${Math.round(agreement * 100)}% agreement ` +
+      `(PRO ${votes.PRO ?? 0} · CON ${votes.CON ?? 0} · TIE ${votes.TIE ?? 0})`,
   },
   voting: {
     title: 'Audience Vote',
@@ -63,6 +69,8 @@ export const strings = {
     loading: 'Loading…',
     empty: "No debates yet — start one and it'll show up here.",
     loadListError: 'Could not load past debates.',
+    loadMore: 'Load more',
+    showing: (shown: number, total: number) => `Showing ${shown} of ${total}`,
     loadDetailError: 'Could not load that debate.',
     messageCount: (count: number) => `· ${count} messages`,
     tie: 'Tie',
@@ -1,5 +1,5 @@
 import { create } from 'zustand';
-import type { DebatePhase, Speaker, DebateMessage, StyleInfo, DebateScores } from '../types/debate';
+import type { DebatePhase, Speaker, DebateMessage, StyleInfo, DebateScores, QueueStatus } from '../types/debate';
 
 interface DebateState {
   // Setup state
@@ -8,6 +8,9 @@ interface DebateState {
   conStyle: string;
   availableStyles: StyleInfo[];
 
+  // Admission queue: set while the debate waits for a generating slot
+  queue: QueueStatus | null;
+
   // Debate state
   debateId: string | null;
   phase: DebatePhase | null;
@@ -28,9 +31,11 @@ interface DebateState {
   setProStyle: (style: string) => void;
   setConStyle: (style: string) => void;
   setAvailableStyles: (styles: StyleInfo[]) => void;
+  setQueue: (queue: QueueStatus | null) => void;
   startDebate: (debateId: string, topic: string, proStyle: string, conStyle: string) => void;
   setPhase: (phase: DebatePhase) => void;
   addMessage: (message: DebateMessage) => void;
+  replaceMessages: (messages: DebateMessage[]) => void;
   setIsWaitingForVote: (waiting: boolean) => void;
   setError: (error: string | null) => void;
   setScores: (scores: DebateScores) => void;
@@ -48,6 +53,7 @@ const initialState = {
   proStyle: 'passionate',
   conStyle: 'passionate',
   availableStyles: [],
+  queue: null,
   debateId: null,
   phase: null,
   messages: [],
@@ -66,6 +72,7 @@ export const useDebateStore = create<DebateState>((set, get) => ({
   setProStyle: (proStyle) => set({ proStyle }),
   setConStyle: (conStyle) => set({ conStyle }),
   setAvailableStyles: (availableStyles) => set({ availableStyles }),
+  setQueue: (queue) => set({ queue }),
 
   startDebate: (debateId, topic, proStyle, conStyle) =>
     set({
@@ -73,6 +80,7 @@ export const useDebateStore = create<DebateState>((set, get) => ({
       topic,
       proStyle,
       conStyle,
+      queue: null,
       isDebating: true,
       messages: [],
       phase: null,
@@ -91,6 +99,8 @@ export const useDebateStore = create<DebateState>((set, get) => ({
       streamingSpeaker: null,
     })),
 
+  replaceMessages: (messages) => set({ messages }),
+
   setIsWaitingForVote: (isWaitingForVote) => set({ isWaitingForVote }),
   // Setting an error ends the current turn: clear any dangling streaming/typing
   // indicator and dismiss the vote modal so a mid-debate failure doesn't leave
@@ -33,6 +33,26 @@ export interface ArgumentScore {
   reason: string;
 }
 
+// Present only when a judge panel scored the debate (src/judge_panel.py).
+export interface JudgeBallot {
+  judge: string;
+  winner: 'PRO' | 'CON' | 'TIE';
+  pro_average: number;
+  con_average: number;
+}
+
+export interface PanelSummary {
+  size: number;
+  failed: number;
+  votes: Record<string, number>;
+  agreement: number;
+  pro_average: number;
+  con_average: number;
+  pro_average_stdev: number;
+  con_average_stdev: number;
+  ballots: JudgeBallot[];
+}
+
 export interface DebateScores {
   pro_arguments: ArgumentScore[];
   con_arguments: ArgumentScore[];
@@ -41,10 +61,18 @@ export interface DebateScores {
   winner: 'PRO' | 'CON' | 'TIE';
   strongest_argument: string;
   weakest_argument: string;
+  panel?: PanelSummary | null;
+}
+
+// Where a debate waits while every generating slot is busy (queue_position)
+export interface QueueStatus {
+  position: number;
+  estimated_wait_seconds: number;
 }
 
 // WebSocket message types
 export type WSMessageType =
+  | 'queue_position'
   | 'debate_started'
   | 'phase_change'
   | 'message_start'
@@ -60,6 +88,15 @@ export interface WSMessage {
   type: WSMessageType;
   debate_id: string;
   data: Record<string, unknown>;
+  // Position in the debate's stream; reconnect with ?last_seq= to resume.
+  seq?: number;
+}
+
+// Sent with debate_complete instead of the transcript itself: the entry
+// count and SHA-256 of the compact JSON of [[speaker, content], ...].
+export interface TranscriptDigest {
+  count: number;
+  sha256: string;
 }
 
 export interface DebateTranscriptEntry {
@@ -81,7 +118,20 @@ export interface PastDebateSummary {
   completed_at: string;
 }
 
-export interface PastDebateDetail extends PastDebateSummary {
+// One page of GET /api/debates: pass next_cursor back as ?cursor= for the next.
+export interface PastDebatePage {
+  items: PastDebateSummary[];
+  next_cursor: string | null;
+  total: number;
+}
+
+// A debate still running or stopped by an error has status 'in_progress' or
+// 'failed' and no completed_at. With ?turns_limit= the transcript is one page;
+// pass next_turn back as ?turns_from= for the next.
+export interface PastDebateDetail extends Omit<PastDebateSummary, 'completed_at'> {
+  status: 'in_progress' | 'failed' | 'completed';
+  completed_at: string | null;
   transcript: DebateTranscriptEntry[];
   argument_scores: DebateScores | null;
+  next_turn: number | null;
 }
@@ -1,11 +1,24 @@
+import argparse
+import asyncio
 import os
 import sys
 import json
+from datetime import datetime
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
 from src.agents.base_agent import build_agents, AgentError
-from src.debate_controller import DebateController
 from src.prompts import validate_styles, StyleConfigError
-from config import AVAILABLE_STYLES, DEFAULT_PRO_STYLE, DEFAULT_CON_STYLE
+from src.batch_runner import (
+    VOTE_CHOICES,
+    VOTE_POLICIES,
+    BatchInputError,
+    VotePolicy,
+    load_batch_items,
+    read_completed_ids,
+    run_batch,
+)
+from src.tournament import EloLeaderboard, round_robin, run_tournament
+from config import AVAILABLE_STYLES, DEFAULT_PRO_STYLE, DEFAULT_CON_STYLE, BATCH_CONCURRENCY
 from messages import (
     API_KEY_MISSING,
     STYLE_CONFIG_INVALID,
@@ -25,8 +38,36 @@ from messages import (
     CLI_SAVE_MARKDOWN_FAILED,
     CLI_SAVED_JSON,
     CLI_SAVE_JSON_FAILED,
+    CLI_BATCH_DESCRIPTION,
+    CLI_BATCH_INPUT_INVALID,
+    CLI_BATCH_STARTING,
+    CLI_BATCH_PROGRESS,
+    CLI_BATCH_SUMMARY,
+    CLI_CONCURRENCY_INVALID,
+    CLI_TOURNAMENT_DESCRIPTION,
+    CLI_SEARCH_BACKFILL_DESCRIPTION,
+    CLI_SEARCH_BACKFILL_DONE,
+    CLI_COMPRESS_DESCRIPTION,
+    CLI_COMPRESS_INVALID,
+    CLI_COMPRESS_DICTIONARY_TRAINED,
+    CLI_COMPRESS_DONE,
+    CLI_EXPORT_DESCRIPTION,
+    CLI_EXPORT_INVALID,
+    CLI_EXPORT_DONE,
+    CLI_EXPORT_EMPTY,
+    SEARCH_UNAVAILABLE,
+    CLI_TOURNAMENT_TOPICS_EMPTY,
+    CLI_TOURNAMENT_STARTING,
+    CLI_TOURNAMENT_RESUMED,
+    CLI_TOURNAMENT_PROGRESS,
+    CLI_TOURNAMENT_STANDINGS_TITLE,
+    CLI_TOURNAMENT_STANDING,
 )
 
+if TYPE_CHECKING:
+    # Rich (through the controller) is imported only when a debate is run.
+    from src.debate_controller import DebateController
+
 # Load the API key from .env file into environment variables
 load_dotenv()
 
@@ -80,16 +121,23 @@ def _prompt_for_setup() -> tuple[str, str, str]:
     return topic, pro_style, con_style
 
 
-def _run_debate(topic: str, pro_style: str, con_style: str) -> DebateController:
+def _run_debate(topic: str, pro_style: str, con_style: str, *, stream: bool = True) -> "DebateController":
     """Build the three agents, run the debate, and return the finished controller.
 
+    ``stream`` renders each turn token-by-token as it is generated (the async
+    ``arun_debate`` path); ``stream=False`` keeps the blocking whole-turn path.
     Exits with a friendly message if a transient LLM failure interrupts it.
     """
+    from src.debate_controller import DebateController
+
     # Same model, different personas via system prompts.
     pro_agent, con_agent, judge_agent = build_agents(pro_style, con_style)
     controller = DebateController(topic, pro_agent, con_agent, judge_agent)
     try:
-        controller.run_debate()
+        if stream:
+            asyncio.run(controller.arun_debate())
+        else:
+            controller.run_debate()
     except AgentError as error:
         print("\n" + "=" * 60)
         print(CLI_INTERRUPTED.format(error=error))
@@ -98,7 +146,7 @@ def _run_debate(topic: str, pro_style: str, con_style: str) -> DebateController:
     return controller
 
 
-def _offer_to_save(controller: DebateController, topic: str, pro_style: str, con_style: str) -> None:
+def _offer_to_save(controller: "DebateController", topic: str, pro_style: str, con_style: str) -> None:
     """Ask whether to save the transcript and write the chosen format(s)."""
     print("\n" + "=" * 60)
     if input(CLI_SAVE_PROMPT).strip().lower() != "y":
@@ -114,7 +162,7 @@ def _offer_to_save(controller: DebateController, topic: str, pro_style: str, con
         _write_json(controller, topic, pro_style, con_style, base_name)
 
 
-def _write_markdown(controller: DebateController, base_name: str) -> None:
+def _write_markdown(controller: "DebateController", base_name: str) -> None:
     """Write the transcript as Markdown, reporting success or an OS error."""
     md_path = f"output/{base_name}.md"
     try:
@@ -126,7 +174,7 @@ def _write_markdown(controller: DebateController, base_name: str) -> None:
 
 
 def _write_json(
-    controller: DebateController, topic: str, pro_style: str, con_style: str, base_name: str
+    controller: "DebateController", topic: str, pro_style: str, con_style: str, base_name: str
 ) -> None:
     """Write the full debate (setup + transcript + scores) as JSON."""
     json_path = f"output/{base_name}.json"
@@ -148,12 +196,313 @@ def _write_json(
         print(CLI_SAVE_JSON_FAILED.format(error=error))
 
 
-def main():
-    """CLI entry point: collect setup, run a full debate, then optionally save it."""
+def _concurrency(value: str) -> int:
+    """``--concurrency``: how many debates run at once, at least one."""
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise argparse.ArgumentTypeError(CLI_CONCURRENCY_INVALID.format(value=value))
+    return count
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """The CLI's argument parser: no subcommand runs one interactive debate."""
+    parser = argparse.ArgumentParser(description=CLI_BANNER.title())
+    parser.add_argument("--no-stream", action="store_true",
+                        help="print each turn only once it is complete instead of streaming tokens")
+    commands = parser.add_subparsers(dest="command")
+
+    batch = commands.add_parser("batch", help=CLI_BATCH_DESCRIPTION, description=CLI_BATCH_DESCRIPTION)
+    batch.add_argument("topics", help="JSONL file: one {\"topic\", \"pro_style\"?, \"con_style\"?, \"id\"?} per line")
+    batch.add_argument(
+        "-o", "--output",
+        help="results JSONL (appended to; rerun with the same path to resume). "
+             "Defaults to output/<topics name>.results.jsonl",
+    )
+    batch.add_argument("-c", "--concurrency", type=_concurrency, default=BATCH_CONCURRENCY,
+                       help=f"debates to run at once (default {BATCH_CONCURRENCY})")
+    batch.add_argument("--vote-policy", choices=VOTE_POLICIES, default="fixed",
+                       help="how the audience vote is answered (default fixed)")
+    batch.add_argument("--vote", choices=VOTE_CHOICES, default="TIE",
+                       help="the side a fixed policy votes for (default TIE)")
+    batch.add_argument("--seed", type=int, default=0, help="seed for the random vote policy")
+
+    tournament = commands.add_parser(
+        "tournament", help=CLI_TOURNAMENT_DESCRIPTION, description=CLI_TOURNAMENT_DESCRIPTION,
+    )
+    tournament.add_argument("topics", help="text file with one debate topic per line")
+    tournament.add_argument("--name", help="tournament id (default: the topics file name); "
+                                           "rerun with the same name to resume")
+    tournament.add_argument("--styles", default=",".join(AVAILABLE_STYLES),
+                            help="comma-separated styles to enter (default: all AVAILABLE_STYLES)")
+    tournament.add_argument("-c", "--concurrency", type=_concurrency, default=BATCH_CONCURRENCY,
+                            help=f"debates to run at once (default {BATCH_CONCURRENCY})")
+
+    backfill = commands.add_parser(
+        "search-backfill", help=CLI_SEARCH_BACKFILL_DESCRIPTION,
+        description=CLI_SEARCH_BACKFILL_DESCRIPTION,
+    )
+    backfill.add_argument("--rebuild", action="store_true",
+                          help="re-index every debate, not just the missing ones")
+    backfill.add_argument("--batch-size", type=int, default=500,
+                          help="debates indexed per transaction (default 500)")
+
+    compress = commands.add_parser(
+        "compress-debates", help=CLI_COMPRESS_DESCRIPTION, description=CLI_COMPRESS_DESCRIPTION,
+    )
+    compress.add_argument("--train-dictionary", action="store_true",
+                          help="train a new zstd dictionary on the saved debates first "
+                               "(DEBATE_COMPRESSION=zstd)")
+    compress.add_argument("--samples", type=int, default=2000,
+                          help="most recent debates to train the dictionary on (default 2000)")
+    compress.add_argument("--dictionary-size", type=int, default=112_640,
+                          help="dictionary size in bytes (default 112640)")
+    compress.add_argument("--batch-size", type=int, default=500,
+                          help="debates rewritten per transaction (default 500)")
+    compress.add_argument("--vacuum", action="store_true",
+                          help="VACUUM an SQLite database afterwards, so the file shrinks")
+
+    export = commands.add_parser(
+        "export-debates", help=CLI_EXPORT_DESCRIPTION, description=CLI_EXPORT_DESCRIPTION,
+    )
+    export.add_argument("-o", "--output", default="-",
+                        help="NDJSON file to write (default: stdout); gzip-compressed if it ends in .gz")
+    export.add_argument("--gzip", action="store_true", help="gzip-compress the output regardless of its name")
+    export.add_argument("--since", help="cursor printed by a previous export: export only debates after it")
+    export.add_argument("--winner", choices=("PRO", "CON", "TIE"))
+    export.add_argument("--pro-style")
+    export.add_argument("--con-style")
+    export.add_argument("--completed-after", type=datetime.fromisoformat,
+                        help="ISO date or datetime (UTC unless it has an offset)")
+    export.add_argument("--completed-before", type=datetime.fromisoformat,
+                        help="ISO date or datetime (UTC unless it has an offset)")
+    export.add_argument("--batch-size", type=int, default=500,
+                        help="debates read from the database at a time (default 500)")
+    return parser
+
+
+def _run_batch_command(args: argparse.Namespace) -> None:
+    """Run ``python main.py batch``: every topic in the file, headlessly."""
+    try:
+        items = load_batch_items(args.topics)
+    except (OSError, BatchInputError) as error:
+        print(CLI_BATCH_INPUT_INVALID.format(error=error))
+        sys.exit(1)
+
+    output = args.output
+    if output is None:
+        os.makedirs("output", exist_ok=True)
+        stem = os.path.splitext(os.path.basename(args.topics))[0]
+        output = os.path.join("output", f"{stem}.results.jsonl")
+
+    skipped = len(read_completed_ids(output) & {item.id for item in items})
+    pending = len(items) - skipped
+    print(CLI_BATCH_STARTING.format(pending=pending, path=args.topics, skipped=skipped, output=output))
+
+    done = 0
+
+    def report(record: dict) -> None:
+        nonlocal done
+        done += 1
+        detail = record.get("winner") or record.get("error") or "-"
+        print(CLI_BATCH_PROGRESS.format(
+            done=done, pending=pending, status=record["status"], id=record["id"], detail=detail,
+        ))
+
+    summary = asyncio.run(run_batch(
+        items,
+        output,
+        concurrency=args.concurrency,
+        vote_policy=VotePolicy(kind=args.vote_policy, side=args.vote, seed=args.seed),
+        on_result=report,
+    ))
+    print(CLI_BATCH_SUMMARY.format(
+        completed=summary.completed, failed=summary.failed, skipped=summary.skipped,
+    ))
+
+
+def _run_tournament_command(args: argparse.Namespace) -> None:
+    """Run ``python main.py tournament``: a checkpointed round-robin with Elo."""
+    # Imported here so the interactive CLI never loads the persistence layer.
+    from api import db
+    from api.services import tournament_repository
+
+    styles = [style.strip() for style in args.styles.split(",") if style.strip()]
+    unknown = [style for style in styles if style not in AVAILABLE_STYLES]
+    if unknown or len(styles) < 2:
+        print(CLI_BATCH_INPUT_INVALID.format(
+            error=f"need two or more of {AVAILABLE_STYLES}, got {styles}"
+        ))
+        sys.exit(1)
+    try:
+        with open(args.topics, encoding="utf-8") as f:
+            topics = [line.strip() for line in f if line.strip()]
+    except OSError as error:
+        print(CLI_BATCH_INPUT_INVALID.format(error=error))
+        sys.exit(1)
+    if not topics:
+        print(CLI_TOURNAMENT_TOPICS_EMPTY.format(path=args.topics))
+        sys.exit(1)
+
+    db.init_db()
+    tournament_id = args.name or os.path.splitext(os.path.basename(args.topics))[0]
+    matchups = round_robin(styles, topics)
+    created = tournament_repository.ensure_tournament(
+        tournament_id, styles=styles, topics=topics, total_matches=len(matchups),
+    )
+    if not created:
+        # Resume with the setup the tournament was started with.
+        with db.SessionLocal() as session:
+            stored = tournament_repository.get_tournament(session, tournament_id)
+            styles, topics = stored.styles, stored.topics
+        matchups = round_robin(styles, topics)
+    results = tournament_repository.completed_results(tournament_id)
+    board = EloLeaderboard.replay(styles, results)
+    completed_keys = {result["matchup_key"] for result in results}
+    if not created:
+        print(CLI_TOURNAMENT_RESUMED.format(id=tournament_id, games=board.games))
+
+    pending = len([m for m in matchups if m.key not in completed_keys])
+    print(CLI_TOURNAMENT_STARTING.format(
+        id=tournament_id, pending=pending, total=len(matchups), styles=", ".join(styles),
+    ))
+    done = 0
+
+    async def checkpoint(record: dict, leaderboard: EloLeaderboard) -> None:
+        nonlocal done
+        await asyncio.to_thread(
+            tournament_repository.record_match, tournament_id, record, leaderboard.to_dict()
+        )
+        done += 1
+        print(CLI_TOURNAMENT_PROGRESS.format(
+            done=done, pending=pending, pro_style=record["pro_style"],
+            con_style=record["con_style"], detail=record.get("winner") or record.get("error"),
+        ))
+
+    asyncio.run(run_tournament(
+        matchups, board, checkpoint,
+        completed_keys=completed_keys, concurrency=args.concurrency,
+    ))
+    print(CLI_TOURNAMENT_STANDINGS_TITLE)
+    for rank, row in enumerate(board.standings(), start=1):
+        print(CLI_TOURNAMENT_STANDING.format(rank=rank, **row))
+
+
+def _run_search_backfill_command(args: argparse.Namespace) -> None:
+    """Run ``python main.py search-backfill``: index debates saved before the
+    search index existed (see api/services/debate_search.py)."""
+    from api import db
+    from api.services import debate_search
+
+    db.init_db()
+    with db.engine.connect() as connection:
+        if not debate_search.available(connection):
+            print(SEARCH_UNAVAILABLE)
+            sys.exit(1)
+    count = debate_search.backfill(batch_size=args.batch_size, rebuild=args.rebuild)
+    print(CLI_SEARCH_BACKFILL_DONE.format(count=count))
+
+
+def _run_compress_command(args: argparse.Namespace) -> None:
+    """Run ``python main.py compress-debates``: bring every saved debate to
+    the current DEBATE_COMPRESSION encoding (see api/compression.py)."""
+    from api import compression, db
+    from api.services import debate_repository
+
+    try:
+        db.init_db()
+        if args.train_dictionary:
+            if compression.DEBATE_COMPRESSION != "zstd":
+                raise ValueError("--train-dictionary needs DEBATE_COMPRESSION=zstd")
+            dictionary_id = debate_repository.train_compression_dictionary(
+                samples=args.samples, size=args.dictionary_size,
+            )
+            print(CLI_COMPRESS_DICTIONARY_TRAINED.format(id=dictionary_id))
+    except ValueError as error:  # a bad setting, or too little to train on
+        print(CLI_COMPRESS_INVALID.format(error=error))
+        sys.exit(1)
+    count = debate_repository.recompress_debates(batch_size=args.batch_size)
+    if args.vacuum and db.engine.dialect.name == "sqlite":
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.exec_driver_sql("VACUUM")
+    print(CLI_COMPRESS_DONE.format(count=count, codec=compression.DEBATE_COMPRESSION))
+
+
+def _run_export_command(args: argparse.Namespace) -> None:
+    """Run ``python main.py export-debates``: write saved debates out as NDJSON
+    (see api/services/debate_export.py). Reports go to stderr, since the export
+    itself may be going to stdout."""
+    from api import db
+    from api.services import debate_export
+    from api.services.debate_repository import DebateFilters
+
+    if args.since is not None:
+        try:
+            debate_export.decode_since(args.since)
+        except ValueError as error:
+            print(CLI_EXPORT_INVALID.format(error=error), file=sys.stderr)
+            sys.exit(1)
+    db.init_db()
+    filters = DebateFilters(
+        winner=args.winner,
+        pro_style=args.pro_style,
+        con_style=args.con_style,
+        completed_after=db.naive_utc(args.completed_after),
+        completed_before=db.naive_utc(args.completed_before),
+    )
+    gzip = args.gzip or args.output.endswith(".gz")
+    if args.output == "-":
+        count, cursor = debate_export.write(sys.stdout.buffer, filters, args.since, gzip=gzip,
+                                            batch_size=args.batch_size)
+        sys.stdout.flush()
+    else:
+        # Written aside and renamed into place, so a failed run never leaves
+        # a partial export where a complete one is expected.
+        partial = f"{args.output}.part"
+        with open(partial, "wb") as out:
+            count, cursor = debate_export.write(out, filters, args.since, gzip=gzip,
+                                                batch_size=args.batch_size)
+        os.replace(partial, args.output)
+    output = "stdout" if args.output == "-" else args.output
+    if cursor is None:
+        print(CLI_EXPORT_EMPTY.format(count=count, output=output), file=sys.stderr)
+    else:
+        print(CLI_EXPORT_DONE.format(count=count, output=output, cursor=cursor), file=sys.stderr)
+
+
+def main(argv: list[str] | None = None):
+    """CLI entry point.
+
+    With no subcommand: collect setup, run one interactive debate, then
+    optionally save it. ``batch`` runs a whole topics file headlessly;
+    ``tournament`` ranks the debater styles against each other;
+    ``search-backfill`` indexes saved debates for search,
+    ``compress-debates`` rewrites them compressed and ``export-debates``
+    writes them out as NDJSON (none of these needs an API key).
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == "search-backfill":
+        _run_search_backfill_command(args)
+        return
+    if args.command == "compress-debates":
+        _run_compress_command(args)
+        return
+    if args.command == "export-debates":
+        _run_export_command(args)
+        return
     _require_api_key()
     _require_valid_style_config()
+    if args.command == "batch":
+        _run_batch_command(args)
+        return
+    if args.command == "tournament":
+        _run_tournament_command(args)
+        return
+
     topic, pro_style, con_style = _prompt_for_setup()
-    controller = _run_debate(topic, pro_style, con_style)
+    controller = _run_debate(topic, pro_style, con_style, stream=not args.no_stream)
     _offer_to_save(controller, topic, pro_style, con_style)
 
 
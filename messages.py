@@ -36,6 +36,41 @@ CLI_SAVED_JSON = "Saved JSON to {path}"
 CLI_SAVE_JSON_FAILED = "Failed to save JSON: {error}"
 
 
+# --- CLI: headless batch mode (main.py batch / src/batch_runner.py) ---
+CLI_BATCH_DESCRIPTION = "Run every debate in a topics JSONL file headlessly, writing results as JSONL."
+CLI_BATCH_INPUT_INVALID = "ERROR: invalid batch input: {error}"
+CLI_BATCH_STARTING = "Running {pending} debate(s) from {path} ({skipped} already completed) -> {output}"
+CLI_BATCH_PROGRESS = "[{done}/{pending}] {status}: {id} — {detail}"
+CLI_BATCH_SUMMARY = "Batch finished: {completed} completed, {failed} failed, {skipped} skipped."
+CLI_CONCURRENCY_INVALID = "must be a whole number of at least 1, not {value!r}"
+
+
+# --- CLI: style tournament (main.py tournament / src/tournament.py) ---
+CLI_SEARCH_BACKFILL_DESCRIPTION = "Index saved debates for full-text search (those saved before search existed)."
+CLI_SEARCH_BACKFILL_DONE = "Indexed {count} debate(s) for search."
+CLI_COMPRESS_DESCRIPTION = (
+    "Rewrite saved debates' transcripts and scores in the DEBATE_COMPRESSION encoding "
+    "(storing the detail body of any that lack one), optionally training a zstd dictionary on them first."
+)
+CLI_COMPRESS_INVALID = "ERROR: cannot compress debates: {error}"
+CLI_COMPRESS_DICTIONARY_TRAINED = "Trained zstd dictionary {id} on the saved debates."
+CLI_COMPRESS_DONE = "Rewrote {count} debate(s) as {codec}."
+CLI_EXPORT_DESCRIPTION = (
+    "Export saved debates as NDJSON (gzip-compressed for a .gz output), in the order they were saved; "
+    "pass --since the cursor printed by the last export to export only newer ones."
+)
+CLI_EXPORT_INVALID = "ERROR: cannot export debates: {error}"
+CLI_EXPORT_DONE = "Exported {count} debate(s) to {output}. Next export: --since {cursor}"
+CLI_EXPORT_EMPTY = "Exported {count} debate(s) to {output}."
+CLI_TOURNAMENT_DESCRIPTION = "Run a round-robin style tournament over a topics file and rank the styles by Elo."
+CLI_TOURNAMENT_TOPICS_EMPTY = "ERROR: no topics found in {path}"
+CLI_TOURNAMENT_STARTING = "Tournament '{id}': {pending} of {total} matchup(s) to play ({styles})"
+CLI_TOURNAMENT_RESUMED = "Resuming tournament '{id}' from its checkpoint ({games} result(s) already rated)."
+CLI_TOURNAMENT_PROGRESS = "[{done}/{pending}] {pro_style} (PRO) vs {con_style} (CON): {detail}"
+CLI_TOURNAMENT_STANDINGS_TITLE = "Final standings:"
+CLI_TOURNAMENT_STANDING = "  {rank}. {style:<12} {rating:>7.1f}   {wins}W {losses}L {ties}T"
+
+
 # --- CLI: live debate rendering (src/debate_controller.py) ---
 CLI_VOTE_TITLE = "AUDIENCE VOTE"
 CLI_VOTE_PANEL = (
@@ -58,6 +93,10 @@ CLI_SCOREBOARD_BODY = (
     "Strongest: {strongest}\n"
     "Weakest: {weakest}"
 )
+CLI_SCOREBOARD_PANEL = (
+    "\n\nJudge panel: {size} judges, {agreement:.0%} agreement "
+    "(PRO {pro} · CON {con} · TIE {tie})"
+)
 
 
 # --- API / WebSocket: client-facing messages ---
@@ -71,8 +110,14 @@ STYLE_DESCRIPTIONS = {
 INVALID_STYLE = "Invalid {field}. Must be one of: {styles}"
 TOO_MANY_DEBATES = "The server is busy running other debates. Please try again in a moment."
 DEBATE_NOT_FOUND = "Debate not found"
+INVALID_CURSOR = "Invalid cursor. Pass the next_cursor of a previous page."
+SEARCH_UNAVAILABLE = "Search needs the SQLite database (DATABASE_URL=sqlite:///...)."
+TOURNAMENT_NOT_FOUND = "Tournament not found"
 DEBATE_SESSION_NOT_FOUND = "Debate session not found"
 DEBATE_ALREADY_RUNNING = "This debate is already running in another session."
 WS_UNEXPECTED_ERROR = "An unexpected error occurred. Please try again."
 VOTE_PROMPT = "Who is winning so far?"
+DEBATE_TIMED_OUT = "This debate stopped making progress and was ended. Please start a new one."
+# Sent to spectators when the socket driving the debate goes away.
+DEBATE_HOST_LEFT = "The debate's host disconnected, so the live stream has ended."
 AI_SERVICE_UNAVAILABLE = "The AI service is temporarily unavailable. Please try again."
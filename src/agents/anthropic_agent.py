@@ -0,0 +1,221 @@
+"""The ``anthropic`` agent backend — the Anthropic SDK with nothing in between.
+
+:class:`AnthropicAgent` is a drop-in for
+:class:`~src.agents.base_agent.DebateAgent` (``AGENT_BACKEND=anthropic``).
+The LangChain backend formats a ``ChatPromptTemplate``, runs a Runnable
+pipeline and wraps every token in an ``AIMessageChunk``. This one builds the
+request body itself and reads the SDK's raw stream events, so a text delta
+reaches the caller as the string the SDK decoded. It uses
+``messages.create(stream=True)`` rather than ``messages.stream``: the latter
+accumulates a snapshot of the whole message on every delta, which the caller
+doesn't need.
+
+The request is the one the LangChain chain sends: the persona as a cached
+system block, then the transcript (cached up to its breakpoint) and the
+per-turn instruction. Scoring forces a single tool call whose input schema
+is :class:`~src.scoring.DebateScores`, as LangChain's
+``with_structured_output`` does.
+
+Agents share one client per kind (as ChatAnthropic instances share
+langchain-anthropic's cached HTTP client), so the connection pool a debate
+warms — or the start-up warm-up opens — serves every later one.
+"""
+from functools import lru_cache
+from typing import AsyncGenerator, Optional
+
+import anthropic
+from pydantic import ValidationError
+
+from config import MAX_RETRIES, MAX_TOKENS, MODEL_NAME, REQUEST_TIMEOUT, SCORING_MAX_TOKENS
+from src.agents.common import INSTRUCTION_TEMPLATE, TRANSCRIPT_TEMPLATE, AgentBase, AgentError
+from src.scoring import DebateScores
+
+_SCORES_TOOL = "DebateScores"
+_TOKEN_FIELDS = (
+    "input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens",
+)
+
+
+@lru_cache(maxsize=None)
+def _async_client() -> anthropic.AsyncAnthropic:
+    return anthropic.AsyncAnthropic(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES)
+
+
+@lru_cache(maxsize=None)
+def _sync_client() -> anthropic.Anthropic:
+    return anthropic.Anthropic(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES)
+
+
+def _token_counts(usage) -> dict:
+    return {field: getattr(usage, field, None) for field in _TOKEN_FIELDS}
+
+
+def _usage_metadata(counts: Optional[dict]) -> Optional[dict]:
+    """SDK token counts in LangChain's ``usage_metadata`` shape, so both
+    backends account tokens identically (``input_tokens`` includes the
+    cached prefix, as langchain-anthropic reports it)."""
+    if counts is None:
+        return None
+    cache_read = counts["cache_read_input_tokens"] or 0
+    cache_creation = counts["cache_creation_input_tokens"] or 0
+    input_tokens = (counts["input_tokens"] or 0) + cache_read + cache_creation
+    output_tokens = counts["output_tokens"] or 0
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+        "input_token_details": {"cache_read": cache_read, "cache_creation": cache_creation},
+    }
+
+
+class AnthropicAgent(AgentBase):
+    """A debate participant that calls the Anthropic SDK directly.
+
+    Same constructor and methods as ``DebateAgent``. The async client serves
+    the web service; the sync one (for the CLI) is created on first use. Both
+    are shared by every agent in the process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        role: str,
+        system_prompt: str,
+        temperature: float = 0.7,
+        model: str = MODEL_NAME,
+    ):
+        super().__init__(name, role, temperature=temperature, model=model)
+        self.system_prompt = system_prompt
+        self.client = _async_client()
+        self._sync_client: Optional[anthropic.Anthropic] = None
+
+    @property
+    def sync_client(self) -> anthropic.Anthropic:
+        if self._sync_client is None:
+            self._sync_client = _sync_client()
+        return self._sync_client
+
+    async def awarm_up(self) -> None:
+        """Open a pooled connection to the API with a free request."""
+        await self.client.models.list(limit=1)
+
+    def _request(self, debate_context: str, instruction: str, max_tokens: int) -> dict:
+        """The Messages API body for one turn, with the same two
+        ``cache_control`` breakpoints as the LangChain prompt."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+            "system": [{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            "messages": [{
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": TRANSCRIPT_TEMPLATE.format(debate_context=debate_context),
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {
+                        "type": "text",
+                        "text": INSTRUCTION_TEMPLATE.format(
+                            instruction=instruction, name=self.name, role=self.role
+                        ),
+                    },
+                ],
+            }],
+        }
+
+    def _scoring_request(self, debate_context: str, instruction: str) -> dict:
+        return {
+            **self._request(debate_context, instruction, SCORING_MAX_TOKENS),
+            "tools": [{
+                "name": _SCORES_TOOL,
+                "description": DebateScores.__doc__ or "The debate's scoreboard.",
+                "input_schema": DebateScores.model_json_schema(),
+            }],
+            "tool_choice": {"type": "tool", "name": _SCORES_TOOL},
+        }
+
+    def _parse_scores(self, message) -> DebateScores:
+        tool_input = next(
+            (block.input for block in message.content if block.type == "tool_use"), None
+        )
+        try:
+            return DebateScores.model_validate(tool_input)
+        except ValidationError as e:
+            raise AgentError(
+                f"{self.name} returned an incomplete or malformed score."
+            ) from e
+
+    def respond(self, debate_context: str, instruction: str) -> str:
+        """Generate a response given the current debate state (synchronous; CLI)."""
+        try:
+            message = self.sync_client.messages.create(
+                **self._request(debate_context, instruction, MAX_TOKENS)
+            )
+        except anthropic.AnthropicError as e:
+            raise AgentError(
+                f"The AI service was unavailable while {self.name} was responding."
+            ) from e
+
+        self._record_usage(_usage_metadata(_token_counts(message.usage)))
+        return "".join(block.text for block in message.content if block.type == "text")
+
+    async def astream_respond(self, debate_context: str, instruction: str) -> AsyncGenerator[str, None]:
+        """Stream a response as the SDK decodes it.
+
+        Input and cache counts arrive on ``message_start``; the final
+        ``message_delta`` carries the output count (and, from newer API
+        versions, the complete usage), so its non-empty fields win.
+        """
+        counts = None
+        try:
+            stream = await self.client.messages.create(
+                **self._request(debate_context, instruction, MAX_TOKENS), stream=True
+            )
+            # Closing the stream releases the connection if the caller stops
+            # early (a debate cancelled mid-turn).
+            async with stream:
+                async for event in stream:
+                    if event.type == "content_block_delta":
+                        if event.delta.type == "text_delta" and event.delta.text:
+                            yield event.delta.text
+                    elif event.type == "message_start":
+                        counts = _token_counts(event.message.usage)
+                    elif event.type == "message_delta" and counts is not None:
+                        counts.update((field, value) for field, value in
+                                      _token_counts(event.usage).items() if value is not None)
+        except anthropic.AnthropicError as e:
+            raise AgentError(
+                f"The AI service was unavailable while {self.name} was responding."
+            ) from e
+
+        self._record_usage(_usage_metadata(counts))
+
+    def score_arguments(self, debate_context: str, instruction: str) -> DebateScores:
+        """Score the debate's arguments as structured data (synchronous; CLI)."""
+        try:
+            message = self.sync_client.messages.create(
+                **self._scoring_request(debate_context, instruction)
+            )
+        except anthropic.AnthropicError as e:
+            raise AgentError(
+                f"The AI service was unavailable while {self.name} was scoring."
+            ) from e
+        return self._parse_scores(message)
+
+    async def ascore_arguments(self, debate_context: str, instruction: str) -> DebateScores:
+        """Async counterpart of :meth:`score_arguments` (used by the web service)."""
+        try:
+            message = await self.client.messages.create(
+                **self._scoring_request(debate_context, instruction)
+            )
+        except anthropic.AnthropicError as e:
+            raise AgentError(
+                f"The AI service was unavailable while {self.name} was scoring."
+            ) from e
+        return self._parse_scores(message)
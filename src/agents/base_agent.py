@@ -1,65 +1,89 @@
-import logging
-from typing import AsyncGenerator, Optional
-import anthropic
-from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate
+"""The ``langchain`` agent backend (the default; see ``src/agents/common.py``).
+
+LangChain and the Anthropic SDK take well over a second to import, so they
+are loaded on first use — when the first :class:`DebateAgent` is built —
+rather than when this module is imported. ``api.main`` and the CLI can then
+start (and answer ``/health`` or ``--help``) without paying for them; the
+optional start-up warm-up (``WARMUP_ON_STARTUP``) pays it ahead of the first
+debate instead.
+"""
+import importlib
+from typing import TYPE_CHECKING, AsyncGenerator
+
 from pydantic import ValidationError
 from config import MODEL_NAME, MAX_TOKENS, SCORING_MAX_TOKENS, REQUEST_TIMEOUT, MAX_RETRIES
+from src.agents.common import (  # noqa: F401 — AgentError and the helpers are re-exported
+    INSTRUCTION_TEMPLATE,
+    TRANSCRIPT_TEMPLATE,
+    AgentBase,
+    AgentError,
+    _cache_stats,
+    _usage_counts,
+    agent_class,
+)
 from src.scoring import DebateScores
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    import anthropic
+    from langchain_anthropic import ChatAnthropic
+    from langchain_core.prompts import ChatPromptTemplate
 
+# name -> (module, attribute) of each deferred import; see ``__getattr__``.
+_LAZY_IMPORTS = {
+    "anthropic": ("anthropic", None),
+    "ChatAnthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "ChatPromptTemplate": ("langchain_core.prompts", "ChatPromptTemplate"),
+}
 
-def _cache_stats(usage_metadata) -> Optional[dict[str, int]]:
-    """Pull the prompt-cache counters out of a response's usage metadata.
 
-    LangChain normalises Anthropic's ``cache_read_input_tokens`` /
-    ``cache_creation_input_tokens`` into ``usage_metadata['input_token_details']``
-    under the keys ``cache_read`` / ``cache_creation``. This returns just those
-    two counters plus the uncached ``input_tokens`` (the prefix paid for at full
-    price), or ``None`` when no usage metadata is present — e.g. the mocked LLM
-    in the tests. Kept pure and side-effect free so the cache accounting can be
-    asserted on directly.
-    """
-    if not isinstance(usage_metadata, dict):
-        return None
-    details = usage_metadata.get("input_token_details") or {}
-    return {
-        "cache_read": details.get("cache_read") or 0,
-        "cache_creation": details.get("cache_creation") or 0,
-        "uncached_input": usage_metadata.get("input_tokens") or 0,
-    }
-
-
-class AgentError(RuntimeError):
-    """A debate agent failed to get a response from the LLM.
-
-    Wraps Anthropic API failures (rate limits, overload, timeouts, connection
-    errors) in one clear, domain-specific error so callers don't have to know
-    about the underlying SDK. The CLI turns this into a friendly message instead
-    of crashing mid-debate; the web layer turns it into a clean error event
-    rather than leaking a raw traceback to the browser.
-    """
+def __getattr__(name: str):
+    """Import a deferred dependency on first access and bind it in this
+    module, so later lookups (and ``mock.patch``) see a plain global."""
+    try:
+        module, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
 
+def _import_dependencies() -> None:
+    """Bind every deferred dependency not already bound (a name patched in by
+    a test is left alone)."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
 
-class DebateAgent:
+
+class DebateAgent(AgentBase):
     """A single LLM-backed participant in the debate (Pro, Con, or Judge).
 
     Each agent owns its own ChatAnthropic instance and prompt chain so it
     maintains an independent temperature and system persona throughout the
     debate. Agents do not hold conversation history — the controller passes
-    the full shared transcript on every turn.
+    the full shared transcript on every turn. This is the ``langchain``
+    backend (see ``src/agents/common.py``).
     """
 
-    def __init__(self, name: str, role: str, system_prompt: str, temperature: float = 0.7):
-        self.name = name
-        self.role = role
+    def __init__(
+        self,
+        name: str,
+        role: str,
+        system_prompt: str,
+        temperature: float = 0.7,
+        model: str = MODEL_NAME,
+    ):
+        super().__init__(name, role, temperature=temperature, model=model)
+        _import_dependencies()
 
         # 1. THE LLM - This is the "brain" of the agent.
         #    ChatAnthropic is a LangChain wrapper around the Anthropic API.
         #    Each agent gets its OWN LLM instance with its own settings.
         self.llm = ChatAnthropic(
-            model=MODEL_NAME,
+            model=model,
             temperature=temperature,
             max_tokens=MAX_TOKENS,
             # Resilience: bound each request and let the SDK retry transient
@@ -79,7 +103,7 @@ class DebateAgent:
         #     config.SCORING_MAX_TOKENS — so it's kept separate rather than
         #     raising max_tokens for every turn.
         self.scoring_llm = ChatAnthropic(
-            model=MODEL_NAME,
+            model=model,
             temperature=temperature,
             max_tokens=SCORING_MAX_TOKENS,
             timeout=REQUEST_TIMEOUT,
@@ -110,17 +134,14 @@ class DebateAgent:
                 {
                     # Stable, append-only prefix — cached up to this breakpoint.
                     "type": "text",
-                    "text": "Current debate transcript:\n{debate_context}",
+                    "text": TRANSCRIPT_TEMPLATE,
                     "cache_control": {"type": "ephemeral"},
                 },
                 {
                     # Volatile per-turn instruction, deliberately placed AFTER the
                     # breakpoint so it never invalidates the cached prefix above.
                     "type": "text",
-                    "text": (
-                        "Your instruction for this turn:\n{instruction}\n\n"
-                        "Respond in character as {name}, the {role} in this debate."
-                    ),
+                    "text": INSTRUCTION_TEMPLATE,
                 },
             ]),
         ])
@@ -129,25 +150,16 @@ class DebateAgent:
         #    LLM: filled template -> Claude -> response.
         self.chain = self.prompt | self.llm
 
-    def _log_cache_usage(self, usage_metadata) -> None:
-        """Log the prompt-cache read/write counts from a response's usage.
+    async def awarm_up(self) -> None:
+        """Open a pooled connection to the API with a one-token message.
 
-        This is the verification hook for the caching above: from the second
-        turn on, ``read`` should be non-zero (the persona + prior transcript
-        served from cache) while ``uncached_input`` stays small (only the new
-        turn is paid for in full). A no-op when usage metadata is absent, so a
-        mocked LLM never trips it.
+        Every ChatAnthropic in the process shares langchain-anthropic's cached
+        HTTP client, so the connection this opens serves the debates after it.
+        That client is only reachable through ChatAnthropic's public methods,
+        so this is the smallest request they make rather than the SDK
+        backend's free model listing.
         """
-        stats = _cache_stats(usage_metadata)
-        if stats is None:
-            return
-        logger.info(
-            "%s prompt cache: read=%d created=%d uncached_input=%d tokens",
-            self.name,
-            stats["cache_read"],
-            stats["cache_creation"],
-            stats["uncached_input"],
-        )
+        await self.llm.ainvoke("Hi", max_tokens=1)
 
     def respond(self, debate_context: str, instruction: str) -> str:
         """Generate a response given the current debate state.
@@ -169,7 +181,7 @@ class DebateAgent:
                 f"The AI service was unavailable while {self.name} was responding."
             ) from e
 
-        self._log_cache_usage(getattr(response, "usage_metadata", None))
+        self._record_usage(getattr(response, "usage_metadata", None))
         return response.content
 
     async def astream_respond(self, debate_context: str, instruction: str) -> AsyncGenerator[str, None]:
@@ -181,7 +193,7 @@ class DebateAgent:
         Anthropic API fails mid-stream, so the web layer can emit a clean error
         event instead of a raw traceback.
         """
-        aggregate = None
+        usage = None
         try:
             async for chunk in self.chain.astream({
                 "debate_context": debate_context,
@@ -189,10 +201,13 @@ class DebateAgent:
                 "name": self.name,
                 "role": self.role
             }):
-                # Accumulate the chunks so the usage metadata — which Anthropic
-                # sends incrementally across the stream — can be read out as a
-                # whole once the stream finishes.
-                aggregate = chunk if aggregate is None else aggregate + chunk
+                # The response's usage arrives complete on the stream's final
+                # message_delta chunk, so keep the last one seen rather than
+                # merging chunks (``aggregate + chunk`` re-copies the whole
+                # content on every delta — quadratic in the response length).
+                # The text itself is the caller's to join.
+                if chunk.usage_metadata:
+                    usage = chunk.usage_metadata
                 if chunk.content:
                     yield chunk.content
         except anthropic.AnthropicError as e:
@@ -200,7 +215,7 @@ class DebateAgent:
                 f"The AI service was unavailable while {self.name} was responding."
             ) from e
 
-        self._log_cache_usage(getattr(aggregate, "usage_metadata", None))
+        self._record_usage(usage)
 
     def score_arguments(self, debate_context: str, instruction: str) -> DebateScores:
         """Score the debate's arguments as structured data (synchronous; CLI).
@@ -248,7 +263,8 @@ class DebateAgent:
 
 
 def build_agents(pro_style: str, con_style: str) -> tuple["DebateAgent", "DebateAgent", "DebateAgent"]:
-    """Return (pro_agent, con_agent, judge_agent) configured for a debate.
+    """Return (pro_agent, con_agent, judge_agent) configured for a debate, on
+    the ``AGENT_BACKEND`` backend.
 
     Raises :class:`~src.prompts.StyleConfigError` (not a bare ``KeyError``) if
     ``pro_style``/``con_style`` has no matching prompt in ``PRO_STYLES``/
@@ -256,7 +272,13 @@ def build_agents(pro_style: str, con_style: str) -> tuple["DebateAgent", "Debate
     ``src.prompts.validate_styles``.
     """
     from src.prompts import PRO_STYLES, CON_STYLES, JUDGE_AGENT_PROMPT, StyleConfigError
-    from config import TEMPERATURE_DEBATERS, TEMPERATURE_JUDGE
+    from config import (
+        TEMPERATURE_DEBATERS,
+        TEMPERATURE_JUDGE,
+        JUDGE_PANEL_SIZE,
+        JUDGE_PANEL_MODELS,
+        JUDGE_PANEL_TEMPERATURES,
+    )
 
     try:
         pro_prompt = PRO_STYLES[pro_style]
@@ -271,22 +293,31 @@ def build_agents(pro_style: str, con_style: str) -> tuple["DebateAgent", "Debate
             f"Unknown con_style '{con_style}': no matching CON_STYLES prompt."
         ) from None
 
-    pro = DebateAgent(
+    agent = agent_class()
+    pro = agent(
         name="Pro",
         role="arguing FOR the topic",
         system_prompt=pro_prompt,
         temperature=TEMPERATURE_DEBATERS,
     )
-    con = DebateAgent(
+    con = agent(
         name="Con",
         role="arguing AGAINST the topic",
         system_prompt=con_prompt,
         temperature=TEMPERATURE_DEBATERS,
     )
-    judge = DebateAgent(
-        name="Judge",
-        role="moderator and judge",
-        system_prompt=JUDGE_AGENT_PROMPT,
-        temperature=TEMPERATURE_JUDGE,
-    )
+    if JUDGE_PANEL_SIZE > 1:
+        # A panel stands in for the lone judge: its first member moderates and
+        # gives the verdict, and all of them score (see src/judge_panel.py).
+        from src.judge_panel import build_judge_panel
+        judge = build_judge_panel(
+            JUDGE_PANEL_SIZE, models=JUDGE_PANEL_MODELS, temperatures=JUDGE_PANEL_TEMPERATURES
+        )
+    else:
+        judge = agent(
+            name="Judge",
+            role="moderator and judge",
+            system_prompt=JUDGE_AGENT_PROMPT,
+            temperature=TEMPERATURE_JUDGE,
+        )
     return pro, con, judge
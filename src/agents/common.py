@@ -0,0 +1,141 @@
+"""What every debate-agent backend shares, without importing any of them.
+
+An agent is one LLM-backed participant (Pro, Con, or Judge) exposing
+``respond`` / ``astream_respond`` / ``score_arguments`` /
+``ascore_arguments``. Two backends implement it, picked by ``AGENT_BACKEND``
+(see :func:`agent_class`):
+
+* ``langchain`` — :class:`~src.agents.base_agent.DebateAgent`, a
+  ``ChatPromptTemplate | ChatAnthropic`` chain (the default);
+* ``anthropic`` — :class:`~src.agents.anthropic_agent.AnthropicAgent`, which
+  calls the Anthropic SDK directly.
+
+Both send the same prompt (the text below, with the same ``cache_control``
+breakpoints), map API failures to the same :class:`AgentError`, and keep the
+same token accounting (:class:`AgentBase`). This module imports neither
+LangChain nor the SDK, so choosing one backend never loads the other.
+"""
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from config import AGENT_BACKEND, MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+# The turn prompt, after the persona (system) block. The transcript is a
+# stable, append-only prefix cached up to its breakpoint; the volatile
+# per-turn instruction comes after it so it never invalidates that prefix.
+# Both are ``str.format`` / LangChain f-string templates.
+TRANSCRIPT_TEMPLATE = "Current debate transcript:\n{debate_context}"
+INSTRUCTION_TEMPLATE = (
+    "Your instruction for this turn:\n{instruction}\n\n"
+    "Respond in character as {name}, the {role} in this debate."
+)
+
+
+def _cache_stats(usage_metadata) -> Optional[dict[str, int]]:
+    """Pull the prompt-cache counters out of a response's usage metadata.
+
+    LangChain normalises Anthropic's ``cache_read_input_tokens`` /
+    ``cache_creation_input_tokens`` into ``usage_metadata['input_token_details']``
+    under the keys ``cache_read`` / ``cache_creation``. This returns just those
+    two counters plus the uncached ``input_tokens`` (the prefix paid for at full
+    price), or ``None`` when no usage metadata is present — e.g. the mocked LLM
+    in the tests. Kept pure and side-effect free so the cache accounting can be
+    asserted on directly.
+    """
+    if not isinstance(usage_metadata, dict):
+        return None
+    details = usage_metadata.get("input_token_details") or {}
+    return {
+        "cache_read": details.get("cache_read") or 0,
+        "cache_creation": details.get("cache_creation") or 0,
+        "uncached_input": usage_metadata.get("input_tokens") or 0,
+    }
+
+
+def _usage_counts(usage_metadata) -> Optional[dict[str, int]]:
+    """Flatten a response's usage metadata into plain token counters.
+
+    Extends :func:`_cache_stats` with the output-token count, so a caller can
+    total what a whole debate cost. ``None`` when there is no usage metadata.
+    """
+    stats = _cache_stats(usage_metadata)
+    if stats is None:
+        return None
+    stats["output"] = usage_metadata.get("output_tokens") or 0
+    return stats
+
+
+class AgentError(RuntimeError):
+    """A debate agent failed to get a response from the LLM.
+
+    Wraps Anthropic API failures (rate limits, overload, timeouts, connection
+    errors) in one clear, domain-specific error so callers don't have to know
+    about the underlying SDK. The CLI turns this into a friendly message instead
+    of crashing mid-debate; the web layer turns it into a clean error event
+    rather than leaking a raw traceback to the browser.
+    """
+
+
+class AgentBase(ABC):
+    """Identity and token accounting shared by the agent backends."""
+
+    def __init__(self, name: str, role: str, temperature: float = 0.7, model: str = MODEL_NAME):
+        self.name = name
+        self.role = role
+        self.model = model
+        self.temperature = temperature
+        # Running token totals across every call this agent makes (see
+        # ``_record_usage``). The batch runner reports these per debate.
+        self.usage: dict[str, int] = {
+            "cache_read": 0, "cache_creation": 0, "uncached_input": 0, "output": 0,
+        }
+
+    @abstractmethod
+    async def awarm_up(self) -> None:
+        """Open a connection to the API that later calls reuse (see
+        ``api/services/warmup.py``). Costs no tokens."""
+
+    def _log_cache_usage(self, usage_metadata) -> None:
+        """Log the prompt-cache read/write counts from a response's usage.
+
+        This is the verification hook for prompt caching: from the second
+        turn on, ``read`` should be non-zero (the persona + prior transcript
+        served from cache) while ``uncached_input`` stays small (only the new
+        turn is paid for in full). A no-op when usage metadata is absent, so a
+        mocked LLM never trips it.
+        """
+        stats = _cache_stats(usage_metadata)
+        if stats is None:
+            return
+        logger.info(
+            "%s prompt cache: read=%d created=%d uncached_input=%d tokens",
+            self.name,
+            stats["cache_read"],
+            stats["cache_creation"],
+            stats["uncached_input"],
+        )
+
+    def _record_usage(self, usage_metadata) -> None:
+        """Log the cache counters and add this response to ``self.usage``."""
+        self._log_cache_usage(usage_metadata)
+        counts = _usage_counts(usage_metadata)
+        if counts is None:
+            return
+        for key, value in counts.items():
+            self.usage[key] += value
+
+
+def agent_class(backend: Optional[str] = None) -> type[AgentBase]:
+    """The agent class for ``backend``, by default ``AGENT_BACKEND``
+    (``langchain`` or ``anthropic``)."""
+    backend = backend or AGENT_BACKEND
+    if backend == "langchain":
+        from src.agents.base_agent import DebateAgent
+        return DebateAgent
+    if backend == "anthropic":
+        from src.agents.anthropic_agent import AnthropicAgent
+        return AnthropicAgent
+    raise ValueError(f"Unknown AGENT_BACKEND '{backend}'. Must be one of: langchain, anthropic")
@@ -0,0 +1,409 @@
+"""Headless batch mode — run many debates concurrently with no human in the loop.
+
+``python main.py batch topics.jsonl`` drives this module. It is a third consumer
+of the shared :class:`~src.debate_engine.DebateEngine`, next to the CLI
+controller and the web service, and — like the web service — it executes turns
+with the agents' *async* methods (``astream_respond`` / ``ascore_arguments``),
+so many debates can share one event loop. The blocking ``respond`` is never
+called here.
+
+The pieces:
+
+* :class:`BatchItem` / :func:`load_batch_items` — the input: one JSON object per
+  line with a ``topic`` and optional ``pro_style`` / ``con_style`` / ``id``.
+* :class:`VotePolicy` — stands in for the audience: a fixed side, a seeded
+  random pick, or no vote at all.
+* :class:`HeadlessDebate` — runs one debate and returns its result record
+  (transcript, scores, token usage, per-turn timings).
+* :func:`run_items` — the bounded-concurrency scheduler, which hands each
+  result to a sink as it finishes (the style tournament in
+  ``src/tournament.py`` reuses it with its own checkpointing sink).
+* :func:`run_batch` — the JSONL sink. Each finished debate is appended to the
+  output file immediately (flushed and fsynced), so a killed batch loses at
+  most the debates that were in flight; rerunning the same command skips
+  every id that already has a ``completed`` record.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from config import (
+    AVAILABLE_STYLES,
+    BATCH_CONCURRENCY,
+    DEFAULT_CON_STYLE,
+    DEFAULT_PRO_STYLE,
+    NUM_REBUTTAL_ROUNDS,
+)
+from src.agents.base_agent import AgentError, DebateAgent, build_agents
+from src.debate_engine import (
+    DEFAULT_WORD_LIMITS,
+    DebateEngine,
+    DebateState,
+    PhaseChange,
+    Score,
+    Turn,
+    Vote,
+    format_audience_vote,
+)
+from src.prompts import StyleConfigError
+
+logger = logging.getLogger(__name__)
+
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+VOTE_POLICIES = ("fixed", "random", "skip")
+VOTE_CHOICES = ("PRO", "CON", "TIE")
+
+
+class BatchInputError(ValueError):
+    """The batch input file is malformed (bad JSON, missing topic, ...)."""
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One debate to run: a stable id plus the topic and each side's style."""
+    id: str
+    topic: str
+    pro_style: str
+    con_style: str
+
+
+def item_id_for(topic: str, pro_style: str, con_style: str) -> str:
+    """A content-derived id for a debate setup, so a resumed batch recognises
+    the same line even if other lines were added or reordered around it."""
+    digest = hashlib.sha1(f"{topic}\x00{pro_style}\x00{con_style}".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def load_batch_items(path: str) -> list[BatchItem]:
+    """Parse the topics JSONL into :class:`BatchItem` objects.
+
+    Blank lines are ignored. A line may omit ``pro_style`` / ``con_style``
+    (the configured defaults apply) and ``id`` (a hash of the setup is used;
+    repeats of the same setup get ``-2``, ``-3`` ... suffixes). Raises
+    :class:`BatchInputError` naming the offending line — including for a style
+    that is given but isn't one of ``AVAILABLE_STYLES`` (``""`` or ``null``
+    too), so a typo fails the batch up front rather than hours into a sweep.
+    """
+    items: list[BatchItem] = []
+    seen: dict[str, int] = {}
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise BatchInputError(f"line {lineno}: invalid JSON ({error})") from None
+            if not isinstance(raw, dict) or not isinstance(raw.get("topic"), str) \
+                    or not raw["topic"].strip():
+                raise BatchInputError(f"line {lineno}: expected an object with a string 'topic'")
+            topic = raw["topic"].strip()
+            pro_style = raw.get("pro_style", DEFAULT_PRO_STYLE)
+            con_style = raw.get("con_style", DEFAULT_CON_STYLE)
+            for field, style in (("pro_style", pro_style), ("con_style", con_style)):
+                if not isinstance(style, str) or style not in AVAILABLE_STYLES:
+                    raise BatchInputError(
+                        f"line {lineno}: unknown {field} {json.dumps(style)}. "
+                        f"Must be one of: {AVAILABLE_STYLES}"
+                    )
+            item_id = str(raw.get("id") or item_id_for(topic, pro_style, con_style))
+            seen[item_id] = seen.get(item_id, 0) + 1
+            if seen[item_id] > 1:
+                item_id = f"{item_id}-{seen[item_id]}"
+            items.append(BatchItem(item_id, topic, pro_style, con_style))
+    return items
+
+
+@dataclass(frozen=True)
+class VotePolicy:
+    """How the headless audience answers the mid-debate vote.
+
+    ``fixed`` always votes ``side``; ``random`` picks PRO/CON/TIE from a RNG
+    seeded by ``seed`` and the debate id (so a rerun reproduces the same
+    votes); ``skip`` records no audience vote at all.
+    """
+    kind: str = "fixed"
+    side: str = "TIE"
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.kind not in VOTE_POLICIES:
+            raise ValueError(f"Unknown vote policy '{self.kind}'. Must be one of: {VOTE_POLICIES}")
+        if self.side not in VOTE_CHOICES:
+            raise ValueError(f"Unknown vote side '{self.side}'. Must be one of: {VOTE_CHOICES}")
+
+    def choose(self, debate_id: str) -> Optional[str]:
+        """Return the vote for ``debate_id``, or ``None`` to skip the vote."""
+        if self.kind == "skip":
+            return None
+        if self.kind == "random":
+            return random.Random(f"{self.seed}:{debate_id}").choice(VOTE_CHOICES)
+        return self.side
+
+
+class HeadlessDebate(DebateState):
+    """Runs one debate end to end with no terminal, socket, or human.
+
+    Consumes the shared :class:`DebateEngine` exactly like the web service
+    does — each ``Turn`` is streamed via ``astream_respond`` and joined, the
+    ``Score`` runs ``ascore_arguments`` — and records per-turn wall times.
+    """
+
+    def __init__(
+        self,
+        debate_id: str,
+        topic: str,
+        pro_agent: DebateAgent,
+        con_agent: DebateAgent,
+        judge_agent: DebateAgent,
+        *,
+        vote_policy: VotePolicy,
+    ):
+        super().__init__(topic)
+        self.debate_id = debate_id
+        self.pro = pro_agent
+        self.con = con_agent
+        self.judge = judge_agent
+        self.vote_policy = vote_policy
+        self.vote: Optional[str] = None
+        self.turn_timings: list[dict] = []
+
+    async def run(self) -> None:
+        """Execute the full debate, populating the transcript and scores."""
+        engine = DebateEngine(
+            self.topic,
+            self.pro,
+            self.con,
+            self.judge,
+            num_rebuttal_rounds=NUM_REBUTTAL_ROUNDS,
+            word_limits=DEFAULT_WORD_LIMITS,
+        )
+        for event in engine.events():
+            if isinstance(event, PhaseChange):
+                self.phase = event.phase
+            elif isinstance(event, Turn):
+                start = time.perf_counter()
+                chunks = [
+                    chunk async for chunk in event.agent.astream_respond(
+                        self.get_transcript_text(), event.instruction
+                    )
+                ]
+                self.add_to_transcript(event.speaker.value, "".join(chunks))
+                self.turn_timings.append({
+                    "speaker": event.speaker.value,
+                    "label": event.label,
+                    "seconds": round(time.perf_counter() - start, 3),
+                })
+            elif isinstance(event, Score):
+                start = time.perf_counter()
+                self.argument_scores = await event.agent.ascore_arguments(
+                    self.get_transcript_text(), event.instruction
+                )
+                self.turn_timings.append({
+                    "speaker": "SCORING",
+                    "label": None,
+                    "seconds": round(time.perf_counter() - start, 3),
+                })
+            elif isinstance(event, Vote):
+                self.vote = self.vote_policy.choose(self.debate_id)
+                if self.vote is not None:
+                    self.add_to_transcript("AUDIENCE", format_audience_vote(self.vote))
+
+    def usage(self) -> dict[str, int]:
+        """Total token usage across the three agents (zeros when unreported)."""
+        totals = {"cache_read": 0, "cache_creation": 0, "uncached_input": 0, "output": 0}
+        for agent in (self.pro, self.con, self.judge):
+            agent_usage = getattr(agent, "usage", None)
+            if not isinstance(agent_usage, dict):
+                continue
+            for key in totals:
+                totals[key] += agent_usage.get(key, 0)
+        return totals
+
+
+def read_completed_ids(output_path: str) -> set[str]:
+    """Ids already recorded as completed in ``output_path`` (for resuming).
+
+    A batch killed mid-write can leave a truncated last line; it is skipped
+    rather than treated as an error, and that debate simply runs again.
+    Failed records are not counted, so a resumed batch retries them.
+    """
+    if not os.path.exists(output_path):
+        return set()
+    completed = set()
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("status") == STATUS_COMPLETED:
+                completed.add(record.get("id"))
+    return completed
+
+
+@dataclass
+class BatchSummary:
+    """Counts for one ``run_batch`` call."""
+    total: int = 0
+    skipped: int = 0
+    completed: int = 0
+    failed: int = 0
+
+
+class _ResultWriter:
+    """Appends result records to the output JSONL, one durable line at a time.
+
+    Writes are serialised with a lock so concurrent debates never interleave
+    partial lines, and each line is flushed and fsynced before the next
+    debate's result is accepted — the resume guarantee depends on that.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = asyncio.Lock()
+        self._checked_tail = False
+
+    async def write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        async with self._lock:
+            await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: str) -> None:
+        if not self._checked_tail:
+            # A previous run killed mid-write leaves a partial last line with no
+            # newline; terminate it so our first record starts on its own line
+            # (read_completed_ids then skips the fragment).
+            self._checked_tail = True
+            if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = "\n" + line
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+async def run_items(
+    items: list[BatchItem],
+    sink: Callable[[dict], Awaitable[None]],
+    *,
+    concurrency: int = BATCH_CONCURRENCY,
+    vote_policy: VotePolicy = VotePolicy(),
+    agent_factory: Callable[[str, str], tuple] = build_agents,
+) -> BatchSummary:
+    """The bounded-concurrency scheduler: run ``items``, at most ``concurrency``
+    debates in flight, handing each result record to ``sink`` as it finishes.
+
+    Every item produces exactly one record — ``completed``, or ``failed`` when
+    anything interrupts it (an :class:`AgentError`, a style misconfiguration,
+    any other exception); one failing debate never stops the rest. A debate's concurrency slot is held
+    until ``sink`` returns, so a durable sink (the JSONL writer, the tournament
+    checkpoint) has recorded a result before another debate starts in its place.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    summary = BatchSummary(total=len(items))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(item: BatchItem) -> None:
+        async with semaphore:
+            record = await _run_item(item, vote_policy, agent_factory)
+            await sink(record)
+        if record["status"] == STATUS_COMPLETED:
+            summary.completed += 1
+        else:
+            summary.failed += 1
+
+    await asyncio.gather(*(run_one(item) for item in items))
+    return summary
+
+
+async def run_batch(
+    items: list[BatchItem],
+    output_path: str,
+    *,
+    concurrency: int = BATCH_CONCURRENCY,
+    vote_policy: VotePolicy = VotePolicy(),
+    agent_factory: Callable[[str, str], tuple] = build_agents,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> BatchSummary:
+    """Run ``items`` via :func:`run_items`, appending each record to ``output_path``.
+
+    Items whose id already has a completed record in ``output_path`` are
+    skipped. ``on_result`` is called with each record once it is written (the
+    CLI uses it for progress output).
+    """
+    done = read_completed_ids(output_path)
+    pending = [item for item in items if item.id not in done]
+    writer = _ResultWriter(output_path)
+
+    async def sink(record: dict) -> None:
+        await writer.write(record)
+        if on_result is not None:
+            on_result(record)
+
+    logger.info(
+        "Batch starting: %d item(s), %d already completed, concurrency=%d",
+        len(items), len(items) - len(pending), concurrency,
+    )
+    summary = await run_items(
+        pending, sink,
+        concurrency=concurrency, vote_policy=vote_policy, agent_factory=agent_factory,
+    )
+    summary.total = len(items)
+    summary.skipped = len(items) - len(pending)
+    return summary
+
+
+async def _run_item(
+    item: BatchItem, vote_policy: VotePolicy, agent_factory: Callable[[str, str], tuple]
+) -> dict:
+    """Run one item and build its result record. Never raises: whatever stops
+    the debate — an :class:`AgentError`, a style misconfiguration, or any
+    other exception (an SDK error, a malformed score) — is recorded as
+    ``failed``, so the rest of the batch runs on."""
+    record = {
+        "id": item.id,
+        "topic": item.topic,
+        "pro_style": item.pro_style,
+        "con_style": item.con_style,
+    }
+    start = time.perf_counter()
+    debate: Optional[HeadlessDebate] = None
+    try:
+        pro, con, judge = agent_factory(item.pro_style, item.con_style)
+        debate = HeadlessDebate(item.id, item.topic, pro, con, judge, vote_policy=vote_policy)
+        await debate.run()
+    except (AgentError, StyleConfigError) as error:
+        logger.warning("Batch debate failed: id=%s (%s)", item.id, error)
+        record.update(status=STATUS_FAILED, error=str(error))
+    except Exception as error:
+        logger.exception("Batch debate failed unexpectedly: id=%s", item.id)
+        record.update(status=STATUS_FAILED, error=f"{type(error).__name__}: {error}")
+    else:
+        scores = debate.argument_scores
+        record.update(
+            status=STATUS_COMPLETED,
+            vote=debate.vote,
+            winner=scores.winner if scores else None,
+            transcript=debate.transcript,
+            argument_scores=scores.model_dump() if scores else None,
+        )
+    record["usage"] = debate.usage() if debate else None
+    record["timings"] = {
+        "total_seconds": round(time.perf_counter() - start, 3),
+        "turns": debate.turn_timings if debate else [],
+    }
+    return record
@@ -1,6 +1,8 @@
+import asyncio
 import time
 from typing import Optional
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from config import NUM_REBUTTAL_ROUNDS
@@ -28,9 +30,85 @@ from messages import (
     CLI_SCORES_COL_REASON,
     CLI_SCOREBOARD_TITLE,
     CLI_SCOREBOARD_BODY,
+    CLI_SCOREBOARD_PANEL,
 )
 
 
+class _StreamingPanel:
+    """A Rich renderable for a turn that is still streaming in.
+
+    Chunks are appended to a list and only joined when Rich actually repaints
+    (``Live`` refreshes on a timer), so a long turn costs one join per frame
+    rather than one per token. The subtitle reports time-to-first-token and
+    the output rate: tokens/sec from the API's usage once the turn is done,
+    and streamed chunks/sec while it is still arriving (or if no usage came
+    back). Each is labelled as what it is, since a chunk is not a token.
+    """
+
+    def __init__(self, title: str, style: str):
+        self.title = title
+        self.style = style
+        self.parts: list[str] = []
+        self.start = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.end: Optional[float] = None
+        self.output_tokens: Optional[int] = None
+
+    def append(self, chunk: str) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.parts.append(chunk)
+
+    def finish(self, output_tokens: Optional[int]) -> str:
+        """Stop the clock and return the full response text."""
+        self.end = time.perf_counter()
+        self.output_tokens = output_tokens or None
+        return "".join(self.parts)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def ttft(self) -> Optional[float]:
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.start
+
+    def _per_second(self, count: int) -> Optional[float]:
+        if self.first_token_at is None:
+            return None
+        generating = (self.end or time.perf_counter()) - self.first_token_at
+        if generating <= 0:
+            return None
+        return count / generating
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Output tokens/sec, once the finished turn's usage reports them."""
+        if self.output_tokens is None:
+            return None
+        return self._per_second(self.output_tokens)
+
+    @property
+    def chunks_per_second(self) -> Optional[float]:
+        """Streamed chunks/sec: the live estimate before usage is known."""
+        return self._per_second(len(self.parts))
+
+    def subtitle(self) -> str:
+        if self.ttft is None:
+            return f"[waiting {self.elapsed:.1f}s]"
+        rate_text = ""
+        if self.tokens_per_second is not None:
+            rate_text = f" · {self.tokens_per_second:.1f} tok/s"
+        elif self.chunks_per_second is not None:
+            rate_text = f" · {self.chunks_per_second:.1f} chunks/s"
+        return f"[TTFT {self.ttft:.2f}s{rate_text} · {self.elapsed:.1f}s]"
+
+    def __rich__(self) -> Panel:
+        return Panel("".join(self.parts), title=self.title, subtitle=self.subtitle(), style=self.style)
+
+
 class DebateController(DebateState):
     """The synchronous (CLI) orchestrator of the multi-agent system.
 
@@ -44,6 +122,11 @@ class DebateController(DebateState):
     The agents don't talk to each other directly — the controller passes the
     shared transcript (inherited from :class:`DebateState`) to each one so they
     can respond to what came before.
+
+    :meth:`arun_debate` is the streaming mode: the same engine, but each turn
+    runs through ``astream_respond`` and its tokens render live in a Rich
+    ``Live`` panel (see :class:`_StreamingPanel`), exactly as the web UI
+    streams them. :meth:`run_debate` keeps the blocking, whole-turn path.
     """
 
     # Rich panel colour per speaker.
@@ -129,6 +212,63 @@ class DebateController(DebateState):
 
         return self.transcript
 
+    async def arun_debate(self):
+        """Execute the full debate with live token streaming (the CLI default).
+
+        Same engine and instructions as :meth:`run_debate`, but every turn is
+        consumed from ``astream_respond`` and painted as it arrives, and the
+        scoreboard comes from ``ascore_arguments``. The audience vote's blocking
+        ``input()`` runs in a worker thread so it never stalls the event loop.
+        """
+        engine = DebateEngine(
+            self.topic,
+            self.pro,
+            self.con,
+            self.judge,
+            num_rebuttal_rounds=NUM_REBUTTAL_ROUNDS,
+            word_limits=None,
+        )
+
+        for event in engine.events():
+            if isinstance(event, PhaseChange):
+                self.phase = event.phase
+            elif isinstance(event, Turn):
+                response = await self._stream_turn(event)
+                self.add_to_transcript(event.speaker.value, response)
+            elif isinstance(event, Score):
+                self.argument_scores = await event.agent.ascore_arguments(
+                    self.get_transcript_text(), event.instruction
+                )
+                self._display_scores(self.argument_scores)
+            elif isinstance(event, Vote):
+                await asyncio.to_thread(self._collect_vote)
+
+        return self.transcript
+
+    async def _stream_turn(self, turn: Turn) -> str:
+        """Stream one turn into a live panel and return the full response.
+
+        The output-token count for the subtitle's final rate is the growth of
+        the agent's running ``usage['output']`` total over this turn, when the
+        API reported it.
+        """
+        panel = _StreamingPanel(
+            self._title(turn.speaker, turn.label),
+            self._SPEAKER_STYLES.get(turn.speaker, "white"),
+        )
+        usage = getattr(turn.agent, "usage", None)
+        output_before = usage.get("output", 0) if isinstance(usage, dict) else 0
+        self.console.print()
+        with Live(panel, console=self.console, refresh_per_second=12):
+            async for chunk in turn.agent.astream_respond(
+                self.get_transcript_text(), turn.instruction
+            ):
+                panel.append(chunk)
+            output_tokens = (
+                usage.get("output", 0) - output_before if isinstance(usage, dict) else None
+            )
+            return panel.finish(output_tokens)
+
     def _display_scores(self, scores: DebateScores):
         """Render the judge's structured scoreboard as a Rich table."""
         self.console.print()
@@ -142,14 +282,23 @@ class DebateController(DebateState):
         for arg in scores.con_arguments:
             table.add_row("CON", arg.summary, f"{arg.score}/10", arg.reason)
         self.console.print(table)
+        body = CLI_SCOREBOARD_BODY.format(
+            pro_average=scores.pro_average,
+            con_average=scores.con_average,
+            winner=scores.winner,
+            strongest=scores.strongest_argument,
+            weakest=scores.weakest_argument,
+        )
+        if scores.panel is not None:
+            body += CLI_SCOREBOARD_PANEL.format(
+                size=scores.panel.size,
+                agreement=scores.panel.agreement,
+                pro=scores.panel.votes["PRO"],
+                con=scores.panel.votes["CON"],
+                tie=scores.panel.votes["TIE"],
+            )
         self.console.print(Panel(
-            CLI_SCOREBOARD_BODY.format(
-                pro_average=scores.pro_average,
-                con_average=scores.con_average,
-                winner=scores.winner,
-                strongest=scores.strongest_argument,
-                weakest=scores.weakest_argument,
-            ),
+            body,
             title=CLI_SCOREBOARD_TITLE,
             style="magenta",
         ))
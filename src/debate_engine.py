@@ -25,6 +25,8 @@ Keeping the engine free of I/O and state mutation is what lets the same sequence
 drive a blocking CLI and an async streaming service without either path being
 able to silently diverge from the other again.
 """
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Optional, Union
 
@@ -80,6 +82,21 @@ class DebateState:
             text += f"[{entry['speaker']}]: {entry['content']}\n\n"
         return text
 
+    def transcript_digest(self) -> dict:
+        """Entry count and SHA-256 of the transcript, for a client to check
+        the copy it assembled from the stream without being re-sent it.
+
+        The hash is over the compact JSON of ``[[speaker, content], ...]``
+        (UTF-8, non-ASCII left as is) — what ``JSON.stringify`` produces for
+        the same pairs in a browser.
+        """
+        pairs = [[entry["speaker"], entry["content"]] for entry in self.transcript]
+        canonical = json.dumps(pairs, separators=(",", ":"), ensure_ascii=False)
+        return {
+            "count": len(pairs),
+            "sha256": hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+        }
+
 
 def format_audience_vote(side: str) -> str:
     """Render the audience-vote transcript line. Shared so the CLI and web
@@ -208,8 +225,33 @@ class DebateEngine:
             return base
         return base + self.word_limits.suffix(kind)
 
-    def events(self):
-        """Generate the full debate as :class:`DebateEvent` objects, in order."""
+    def events(self, resume_at: int = 0):
+        """Generate the debate as :class:`DebateEvent` objects, in order.
+
+        ``resume_at`` is the debate's position: the number of steps (each
+        :class:`Turn` and the :class:`Vote` — i.e. each transcript entry)
+        already completed. Those steps are skipped, never re-issued, and the
+        stream picks up at the next one, preceded by the :class:`PhaseChange`
+        for the phase (and so the rebuttal round) it falls in. ``resume_at=0``
+        is the whole debate. This is how a checkpointed debate continues after
+        a restart without regenerating turns that were already paid for.
+        """
+        step = 0
+        pending_phase = None
+        for event in self._all_events():
+            if step < resume_at:
+                if isinstance(event, PhaseChange):
+                    pending_phase = event
+                elif isinstance(event, (Turn, Vote)):
+                    step += 1
+                continue
+            if pending_phase is not None and not isinstance(event, PhaseChange):
+                yield pending_phase
+            pending_phase = None
+            yield event
+
+    def _all_events(self):
+        """The full, unskipped event sequence (see :meth:`events`)."""
 
         # --- PHASE 1: Introduction (judge acts as moderator) ---
         yield PhaseChange(DebatePhase.INTRODUCTION)
@@ -0,0 +1,198 @@
+"""Judge panel — several judges score the debate at once; one scoreboard out.
+
+A single judge at ``TEMPERATURE_JUDGE`` gives a noisy winner: re-score the
+same transcript and the verdict can flip. A panel of K judges (each with its
+own model and temperature, from ``JUDGE_PANEL_MODELS`` /
+``JUDGE_PANEL_TEMPERATURES``) scores the finished debate *concurrently*, so
+scoring wall time stays close to one judge's while the merged result varies
+far less. Every judge sends the same persona + transcript prompt prefix, so
+judges on the same model are prompt-cache compatible with one another.
+
+:func:`aggregate_scores` merges the judges' :class:`DebateScores`:
+
+* **winner** — majority vote. A split vote (no unique plurality) falls back to
+  the mean per-side averages: higher wins, equal is a ``TIE``.
+* **averages** — the mean of the judges' per-side averages.
+* **arguments** — the per-argument table (and strongest/weakest picks) of the
+  *representative* judge: the one, among those who backed the panel's winner,
+  whose averages sit closest to the panel means. Judges list different
+  arguments, so individual rows can't be averaged meaningfully.
+* **agreement** — a :class:`~src.scoring.PanelSummary` with the vote counts,
+  each judge's ballot, and the spread of their averages.
+
+:class:`JudgePanel` is a drop-in for the judge agent returned by
+``build_agents``: its first member moderates and delivers the verdict exactly
+as a lone judge would; only scoring fans out. A judge that fails is left out
+of the merge (and counted in ``panel.failed``); the scoring step fails only if
+every judge does.
+"""
+import asyncio
+import logging
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Optional
+
+from config import MODEL_NAME, TEMPERATURE_JUDGE
+from src.agents.base_agent import AgentError, DebateAgent, agent_class
+from src.scoring import DebateScores, JudgeBallot, PanelSummary
+
+logger = logging.getLogger(__name__)
+
+_WINNERS = ("PRO", "CON", "TIE")
+
+
+def aggregate_scores(scores: list[DebateScores], judges: Optional[list[str]] = None,
+                     *, failed: int = 0) -> DebateScores:
+    """Merge several judges' scoreboards into one (see module docstring).
+
+    ``judges`` labels each scoreboard's ballot (defaults to ``Judge 1..K``).
+    Raises ``ValueError`` on an empty list.
+    """
+    if not scores:
+        raise ValueError("aggregate_scores needs at least one scoreboard")
+    judges = judges or [f"Judge {i + 1}" for i in range(len(scores))]
+    pro_avgs = [s.pro_average for s in scores]
+    con_avgs = [s.con_average for s in scores]
+    pro_mean = round(statistics.fmean(pro_avgs), 1)
+    con_mean = round(statistics.fmean(con_avgs), 1)
+
+    votes = Counter(s.winner for s in scores)
+    ranked = votes.most_common()
+    if len(ranked) == 1 or ranked[0][1] > ranked[1][1]:
+        winner = ranked[0][0]
+    elif pro_mean != con_mean:
+        winner = "PRO" if pro_mean > con_mean else "CON"
+    else:
+        winner = "TIE"
+
+    backers = [s for s in scores if s.winner == winner] or scores
+    representative = min(
+        backers,
+        key=lambda s: abs(s.pro_average - pro_mean) + abs(s.con_average - con_mean),
+    )
+
+    panel = PanelSummary(
+        size=len(scores),
+        failed=failed,
+        votes={side: votes.get(side, 0) for side in _WINNERS},
+        agreement=round(votes.get(winner, 0) / len(scores), 2),
+        pro_average=pro_mean,
+        con_average=con_mean,
+        pro_average_stdev=round(statistics.pstdev(pro_avgs), 2),
+        con_average_stdev=round(statistics.pstdev(con_avgs), 2),
+        ballots=[
+            JudgeBallot(
+                judge=label, winner=s.winner,
+                pro_average=s.pro_average, con_average=s.con_average,
+            )
+            for label, s in zip(judges, scores)
+        ],
+    )
+    return representative.model_copy(update={"winner": winner, "panel": panel})
+
+
+class JudgePanel:
+    """K judge agents that score concurrently, behind the judge-agent interface.
+
+    Turns (the introduction and the verdict) go to the lead judge,
+    ``judges[0]``; :meth:`ascore_arguments` / :meth:`score_arguments` run every
+    judge at once and return the merged scoreboard.
+    """
+
+    def __init__(self, judges: list[DebateAgent]):
+        if not judges:
+            raise ValueError("A judge panel needs at least one judge")
+        self.judges = list(judges)
+        self.lead = self.judges[0]
+        self.name = self.lead.name
+        self.role = self.lead.role
+
+    @property
+    def usage(self) -> dict[str, int]:
+        """Token totals summed over every judge on the panel."""
+        totals: dict[str, int] = {}
+        for judge in self.judges:
+            for key, count in getattr(judge, "usage", {}).items():
+                totals[key] = totals.get(key, 0) + count
+        return totals
+
+    def respond(self, debate_context: str, instruction: str) -> str:
+        return self.lead.respond(debate_context, instruction)
+
+    async def astream_respond(
+        self, debate_context: str, instruction: str
+    ) -> AsyncGenerator[str, None]:
+        async for chunk in self.lead.astream_respond(debate_context, instruction):
+            yield chunk
+
+    async def ascore_arguments(self, debate_context: str, instruction: str) -> DebateScores:
+        """Score with every judge concurrently and merge (web service / async CLI)."""
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(judge.ascore_arguments(debate_context, instruction) for judge in self.judges),
+            return_exceptions=True,
+        )
+        return self._merge(results, time.perf_counter() - start)
+
+    def score_arguments(self, debate_context: str, instruction: str) -> DebateScores:
+        """Synchronous counterpart (the blocking CLI): one thread per judge."""
+        def score(judge):
+            try:
+                return judge.score_arguments(debate_context, instruction)
+            except AgentError as e:
+                return e
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(self.judges)) as pool:
+            results = list(pool.map(score, self.judges))
+        return self._merge(results, time.perf_counter() - start)
+
+    def _merge(self, results: list, elapsed: float) -> DebateScores:
+        scored, labels, errors = [], [], []
+        for judge, result in zip(self.judges, results):
+            if isinstance(result, AgentError):
+                logger.warning("Panel judge %s failed to score: %s", judge.name, result)
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                scored.append(result)
+                labels.append(judge.name)
+        if not scored:
+            raise errors[0]
+        merged = aggregate_scores(scored, labels, failed=len(errors))
+        logger.info(
+            "Judge panel scored: %d/%d judges in %.2fs, winner=%s agreement=%.0f%%",
+            len(scored), len(self.judges), elapsed, merged.winner,
+            merged.panel.agreement * 100,
+        )
+        return merged
+
+
+def build_judge_panel(
+    size: int,
+    *,
+    models: Optional[list[str]] = None,
+    temperatures: Optional[list[float]] = None,
+) -> JudgePanel:
+    """Build a panel of ``size`` judges on the shared judge persona.
+
+    Judge ``i`` takes ``models[i % len(models)]`` and
+    ``temperatures[i % len(temperatures)]``; an empty list means every judge
+    uses ``MODEL_NAME`` / ``TEMPERATURE_JUDGE``.
+    """
+    from src.prompts import JUDGE_AGENT_PROMPT
+
+    agent = agent_class()
+    judges = []
+    for i in range(size):
+        judges.append(agent(
+            name="Judge" if i == 0 else f"Judge {i + 1}",
+            role="moderator and judge",
+            system_prompt=JUDGE_AGENT_PROMPT,
+            temperature=temperatures[i % len(temperatures)] if temperatures else TEMPERATURE_JUDGE,
+            model=models[i % len(models)] if models else MODEL_NAME,
+        ))
+    return JudgePanel(judges)
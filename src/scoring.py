@@ -10,10 +10,18 @@ The model supplies the per-argument scores, the winner, and the
 strongest/weakest picks; the per-side averages are computed in code (a
 ``computed_field``, so they still serialize) — more reliable than asking the
 model to do the arithmetic.
+
+When a judge panel scores the debate (``src/judge_panel.py``), the merged
+scoreboard also carries a :class:`PanelSummary` — each judge's ballot and how
+far they agreed. It is hidden from the JSON schema, so the model is never
+asked to fill it in.
 """
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, computed_field
+from pydantic.json_schema import SkipJsonSchema
+
+Winner = Literal["PRO", "CON", "TIE"]
 
 
 class ArgumentScore(BaseModel):
@@ -23,6 +31,33 @@ class ArgumentScore(BaseModel):
     reason: str = Field(description="A brief justification for the score.")
 
 
+class JudgeBallot(BaseModel):
+    """One panel judge's bottom line."""
+    judge: str
+    winner: Winner
+    pro_average: float
+    con_average: float
+
+
+class PanelSummary(BaseModel):
+    """How a judge panel voted, and how far its judges agreed.
+
+    ``pro_average`` / ``con_average`` are the means of the judges' per-side
+    averages; the ``*_stdev`` fields are their population standard deviations.
+    ``agreement`` is the share of scoring judges whose winner matches the
+    panel's. ``failed`` counts judges whose call errored and were left out.
+    """
+    size: int
+    failed: int = 0
+    votes: dict[str, int]
+    agreement: float
+    pro_average: float
+    con_average: float
+    pro_average_stdev: float
+    con_average_stdev: float
+    ballots: list[JudgeBallot]
+
+
 class DebateScores(BaseModel):
     """The judge's structured scoring of a whole debate."""
     pro_arguments: list[ArgumentScore] = Field(
@@ -31,7 +66,7 @@ class DebateScores(BaseModel):
     con_arguments: list[ArgumentScore] = Field(
         description="Each distinct argument the CON side made, scored."
     )
-    winner: Literal["PRO", "CON", "TIE"] = Field(
+    winner: Winner = Field(
         description="The side that argued most effectively overall."
     )
     strongest_argument: str = Field(
@@ -40,15 +75,22 @@ class DebateScores(BaseModel):
     weakest_argument: str = Field(
         description="The single weakest argument in the debate, and why."
     )
+    # Set only on a judge panel's merged scoreboard; never part of the schema
+    # the model fills.
+    panel: SkipJsonSchema[Optional[PanelSummary]] = None
 
     @computed_field  # serialized into model_dump(); not asked of the model
     @property
     def pro_average(self) -> float:
+        if self.panel is not None:
+            return self.panel.pro_average
         return _average(self.pro_arguments)
 
     @computed_field
     @property
     def con_average(self) -> float:
+        if self.panel is not None:
+            return self.panel.con_average
         return _average(self.con_arguments)
 
 
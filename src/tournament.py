@@ -0,0 +1,190 @@
+"""Style tournament — which ``AVAILABLE_STYLES`` pairing wins most often?
+
+A tournament is a round-robin over every ordered ``(pro_style, con_style)``
+pair of distinct styles, crossed with a list of topics. Each matchup is one
+headless debate run by the batch scheduler (:func:`src.batch_runner.run_items`),
+so it inherits its bounded concurrency and failure isolation. As each result
+arrives, the judge's ``DebateScores.winner`` is folded into an
+:class:`EloLeaderboard` — Elo ratings per style plus a pro-vs-con win matrix.
+
+This module is pure scheduling and rating. Durability lives with the caller:
+``main.py tournament`` checkpoints every result (and the updated standings)
+through ``api/services/tournament_repository.py``, which is also what the
+``/api/tournaments`` endpoints read. On restart the leaderboard is rebuilt by
+replaying the checkpointed results in the order they arrived, and only the
+matchups without a completed result are scheduled again.
+"""
+import asyncio
+from dataclasses import dataclass
+from itertools import permutations
+from typing import Awaitable, Callable, Iterable, Optional
+
+from config import BATCH_CONCURRENCY, TOURNAMENT_ELO_INITIAL, TOURNAMENT_ELO_K
+from src.agents.base_agent import build_agents
+from src.batch_runner import (
+    STATUS_COMPLETED,
+    BatchItem,
+    BatchSummary,
+    VotePolicy,
+    item_id_for,
+    run_items,
+)
+
+# Outcomes recorded per cell of the win matrix. Keyed by the judge's verdict,
+# so the matrix reads "in pro_style vs con_style debates, PRO won n times".
+OUTCOMES = ("PRO", "CON", "TIE")
+
+
+@dataclass(frozen=True)
+class Matchup:
+    """One scheduled debate: a style for each side, and the topic."""
+    pro_style: str
+    con_style: str
+    topic: str
+
+    @property
+    def key(self) -> str:
+        """Stable id — the same content hash the batch runner uses, so a
+        restarted tournament recognises matchups it already played."""
+        return item_id_for(self.topic, self.pro_style, self.con_style)
+
+    def to_batch_item(self) -> BatchItem:
+        return BatchItem(self.key, self.topic, self.pro_style, self.con_style)
+
+
+def round_robin(styles: Iterable[str], topics: Iterable[str]) -> list[Matchup]:
+    """Every ordered pairing of two distinct styles, for every topic.
+
+    Both orientations are scheduled (A-pro vs B-con *and* B-pro vs A-con) so
+    each style argues each side equally often and side bias washes out of the
+    ratings. A style never debates itself — that result would carry no
+    information about which style is stronger.
+    """
+    styles = list(dict.fromkeys(styles))
+    topics = list(dict.fromkeys(topics))
+    return [
+        Matchup(pro_style, con_style, topic)
+        for topic in topics
+        for pro_style, con_style in permutations(styles, 2)
+    ]
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    """The Elo expected score of a player rated ``rating`` against ``opponent``."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / 400.0))
+
+
+class EloLeaderboard:
+    """Elo ratings per style plus a pro-style x con-style win matrix.
+
+    Updated incrementally by :meth:`record` — one O(1) update per result, in
+    arrival order. ``to_dict`` is the JSON snapshot the API serves.
+    """
+
+    def __init__(
+        self,
+        styles: Iterable[str],
+        *,
+        k: float = TOURNAMENT_ELO_K,
+        initial: float = TOURNAMENT_ELO_INITIAL,
+    ):
+        self.k = k
+        self.styles = list(dict.fromkeys(styles))
+        self.ratings: dict[str, float] = {style: initial for style in self.styles}
+        self.record_counts: dict[str, dict[str, int]] = {
+            style: {"wins": 0, "losses": 0, "ties": 0} for style in self.styles
+        }
+        self.win_matrix: dict[str, dict[str, dict[str, int]]] = {
+            pro: {con: dict.fromkeys(OUTCOMES, 0) for con in self.styles if con != pro}
+            for pro in self.styles
+        }
+        self.games = 0
+
+    def record(self, pro_style: str, con_style: str, winner: str) -> None:
+        """Fold one result into the ratings, per-style records, and the matrix."""
+        if winner not in OUTCOMES:
+            raise ValueError(f"Unknown winner '{winner}'. Must be one of: {OUTCOMES}")
+        pro_score = {"PRO": 1.0, "CON": 0.0, "TIE": 0.5}[winner]
+        pro_rating, con_rating = self.ratings[pro_style], self.ratings[con_style]
+        pro_expected = expected_score(pro_rating, con_rating)
+        self.ratings[pro_style] = pro_rating + self.k * (pro_score - pro_expected)
+        self.ratings[con_style] = con_rating + self.k * (pro_expected - pro_score)
+
+        if winner == "TIE":
+            self.record_counts[pro_style]["ties"] += 1
+            self.record_counts[con_style]["ties"] += 1
+        else:
+            won, lost = (pro_style, con_style) if winner == "PRO" else (con_style, pro_style)
+            self.record_counts[won]["wins"] += 1
+            self.record_counts[lost]["losses"] += 1
+
+        self.win_matrix[pro_style][con_style][winner] += 1
+        self.games += 1
+
+    def standings(self) -> list[dict]:
+        """Styles ranked by rating, highest first, with their W/L/T record."""
+        ranked = sorted(self.styles, key=lambda style: self.ratings[style], reverse=True)
+        return [
+            {"style": style, "rating": round(self.ratings[style], 1), **self.record_counts[style]}
+            for style in ranked
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "standings": self.standings(),
+            "win_matrix": self.win_matrix,
+        }
+
+    @classmethod
+    def replay(cls, styles: Iterable[str], results: Iterable[dict], **kwargs) -> "EloLeaderboard":
+        """Rebuild a leaderboard from checkpointed results, in arrival order.
+
+        Elo is order-dependent, so replaying the stored sequence reproduces the
+        exact ratings the interrupted run had reached.
+        """
+        board = cls(styles, **kwargs)
+        for result in results:
+            board.record(result["pro_style"], result["con_style"], result["winner"])
+        return board
+
+
+async def run_tournament(
+    matchups: list[Matchup],
+    board: EloLeaderboard,
+    checkpoint: Callable[[dict, EloLeaderboard], Awaitable[None]],
+    *,
+    completed_keys: Optional[set[str]] = None,
+    concurrency: int = BATCH_CONCURRENCY,
+    vote_policy: VotePolicy = VotePolicy("skip"),
+    agent_factory: Callable[[str, str], tuple] = build_agents,
+) -> BatchSummary:
+    """Play every matchup not in ``completed_keys``, updating ``board`` live.
+
+    Each completed result is folded into ``board`` the moment it arrives, then
+    ``checkpoint(record, board)`` persists it before the next debate takes the
+    freed concurrency slot. The two happen together under one lock, one result
+    at a time, so results are persisted in the order they were rated (the
+    order :meth:`EloLeaderboard.replay` reads them back in) and no standings
+    snapshot can land after a newer one. Failed debates are checkpointed too
+    (so they are visible) but never rated. The audience vote is skipped by
+    default: the judge reads the transcript, and a scripted vote line would
+    bias it.
+    """
+    completed_keys = completed_keys or set()
+    pending = [m.to_batch_item() for m in matchups if m.key not in completed_keys]
+    rating = asyncio.Lock()
+
+    async def sink(record: dict) -> None:
+        async with rating:
+            if record["status"] == STATUS_COMPLETED and record.get("winner") in OUTCOMES:
+                board.record(record["pro_style"], record["con_style"], record["winner"])
+            await checkpoint(record, board)
+
+    summary = await run_items(
+        pending, sink,
+        concurrency=concurrency, vote_policy=vote_policy, agent_factory=agent_factory,
+    )
+    summary.total = len(matchups)
+    summary.skipped = len(matchups) - len(pending)
+    return summary
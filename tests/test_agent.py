@@ -1,4 +1,8 @@
 import logging
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
 
 import anthropic
 import pytest
@@ -120,6 +124,16 @@ class TestDebateAgentConstruct:
 # DebateAgent.respond
 # ---------------------------------------------------------------------------
 
+def test_a_backend_without_warm_up_fails_when_built():
+    from src.agents.common import AgentBase
+
+    class NoWarmUp(AgentBase):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWarmUp("PRO", "pro")
+
+
 class TestDebateAgentRespond:
     def test_returns_content_string(self):
         agent = _make_agent()
@@ -164,6 +178,27 @@ class TestDebateAgentAstreamRespond:
 
         assert result == ["Hello ", "world"]  # empty chunk filtered
 
+    async def test_usage_is_read_from_the_final_usage_chunk(self):
+        agent = _make_agent()
+        agent.chain = MagicMock()
+        usage = {
+            "input_tokens": 30,
+            "output_tokens": 2,
+            "input_token_details": {"cache_read": 1500, "cache_creation": 0},
+        }
+        agent.chain.astream.side_effect = lambda payload: _aiter([
+            MagicMock(content="Hello ", usage_metadata=None),
+            MagicMock(content="world", usage_metadata=None),
+            MagicMock(content="", usage_metadata=usage),
+        ])
+
+        result = [chunk async for chunk in agent.astream_respond("ctx", "instr")]
+
+        assert result == ["Hello ", "world"]
+        assert agent.usage == {
+            "cache_read": 1500, "cache_creation": 0, "uncached_input": 30, "output": 2,
+        }
+
     async def test_empty_chunks_skipped(self):
         agent = _make_agent()
         agent.chain = MagicMock()
@@ -465,7 +500,7 @@ class TestCacheUsageLogging:
         agent.chain = MagicMock()
         agent.chain.invoke.return_value = response
 
-        with caplog.at_level(logging.INFO, logger="src.agents.base_agent"):
+        with caplog.at_level(logging.INFO, logger="src.agents.common"):
             agent.respond("ctx", "instr")
 
         assert "Pro prompt cache" in caplog.text
@@ -479,7 +514,195 @@ class TestCacheUsageLogging:
         agent.chain = MagicMock()
         agent.chain.invoke.return_value = response
 
-        with caplog.at_level(logging.INFO, logger="src.agents.base_agent"):
+        with caplog.at_level(logging.INFO, logger="src.agents.common"):
             agent.respond("ctx", "instr")
 
         assert "prompt cache" not in caplog.text
+
+    def test_respond_accumulates_usage_totals(self):
+        agent = _make_agent(name="Pro")
+        response = MagicMock()
+        response.content = "argued"
+        response.usage_metadata = {
+            "input_tokens": 30,
+            "output_tokens": 200,
+            "input_token_details": {"cache_read": 1500, "cache_creation": 10},
+        }
+        agent.chain = MagicMock()
+        agent.chain.invoke.return_value = response
+
+        agent.respond("ctx", "instr")
+        agent.respond("ctx", "instr")
+
+        assert agent.usage == {
+            "cache_read": 3000, "cache_creation": 20, "uncached_input": 60, "output": 400,
+        }
+
+
+# ---------------------------------------------------------------------------
+# AnthropicAgent — the direct-SDK backend (AGENT_BACKEND=anthropic)
+# ---------------------------------------------------------------------------
+
+def _sdk_usage(**counts):
+    fields = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+    return SimpleNamespace(**{field: counts.get(field) for field in fields})
+
+
+class _SdkStream:
+    """Stand-in for the SDK's AsyncStream of raw events."""
+
+    def __init__(self, events, exc=None):
+        self.events, self.exc, self.closed = events, exc, False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+        if self.exc is not None:
+            raise self.exc
+
+
+def _sdk_events(*texts, usage_start, usage_delta):
+    return [
+        SimpleNamespace(type="message_start", message=SimpleNamespace(usage=usage_start)),
+        SimpleNamespace(type="content_block_start"),
+        *[SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=t))
+          for t in texts],
+        SimpleNamespace(type="content_block_stop"),
+        SimpleNamespace(type="message_delta", usage=usage_delta),
+        SimpleNamespace(type="message_stop"),
+    ]
+
+
+def _sdk_agent(name="Pro", role="arguing FOR the topic", system_prompt="You are the PRO debater."):
+    from src.agents.anthropic_agent import AnthropicAgent
+    agent = AnthropicAgent(name=name, role=role, system_prompt=system_prompt)
+    agent.client = MagicMock()
+    agent._sync_client = MagicMock()
+    return agent
+
+
+class TestAnthropicAgent:
+    async def test_streams_text_deltas_and_records_final_usage(self):
+        agent = _sdk_agent()
+        stream = _SdkStream(_sdk_events(
+            "Hello ", "world",
+            usage_start=_sdk_usage(input_tokens=30, output_tokens=1,
+                                   cache_read_input_tokens=1500, cache_creation_input_tokens=0),
+            usage_delta=_sdk_usage(output_tokens=200),
+        ))
+        agent.client.messages.create = AsyncMock(return_value=stream)
+
+        result = [chunk async for chunk in agent.astream_respond("ctx", "instr")]
+
+        assert result == ["Hello ", "world"]
+        assert stream.closed
+        # input_tokens counts the cached prefix too, as the LangChain backend reports it.
+        assert agent.usage == {
+            "cache_read": 1500, "cache_creation": 0, "uncached_input": 1530, "output": 200,
+        }
+
+    async def test_request_matches_the_langchain_prompt(self):
+        agent = _sdk_agent(system_prompt="PERSONA TEXT")
+        agent.client.messages.create = AsyncMock(return_value=_SdkStream(_sdk_events(
+            usage_start=_sdk_usage(), usage_delta=_sdk_usage())))
+        [chunk async for chunk in agent.astream_respond("[Pro]: AI helps people.\n", "Rebut.")]
+
+        kwargs = agent.client.messages.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["system"] == [{"type": "text", "text": "PERSONA TEXT",
+                                     "cache_control": {"type": "ephemeral"}}]
+        _, human = _real_prompt_agent(system_prompt="PERSONA TEXT").prompt.format_messages(
+            debate_context="[Pro]: AI helps people.\n", instruction="Rebut.",
+            name="Pro", role="arguing FOR the topic",
+        )
+        assert kwargs["messages"] == [{"role": "user", "content": human.content}]
+
+    async def test_api_error_mid_stream_becomes_agent_error(self):
+        agent = _sdk_agent()
+        error = anthropic.APIConnectionError(request=MagicMock())
+        agent.client.messages.create = AsyncMock(return_value=_SdkStream(
+            _sdk_events("partial", usage_start=_sdk_usage(), usage_delta=_sdk_usage())[:3],
+            exc=error,
+        ))
+        with pytest.raises(AgentError, match="Pro"):
+            [chunk async for chunk in agent.astream_respond("ctx", "instr")]
+
+    async def test_scores_come_from_a_forced_tool_call(self):
+        agent = _sdk_agent(name="Judge")
+        message = SimpleNamespace(content=[
+            SimpleNamespace(type="tool_use", input=sample_scores().model_dump()),
+        ])
+        agent.client.messages.create = AsyncMock(return_value=message)
+
+        scores = await agent.ascore_arguments("ctx", "score it")
+
+        assert scores == sample_scores()
+        kwargs = agent.client.messages.create.call_args.kwargs
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "DebateScores"}
+        assert kwargs["tools"][0]["input_schema"] == DebateScores.model_json_schema()
+        assert kwargs["max_tokens"] == config.SCORING_MAX_TOKENS
+
+    def test_truncated_score_becomes_agent_error(self):
+        agent = _sdk_agent(name="Judge")
+        agent.sync_client.messages.create.return_value = SimpleNamespace(content=[
+            SimpleNamespace(type="tool_use", input={"pro_arguments": []}),
+        ])
+        with pytest.raises(AgentError, match="malformed"):
+            agent.score_arguments("ctx", "score it")
+
+    def test_respond_joins_text_blocks(self):
+        agent = _sdk_agent()
+        agent.sync_client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="argued")],
+            usage=_sdk_usage(input_tokens=5, output_tokens=7),
+        )
+        assert agent.respond("ctx", "instr") == "argued"
+        assert agent.usage["output"] == 7
+
+    def test_backend_is_selected_by_config(self):
+        from src.agents.anthropic_agent import AnthropicAgent
+        from src.agents.base_agent import DebateAgent, build_agents
+        from src.agents.common import agent_class
+
+        assert agent_class("langchain") is DebateAgent
+        assert agent_class("anthropic") is AnthropicAgent
+        with pytest.raises(ValueError, match="AGENT_BACKEND"):
+            agent_class("openai")
+        with patch("src.agents.common.AGENT_BACKEND", "anthropic"):
+            agents = build_agents("passionate", "passionate")
+        assert all(isinstance(agent, AnthropicAgent) for agent in agents)
+
+
+# ---------------------------------------------------------------------------
+# Start-up: deferred imports and the warm-up hook
+# ---------------------------------------------------------------------------
+
+class TestStartup:
+    def test_entry_points_do_not_import_langchain(self):
+        # A fresh interpreter: this one has long since imported everything.
+        code = (
+            "import sys, api.main, main\n"
+            "heavy = [m for m in ('langchain_core', 'langchain_anthropic', 'anthropic', 'rich')"
+            " if m in sys.modules]\n"
+            "assert not heavy, heavy\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True,
+                       cwd=os.path.dirname(os.path.dirname(__file__)))
+
+    async def test_debate_agent_warm_up_sends_one_token_message(self):
+        agent = _make_agent()
+        agent.llm.ainvoke = AsyncMock()
+        await agent.awarm_up()
+        agent.llm.ainvoke.assert_awaited_once_with("Hi", max_tokens=1)
+
+    async def test_sdk_agent_warm_up_lists_models(self):
+        agent = _sdk_agent()
+        agent.client.models.list = AsyncMock()
+        await agent.awarm_up()
+        agent.client.models.list.assert_awaited_once_with(limit=1)
@@ -0,0 +1,269 @@
+"""Tests for the headless batch runner (``python main.py batch``) — input
+parsing, vote policies, the bounded-concurrency scheduler, and resuming from a
+partially written results file. The LLM is mocked (see conftest fixtures).
+"""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.batch_runner import (
+    BatchInputError,
+    BatchItem,
+    VotePolicy,
+    load_batch_items,
+    read_completed_ids,
+    run_batch,
+)
+
+
+def _write_lines(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture
+def agent_factory(make_mock_agent):
+    def factory(pro_style, con_style):
+        return make_mock_agent("PRO"), make_mock_agent("CON"), make_mock_agent("JUDGE")
+    return factory
+
+
+def _items(n):
+    return [BatchItem(f"id-{i}", f"Topic {i}", "passionate", "academic") for i in range(n)]
+
+
+# ---------------------------------------------------------------------------
+# Input parsing
+# ---------------------------------------------------------------------------
+
+class TestLoadBatchItems:
+    def test_defaults_styles_and_derives_stable_ids(self, tmp_path):
+        path = _write_lines(tmp_path / "t.jsonl", [
+            json.dumps({"topic": "A"}),
+            "",
+            json.dumps({"topic": "B", "pro_style": "academic", "id": "custom"}),
+        ])
+        first = load_batch_items(path)
+        assert [i.topic for i in first] == ["A", "B"]
+        assert first[0].pro_style == "passionate"
+        assert first[1].pro_style == "academic"
+        assert first[1].id == "custom"
+        # Ids are content-derived, so re-reading gives the same ones.
+        assert [i.id for i in load_batch_items(path)] == [i.id for i in first]
+
+    def test_duplicate_setups_get_distinct_ids(self, tmp_path):
+        path = _write_lines(tmp_path / "t.jsonl", [json.dumps({"topic": "A"})] * 3)
+        ids = [i.id for i in load_batch_items(path)]
+        assert len(set(ids)) == 3
+
+    def test_invalid_json_names_the_line(self, tmp_path):
+        path = _write_lines(tmp_path / "t.jsonl", [json.dumps({"topic": "A"}), "{nope"])
+        with pytest.raises(BatchInputError, match="line 2"):
+            load_batch_items(path)
+
+    def test_missing_topic_rejected(self, tmp_path):
+        path = _write_lines(tmp_path / "t.jsonl", [json.dumps({"pro_style": "academic"})])
+        with pytest.raises(BatchInputError):
+            load_batch_items(path)
+
+    @pytest.mark.parametrize("item", [
+        {"topic": 5},
+        {"topic": "A", "pro_style": ["academic"]},
+        # Given but empty or falsy: rejected, not replaced by the default.
+        {"topic": "A", "pro_style": ""},
+        {"topic": "A", "con_style": None},
+        {"topic": "A", "con_style": 0},
+        {"topic": "A", "pro_style": False},
+    ])
+    def test_non_string_fields_name_the_line(self, tmp_path, item):
+        path = _write_lines(tmp_path / "t.jsonl", [json.dumps({"topic": "A"}), json.dumps(item)])
+        with pytest.raises(BatchInputError, match="line 2"):
+            load_batch_items(path)
+
+    def test_unknown_style_rejected_up_front(self, tmp_path):
+        path = _write_lines(tmp_path / "t.jsonl", [json.dumps({"topic": "A", "con_style": "bogus"})])
+        with pytest.raises(BatchInputError, match="con_style"):
+            load_batch_items(path)
+
+
+@pytest.mark.parametrize("command", ["batch", "tournament"])
+@pytest.mark.parametrize("value", ["0", "-2", "many"])
+def test_concurrency_below_one_is_a_usage_error(command, value, capsys):
+    import main
+
+    with pytest.raises(SystemExit) as exited:
+        main.main([command, "topics", "--concurrency", value])
+    assert exited.value.code == 2
+    assert "--concurrency: must be a whole number of at least 1" in capsys.readouterr().err
+
+
+# ---------------------------------------------------------------------------
+# Vote policies
+# ---------------------------------------------------------------------------
+
+class TestVotePolicy:
+    def test_fixed_always_votes_side(self):
+        assert VotePolicy("fixed", side="CON").choose("x") == "CON"
+
+    def test_skip_returns_none(self):
+        assert VotePolicy("skip").choose("x") is None
+
+    def test_random_is_reproducible_per_id(self):
+        policy = VotePolicy("random", seed=7)
+        assert policy.choose("a") == policy.choose("a")
+        assert policy.choose("a") in ("PRO", "CON", "TIE")
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            VotePolicy("coin-flip")
+
+
+# ---------------------------------------------------------------------------
+# run_batch
+# ---------------------------------------------------------------------------
+
+class TestRunBatch:
+    async def test_writes_one_completed_record_per_item(self, tmp_path, agent_factory):
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            summary = await run_batch(_items(3), out, concurrency=2, agent_factory=agent_factory)
+
+        assert (summary.completed, summary.failed, summary.skipped) == (3, 0, 0)
+        records = _read_records(out)
+        assert sorted(r["id"] for r in records) == ["id-0", "id-1", "id-2"]
+        record = records[0]
+        assert record["status"] == "completed"
+        assert record["winner"] == "PRO"
+        assert record["argument_scores"]["pro_average"] == 8.0
+        assert record["transcript"][0]["content"] == "JUDGE-a JUDGE-b"
+        assert record["timings"]["total_seconds"] >= 0
+        # Intro, 2 openings, 2 rebuttals, 2 closings, verdict, then scoring.
+        assert len(record["timings"]["turns"]) == 9
+        assert set(record["usage"]) == {"cache_read", "cache_creation", "uncached_input", "output"}
+
+    async def test_vote_policy_applied(self, tmp_path, agent_factory):
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            await run_batch(_items(1), out, vote_policy=VotePolicy("fixed", side="CON"),
+                            agent_factory=agent_factory)
+        record = _read_records(out)[0]
+        assert record["vote"] == "CON"
+        audience = [e for e in record["transcript"] if e["speaker"] == "AUDIENCE"]
+        assert audience and "CON" in audience[0]["content"]
+
+    async def test_skip_policy_records_no_audience_line(self, tmp_path, agent_factory):
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            await run_batch(_items(1), out, vote_policy=VotePolicy("skip"),
+                            agent_factory=agent_factory)
+        record = _read_records(out)[0]
+        assert record["vote"] is None
+        assert all(e["speaker"] != "AUDIENCE" for e in record["transcript"])
+
+    async def test_uses_async_agent_methods_only(self, tmp_path, make_mock_agent):
+        agents = [make_mock_agent("PRO"), make_mock_agent("CON"), make_mock_agent("JUDGE")]
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            await run_batch(_items(1), out, agent_factory=lambda p, c: tuple(agents))
+        for agent in agents:
+            agent.respond.assert_not_called()
+            agent.score_arguments.assert_not_called()
+
+    async def test_concurrency_is_bounded(self, tmp_path, make_mock_agent):
+        in_flight = 0
+        peak = 0
+
+        def factory(pro_style, con_style):
+            pro, con, judge = make_mock_agent("PRO"), make_mock_agent("CON"), make_mock_agent("JUDGE")
+
+            async def slow_score(debate_context, instruction):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                from conftest import sample_scores
+                return sample_scores()
+
+            judge.ascore_arguments = slow_score
+            return pro, con, judge
+
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            await run_batch(_items(6), out, concurrency=2, agent_factory=factory)
+        assert peak == 2
+
+    async def test_agent_failure_is_recorded_and_batch_continues(self, tmp_path, make_mock_agent):
+        def factory(pro_style, con_style):
+            fail = pro_style == "aggressive"
+            return make_mock_agent("PRO", fail=fail), make_mock_agent("CON"), make_mock_agent("JUDGE")
+
+        items = [
+            BatchItem("bad", "T", "aggressive", "academic"),
+            BatchItem("good", "T", "passionate", "academic"),
+        ]
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            summary = await run_batch(items, out, agent_factory=factory)
+
+        assert (summary.completed, summary.failed) == (1, 1)
+        by_id = {r["id"]: r for r in _read_records(out)}
+        assert by_id["bad"]["status"] == "failed" and by_id["bad"]["error"]
+        assert by_id["good"]["status"] == "completed"
+
+    async def test_unexpected_error_fails_only_its_item(self, tmp_path, make_mock_agent):
+        def factory(pro_style, con_style):
+            judge = make_mock_agent("JUDGE")
+            if pro_style == "aggressive":
+                async def ascore_arguments(transcript, instruction):
+                    raise ValueError("unparseable score")
+                judge.ascore_arguments = ascore_arguments
+            return make_mock_agent("PRO"), make_mock_agent("CON"), judge
+
+        items = [
+            BatchItem("bad", "T", "aggressive", "academic"),
+            BatchItem("good", "T", "passionate", "academic"),
+        ]
+        out = str(tmp_path / "out.jsonl")
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            summary = await run_batch(items, out, agent_factory=factory)
+
+        assert (summary.completed, summary.failed) == (1, 1)
+        by_id = {r["id"]: r for r in _read_records(out)}
+        assert by_id["bad"]["status"] == "failed"
+        assert by_id["bad"]["error"] == "ValueError: unparseable score"
+        assert by_id["good"]["status"] == "completed"
+
+
+# ---------------------------------------------------------------------------
+# Resuming
+# ---------------------------------------------------------------------------
+
+class TestResume:
+    async def test_rerun_skips_completed_and_retries_failed(self, tmp_path, agent_factory):
+        out = tmp_path / "out.jsonl"
+        out.write_text(
+            json.dumps({"id": "id-0", "status": "completed"}) + "\n"
+            + json.dumps({"id": "id-1", "status": "failed", "error": "x"}) + "\n"
+            # A batch killed mid-write leaves a truncated final line.
+            + '{"id": "id-2", "status": "compl',
+            encoding="utf-8",
+        )
+        assert read_completed_ids(str(out)) == {"id-0"}
+
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            summary = await run_batch(_items(3), str(out), agent_factory=agent_factory)
+
+        assert summary.skipped == 1
+        assert summary.completed == 2
+        assert read_completed_ids(str(out)) == {"id-0", "id-1", "id-2"}
+
+    def test_missing_output_means_nothing_completed(self, tmp_path):
+        assert read_completed_ids(str(tmp_path / "absent.jsonl")) == set()
@@ -0,0 +1,182 @@
+"""Tests for live-debate fan-out — frames numbered and encoded once per
+codec for every socket, late joiners catching up mid-turn, reconnecting clients
+replayed from the ring buffer, and a stuck socket being dropped without
+affecting the rest. Sockets are stand-ins (see conftest)."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from api.services.broadcast import FRAMES_REPLAYED, BroadcastHub
+from api.services.socket_sender import SocketSender
+from api.services.wire import JSON, MSGPACK
+from conftest import FakeSocket
+
+
+def _frame(kind, **data):
+    return {"type": kind, "debate_id": "d", "data": data}
+
+
+@pytest.fixture
+def hub():
+    hub = BroadcastHub(SimpleNamespace(debate_id="d", transcript=[]), buffer_size=8)
+    yield hub
+    for sender in list(hub.subscribers):
+        sender.close()
+    hub.close()
+
+
+def _watch(hub, socket=None, *, driver=False, last_seq=None, **kwargs):
+    socket = socket or FakeSocket()
+    sender = SocketSender(socket, **kwargs)
+    sender.start()
+    hub.attach(sender, driver=driver, last_seq=last_seq)
+    return socket, sender
+
+
+async def _flush(hub):
+    await asyncio.gather(*(sender.flush() for sender in list(hub.subscribers)))
+
+
+def _start_turn(hub):
+    hub.session.transcript.append({"speaker": "MODERATOR", "content": "hi", "phase": "intro"})
+    hub.publish(_frame("debate_started", topic="T", resumed_from=0))
+    hub.publish(_frame("phase_change", phase="opening"))
+    hub.publish(_frame("message_start", speaker="PRO"))
+    hub.publish(_frame("message_chunk", speaker="PRO", chunk="a "))
+    hub.publish(_frame("message_chunk", speaker="PRO", chunk="b "))
+
+
+class TestBroadcastHub:
+    async def test_each_frame_is_encoded_once_per_codec(self, hub):
+        json_watchers = [_watch(hub) for _ in range(25)]
+        msgpack_watchers = [_watch(hub, codec=MSGPACK) for _ in range(25)]
+        frames = [_frame("message_chunk", speaker="PRO", chunk=str(i)) for i in range(10)]
+        with patch.object(JSON, "encode", wraps=JSON.encode) as json_encode, \
+             patch.object(MSGPACK, "encode", wraps=MSGPACK.encode) as msgpack_encode:
+            for frame in frames:
+                hub.publish(frame)
+            await _flush(hub)
+
+        assert json_encode.call_count == msgpack_encode.call_count == len(frames)
+        assert [f["seq"] for f in frames] == list(range(1, 11))
+        assert all(socket.sent == frames for socket, _ in json_watchers)
+        compact = [[4, f["seq"], 0, f["data"]["chunk"]] for f in frames]
+        assert all(socket.sent == compact for socket, _ in msgpack_watchers)
+
+    async def test_turn_frames_carry_the_turn_number(self, hub):
+        socket, _ = _watch(hub, codec=MSGPACK)
+        for speaker in ("PRO", "CON"):
+            hub.publish(_frame("message_start", speaker=speaker))
+            hub.publish(_frame("message_chunk", speaker=speaker, chunk="x"))
+            hub.publish(_frame("message_complete", speaker=speaker, content="x"))
+        await _flush(hub)
+        assert [f[2] for f in socket.sent] == [1, 1, 1, 2, 2, 2]
+        assert socket.sent[3] == [3, 4, 2, {"speaker": "CON"}]
+
+    async def test_late_joiner_catches_up_mid_turn(self, hub):
+        _start_turn(hub)
+        socket, _ = _watch(hub)
+        hub.publish(_frame("message_chunk", speaker="PRO", chunk="c"))
+        await _flush(hub)
+
+        started, phase, start, caught_up, live = socket.sent
+        assert started["type"] == "debate_started"
+        assert started["data"]["spectator"] is True
+        assert started["data"]["transcript"] == hub.session.transcript
+        assert started["data"]["resumed_from"] == 1
+        assert phase["data"] == {"phase": "opening"}
+        assert start["data"] == {"speaker": "PRO"}
+        assert caught_up["data"]["chunk"] == "a b "
+        # Catch-up frames carry the seq they bring the client up to.
+        assert {f["seq"] for f in (started, phase, start, caught_up)} == {5}
+        assert live["seq"] == 6 and live["data"]["chunk"] == "c"
+
+    async def test_joining_before_the_debate_starts_needs_no_catch_up(self, hub):
+        socket, _ = _watch(hub)
+        hub.publish(_frame("queue_position", position=2))
+        await _flush(hub)
+        assert [f["type"] for f in socket.sent] == ["queue_position"]
+
+    async def test_driver_only_frames_skip_spectators(self, hub):
+        spectator, _ = _watch(hub)
+        driver, _ = _watch(hub, driver=True)
+        hub.publish(_frame("vote_required", message="?"), driver_only=True)
+        await _flush(hub)
+        assert spectator.sent == []
+        assert [f["type"] for f in driver.sent] == ["vote_required"]
+
+    async def test_reconnect_replays_only_the_frames_after_last_seq(self, hub):
+        _start_turn(hub)
+        before = FRAMES_REPLAYED.value
+        socket, _ = _watch(hub, driver=True, last_seq=3)
+        hub.publish(_frame("message_complete", speaker="PRO", content="a b "))
+        await _flush(hub)
+
+        assert [f["seq"] for f in socket.sent] == [4, 5, 6]
+        assert [f["data"].get("chunk") for f in socket.sent[:2]] == ["a ", "b "]
+        assert FRAMES_REPLAYED.value == before + 2
+
+    async def test_reconnect_that_saw_everything_gets_only_live_frames(self, hub):
+        _start_turn(hub)
+        socket, _ = _watch(hub, last_seq=hub.seq)
+        hub.publish(_frame("message_chunk", speaker="PRO", chunk="c"))
+        await _flush(hub)
+        assert [f["seq"] for f in socket.sent] == [6]
+
+    async def test_gap_older_than_the_ring_falls_back_to_catch_up(self, hub):
+        _start_turn(hub)
+        for i in range(10):
+            hub.publish(_frame("message_chunk", speaker="PRO", chunk=f"{i} "))
+        socket, _ = _watch(hub, last_seq=2)
+        await _flush(hub)
+
+        assert socket.sent[0]["type"] == "debate_started"
+        assert socket.sent[-1]["data"]["chunk"] == "a b " + "".join(f"{i} " for i in range(10))
+        assert all(f["seq"] == hub.seq for f in socket.sent)
+
+    async def test_unknown_last_seq_falls_back_to_catch_up(self, hub):
+        _start_turn(hub)
+        socket, _ = _watch(hub, last_seq=99)
+        await _flush(hub)
+        assert socket.sent[0]["type"] == "debate_started"
+
+    async def test_driver_reattaching_during_the_vote_is_prompted_again(self, hub):
+        _start_turn(hub)
+        hub.publish(_frame("vote_required", message="?"), driver_only=True)
+        # Replayed: the prompt is in the gap, and isn't sent twice.
+        replayed, _ = _watch(hub, driver=True, last_seq=5)
+        await _flush(hub)
+        assert [f["type"] for f in replayed.sent] == ["vote_required"]
+
+        hub.detach(hub.driver)
+        # Nothing to replay: the open prompt is re-sent.
+        resumed, _ = _watch(hub, driver=True, last_seq=hub.seq)
+        spectator, _ = _watch(hub, last_seq=5)
+        await _flush(hub)
+        assert [f["type"] for f in resumed.sent] == ["vote_required"]
+        assert spectator.sent == []
+
+    async def test_stuck_socket_is_dropped_without_holding_up_others(self, hub):
+        _, stuck = _watch(hub, FakeSocket(hang=True), driver=True, send_timeout=0.05)
+        healthy, _ = _watch(hub)
+        hub.publish(_frame("phase_change", phase="opening"))
+        await asyncio.sleep(0.1)
+        hub.publish(_frame("phase_change", phase="rebuttal"))
+        await _flush(hub)
+
+        assert stuck not in hub.subscribers
+        assert hub.driver is None
+        assert len(healthy.sent) == 2
+        stuck.close()
+
+    async def test_close_marks_the_stream_done_and_frees_the_ring(self, hub):
+        _watch(hub)
+        hub.publish(_frame("phase_change", phase="opening"))
+        await _flush(hub)
+        assert hub.buffered_bytes > 0
+        assert not hub.done.is_set()
+        hub.close()
+        assert hub.done.is_set()
+        assert hub.buffered_bytes == 0
@@ -0,0 +1,152 @@
+"""Tests for compressed debate storage (api/compression.py): the column type,
+the batch migration, zstd dictionaries, and the ``compress-debates`` command.
+The DB is a throwaway SQLite per test (see ``conftest._test_db``)."""
+import json
+import random
+import zlib
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from api import compression, db
+from api.services import debate_repository
+
+_WORDS = ("the carbon tax would cut emissions faster than any subsidy my opponent "
+          "ignores the evidence from every market that tried it").split()
+
+
+def _save(debate_id, seed=0, turns=3):
+    rng = random.Random(seed)
+    debate_repository.save_completed_debate(
+        debate_id=debate_id, topic="Carbon tax?", pro_style="passionate", con_style="academic",
+        transcript=[{"speaker": "PRO" if turn % 2 == 0 else "CON", "phase": "opening",
+                     "content": " ".join(rng.choices(_WORDS, k=60))} for turn in range(turns)],
+        argument_scores={"winner": "PRO", "pro_arguments": [], "con_arguments": []},
+        winner="PRO", created_at=datetime(2025, 1, 1),
+    )
+
+
+def _stored(debate_id):
+    with db.engine.connect() as connection:
+        return connection.execute(
+            text("SELECT transcript, argument_scores FROM debates WHERE id = :id"), {"id": debate_id}
+        ).one()
+
+
+def _get(debate_id):
+    with db.SessionLocal() as session:
+        row = debate_repository.get_debate(session, debate_id)
+        return row.transcript, row.argument_scores
+
+
+def _legacy(debate_id, transcript):
+    """A row as saved when the columns were plain JSON text."""
+    with db.engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO debates (id, topic, pro_style, con_style, winner, message_count,"
+            " transcript, argument_scores, created_at, completed_at) VALUES (:id, 'T',"
+            " 'passionate', 'academic', 'CON', :n, :transcript, 'null',"
+            " '2025-01-01 00:00:00', '2025-01-01 00:00:00')"
+        ), {"id": debate_id, "n": len(transcript), "transcript": json.dumps(transcript)})
+
+
+class TestCodec:
+    @pytest.mark.parametrize("codec", ["zlib", "none"])
+    def test_round_trips(self, codec):
+        value = [{"speaker": "PRO", "content": "Ünïcode — and \"quotes\"", "phase": "opening"}]
+        assert compression.decode(compression.encode(value, codec)) == value
+
+    def test_reads_json_text_and_null(self):
+        assert compression.decode('[{"a": 1}]') == [{"a": 1}]
+        assert compression.decode(None) is None
+        assert compression.encode(None) is None
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError, match="DEBATE_COMPRESSION"):
+            compression.check_codec("lz4")
+        with pytest.raises(ValueError):
+            compression.encode([], "lz4")
+
+
+class TestStorage:
+    def test_saved_debates_are_stored_compressed(self):
+        _save("z")
+        transcript = _stored("z").transcript
+        assert isinstance(transcript, bytes)
+        assert json.loads(zlib.decompress(transcript))[0]["speaker"] == "PRO"
+        assert len(transcript) < len(compression.dumps(_get("z")[0]))
+        assert _get("z")[1]["winner"] == "PRO"
+
+    def test_legacy_rows_read_and_are_rewritten_in_batches(self):
+        _legacy("old-1", [{"speaker": "PRO", "content": "Hi", "phase": "opening"}])
+        _legacy("old-2", [])
+        _save("new")
+        assert _get("old-1") == ([{"speaker": "PRO", "content": "Hi", "phase": "opening"}], None)
+
+        assert debate_repository.recompress_debates(batch_size=1) == 2
+        assert debate_repository.recompress_debates() == 0
+        assert compression.is_current(_stored("old-1").transcript)
+        assert _stored("old-1").argument_scores is None
+        assert _get("old-2") == ([], None)
+
+    def test_changing_the_codec_rewrites_older_rows(self, monkeypatch):
+        _save("a")
+        monkeypatch.setattr(compression, "DEBATE_COMPRESSION", "none")
+        _save("b")
+        assert _stored("b").transcript.startswith(b"[")
+        assert _get("a")[1]["winner"] == "PRO"  # the zlib row still reads
+
+        assert debate_repository.recompress_debates() == 1
+        assert _stored("a").transcript.startswith(b"[")
+
+    def test_init_db_rejects_an_unknown_codec(self, monkeypatch):
+        monkeypatch.setattr(compression, "DEBATE_COMPRESSION", "brotli")
+        with pytest.raises(ValueError, match="brotli"):
+            db.init_db()
+
+
+class TestZstdDictionary:
+    @pytest.fixture(autouse=True)
+    def _zstd(self, monkeypatch):
+        pytest.importorskip("zstandard")
+        monkeypatch.setattr(compression, "DEBATE_COMPRESSION", "zstd")
+
+    def test_trained_dictionary_is_used_and_kept_for_older_rows(self):
+        for i in range(40):
+            _save(f"d{i:02d}", seed=i)
+        first = debate_repository.train_compression_dictionary(samples=40, size=4096)
+        assert debate_repository.recompress_debates() == 40
+        framed = compression.zstandard.get_frame_parameters(_stored("d00").transcript)
+        assert framed.dict_id == first
+
+        second = debate_repository.train_compression_dictionary(samples=40, size=2048)
+        assert second != first
+        assert not compression.is_current(_stored("d00").transcript)
+        # Another worker, with nothing cached, loads them from the database.
+        compression._dictionaries = None
+        assert _get("d07")[0][0]["speaker"] == "PRO"
+        _save("later")
+        assert compression.zstandard.get_frame_parameters(_stored("later").transcript).dict_id == second
+
+    def test_too_few_samples_is_a_value_error(self):
+        _save("only")
+        with pytest.raises(ValueError, match="cannot train"):
+            debate_repository.train_compression_dictionary(samples=10, size=4096)
+
+
+class TestCommand:
+    def test_rewrites_and_vacuums(self, capsys):
+        import main
+
+        _legacy("old", [{"speaker": "CON", "content": "Hello", "phase": "opening"}])
+        main.main(["compress-debates", "--vacuum"])
+        assert "Rewrote 1 debate(s) as zlib." in capsys.readouterr().out
+        assert compression.is_current(_stored("old").transcript)
+
+    def test_dictionary_needs_zstd(self, capsys):
+        import main
+
+        with pytest.raises(SystemExit):
+            main.main(["compress-debates", "--train-dictionary"])
+        assert "DEBATE_COMPRESSION=zstd" in capsys.readouterr().out
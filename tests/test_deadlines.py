@@ -0,0 +1,144 @@
+"""Tests for the deadline scheduler — ordering, replacement, cancellation,
+heap compaction, the inspectable snapshot, and the self-arming loop timer.
+Sync tests drive expiry by hand with a fake clock (see conftest)."""
+import asyncio
+import logging
+
+import pytest
+
+from api.services.deadlines import DeadlineKind, DeadlineScheduler
+
+
+@pytest.fixture
+def scheduler(fake_clock):
+    return DeadlineScheduler(clock=fake_clock)
+
+
+def _record_fired(scheduler, kind=DeadlineKind.ORPHAN):
+    fired = []
+    scheduler.on(kind, fired.append)
+    return fired
+
+
+class TestScheduling:
+    def test_fires_due_deadlines_in_order(self, scheduler, fake_clock):
+        fired = _record_fired(scheduler)
+        scheduler.schedule("late", DeadlineKind.ORPHAN, 30)
+        scheduler.schedule("early", DeadlineKind.ORPHAN, 10)
+        scheduler.schedule("never", DeadlineKind.ORPHAN, 100)
+
+        fake_clock.advance(5)
+        assert scheduler.expire_due() == 0
+        fake_clock.advance(30)
+        assert scheduler.expire_due() == 2
+        assert fired == ["early", "late"]
+        assert len(scheduler) == 1
+
+    def test_rescheduling_replaces_the_pending_deadline(self, scheduler, fake_clock):
+        fired = _record_fired(scheduler)
+        scheduler.schedule("a", DeadlineKind.ORPHAN, 10)
+        scheduler.schedule("a", DeadlineKind.ORPHAN, 50)
+        fake_clock.advance(20)
+        assert scheduler.expire_due() == 0
+        fake_clock.advance(40)
+        assert scheduler.expire_due() == 1
+        assert fired == ["a"]
+
+    def test_kinds_of_one_key_are_independent(self, scheduler, fake_clock):
+        orphans = _record_fired(scheduler, DeadlineKind.ORPHAN)
+        votes = _record_fired(scheduler, DeadlineKind.VOTE)
+        scheduler.schedule("a", DeadlineKind.ORPHAN, 10)
+        scheduler.schedule("a", DeadlineKind.VOTE, 10)
+        scheduler.cancel("a", DeadlineKind.ORPHAN)
+        fake_clock.advance(10)
+        scheduler.expire_due()
+        assert (orphans, votes) == ([], ["a"])
+
+    def test_cancel_all_kinds_of_a_key(self, scheduler, fake_clock):
+        scheduler.schedule("a", DeadlineKind.IDLE, 10)
+        scheduler.schedule("a", DeadlineKind.MAX_DURATION, 10)
+        scheduler.cancel("a")
+        scheduler.cancel("a")  # idempotent
+        assert len(scheduler) == 0
+        assert scheduler.pending("a", DeadlineKind.IDLE) is None
+
+    def test_failing_handler_is_logged_not_raised(self, scheduler, fake_clock, caplog):
+        def boom(key):
+            raise RuntimeError("handler bug")
+
+        scheduler.on(DeadlineKind.ORPHAN, boom)
+        fired = _record_fired(scheduler, DeadlineKind.VOTE)
+        scheduler.schedule("a", DeadlineKind.ORPHAN, 1)
+        scheduler.schedule("b", DeadlineKind.VOTE, 2)
+        fake_clock.advance(5)
+        with caplog.at_level(logging.ERROR):
+            assert scheduler.expire_due() == 2
+        assert fired == ["b"]
+        assert "Deadline handler failed" in caplog.text
+
+
+class TestHeapUpkeep:
+    def test_cancelled_entries_are_compacted(self, scheduler):
+        for i in range(1000):
+            scheduler.schedule(f"s{i}", DeadlineKind.ORPHAN, 60)
+        for i in range(990):
+            scheduler.cancel(f"s{i}")
+        assert len(scheduler) == 10
+        # Dead entries never outnumber live ones by more than 2:1 (plus slack).
+        assert len(scheduler._heap) <= max(64, 2 * len(scheduler))
+
+    def test_rescheduling_one_key_repeatedly_stays_bounded(self, scheduler):
+        for _ in range(10_000):
+            scheduler.schedule("a", DeadlineKind.IDLE, 60)
+        assert len(scheduler) == 1
+        assert len(scheduler._heap) <= 65
+
+
+class TestSnapshot:
+    def test_reports_counts_and_soonest_deadlines(self, scheduler, fake_clock):
+        scheduler.schedule("a", DeadlineKind.ORPHAN, 30)
+        scheduler.schedule("b", DeadlineKind.VOTE, 10)
+        scheduler.schedule("c", DeadlineKind.IDLE, 20)
+        snap = scheduler.snapshot(limit=2)
+        assert snap["pending"] == 3
+        assert snap["by_kind"]["orphan"] == 1 and snap["by_kind"]["vote"] == 1
+        assert snap["next_due_in_seconds"] == 10
+        assert [(d["key"], d["kind"]) for d in snap["deadlines"]] == [("b", "vote"), ("c", "idle")]
+
+    def test_empty_scheduler(self, scheduler):
+        snap = scheduler.snapshot()
+        assert snap["pending"] == 0 and snap["next_due_in_seconds"] is None
+
+
+class TestLoopTimer:
+    async def test_deadline_fires_without_being_polled(self):
+        scheduler = DeadlineScheduler()
+        fired = asyncio.Event()
+        scheduler.on(DeadlineKind.VOTE, lambda key: fired.set())
+        scheduler.schedule("a", DeadlineKind.VOTE, 0.02)
+        await asyncio.wait_for(fired.wait(), timeout=1)
+        assert len(scheduler) == 0
+
+    async def test_earlier_deadline_rearms_the_timer(self):
+        scheduler = DeadlineScheduler()
+        order = []
+        scheduler.on(DeadlineKind.VOTE, order.append)
+        scheduler.schedule("slow", DeadlineKind.VOTE, 0.2)
+        scheduler.schedule("fast", DeadlineKind.VOTE, 0.01)
+        await asyncio.sleep(0.05)
+        assert order == ["fast"]
+        scheduler.stop()
+
+    async def test_handler_rescheduling_itself_recurs(self):
+        scheduler = DeadlineScheduler()
+        ticks = []
+
+        def tick(key):
+            ticks.append(key)
+            scheduler.schedule(key, DeadlineKind.STORE_SWEEP, 0.01)
+
+        scheduler.on(DeadlineKind.STORE_SWEEP, tick)
+        scheduler.schedule("*", DeadlineKind.STORE_SWEEP, 0.01)
+        await asyncio.sleep(0.1)
+        scheduler.stop()
+        assert len(ticks) >= 3
@@ -155,6 +155,37 @@ class TestEngineSequence:
         assert labels == ["Rebuttal 1", "Rebuttal 1", "Rebuttal 2", "Rebuttal 2"]
 
 
+class TestEngineResume:
+    def test_resume_at_zero_is_the_full_debate(self):
+        assert list(build_engine().events(resume_at=0)) == list(build_engine().events())
+
+    def test_resume_skips_completed_steps_and_reannounces_phase(self):
+        # 3 steps done: intro, PRO opening, CON opening. Next is rebuttal 1 PRO.
+        events = list(build_engine(rounds=2).events(resume_at=3))
+        assert events[0] == PhaseChange(DebatePhase.REBUTTAL)
+        assert isinstance(events[1], Turn)
+        assert (events[1].speaker, events[1].label) == (Speaker.PRO, "Rebuttal 1")
+
+    def test_resume_mid_phase_reannounces_that_phase(self):
+        # 4 steps done: the next turn is CON's first rebuttal, still REBUTTAL.
+        events = list(build_engine(rounds=2).events(resume_at=4))
+        assert events[0] == PhaseChange(DebatePhase.REBUTTAL)
+        assert (events[1].speaker, events[1].label) == (Speaker.CON, "Rebuttal 1")
+
+    def test_resume_never_reissues_completed_steps(self):
+        full = [e for e in build_engine().events() if isinstance(e, (Turn, Vote))]
+        for done in range(len(full) + 1):
+            rest = [e for e in build_engine().events(resume_at=done)
+                    if isinstance(e, (Turn, Vote))]
+            assert rest == full[done:]
+
+    def test_resume_after_vote_continues_with_closings(self):
+        # intro + 2 openings + 4 rebuttals + vote = 8 steps.
+        events = list(build_engine(rounds=2).events(resume_at=8))
+        assert events[0] == PhaseChange(DebatePhase.CLOSING_PRO)
+        assert events[1].speaker == Speaker.PRO
+
+
 class TestEngineWordLimits:
     def test_no_limits_leaves_instructions_bare(self):
         turns = [e for e in build_engine(word_limits=None).events() if isinstance(e, Turn)]
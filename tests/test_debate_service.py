@@ -5,16 +5,18 @@ These are async tests; pytest-asyncio runs them on an event loop (asyncio_mode
 is set to ``auto`` in pytest.ini).
 """
 import asyncio
-from contextlib import suppress
-from datetime import timedelta
+import hashlib
+import json
 from unittest.mock import patch
 
 import pytest
 
-from api import db
+from api.services.deadlines import DeadlineKind, DeadlineScheduler
 from api.services.debate_service import DebateService, SessionLimitExceeded
 from api.schemas.debate import WSMessageType, DebatePhase
 from config import SESSION_TTL_SECONDS
+from messages import DEBATE_TIMED_OUT
+from src.scoring import DebateScores
 
 
 # ---------------------------------------------------------------------------
@@ -86,13 +88,13 @@ class TestDeferredAgents:
 
 
 # ---------------------------------------------------------------------------
-# MAX_LIVE_SESSIONS cap
+# ADMISSION_QUEUE_SIZE bound on not-yet-generating sessions
 # ---------------------------------------------------------------------------
 
 class TestSessionCap:
     def test_create_beyond_cap_raises(self, mock_build_agents):
         svc = DebateService()
-        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 2):
+        with patch("api.services.debate_service.ADMISSION_QUEUE_SIZE", 2):
             svc.create_debate("T", "passionate", "passionate")
             svc.create_debate("T", "passionate", "passionate")
             with pytest.raises(SessionLimitExceeded):
@@ -100,16 +102,15 @@ class TestSessionCap:
         # The rejected session was not stored.
         assert len(svc.sessions) == 2
 
-    def test_cap_sweeps_expired_orphans_before_rejecting(self, mock_build_agents):
+    def test_cap_expires_overdue_orphans_before_rejecting(self, mock_build_agents, fake_clock):
         # A backlog of expired orphans must not wrongly reject a fresh request:
-        # create_debate sweeps first, freeing room under the cap.
-        svc = DebateService()
-        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 2):
+        # a full queue runs overdue deadlines first, freeing room under the cap.
+        svc = DebateService(deadlines=DeadlineScheduler(clock=fake_clock))
+        with patch("api.services.debate_service.ADMISSION_QUEUE_SIZE", 2):
             a = svc.create_debate("T", "passionate", "passionate")
             b = svc.create_debate("T", "passionate", "passionate")
-            # Age both existing sessions past the TTL.
-            old = db.utcnow() - timedelta(seconds=SESSION_TTL_SECONDS + 1)
-            a.created_at = b.created_at = old
+            # Both orphan deadlines pass (no loop timer in a sync test).
+            fake_clock.advance(SESSION_TTL_SECONDS + 1)
             # At the cap, but the two are reclaimable — this should succeed.
             fresh = svc.create_debate("T", "passionate", "passionate")
         assert fresh.debate_id in svc.sessions
@@ -119,60 +120,60 @@ class TestSessionCap:
 
 
 # ---------------------------------------------------------------------------
-# TTL sweeper
+# Session deadlines (orphan TTL; idle / max-duration / vote further below)
 # ---------------------------------------------------------------------------
 
-class TestSessionSweeper:
-    def test_orphans_swept_past_ttl(self, mock_build_agents):
+class TestOrphanDeadline:
+    def test_orphans_expire_past_ttl(self, mock_build_agents, fake_clock):
         # Creating N debates without a socket must not retain them past the TTL.
-        svc = DebateService()
-        sessions = [
-            svc.create_debate("T", "passionate", "passionate") for _ in range(5)
-        ]
-        old = db.utcnow() - timedelta(seconds=SESSION_TTL_SECONDS + 1)
-        for s in sessions:
-            s.created_at = old
+        svc = DebateService(deadlines=DeadlineScheduler(clock=fake_clock))
+        for _ in range(5):
+            svc.create_debate("T", "passionate", "passionate")
+        fake_clock.advance(SESSION_TTL_SECONDS + 1)
 
-        evicted = svc.sweep_expired_sessions()
-        assert evicted == 5
+        assert svc.sweep_expired_sessions() == 5
         assert svc.sessions == {}
+        assert svc.store.count() == 0
 
-    def test_fresh_orphans_not_swept(self, mock_build_agents):
-        svc = DebateService()
+    def test_fresh_orphans_kept(self, mock_build_agents, fake_clock):
+        svc = DebateService(deadlines=DeadlineScheduler(clock=fake_clock))
         for _ in range(3):
             svc.create_debate("T", "passionate", "passionate")
+        fake_clock.advance(SESSION_TTL_SECONDS - 1)
         assert svc.sweep_expired_sessions() == 0
         assert len(svc.sessions) == 3
 
-    def test_started_session_never_swept_even_when_old(self, mock_build_agents):
-        # A live debate (started by a socket) outlives the TTL — it must NOT be
-        # reclaimed out from under run_debate; its cleanup is run_debate's finally.
+    async def test_started_session_has_no_orphan_deadline(self, mock_build_agents):
+        # A live debate outlives the TTL — it must NOT be reclaimed out from
+        # under run_debate; its cleanup is run_debate's finally.
         svc = DebateService()
         session = svc.create_debate("T", "passionate", "passionate")
-        session.started = True
-        session.created_at = db.utcnow() - timedelta(seconds=SESSION_TTL_SECONDS + 1)
-
-        assert svc.sweep_expired_sessions() == 0
-        assert session.debate_id in svc.sessions
-
-    async def test_sweeper_loop_reclaims_orphans_over_time(self, mock_build_agents):
+        run = svc.run_debate(session)
+        await run.__anext__()
+        assert svc.deadlines.pending(session.debate_id, DeadlineKind.ORPHAN) is None
+        assert svc.deadlines.pending(session.debate_id, DeadlineKind.IDLE) is not None
+        await run.aclose()
+        # Cleanup drops every deadline the session had.
+        assert len(svc.deadlines) == 0
+
+    async def test_orphan_expires_on_its_own_timer(self, mock_build_agents):
         svc = DebateService()
-        session = svc.create_debate("T", "passionate", "passionate")
-        session.created_at = db.utcnow() - timedelta(seconds=SESSION_TTL_SECONDS + 1)
-
-        task = asyncio.create_task(svc.run_session_sweeper(interval=0.01))
-        try:
-            # Give the loop a few ticks to run at least one sweep.
-            for _ in range(50):
-                await asyncio.sleep(0.01)
-                if not svc.sessions:
-                    break
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
+        with patch("api.services.debate_service.SESSION_TTL_SECONDS", 0.02):
+            session = svc.create_debate("T", "passionate", "passionate")
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if not svc.sessions:
+                break
+        assert svc.get_session(session.debate_id) is None
 
-        assert svc.sessions == {}
+    def test_create_does_not_scan_when_the_queue_has_room(self, mock_build_agents):
+        svc = DebateService()
+        with patch.object(svc, "sweep_expired_sessions") as sweep, \
+             patch.object(svc.store, "sweep") as store_sweep:
+            for _ in range(20):
+                svc.create_debate("T", "passionate", "passionate")
+        sweep.assert_not_called()
+        store_sweep.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -233,8 +234,7 @@ class TestRunDebateHappyPath:
             events = await _drain(svc, session, vote="CON")
 
         complete = next(e for e in events if e["type"] == WSMessageType.DEBATE_COMPLETE)
-        transcript = complete["data"]["transcript"]
-        audience = [e for e in transcript if e["speaker"] == "AUDIENCE"]
+        audience = [e for e in session.transcript if e["speaker"] == "AUDIENCE"]
         assert audience and "CON" in audience[0]["content"]
 
         # argument_scores is now a serialized DebateScores (dict), with computed averages.
@@ -244,6 +244,30 @@ class TestRunDebateHappyPath:
         assert scores["con_average"] == 6.0
         assert [a["score"] for a in scores["pro_arguments"]] == [8]
 
+    async def test_debate_complete_carries_a_digest_not_the_transcript(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = svc.create_debate("T", "passionate", "passionate")
+            with patch.object(DebateScores, "model_dump", autospec=True,
+                              side_effect=DebateScores.model_dump) as dump:
+                events = await _drain(svc, session)
+
+        complete = next(e for e in events if e["type"] == WSMessageType.DEBATE_COMPLETE)
+        assert "transcript" not in complete["data"]
+        digest = complete["data"]["transcript_digest"]
+        # The client can rebuild the digest from what it was streamed: every
+        # completed turn plus the audience-vote line.
+        streamed = [[e["data"]["speaker"], e["data"]["content"]] for e in events
+                    if e["type"] == WSMessageType.MESSAGE_COMPLETE]
+        vote = next(e for e in events if e["type"] == WSMessageType.VOTE_RECEIVED)
+        streamed.insert(next(i for i, entry in enumerate(session.transcript)
+                             if entry["speaker"] == "AUDIENCE"), ["AUDIENCE", vote["data"]["message"]])
+        canonical = json.dumps(streamed, separators=(",", ":"), ensure_ascii=False)
+        assert digest == {"count": len(streamed),
+                          "sha256": hashlib.sha256(canonical.encode()).hexdigest()}
+        # The scoreboard is serialized once and shared by every consumer.
+        assert dump.call_count == 1
+
     async def test_argument_scores_event_emitted_during_scoring(self, mock_build_agents):
         svc = DebateService()
         with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
@@ -326,3 +350,238 @@ class TestRunDebateErrorPath:
             session = svc.create_debate("T", "passionate", "passionate")
             [e async for e in svc.run_debate(session)]
         assert svc.get_session(session.debate_id) is None
+
+
+# ---------------------------------------------------------------------------
+# Admission queue
+# ---------------------------------------------------------------------------
+
+class TestAdmissionQueue:
+    async def test_second_debate_queues_until_the_first_finishes(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 1), \
+             patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            first = svc.create_debate("T", "passionate", "passionate")
+            second = svc.create_debate("T", "passionate", "passionate")
+            run = svc.run_debate(first)
+            assert (await run.__anext__())["type"] == WSMessageType.DEBATE_STARTED
+
+            waiting = asyncio.create_task(_drain(svc, second))
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            assert svc.store.queue_status() == (1, 1)
+
+            async for event in run:
+                if event["type"] == WSMessageType.VOTE_REQUIRED:
+                    svc.submit_vote(first.debate_id, "PRO")
+            events = await asyncio.wait_for(waiting, timeout=5)
+
+        assert events[0]["type"] == WSMessageType.QUEUE_POSITION
+        assert events[0]["data"]["position"] == 1
+        assert events[0]["data"]["estimated_wait_seconds"] > 0
+        assert events[1]["type"] == WSMessageType.DEBATE_STARTED
+        assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
+
+    async def test_admitted_debate_streams_no_queue_events(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = svc.create_debate("T", "passionate", "passionate")
+            events = await _drain(svc, session)
+        assert WSMessageType.QUEUE_POSITION not in [e["type"] for e in events]
+
+    async def test_disconnect_while_queued_releases_the_session(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 1):
+            first = svc.create_debate("T", "passionate", "passionate")
+            second = svc.create_debate("T", "passionate", "passionate")
+            run = svc.run_debate(first)
+            await run.__anext__()
+
+            queued = svc.run_debate(second)
+            assert (await queued.__anext__())["type"] == WSMessageType.QUEUE_POSITION
+            await queued.aclose()
+            assert svc.get_session(second.debate_id) is None
+            assert svc.store.queue_status() == (1, 0)
+            await run.aclose()
+
+    async def test_queue_estimate_reflects_waiters(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 1):
+            first = svc.create_debate("T", "passionate", "passionate")
+            assert svc.queue_estimate() == (0, 0.0)
+            run = svc.run_debate(first)
+            await run.__anext__()
+            svc.create_debate("T", "passionate", "passionate")
+            position, wait = svc.queue_estimate()
+            await run.aclose()
+        assert position == 1 and wait > 0
+
+    async def test_admission_wait_is_observed(self, mock_build_agents):
+        from api.services.debate_service import ADMISSION_WAIT
+
+        svc = DebateService()
+        before = ADMISSION_WAIT.count
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            await _drain(svc, svc.create_debate("T", "passionate", "passionate"))
+        assert ADMISSION_WAIT.count == before + 1
+
+
+# ---------------------------------------------------------------------------
+# Memory-budgeted admission
+# ---------------------------------------------------------------------------
+
+class TestMemoryBudget:
+    async def test_footprint_tracks_transcript_agents_and_buffered_turn(self, mock_build_agents):
+        svc = DebateService()
+        session = svc.create_debate("T", "passionate", "passionate")
+        empty = session.footprint()
+        assert (empty["transcript_bytes"], empty["agent_bytes"]) == (0, 0)
+
+        run = svc.run_debate(session)
+        await run.__anext__()  # DEBATE_STARTED
+        seen_buffered = 0
+        async for event in run:
+            seen_buffered = max(seen_buffered, session.buffered_bytes)
+            if event["type"] == WSMessageType.MESSAGE_COMPLETE:
+                break
+        footprint = session.footprint()
+        await run.aclose()
+
+        assert seen_buffered > 0
+        assert footprint["buffered_bytes"] == 0
+        assert footprint["agent_bytes"] > 0
+        assert footprint["transcript_bytes"] > len(session.transcript[0]["content"])
+        assert footprint["total_bytes"] > sum(
+            footprint[k] for k in ("transcript_bytes", "agent_bytes", "buffered_bytes")
+        )
+
+    async def test_debate_waits_until_the_budget_has_room(self, mock_build_agents):
+        svc = DebateService()
+        budget = int(svc.projected_footprint() * 1.5)
+        with patch("api.services.debate_service.SESSION_MEMORY_BUDGET_BYTES", budget), \
+             patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            first = svc.create_debate("T", "passionate", "passionate")
+            second = svc.create_debate("T", "passionate", "passionate")
+            assert svc.capacity() == 1
+            run = svc.run_debate(first)
+            await run.__anext__()
+
+            waiting = asyncio.create_task(_drain(svc, second))
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            assert svc.store.queue_status() == (1, 1)
+
+            async for event in run:
+                if event["type"] == WSMessageType.VOTE_REQUIRED:
+                    svc.submit_vote(first.debate_id, "PRO")
+            events = await asyncio.wait_for(waiting, timeout=5)
+
+        assert events[0]["type"] == WSMessageType.QUEUE_POSITION
+        assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
+
+    async def test_budget_below_one_debate_still_admits_one(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.SESSION_MEMORY_BUDGET_BYTES", 1), \
+             patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            events = await _drain(svc, svc.create_debate("T", "passionate", "passionate"))
+        assert events[0]["type"] == WSMessageType.DEBATE_STARTED
+        assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
+
+    async def test_admission_never_walks_the_sessions(self, mock_build_agents):
+        svc = DebateService()
+        svc.sessions = _NoScanDict()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            waiting = svc.create_debate("T", "passionate", "passionate")
+            events = await _drain(svc, svc.create_debate("T", "passionate", "passionate"))
+        assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
+        # The finished debate was taken off the total; the unstarted one is on it.
+        assert svc.memory_committed() == waiting.footprint()["total_bytes"]
+
+    async def test_snapshot_lists_largest_sessions_first(self, mock_build_agents):
+        svc = DebateService()
+        small = svc.create_debate("small", "passionate", "passionate")
+        big = svc.create_debate("big", "passionate", "passionate")
+        big.add_to_transcript("PRO", "x" * 10_000)
+
+        snap = svc.memory_snapshot(limit=1)
+        assert snap["sessions"] == 2
+        assert [s["debate_id"] for s in snap["largest"]] == [big.debate_id]
+        assert snap["in_use_bytes"] == sum(
+            s.footprint()["total_bytes"] for s in (small, big)
+        )
+
+
+class _NoScanDict(dict):
+    def values(self):
+        raise AssertionError("admission walked every session")
+
+    items = __iter__ = values
+
+
+# ---------------------------------------------------------------------------
+# Run deadlines: idle, max duration, vote
+# ---------------------------------------------------------------------------
+
+def _slow_agents(make_mock_agent, *, chunk_delay, chunks):
+    """build_agents stand-in whose PRO streams ``chunks`` chunks ``chunk_delay`` apart."""
+    def factory(pro_style, con_style):
+        pro = make_mock_agent("PRO")
+
+        async def astream_respond(debate_context, instruction):
+            for i in range(chunks):
+                await asyncio.sleep(chunk_delay)
+                yield f"c{i} "
+
+        pro.astream_respond = astream_respond
+        return pro, make_mock_agent("CON"), make_mock_agent("JUDGE")
+    return factory
+
+
+class TestRunDeadlines:
+    async def test_stalled_turn_is_ended_by_the_idle_deadline(self, make_mock_agent):
+        factory = _slow_agents(make_mock_agent, chunk_delay=30, chunks=1)
+        with patch("api.services.debate_service.build_agents", side_effect=factory), \
+             patch("api.services.debate_service.SESSION_IDLE_SECONDS", 0.05):
+            svc = DebateService()
+            session = svc.create_debate("T", "passionate", "passionate")
+            events = await asyncio.wait_for(_drain(svc, session), timeout=5)
+
+        assert events[-1]["type"] == WSMessageType.ERROR
+        assert events[-1]["data"]["message"] == DEBATE_TIMED_OUT
+        assert session.expired == DeadlineKind.IDLE
+        assert svc.get_session(session.debate_id) is None
+        assert len(svc.deadlines) == 0
+
+    async def test_streaming_chunks_keep_the_idle_deadline_away(self, make_mock_agent):
+        # Each chunk arrives well inside the idle bound, though the turn as a
+        # whole runs several bounds long.
+        factory = _slow_agents(make_mock_agent, chunk_delay=0.01, chunks=15)
+        with patch("api.services.debate_service.build_agents", side_effect=factory), \
+             patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1), \
+             patch("api.services.debate_service.SESSION_IDLE_SECONDS", 0.05):
+            svc = DebateService()
+            events = await _drain(svc, svc.create_debate("T", "passionate", "passionate"))
+        assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
+
+    async def test_max_duration_ends_a_debate_that_keeps_streaming(self, make_mock_agent):
+        factory = _slow_agents(make_mock_agent, chunk_delay=0.01, chunks=1000)
+        with patch("api.services.debate_service.build_agents", side_effect=factory), \
+             patch("api.services.debate_service.MAX_DEBATE_SECONDS", 0.1):
+            svc = DebateService()
+            session = svc.create_debate("T", "passionate", "passionate")
+            events = await asyncio.wait_for(_drain(svc, session), timeout=5)
+        assert events[-1]["data"]["message"] == DEBATE_TIMED_OUT
+        assert session.expired == DeadlineKind.MAX_DURATION
+
+    async def test_vote_deadline_records_a_tie_and_suspends_idle(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1), \
+             patch("api.services.debate_service.VOTE_TIMEOUT_SECONDS", 0.1), \
+             patch("api.services.debate_service.SESSION_IDLE_SECONDS", 0.02):
+            session = svc.create_debate("T", "passionate", "passionate")
+            # vote=None: nobody answers the prompt.
+            events = await asyncio.wait_for(_drain(svc, session, vote=None), timeout=5)
+
+        received = next(e for e in events if e["type"] == WSMessageType.VOTE_RECEIVED)
+        assert received["data"]["vote"] == "TIE"
+        assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
@@ -0,0 +1,131 @@
+"""Tests for the stored detail body of finished debates: serialized at save
+time, served with an ETag and Cache-Control (304 on a match), and kept in the
+in-process LRU (api/services/detail_cache.py). The DB is a throwaway SQLite
+per test (see ``conftest._test_db``)."""
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from api import db
+from api.services import debate_repository
+from api.services.detail_cache import CACHE_HITS, CACHE_MISSES, DetailCache
+
+
+def _save(debate_id, content="Opening"):
+    debate_repository.save_completed_debate(
+        debate_id=debate_id, topic="Ban cars?", pro_style="passionate", con_style="academic",
+        transcript=[{"speaker": "PRO", "content": content, "phase": "opening"}],
+        argument_scores={"winner": "PRO", "pro_arguments": [], "con_arguments": []},
+        winner="PRO", created_at=datetime(2025, 1, 1),
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    from api.main import app
+    return TestClient(app)
+
+
+class TestDetailCache:
+    def test_evicts_the_least_recently_read_by_size(self):
+        cache = DetailCache(max_bytes=10)
+        cache.put("a", "ea", b"aaaa")
+        cache.put("b", "eb", b"bbbb")
+        assert cache.get("a") == ("ea", b"aaaa")
+        cache.put("c", "ec", b"cccc")
+        assert cache.get("b") is None
+        assert cache.get("a") and cache.get("c")
+        assert cache.size == 8
+
+    def test_skips_a_body_bigger_than_the_budget(self):
+        cache = DetailCache(max_bytes=4)
+        cache.put("a", "ea", b"aaaaa")
+        assert len(cache) == 0
+
+    def test_discard_and_replace_keep_the_size(self):
+        cache = DetailCache(max_bytes=100)
+        cache.put("a", "ea", b"aaaa")
+        cache.put("a", "ea2", b"aa")
+        assert cache.size == 2
+        cache.discard(["a", "missing"])
+        assert cache.size == 0 and cache.get("a") is None
+
+
+class TestStoredDetail:
+    def test_body_matches_the_serialized_detail(self, client):
+        _save("d")
+        stored = client.get("/api/debates/d")
+        assert stored.headers["content-type"] == "application/json"
+        assert stored.json() == {
+            **client.get("/api/debates/d", params={"turns_limit": 500}).json(),
+            "next_turn": None,
+        }
+        assert stored.json()["completed_at"].endswith("Z")
+
+    def test_etag_and_cache_control(self, client):
+        _save("d")
+        resp = client.get("/api/debates/d")
+        etag = resp.headers["etag"]
+        assert etag.startswith('"') and len(etag) == 66
+        assert "immutable" in resp.headers["cache-control"]
+        assert "max-age=" in resp.headers["cache-control"]
+
+        for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            not_modified = client.get("/api/debates/d", headers={"If-None-Match": header})
+            assert not_modified.status_code == 304
+            assert not_modified.content == b""
+            assert not_modified.headers["etag"] == etag
+        assert client.get("/api/debates/d", headers={"If-None-Match": '"other"'}).status_code == 200
+
+    def test_repeat_reads_come_from_the_lru(self, client):
+        _save("d")
+        first = client.get("/api/debates/d").content
+        with db.engine.begin() as connection:
+            connection.execute(text("UPDATE debates SET detail = NULL, detail_etag = NULL"))
+        assert client.get("/api/debates/d").content == first
+
+    def test_a_conditional_miss_is_one_lookup(self, client):
+        _save("d")
+        etag = client.get("/api/debates/d").headers["etag"]
+        debate_repository._detail_cache.discard(["d"])
+        misses, hits = CACHE_MISSES.value, CACHE_HITS.value
+        assert client.get("/api/debates/d", headers={"If-None-Match": etag}).status_code == 304
+        assert (CACHE_MISSES.value - misses, CACHE_HITS.value - hits) == (1, 0)
+        # ... and it left the body in the LRU for the next read.
+        assert client.get("/api/debates/d", headers={"If-None-Match": etag}).status_code == 304
+        assert (CACHE_MISSES.value - misses, CACHE_HITS.value - hits) == (1, 1)
+
+    def test_resave_replaces_the_cached_body(self, client):
+        _save("d", content="First")
+        etag = client.get("/api/debates/d").headers["etag"]
+        _save("d", content="Second")
+        resp = client.get("/api/debates/d", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["transcript"][0]["content"] == "Second"
+
+    def test_pages_and_unfinished_debates_are_not_cached(self, client):
+        _save("d")
+        assert "etag" not in client.get("/api/debates/d", params={"turns_limit": 1}).headers
+        debate_repository.save_checkpoint(
+            debate_id="live", topic="T", pro_style="passionate", con_style="academic",
+            phase="opening", turns=[], first_seq=0, created_at=datetime(2025, 1, 1),
+        )
+        resp = client.get("/api/debates/live", headers={"If-None-Match": "*"})
+        assert resp.status_code == 200 and "etag" not in resp.headers
+
+    def test_rows_saved_before_bodies_are_filled_by_compress_debates(self, client):
+        _save("old")
+        with db.engine.begin() as connection:
+            connection.execute(text("UPDATE debates SET detail = NULL, detail_etag = NULL"))
+        legacy = client.get("/api/debates/old")
+        assert legacy.status_code == 200 and "etag" not in legacy.headers
+
+        assert debate_repository.recompress_debates() == 1
+        resp = client.get("/api/debates/old")
+        assert "etag" in resp.headers
+        assert resp.json() == legacy.json()
+        assert json.loads(resp.content)["transcript"][0]["content"] == "Opening"
@@ -0,0 +1,168 @@
+"""Tests for the NDJSON export of finished debates (api/services/debate_export.py):
+``GET /api/debates/export`` and ``python main.py export-debates``. The DB is a
+throwaway SQLite per test (see ``conftest._test_db``)."""
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from api import db
+from api.services import debate_export, debate_repository
+from api.services.debate_repository import DebateFilters
+
+
+def _save(debate_id, completed_at, winner="PRO"):
+    debate_repository.save_completed_debate(
+        debate_id=debate_id, topic=f"Topic {debate_id}", pro_style="passionate",
+        con_style="academic",
+        transcript=[{"speaker": "PRO", "content": f"Opening {debate_id}", "phase": "opening"}],
+        argument_scores={"winner": winner, "pro_arguments": [], "con_arguments": []},
+        winner=winner, created_at=datetime(2025, 1, 1), completed_at=completed_at,
+    )
+
+
+def _ids(body: bytes) -> list[str]:
+    return [json.loads(line)["id"] for line in body.splitlines()]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    from api.main import app
+    return TestClient(app)
+
+
+class TestExportLines:
+    def test_save_order_one_detail_body_per_line(self, client):
+        _save("b", datetime(2025, 1, 2))
+        _save("a", datetime(2025, 1, 3))
+        _save("c", datetime(2025, 1, 2))
+        with db.SessionLocal() as session:
+            lines = list(debate_export.export_lines(session, batch_size=2))
+        assert _ids(b"".join(lines)) == ["b", "a", "c"]
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+        assert json.loads(lines[1]) == client.get("/api/debates/a").json()
+
+    def test_rows_without_a_stored_body_are_built(self):
+        _save("old", datetime(2025, 1, 2))
+        with db.SessionLocal() as session:
+            stored = list(debate_export.export_lines(session))
+        with db.engine.begin() as connection:
+            connection.execute(text("UPDATE debates SET detail = NULL, detail_etag = NULL"))
+        with db.SessionLocal() as session:
+            assert list(debate_export.export_lines(session)) == stored
+
+    def test_chunks_gzip_as_one_stream(self, monkeypatch):
+        monkeypatch.setattr(debate_export, "_CHUNK_BYTES", 10)
+        lines = [b'{"n": %d}\n' % n for n in range(50)]
+        plain = list(debate_export.chunks(lines))
+        assert len(plain) > 1 and b"".join(plain) == b"".join(lines)
+        assert gzip.decompress(b"".join(debate_export.chunks(lines, gzip=True))) == b"".join(lines)
+        assert gzip.decompress(b"".join(debate_export.chunks([], gzip=True))) == b""
+
+
+class TestExportEndpoint:
+    def test_streams_ndjson_with_filters(self, client):
+        _save("a", datetime(2025, 1, 2), winner="PRO")
+        _save("b", datetime(2025, 1, 3), winner="CON")
+        resp = client.get("/api/debates/export")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert _ids(resp.content) == ["a", "b"]
+        assert _ids(client.get("/api/debates/export", params={"winner": "CON"}).content) == ["b"]
+        assert _ids(client.get(
+            "/api/debates/export", params={"completed_before": "2025-01-03T00:00:00"}
+        ).content) == ["a"]
+
+    def test_gzip(self, client):
+        _save("a", datetime(2025, 1, 2))
+        resp = client.get("/api/debates/export", params={"gzip": True})
+        assert resp.headers["content-type"] == "application/gzip"
+        assert "debates.ndjson.gz" in resp.headers["content-disposition"]
+        assert _ids(gzip.decompress(resp.content)) == ["a"]
+
+    def test_since_cursor_exports_only_newer_debates(self, client):
+        _save("a", datetime(2025, 1, 2))
+        first = client.get("/api/debates/export")
+        cursor = first.headers["x-export-cursor"]
+
+        again = client.get("/api/debates/export", params={"since": cursor})
+        assert again.content == b"" and again.headers["x-export-cursor"] == cursor
+
+        _save("b", datetime(2025, 1, 3))
+        _save("c", datetime(2025, 1, 3))
+        newer = client.get("/api/debates/export", params={"since": cursor})
+        assert _ids(newer.content) == ["b", "c"]
+        assert newer.headers["x-export-cursor"] != cursor
+
+    def test_a_debate_committed_after_the_cursor_is_not_missed(self, client):
+        # Completed before "b" but committed after the cursor was handed out,
+        # as by a second worker, a retried batch, or a spool replay.
+        _save("b", datetime(2025, 1, 3))
+        cursor = client.get("/api/debates/export").headers["x-export-cursor"]
+        _save("late", datetime(2025, 1, 2))
+        assert _ids(client.get("/api/debates/export", params={"since": cursor}).content) == ["late"]
+
+        # Saved again, a debate is exported again.
+        cursor = client.get("/api/debates/export", params={"since": cursor}).headers["x-export-cursor"]
+        _save("b", datetime(2025, 1, 3), winner="CON")
+        assert _ids(client.get("/api/debates/export", params={"since": cursor}).content) == ["b"]
+
+    def test_empty_archive_and_bad_cursor(self, client):
+        resp = client.get("/api/debates/export")
+        assert resp.status_code == 200 and resp.content == b""
+        assert "x-export-cursor" not in resp.headers
+        for bad in ("%%%", "-1", "01"):
+            assert client.get("/api/debates/export", params={"since": bad}).status_code == 400
+
+    def test_export_stops_at_its_cursor(self):
+        _save("a", datetime(2025, 1, 2))
+        with db.SessionLocal() as session:
+            until = debate_export.export_cursor(session, DebateFilters())
+        _save("b", datetime(2025, 1, 3))
+        assert _ids(b"".join(debate_export.stream(until=until))) == ["a"]
+
+    def test_init_db_numbers_older_debates_in_completed_order(self):
+        _save("b", datetime(2025, 1, 3))
+        _save("a", datetime(2025, 1, 2))
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_debates_saved_seq"))
+            connection.execute(text("ALTER TABLE debates DROP COLUMN saved_seq"))
+        db.init_db()
+        db.init_db()  # idempotent once migrated
+        _save("c", datetime(2025, 1, 1))
+        assert _ids(b"".join(debate_export.stream(until="3"))) == ["a", "b", "c"]
+
+
+class TestExportCommand:
+    def test_writes_a_gzip_file_and_prints_the_cursor(self, tmp_path, capsys):
+        import main
+
+        _save("a", datetime(2025, 1, 2))
+        output = tmp_path / "debates.ndjson.gz"
+        main.main(["export-debates", "-o", str(output)])
+        assert _ids(gzip.decompress(output.read_bytes())) == ["a"]
+        assert not (tmp_path / "debates.ndjson.gz.part").exists()
+        report = capsys.readouterr().err
+        assert "Exported 1 debate(s)" in report
+        cursor = report.rsplit("--since ", 1)[1].strip()
+
+        _save("b", datetime(2025, 1, 3))
+        main.main(["export-debates", "-o", str(tmp_path / "next.ndjson"), "--since", cursor])
+        assert _ids((tmp_path / "next.ndjson").read_bytes()) == ["b"]
+
+    def test_stdout_and_bad_cursor(self, capsys, monkeypatch):
+        import main
+
+        _save("a", datetime(2025, 1, 2))
+        out = io.BytesIO()
+        monkeypatch.setattr("sys.stdout", io.TextIOWrapper(out))
+        main.main(["export-debates", "--winner", "PRO"])
+        assert _ids(out.getvalue()) == ["a"]
+        with pytest.raises(SystemExit):
+            main.main(["export-debates", "--since", "%%%"])
+        assert "cannot export debates" in capsys.readouterr().err
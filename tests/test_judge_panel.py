@@ -0,0 +1,186 @@
+"""Tests for the judge panel — score aggregation (majority winner, mean
+averages, agreement stats), concurrent scoring, partial failure, and the
+``build_agents`` wiring. Judges are mocked (see conftest fixtures).
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from langchain_anthropic.chat_models import convert_to_anthropic_tool
+
+from src.agents.base_agent import AgentError
+from src.judge_panel import JudgePanel, aggregate_scores, build_judge_panel
+from src.scoring import ArgumentScore, DebateScores
+
+
+def _scores(winner, pro, con, tag=""):
+    return DebateScores(
+        pro_arguments=[ArgumentScore(summary=f"pro{tag}", score=pro, reason="r")],
+        con_arguments=[ArgumentScore(summary=f"con{tag}", score=con, reason="r")],
+        winner=winner,
+        strongest_argument=f"strong{tag}",
+        weakest_argument=f"weak{tag}",
+    )
+
+
+def _judge(make_mock_agent, name, scores=None, fail=False, delay=0.0):
+    judge = make_mock_agent(name, fail=fail)
+    judge.name = name
+
+    async def ascore(debate_context, instruction):
+        await asyncio.sleep(delay)
+        if fail:
+            raise AgentError(f"{name} down")
+        return scores
+
+    judge.ascore_arguments = ascore
+    if fail:
+        judge.score_arguments.side_effect = AgentError(f"{name} down")
+    else:
+        judge.score_arguments.return_value = scores
+    return judge
+
+
+# ---------------------------------------------------------------------------
+# aggregate_scores
+# ---------------------------------------------------------------------------
+
+class TestAggregateScores:
+    def test_majority_winner_and_mean_averages(self):
+        merged = aggregate_scores([
+            _scores("PRO", 8, 6), _scores("PRO", 7, 5), _scores("CON", 5, 7),
+        ])
+        assert merged.winner == "PRO"
+        assert merged.pro_average == 6.7
+        assert merged.con_average == 6.0
+        assert merged.panel.votes == {"PRO": 2, "CON": 1, "TIE": 0}
+        assert merged.panel.agreement == 0.67
+        assert merged.panel.size == 3
+
+    def test_split_vote_falls_back_to_mean_averages(self):
+        merged = aggregate_scores([_scores("PRO", 6, 5), _scores("CON", 5, 9)])
+        assert merged.winner == "CON"
+        # Equal means with a split vote is a tie nobody voted for.
+        tied = aggregate_scores([_scores("PRO", 7, 6), _scores("CON", 6, 7)])
+        assert tied.winner == "TIE"
+        assert tied.panel.agreement == 0.0
+
+    def test_representative_is_closest_backer_of_the_winner(self):
+        merged = aggregate_scores([
+            _scores("PRO", 10, 2, tag="a"),
+            _scores("PRO", 7, 6, tag="b"),
+            _scores("PRO", 7, 5, tag="c"),
+            _scores("CON", 7, 6, tag="d"),
+        ])
+        # Means are 7.8 / 4.8; judge "c" is the nearest PRO backer.
+        assert merged.pro_arguments[0].summary == "proc"
+        assert merged.strongest_argument == "strongc"
+
+    def test_unanimous_panel_has_full_agreement_and_no_spread(self):
+        merged = aggregate_scores([_scores("CON", 4, 8)] * 3)
+        assert merged.panel.agreement == 1.0
+        assert merged.panel.pro_average_stdev == 0.0
+
+    def test_ballots_are_labelled(self):
+        merged = aggregate_scores([_scores("PRO", 8, 6), _scores("TIE", 6, 6)], ["A", "B"])
+        assert [(b.judge, b.winner) for b in merged.panel.ballots] == [("A", "PRO"), ("B", "TIE")]
+
+    def test_empty_rejected(self):
+        with pytest.raises(ValueError):
+            aggregate_scores([])
+
+    def test_panel_round_trips_through_model_dump(self):
+        merged = aggregate_scores([_scores("PRO", 8, 6), _scores("CON", 5, 7)])
+        restored = DebateScores.model_validate(merged.model_dump())
+        assert restored.panel == merged.panel
+        assert restored.pro_average == merged.pro_average
+
+    def test_panel_is_not_part_of_the_model_facing_schema(self):
+        # The judge fills DebateScores via structured output; it must never be
+        # asked to invent panel statistics.
+        schema = convert_to_anthropic_tool(DebateScores)["input_schema"]
+        assert "panel" not in schema["properties"]
+        assert _scores("PRO", 8, 6).model_dump()["panel"] is None
+
+
+# ---------------------------------------------------------------------------
+# JudgePanel
+# ---------------------------------------------------------------------------
+
+class TestJudgePanel:
+    async def test_judges_score_concurrently(self, make_mock_agent):
+        judges = [
+            _judge(make_mock_agent, f"J{i}", _scores("PRO", 8, 6), delay=0.1) for i in range(4)
+        ]
+        start = time.perf_counter()
+        merged = await JudgePanel(judges).ascore_arguments("ctx", "instr")
+        elapsed = time.perf_counter() - start
+        # Four 0.1s judges in parallel take about one judge's time, not four.
+        assert elapsed < 0.3
+        assert merged.panel.size == 4
+
+    async def test_failed_judge_is_left_out(self, make_mock_agent):
+        panel = JudgePanel([
+            _judge(make_mock_agent, "J1", _scores("CON", 5, 7)),
+            _judge(make_mock_agent, "J2", fail=True),
+            _judge(make_mock_agent, "J3", _scores("CON", 4, 8)),
+        ])
+        merged = await panel.ascore_arguments("ctx", "instr")
+        assert merged.winner == "CON"
+        assert (merged.panel.size, merged.panel.failed) == (2, 1)
+
+    async def test_all_judges_failing_raises_agent_error(self, make_mock_agent):
+        panel = JudgePanel([_judge(make_mock_agent, f"J{i}", fail=True) for i in range(2)])
+        with pytest.raises(AgentError):
+            await panel.ascore_arguments("ctx", "instr")
+
+    def test_sync_scoring_merges_too(self, make_mock_agent):
+        panel = JudgePanel([
+            _judge(make_mock_agent, "J1", _scores("PRO", 8, 6)),
+            _judge(make_mock_agent, "J2", fail=True),
+            _judge(make_mock_agent, "J3", _scores("PRO", 9, 5)),
+        ])
+        merged = panel.score_arguments("ctx", "instr")
+        assert merged.winner == "PRO"
+        assert merged.panel.failed == 1
+
+    async def test_turns_go_to_the_lead_judge(self, make_mock_agent):
+        lead, other = make_mock_agent("LEAD"), make_mock_agent("OTHER")
+        lead.usage = {"output": 3}
+        other.usage = {"output": 4}
+        panel = JudgePanel([lead, other])
+        chunks = [c async for c in panel.astream_respond("ctx", "instr")]
+        assert "".join(chunks) == "LEAD-a LEAD-b"
+        assert panel.respond("ctx", "instr") == "LEAD-a LEAD-b"
+        assert panel.usage == {"output": 7}
+
+
+class TestBuildAgentsPanel:
+    def test_panel_size_one_keeps_a_single_judge(self):
+        with patch("src.agents.base_agent.ChatAnthropic"), \
+             patch("src.agents.base_agent.ChatPromptTemplate"):
+            from src.agents.base_agent import DebateAgent, build_agents
+            _, _, judge = build_agents("passionate", "academic")
+        assert isinstance(judge, DebateAgent)
+
+    def test_panel_built_with_round_robin_models_and_temperatures(self):
+        with patch("src.agents.base_agent.ChatAnthropic"), \
+             patch("src.agents.base_agent.ChatPromptTemplate"), \
+             patch("config.JUDGE_PANEL_SIZE", 3), \
+             patch("config.JUDGE_PANEL_MODELS", ["m1", "m2"]), \
+             patch("config.JUDGE_PANEL_TEMPERATURES", [0.1]):
+            from src.agents.base_agent import build_agents
+            _, _, judge = build_agents("passionate", "academic")
+        assert isinstance(judge, JudgePanel)
+        assert [j.model for j in judge.judges] == ["m1", "m2", "m1"]
+        assert [j.temperature for j in judge.judges] == [0.1, 0.1, 0.1]
+        assert judge.name == "Judge"
+
+    def test_empty_lists_default_to_the_lone_judge_settings(self):
+        with patch("src.agents.base_agent.ChatAnthropic"), \
+             patch("src.agents.base_agent.ChatPromptTemplate"):
+            panel = build_judge_panel(2)
+        from config import MODEL_NAME, TEMPERATURE_JUDGE
+        assert {j.model for j in panel.judges} == {MODEL_NAME}
+        assert {j.temperature for j in panel.judges} == {TEMPERATURE_JUDGE}
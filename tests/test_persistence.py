@@ -2,15 +2,20 @@
 persist-on-completion behaviour of run_debate. The DB is a throwaway SQLite per
 test (see ``conftest._test_db``); the LLM is mocked via the conftest fixtures.
 """
+import hashlib
+import json
+import threading
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from api import db
-from api.services import debate_repository
-from api.services.debate_service import DebateService
+from api.services import debate_repository, debate_writer
+from api.services.debate_service import DebateService, debate_service
+from api.services.debate_writer import DebateWriter
 from api.schemas.debate import WSMessageType
 from conftest import sample_scores
 
@@ -98,6 +103,161 @@ class TestRepository:
             assert row.topic == "Updated"
 
 
+    def test_list_projects_summaries_without_the_payload(self):
+        debate_repository.save_completed_debate(**_save_kwargs("p", n_transcript=5))
+        with db.SessionLocal() as s:
+            [row] = debate_repository.list_debates(s)
+        assert row.message_count == 5
+        assert "transcript" not in row._fields
+        assert "argument_scores" not in row._fields
+
+    def test_init_db_moves_checkpoint_transcripts_into_turns(self):
+        from sqlalchemy import inspect, text
+
+        with db.engine.begin() as connection:
+            # A debate saved back when transcripts were JSON text.
+            connection.execute(text(
+                "INSERT INTO debates (id, topic, pro_style, con_style, message_count, transcript,"
+                " created_at, completed_at) VALUES ('done', 'T', 'passionate', 'academic', 3,"
+                " :transcript, '2025-01-01 00:00:00', '2025-01-01 00:00:00')"
+            ), {"transcript": json.dumps(_save_kwargs("done", n_transcript=3)["transcript"])})
+            connection.execute(text("DROP TABLE debate_turns"))
+            connection.execute(text("DROP TABLE debate_checkpoints"))
+            connection.execute(text(
+                "CREATE TABLE debate_checkpoints (id VARCHAR PRIMARY KEY, topic VARCHAR NOT NULL,"
+                " pro_style VARCHAR NOT NULL, con_style VARCHAR NOT NULL, phase VARCHAR NOT NULL,"
+                " transcript JSON NOT NULL, created_at DATETIME NOT NULL,"
+                " updated_at DATETIME NOT NULL)"
+            ))
+            connection.execute(text(
+                "INSERT INTO debate_checkpoints VALUES ('ck', 'T', 'passionate', 'academic',"
+                " 'opening', '[{\"speaker\": \"MODERATOR\", \"content\": \"Hi\","
+                " \"phase\": \"introduction\"}]', '2025-01-01 00:00:00', '2025-01-01 00:00:00')"
+            ))
+        db.init_db()
+        db.init_db()  # idempotent once migrated
+
+        checkpoint = debate_repository.load_checkpoint("ck")
+        assert checkpoint.status == "in_progress"
+        assert checkpoint.transcript == [
+            {"speaker": "MODERATOR", "content": "Hi", "phase": "introduction"}]
+        with db.SessionLocal() as s:
+            assert debate_repository.count_turns(s, "done") == 3
+        columns = {column["name"] for column in inspect(db.engine).get_columns("debate_checkpoints")}
+        assert "transcript" not in columns
+        with db.engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+    def test_get_loads_the_deferred_payload(self):
+        debate_repository.save_completed_debate(**_save_kwargs("g", n_transcript=3))
+        with db.SessionLocal() as s:
+            row = debate_repository.get_debate(s, "g")
+        # Read after the session closed: only works if it was loaded up front.
+        assert len(row.transcript) == 3
+        assert row.argument_scores["winner"] == "PRO"
+
+    def test_init_db_adds_and_backfills_message_count(self):
+        from sqlalchemy import inspect, text
+
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP TABLE debates"))
+            connection.execute(text(
+                "CREATE TABLE debates (id VARCHAR PRIMARY KEY, topic VARCHAR NOT NULL,"
+                " pro_style VARCHAR NOT NULL, con_style VARCHAR NOT NULL, winner VARCHAR,"
+                " transcript JSON NOT NULL, argument_scores JSON,"
+                " created_at DATETIME NOT NULL, completed_at DATETIME NOT NULL)"
+            ))
+            connection.execute(text(
+                "INSERT INTO debates VALUES ('old', 'T', 'passionate', 'academic', 'PRO',"
+                " '[{\"speaker\": \"PRO\"}, {\"speaker\": \"CON\"}]', NULL,"
+                " '2025-01-01 00:00:00', '2025-01-01 00:00:00')"
+            ))
+        db.init_db()
+        db.init_db()  # idempotent once migrated
+        with db.SessionLocal() as s:
+            [row] = debate_repository.list_debates(s)
+        assert row.message_count == 2
+        indexed = {tuple(index["column_names"]) for index in inspect(db.engine).get_indexes("debates")}
+        assert ("completed_at", "id") in indexed
+        assert ("completed_at",) not in indexed  # superseded by the composite
+
+
+class TestArchivePaging:
+    """Keyset pages on (completed_at, id), filters, and the cached count."""
+
+    @pytest.fixture
+    def archive(self, monkeypatch):
+        # Ten debates, completed in pairs sharing a timestamp, so pages must
+        # break ties on id. Even ones PRO won in the passionate style.
+        stamps = iter([datetime(2026, 1, 1 + i // 2) for i in range(10)])
+        monkeypatch.setattr(db, "utcnow", lambda: next(stamps, datetime(2026, 2, 1)))
+        for i in range(10):
+            kwargs = _save_kwargs(f"d{i}", topic=f"T{i}", winner="PRO" if i % 2 == 0 else "CON")
+            kwargs["pro_style"] = "passionate" if i % 2 == 0 else "humorous"
+            debate_repository.save_completed_debate(**kwargs)
+
+    def _walk(self, limit, filters=None):
+        ids, cursor = [], None
+        with db.SessionLocal() as s:
+            while True:
+                rows, cursor = debate_repository.page_debates(s, limit, cursor=cursor, filters=filters)
+                ids += [row.id for row in rows]
+                if cursor is None:
+                    return ids
+
+    def test_pages_cover_the_archive_once_newest_first(self, archive):
+        everything = [f"d{i}" for i in reversed(range(10))]
+        assert self._walk(3) == everything
+        assert self._walk(10) == everything
+        assert self._walk(200) == everything
+
+    def test_filters_narrow_every_page(self, archive):
+        filters = debate_repository.DebateFilters(winner="PRO", pro_style="passionate")
+        assert self._walk(2, filters) == ["d8", "d6", "d4", "d2", "d0"]
+        dated = debate_repository.DebateFilters(
+            completed_after=datetime(2026, 1, 2), completed_before=datetime(2026, 1, 4)
+        )
+        assert self._walk(3, dated) == ["d5", "d4", "d3", "d2"]
+
+    def test_malformed_cursor_raises_value_error(self, archive):
+        with db.SessionLocal() as s, pytest.raises(ValueError):
+            debate_repository.list_debates(s, cursor="not-a-cursor")
+
+    def test_count_is_cached_until_a_save(self, archive):
+        from sqlalchemy import delete
+        from api.models import Debate
+
+        with db.SessionLocal() as s:
+            assert debate_repository.count_debates(s) == 10
+            s.execute(delete(Debate).where(Debate.id == "d0"))
+            s.commit()
+            assert debate_repository.count_debates(s) == 10  # served from the cache
+        debate_repository.save_completed_debate(**_save_kwargs("d10"))
+        with db.SessionLocal() as s:
+            assert debate_repository.count_debates(s) == 10  # -1 deleted, +1 saved
+            pro = debate_repository.DebateFilters(winner="PRO")
+            assert debate_repository.count_debates(s, pro) == 5
+
+    def test_route_pages_with_cursor_filters_and_total(self, archive, client):
+        first = client.get("/api/debates", params={"limit": 4, "winner": "CON"}).json()
+        assert [item["id"] for item in first["items"]] == ["d9", "d7", "d5", "d3"]
+        assert first["total"] == 5
+        second = client.get("/api/debates", params={
+            "limit": 4, "winner": "CON", "cursor": first["next_cursor"],
+        }).json()
+        assert [item["id"] for item in second["items"]] == ["d1"]
+        assert second["next_cursor"] is None
+
+    def test_route_takes_offset_dates_as_utc(self, archive, client):
+        resp = client.get("/api/debates", params={"completed_after": "2026-01-05T02:00:00+02:00"})
+        assert [item["id"] for item in resp.json()["items"]] == ["d9", "d8"]
+
+    def test_route_rejects_bad_cursor_and_winner(self, client):
+        resp = client.get("/api/debates", params={"cursor": "garbage"})
+        assert resp.status_code == 400
+        assert client.get("/api/debates", params={"winner": "NOBODY"}).status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # Persist-on-completion (run_debate)
 # ---------------------------------------------------------------------------
@@ -108,6 +268,7 @@ class TestServicePersistence:
         with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
             session = svc.create_debate("Persist me", "passionate", "academic")
             await _drain(svc, session)
+        assert svc.writer.flush(timeout=5)
 
         with db.SessionLocal() as s:
             row = debate_repository.get_debate(s, session.debate_id)
@@ -133,6 +294,327 @@ class TestServicePersistence:
             assert debate_repository.get_debate(s, session.debate_id) is None
 
 
+# ---------------------------------------------------------------------------
+# Write-behind writer
+# ---------------------------------------------------------------------------
+
+def _row(debate_id, topic="T"):
+    return debate_repository.debate_row(**_save_kwargs(debate_id, topic=topic))
+
+
+def _spool_files():
+    return sorted(Path(debate_writer.DEBATE_SPOOL_DIR).glob("*.jsonl"))
+
+
+def _stored(debate_id):
+    with db.SessionLocal() as s:
+        return debate_repository.get_debate(s, debate_id)
+
+
+class TestWriteBehind:
+    async def test_completion_does_not_wait_for_the_write(self, mock_build_agents, client):
+        release = threading.Event()
+        save = debate_repository.save_completed_debates
+
+        def slow_save(rows):
+            release.wait(5)
+            save(rows)
+
+        with patch.object(debate_writer, "save_completed_debates", side_effect=slow_save), \
+                patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = debate_service.create_debate("Write behind", "passionate", "academic")
+            events = await _drain(debate_service, session)
+            assert events[-1]["type"] == WSMessageType.DEBATE_COMPLETE
+            assert _stored(session.debate_id) is None
+            # Still readable in full while the commit is held up.
+            resp = client.get(f"/api/debates/{session.debate_id}")
+            assert resp.status_code == 200
+            assert resp.json()["topic"] == "Write behind"
+            release.set()
+            assert debate_service.writer.flush(timeout=5)
+        assert _stored(session.debate_id).topic == "Write behind"
+        assert debate_service.writer.get(session.debate_id) is None
+
+    async def test_transcript_fetched_before_the_commit_matches_the_digest(
+        self, mock_build_agents, client
+    ):
+        # debate_complete carries only a digest; a client whose copy doesn't
+        # match fetches the transcript at once, before the writer commits.
+        release = threading.Event()
+        save = debate_repository.save_completed_debates
+
+        def held_save(rows):
+            release.wait(5)
+            save(rows)
+
+        with patch.object(debate_writer, "save_completed_debates", side_effect=held_save), \
+                patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = debate_service.create_debate("Digest", "passionate", "academic")
+            events = await _drain(debate_service, session)
+            digest = events[-1]["data"]["transcript_digest"]
+            assert _stored(session.debate_id) is None
+            transcript = client.get(f"/api/debates/{session.debate_id}").json()["transcript"]
+            release.set()
+            assert debate_service.writer.flush(timeout=5)
+
+        canonical = json.dumps([[entry["speaker"], entry["content"]] for entry in transcript],
+                               separators=(",", ":"), ensure_ascii=False)
+        assert digest == {"count": len(transcript),
+                          "sha256": hashlib.sha256(canonical.encode()).hexdigest()}
+
+    async def test_a_commit_between_the_reads_is_still_found(self, mock_build_agents, client):
+        # The writer commits (and drops the debate from its queue) while the
+        # endpoint is reading the archive: the debate must be found in one.
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = debate_service.create_debate("Race", "passionate", "academic")
+            release = threading.Event()
+            save = debate_repository.save_completed_debates
+
+            def held_save(rows):
+                release.wait(5)
+                save(rows)
+
+            with patch.object(debate_writer, "save_completed_debates", side_effect=held_save):
+                await _drain(debate_service, session)
+                read = debate_repository.get_debate_detail
+
+                def commit_after_reading(*args):
+                    found = read(*args)
+                    release.set()
+                    assert debate_service.writer.flush(timeout=5)
+                    return found
+
+                with patch.object(debate_repository, "get_debate_detail",
+                                  side_effect=commit_after_reading):
+                    resp = client.get(f"/api/debates/{session.debate_id}")
+                release.set()
+                assert debate_service.writer.flush(timeout=5)
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "completed"
+
+    def test_queued_debates_are_committed_in_batches(self):
+        writer = DebateWriter()
+        release = threading.Event()
+        batches = []
+        save = debate_repository.save_completed_debates
+
+        def record(rows):
+            release.wait(5)
+            batches.append([row["id"] for row in rows])
+            save(rows)
+
+        with patch.object(debate_writer, "save_completed_debates", side_effect=record):
+            for i in range(5):
+                writer.enqueue(_row(f"b{i}"))
+            release.set()
+            assert writer.flush(timeout=5)
+        # The first commit took what was queued when the thread woke; the
+        # rest, queued meanwhile, went in one more transaction.
+        assert len(batches) <= 2
+        assert sorted(sum(batches, [])) == [f"b{i}" for i in range(5)]
+        with db.SessionLocal() as s:
+            assert len(debate_repository.list_debates(s)) == 5
+
+    def test_failed_commit_is_retried(self, monkeypatch):
+        monkeypatch.setattr(debate_writer, "DEBATE_WRITE_RETRY_SECONDS", 0.01)
+        failures = debate_writer.WRITE_FAILURES.value
+        writer = DebateWriter()
+        calls = []
+
+        def flaky(rows):
+            calls.append(rows)
+            if len(calls) < 3:
+                raise OSError("disk I/O error")
+            debate_repository.save_completed_debates(rows)
+
+        with patch.object(debate_writer, "save_completed_debates", side_effect=flaky):
+            writer.enqueue(_row("retry"))
+            assert writer.flush(timeout=5)
+        assert _stored("retry") is not None
+        assert debate_writer.WRITE_FAILURES.value == failures + 2
+
+    def test_stop_drains_and_removes_the_spool(self):
+        writer = DebateWriter()
+        writer.enqueue(_row("drained"))
+        assert writer.stop(timeout=5)
+        assert _stored("drained") is not None
+        assert _spool_files() == []
+
+    def test_unsaved_debates_are_spooled_and_recovered_on_the_next_start(self):
+        writer = DebateWriter()
+        with patch.object(debate_writer, "save_completed_debates", side_effect=OSError("down")):
+            writer.enqueue(_row("spooled", topic="Kept"))
+            assert not writer.stop(timeout=0.2)
+        [spool] = _spool_files()
+        assert b'"spooled"' in spool.read_bytes()
+        assert _stored("spooled") is None
+
+        # A worker starting later commits the dead worker's rows.
+        assert DebateWriter().recover() == 1
+        assert _stored("spooled").topic == "Kept"
+        assert _spool_files() == []
+
+    def test_recover_leaves_a_live_workers_spool_alone(self):
+        live = DebateWriter()
+        release = threading.Event()
+        with patch.object(debate_writer, "save_completed_debates",
+                          side_effect=lambda rows: release.wait(5)):
+            live.enqueue(_row("live"))
+            for _ in range(100):
+                if _spool_files():
+                    break
+                threading.Event().wait(0.01)
+            assert DebateWriter().recover() == 0
+            release.set()
+        assert len(_spool_files()) == 1
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints and resuming
+# ---------------------------------------------------------------------------
+
+def _fail_on_opening_factory(make_mock_agent):
+    """PRO fails its opening — so the debate dies right after the intro."""
+    def factory(pro_style, con_style):
+        return make_mock_agent("PRO", fail=True), make_mock_agent("CON"), make_mock_agent("JUDGE")
+    return factory
+
+
+class TestCheckpoints:
+    async def test_each_completed_turn_is_checkpointed(self, make_mock_agent):
+        with patch("api.services.debate_service.build_agents",
+                   side_effect=_fail_on_opening_factory(make_mock_agent)):
+            svc = DebateService()
+            session = svc.create_debate("Resume me", "passionate", "academic")
+            [e async for e in svc.run_debate(session)]
+
+        checkpoint = debate_repository.load_checkpoint(session.debate_id)
+        assert checkpoint is not None
+        assert checkpoint.topic == "Resume me"
+        assert [e["speaker"] for e in checkpoint.transcript] == ["MODERATOR"]
+        assert checkpoint.created_at == session.created_at
+
+    async def test_completed_debate_drops_its_checkpoint(self, mock_build_agents):
+        svc = DebateService()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = svc.create_debate("T", "passionate", "academic")
+            await _drain(svc, session)
+        assert svc.writer.flush(timeout=5)
+        assert debate_repository.load_checkpoint(session.debate_id) is None
+
+    async def test_restored_debate_resumes_without_regenerating_turns(
+        self, make_mock_agent, mock_build_agents
+    ):
+        with patch("api.services.debate_service.build_agents",
+                   side_effect=_fail_on_opening_factory(make_mock_agent)):
+            first = DebateService()
+            session = first.create_debate("T", "passionate", "academic")
+            [e async for e in first.run_debate(session)]
+
+        # A fresh service stands in for a restarted process.
+        svc = DebateService()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            restored = await svc.restore_session(session.debate_id)
+            assert restored is svc.get_session(session.debate_id)
+            assert len(restored.transcript) == 1
+            assert restored.driver_token == session.driver_token
+            events = await _drain(svc, restored)
+        assert svc.writer.flush(timeout=5)
+
+        started = events[0]
+        assert started["type"] == WSMessageType.DEBATE_STARTED
+        assert started["data"]["resumed_from"] == 1
+        assert [e["speaker"] for e in started["data"]["transcript"]] == ["MODERATOR"]
+        # The intro was not streamed again: the first new turn is PRO's opening.
+        first_turn = next(e for e in events if e["type"] == WSMessageType.MESSAGE_COMPLETE)
+        assert first_turn["data"]["speaker"] == "PRO"
+        moderator_turns = [e for e in events if e["type"] == WSMessageType.MESSAGE_COMPLETE
+                           and e["data"]["speaker"] == "MODERATOR"]
+        assert moderator_turns == []
+
+        with db.SessionLocal() as s:
+            row = debate_repository.get_debate(s, session.debate_id)
+        # The persisted transcript is the whole debate, intro included, once.
+        assert [e["speaker"] for e in row.transcript].count("MODERATOR") == 1
+        assert row.created_at == session.created_at
+
+    async def test_each_checkpoint_appends_only_the_new_turn(self, mock_build_agents):
+        appended = []
+        save = debate_repository.save_checkpoint
+
+        def record(**kwargs):
+            appended.append((kwargs["first_seq"], len(kwargs["turns"])))
+            save(**kwargs)
+
+        svc = DebateService()
+        with patch("api.services.debate_service.save_checkpoint", side_effect=record), \
+                patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = svc.create_debate("T", "passionate", "academic")
+            await _drain(svc, session)
+        assert appended == [(seq, 1) for seq in range(len(session.transcript))]
+        with db.SessionLocal() as s:
+            turns, next_turn = debate_repository.page_turns(s, session.debate_id)
+        assert turns == session.transcript
+        assert next_turn is None
+
+    async def test_failed_run_is_marked_failed_then_resumed(
+        self, make_mock_agent, mock_build_agents
+    ):
+        with patch("api.services.debate_service.build_agents",
+                   side_effect=_fail_on_opening_factory(make_mock_agent)):
+            first = DebateService()
+            session = first.create_debate("T", "passionate", "academic")
+            [e async for e in first.run_debate(session)]
+        assert debate_repository.load_checkpoint(session.debate_id).status == "failed"
+
+        svc = DebateService()
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            restored = await svc.restore_session(session.debate_id)
+            async for event in svc.run_debate(restored):
+                if event["type"] == WSMessageType.MESSAGE_COMPLETE:
+                    checkpoint = debate_repository.load_checkpoint(session.debate_id)
+                    assert checkpoint.status == "in_progress"
+                if event["type"] == WSMessageType.VOTE_REQUIRED:
+                    svc.submit_vote(session.debate_id, "PRO")
+        assert svc.writer.flush(timeout=5)
+        assert debate_repository.load_checkpoint(session.debate_id) is None
+
+    async def test_restore_without_checkpoint_returns_none(self):
+        assert await DebateService().restore_session("never-started") is None
+
+    def test_stale_checkpoints_are_purged(self):
+        debate_repository.save_checkpoint(
+            debate_id="old", topic="T", pro_style="passionate", con_style="academic",
+            phase="introduction", turns=[{"speaker": "MODERATOR", "content": "Hi",
+                                          "phase": "introduction"}],
+            first_seq=0, created_at=datetime(2025, 1, 1),
+        )
+        assert debate_repository.purge_stale_checkpoints(3600) == 0
+        assert debate_repository.purge_stale_checkpoints(-1) == 1
+        assert debate_repository.load_checkpoint("old") is None
+
+    def test_websocket_reconnect_resumes_checkpointed_debate(self, client, mock_build_agents):
+        debate_repository.save_checkpoint(
+            debate_id="ck1", topic="Reconnect", pro_style="passionate", con_style="academic",
+            phase="introduction",
+            turns=[{"speaker": "MODERATOR", "content": "Welcome", "phase": "introduction"}],
+            first_seq=0, created_at=datetime(2025, 1, 1),
+        )
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            with client.websocket_connect("/ws/debates/ck1") as ws:
+                started = ws.receive_json()
+                assert started["type"] == "debate_started"
+                assert started["data"]["resumed_from"] == 1
+                while True:
+                    msg = ws.receive_json()
+                    if msg["type"] == "vote_required":
+                        ws.send_json({"type": "vote", "vote": "PRO"})
+                    if msg["type"] in ("debate_complete", "error"):
+                        break
+        assert msg["type"] == "debate_complete"
+        assert client.get("/api/debates/ck1").status_code == 200
+
+
 # ---------------------------------------------------------------------------
 # Read endpoints
 # ---------------------------------------------------------------------------
@@ -141,13 +623,13 @@ class TestHistoryRoutes:
     def test_list_is_empty_with_no_debates(self, client):
         resp = client.get("/api/debates")
         assert resp.status_code == 200
-        assert resp.json() == []
+        assert resp.json() == {"items": [], "next_cursor": None, "total": 0}
 
     def test_list_returns_summary_without_transcript(self, client):
         debate_repository.save_completed_debate(**_save_kwargs("r1", topic="Saved one"))
         resp = client.get("/api/debates")
         assert resp.status_code == 200
-        data = resp.json()
+        data = resp.json()["items"]
         assert len(data) == 1
         item = data[0]
         assert item["id"] == "r1"
@@ -168,6 +650,40 @@ class TestHistoryRoutes:
         assert isinstance(data["transcript"], list) and len(data["transcript"]) == 2
         assert data["argument_scores"]["winner"] == "PRO"
 
+    def test_detail_pages_through_turns(self, client):
+        kwargs = _save_kwargs("pg", n_transcript=5)
+        kwargs["transcript"] = [{"speaker": "PRO", "content": f"turn {i}", "phase": "p"}
+                                for i in range(5)]
+        debate_repository.save_completed_debate(**kwargs)
+        first = client.get("/api/debates/pg", params={"turns_limit": 2}).json()
+        assert [turn["content"] for turn in first["transcript"]] == ["turn 0", "turn 1"]
+        assert first["next_turn"] == 2
+        assert first["argument_scores"]["winner"] == "PRO"
+        assert first["message_count"] == 5
+        last = client.get("/api/debates/pg", params={"turns_from": 4, "turns_limit": 2}).json()
+        assert [turn["content"] for turn in last["transcript"]] == ["turn 4"]
+        assert last["next_turn"] is None
+        assert last["status"] == "completed"
+
+    def test_detail_serves_an_unfinished_debate_from_its_checkpoint(self, client):
+        debate_repository.save_checkpoint(
+            debate_id="live", topic="Ongoing", pro_style="passionate", con_style="academic",
+            phase="opening",
+            turns=[{"speaker": "MODERATOR", "content": "Welcome", "phase": "introduction"},
+                   {"speaker": "PRO", "content": "Opening", "phase": "opening"}],
+            first_seq=0, created_at=datetime(2025, 1, 1),
+        )
+        data = client.get("/api/debates/live").json()
+        assert data["status"] == "in_progress"
+        assert data["completed_at"] is None
+        assert data["message_count"] == 2
+        assert [turn["speaker"] for turn in data["transcript"]] == ["MODERATOR", "PRO"]
+
+        debate_repository.set_checkpoint_status("live", "failed")
+        page = client.get("/api/debates/live", params={"turns_from": 1, "turns_limit": 1}).json()
+        assert page["status"] == "failed"
+        assert [turn["content"] for turn in page["transcript"]] == ["Opening"]
+
     def test_detail_unknown_id_returns_404(self, client):
         resp = client.get("/api/debates/does-not-exist")
         assert resp.status_code == 404
@@ -177,7 +693,7 @@ class TestHistoryRoutes:
         # column type); the serialized wire value must still carry a UTC
         # designator or the frontend's `new Date(iso)` parses it as local time.
         debate_repository.save_completed_debate(**_save_kwargs("r3", topic="TZ check"))
-        item = client.get("/api/debates").json()[0]
+        item = client.get("/api/debates").json()["items"][0]
         assert item["created_at"].endswith("Z")
         assert item["completed_at"].endswith("Z")
 
@@ -200,7 +716,9 @@ class TestHistoryRoutes:
                     if msg["type"] in ("debate_complete", "error"):
                         break
 
-        listing = client.get("/api/debates").json()
+        # The list reads only committed debates; the save is write-behind.
+        assert debate_service.writer.flush(timeout=5)
+        listing = client.get("/api/debates").json()["items"]
         assert any(d["id"] == debate_id and d["topic"] == "End to end" for d in listing)
 
         detail = client.get(f"/api/debates/{debate_id}")
@@ -1,6 +1,6 @@
 """Tests for the API routes via FastAPI's TestClient — the REST endpoints and
 the WebSocket debate flow — with the LLM mocked (see conftest fixtures)."""
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -19,6 +19,16 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def shared_loop_client():
+    # Entered as a context manager, TestClient runs the app (lifespan
+    # included) on ONE event loop for every connection — needed when two
+    # sockets share a live debate. The plain client gives each its own loop.
+    from api.main import app
+    with TestClient(app) as client:
+        yield client
+
+
 def _drive_ws(ws, *, vote="PRO"):
     """Receive WebSocket messages until the debate completes or errors,
     auto-answering the vote prompt. Returns the list of messages."""
@@ -59,6 +69,50 @@ class TestLifespanStyleValidation:
             pass  # reaching here means startup succeeded
 
 
+class TestHealthReadiness:
+    """``/health`` is the readiness probe: 503 while the optional start-up
+    warm-up runs (api/services/warmup.py), 200 otherwise."""
+
+    def test_ready_without_warm_up(self, client):
+        resp = client.get("/health")
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "healthy"}
+
+    def test_warming_up_reports_503(self, client, monkeypatch):
+        from api.services.warmup import warmup
+
+        monkeypatch.setattr(warmup, "ready", False)
+        resp = client.get("/health")
+        assert resp.status_code == 503
+        assert resp.json() == {"status": "warming_up"}
+
+    async def test_lifespan_warm_up_builds_agents_and_opens_the_pool(self, monkeypatch):
+        import api.main as api_main
+        from api.services.warmup import warmup
+
+        pro = AsyncMock()
+        monkeypatch.setattr(api_main, "WARMUP_ON_STARTUP", True)
+        with patch("src.agents.base_agent.build_agents", return_value=(pro, None, None)) as build:
+            async with api_main.lifespan(api_main.app):
+                assert not warmup.ready
+                await warmup._task
+                assert warmup.ready
+        build.assert_called_once()
+        pro.awarm_up.assert_awaited_once()
+
+    async def test_failed_warm_up_still_reports_ready(self):
+        from api.services.warmup import WarmUp
+
+        pro = AsyncMock()
+        pro.awarm_up.side_effect = ConnectionError("api unreachable")
+        warm = WarmUp()
+        with patch("src.agents.base_agent.build_agents", return_value=(pro, None, None)):
+            warm.start()
+            await warm._task
+        assert warm.ready
+        assert warm.seconds > 0
+
+
 # ---------------------------------------------------------------------------
 # REST endpoints
 # ---------------------------------------------------------------------------
@@ -111,17 +165,76 @@ class TestCreateDebate:
         })
         assert resp.status_code == 422
 
-    def test_over_live_session_cap_returns_429(self, client, mock_build_agents):
-        # With the cap set to 1, the first create succeeds and the second — still
-        # live because no socket drove it — is rejected with 429.
+    def test_full_admission_queue_returns_429(self, client, mock_build_agents):
+        # With the queue bound set to 1, the first create succeeds and the
+        # second — still waiting because no socket drove it — is rejected.
         body = {"topic": "T", "pro_style": "passionate", "con_style": "passionate"}
-        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 1):
+        with patch("api.services.debate_service.ADMISSION_QUEUE_SIZE", 1):
             first = client.post("/api/debates", json=body)
             second = client.post("/api/debates", json=body)
         assert first.status_code == 200
         assert second.status_code == 429
         assert second.json()["detail"]
 
+    def test_busy_slots_report_queue_position(self, client, mock_build_agents):
+        body = {"topic": "T", "pro_style": "passionate", "con_style": "passionate"}
+        with patch("api.services.debate_service.MAX_LIVE_SESSIONS", 1):
+            first = client.post("/api/debates", json=body).json()
+            second = client.post("/api/debates", json=body).json()
+        assert (first["queue_position"], first["estimated_wait_seconds"]) == (0, 0.0)
+        assert second["queue_position"] == 1
+        assert second["estimated_wait_seconds"] > 0
+
+
+class TestAdminDeadlines:
+    def test_lists_pending_session_deadlines(self, client, mock_build_agents):
+        body = {"topic": "T", "pro_style": "passionate", "con_style": "passionate"}
+        debate_id = client.post("/api/debates", json=body).json()["debate_id"]
+
+        snap = client.get("/api/admin/deadlines").json()
+        assert snap["pending"] == 1
+        assert snap["by_kind"]["orphan"] == 1
+        assert snap["deadlines"][0]["key"] == debate_id
+        assert 0 < snap["deadlines"][0]["due_in_seconds"] <= snap["next_due_in_seconds"] + 1
+
+    def test_limit_is_validated(self, client):
+        assert client.get("/api/admin/deadlines?limit=0").status_code == 422
+
+
+class TestAdminSessions:
+    def test_lists_session_footprints(self, client, mock_build_agents):
+        body = {"topic": "T", "pro_style": "passionate", "con_style": "passionate"}
+        debate_id = client.post("/api/debates", json=body).json()["debate_id"]
+
+        report = client.get("/api/admin/sessions").json()
+        assert report["sessions"] == 1
+        assert report["capacity"] >= 1
+        assert report["largest"][0]["debate_id"] == debate_id
+        assert report["largest"][0]["admitted"] is False
+        assert report["committed_bytes"] == report["largest"][0]["total_bytes"]
+
+
+class TestMetricsEndpoint:
+    def test_exposes_admission_metrics(self, client):
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        text = resp.text
+        assert "debate_admission_queue_length 0" in text
+        assert "debate_active_sessions 0" in text
+        assert "debate_session_memory_committed_bytes 0" in text
+        assert "debate_ws_send_queue_max_depth 0" in text
+        assert 'debate_admission_wait_seconds_bucket{le="+Inf"}' in text
+
+    def test_a_metric_without_render_fails_when_built(self):
+        from api.services.metrics import Registry, _Metric
+
+        class Unrendered(_Metric):
+            kind = "gauge"
+
+        with pytest.raises(TypeError):
+            Unrendered("unrendered", "Never rendered.", registry=Registry())
+
 
 # ---------------------------------------------------------------------------
 # WebSocket flow
@@ -158,15 +271,67 @@ class TestWebSocket:
         assert scores["winner"] in ("PRO", "CON", "TIE")
         assert "pro_average" in scores and "con_average" in scores
 
+    def test_msgpack_subprotocol_streams_compact_frames(self, client, mock_build_agents):
+        import ormsgpack
+
+        from api.services.wire import MSGPACK_SUBPROTOCOL, TAGS
+
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            debate_id = client.post("/api/debates", json={
+                "topic": "T", "pro_style": "passionate", "con_style": "passionate",
+            }).json()["debate_id"]
+
+            with client.websocket_connect(f"/ws/debates/{debate_id}",
+                                          subprotocols=[MSGPACK_SUBPROTOCOL]) as ws:
+                assert ws.accepted_subprotocol == MSGPACK_SUBPROTOCOL
+                frames = []
+                while not frames or frames[-1][0] not in (TAGS["debate_complete"], TAGS["error"]):
+                    frames.append(ormsgpack.unpackb(ws.receive_bytes()))
+                    if frames[-1][0] == TAGS["vote_required"]:
+                        ws.send_bytes(ormsgpack.packb({"type": "vote", "vote": "CON"}))
+
+        assert frames[0][0] == TAGS["debate_started"]
+        assert frames[-1][0] == TAGS["debate_complete"]
+        assert [f[1] for f in frames] == list(range(1, len(frames) + 1))
+        received = next(f for f in frames if f[0] == TAGS["vote_received"])
+        assert received[2]["vote"] == "CON"
+        # A chunk is just its turn and its text, and the turn was opened by a
+        # message_start naming the speaker.
+        chunk = next(f for f in frames if f[0] == TAGS["message_chunk"])
+        assert len(chunk) == 4 and isinstance(chunk[3], str)
+        start = next(f for f in frames if f[0] == TAGS["message_start"] and f[2] == chunk[2])
+        assert "speaker" in start[3]
+
+    def test_a_codec_missing_a_method_fails_when_built(self):
+        from api.services.wire import Codec
+
+        class EncodeOnly(Codec):
+            def encode(self, frame):
+                return ""
+
+        with pytest.raises(TypeError):
+            EncodeOnly()
+
+    def test_msgpack_refusal_is_encoded_too(self, client):
+        import ormsgpack
+
+        from api.services.wire import MSGPACK_SUBPROTOCOL, TAGS
+
+        with client.websocket_connect("/ws/debates/does-not-exist",
+                                      subprotocols=[MSGPACK_SUBPROTOCOL]) as ws:
+            tag, seq, data = ormsgpack.unpackb(ws.receive_bytes())
+        assert tag == TAGS["error"] and seq is None
+        assert "not found" in data["message"].lower()
+
     def test_silent_client_vote_times_out_to_tie_and_evicts_session(self, client, mock_build_agents):
         # A client that receives the vote prompt and never votes must not hang
-        # the debate: the route's VOTE_TIMEOUT_SECONDS bound records a TIE, the
+        # the debate: the session's VOTE deadline records a TIE, the
         # debate completes, and the session is fully evicted (no leak). A short
         # timeout keeps the test fast.
         from api.services.debate_service import debate_service
 
         with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1), \
-             patch("api.routes.websocket.VOTE_TIMEOUT_SECONDS", 0.1):
+             patch("api.services.debate_service.VOTE_TIMEOUT_SECONDS", 0.1):
             debate_id = client.post("/api/debates", json={
                 "topic": "T", "pro_style": "passionate", "con_style": "passionate",
             }).json()["debate_id"]
@@ -185,12 +350,33 @@ class TestWebSocket:
         # The session was reclaimed by run_debate's cleanup — nothing leaks.
         assert debate_service.get_session(debate_id) is None
 
-    def test_second_connect_to_live_debate_is_rejected(self, client, mock_build_agents):
-        # A second WebSocket for an in-flight debate must be refused (error event
-        # + closed socket) and must never run a second run_debate over the shared
-        # session — the live transcript stays untouched.
+    def test_max_duration_during_the_vote_ends_the_debate(self, client, mock_build_agents):
+        # The deadline fires while the debate's task (not run_debate) is
+        # waiting for the driver's vote; it reports it and releases the session.
+        from api.services.debate_service import debate_service
+
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1), \
+             patch("api.services.debate_service.MAX_DEBATE_SECONDS", 0.3):
+            debate_id = client.post("/api/debates", json={
+                "topic": "T", "pro_style": "passionate", "con_style": "passionate",
+            }).json()["debate_id"]
+
+            with client.websocket_connect(f"/ws/debates/{debate_id}") as ws:
+                messages = _drive_ws(ws, vote=None)
+
+        assert messages[-2]["type"] == "vote_required"
+        assert messages[-1]["type"] == "error"
+        assert "stopped making progress" in messages[-1]["data"]["message"]
+        assert debate_service.get_session(debate_id) is None
+
+    def test_second_connect_to_live_debate_spectates(self, shared_loop_client, mock_build_agents):
+        # A second WebSocket for an in-flight debate watches it read-only: it
+        # catches up from the transcript, never drives a second run_debate over
+        # the shared session, and is never asked to vote.
         from api.services.debate_service import debate_service
 
+        client = shared_loop_client
+
         with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
             debate_id = client.post("/api/debates", json={
                 "topic": "T", "pro_style": "passionate", "con_style": "passionate",
@@ -207,27 +393,124 @@ class TestWebSocket:
                 assert live is not None and live.started is True
                 transcript_before = list(live.transcript)
 
-                # A second connect for the same live debate is rejected outright.
                 with client.websocket_connect(f"/ws/debates/{debate_id}") as ws2:
-                    rejected = ws2.receive_json()
-                assert rejected["type"] == "error"
-                assert "already running" in rejected["data"]["message"].lower()
-
-                # The rejected connection never ran run_debate, so the live
-                # transcript is untouched (no interleaved/duplicated appends).
-                assert live.transcript == transcript_before
-
-                # The first debate still finishes cleanly over its own socket.
-                ws1.send_json({"type": "vote", "vote": "PRO"})
-                types = [msg["type"]]
-                while types[-1] not in ("debate_complete", "error"):
-                    types.append(ws1.receive_json()["type"])
+                    catch_up = ws2.receive_json()
+                    assert catch_up["type"] == "debate_started"
+                    assert catch_up["data"]["spectator"] is True
+                    assert catch_up["data"]["transcript"] == transcript_before
+                    # Joining never touched the live transcript.
+                    assert live.transcript == transcript_before
+
+                    # The first debate still finishes cleanly over its own socket.
+                    ws1.send_json({"type": "vote", "vote": "PRO"})
+                    types = [msg["type"]]
+                    while types[-1] not in ("debate_complete", "error"):
+                        types.append(ws1.receive_json()["type"])
+
+                    watched = [catch_up["type"]]
+                    while watched[-1] not in ("debate_complete", "error"):
+                        watched.append(ws2.receive_json()["type"])
 
         assert types[-1] == "debate_complete"
+        assert watched[-1] == "debate_complete"
+        assert "vote_required" not in watched
+        assert "vote_received" in watched
         # The single (first) runner evicted the session on completion — no leak,
         # and no double-eviction from a second runner.
         assert debate_service.get_session(debate_id) is None
 
+    def test_reconnect_with_last_seq_replays_only_missed_frames(
+        self, shared_loop_client, mock_build_agents
+    ):
+        # The driver drops mid-debate; the debate keeps generating, and the
+        # reconnecting client is sent exactly the frames after the last seq it
+        # saw — no turn is regenerated, nothing is sent twice.
+        from api.services.debate_service import debate_service
+
+        client = shared_loop_client
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            created = client.post("/api/debates", json={
+                "topic": "T", "pro_style": "passionate", "con_style": "passionate",
+            }).json()
+            debate_id = created["debate_id"]
+
+            with client.websocket_connect(f"/ws/debates/{debate_id}") as ws:
+                seen = [ws.receive_json()]
+                while seen[-1]["type"] != "message_complete":
+                    seen.append(ws.receive_json())
+            last_seq = seen[-1]["seq"]
+            assert [m["seq"] for m in seen] == list(range(1, last_seq + 1))
+            assert debate_service.get_session(debate_id) is not None
+
+            with client.websocket_connect(f"/ws/debates/{debate_id}?last_seq={last_seq}"
+                                          f"&driver_token={created['driver_token']}") as ws:
+                rest = _drive_ws(ws)
+
+        assert rest[0]["seq"] == last_seq + 1
+        seqs = [m["seq"] for m in rest]
+        assert seqs == sorted(set(seqs))
+        assert "debate_started" not in [m["type"] for m in rest]
+        assert rest[-1]["type"] == "debate_complete"
+        assert debate_service.get_session(debate_id) is None
+
+    def test_only_the_driver_token_takes_the_driver_role_back(
+        self, shared_loop_client, mock_build_agents
+    ):
+        # While the driver is away, a socket without its token (a spectator,
+        # or anyone who knows the id) stays a spectator and never gets the
+        # vote; the original client reconnecting with the token drives again.
+        from api.services.debate_service import debate_service
+
+        client = shared_loop_client
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            created = client.post("/api/debates", json={
+                "topic": "T", "pro_style": "passionate", "con_style": "passionate",
+            }).json()
+            debate_id = created["debate_id"]
+            with client.websocket_connect(f"/ws/debates/{debate_id}") as ws:
+                assert ws.receive_json()["type"] == "debate_started"
+
+            url = f"/ws/debates/{debate_id}"
+            with client.websocket_connect(f"{url}?driver_token=guess") as intruder:
+                catch_up = intruder.receive_json()
+                assert catch_up["data"]["spectator"] is True
+                hub = debate_service.get_session(debate_id).hub
+                assert hub.driver is None
+
+                with client.websocket_connect(
+                    f"{url}?driver_token={created['driver_token']}"
+                ) as ws:
+                    messages = _drive_ws(ws)
+
+                watched = [catch_up["type"]]
+                while watched[-1] not in ("debate_complete", "error"):
+                    watched.append(intruder.receive_json()["type"])
+
+        assert "spectator" not in messages[0]["data"]
+        assert "vote_required" in [m["type"] for m in messages]
+        assert messages[-1]["type"] == "debate_complete"
+        assert "vote_required" not in watched
+
+    def test_driver_that_never_returns_is_evicted_after_the_grace(
+        self, shared_loop_client, mock_build_agents
+    ):
+        import time
+
+        from api.services.debate_service import debate_service
+
+        client = shared_loop_client
+        with patch("api.services.debate_service.RECONNECT_GRACE_SECONDS", 0.1):
+            debate_id = client.post("/api/debates", json={
+                "topic": "T", "pro_style": "passionate", "con_style": "passionate",
+            }).json()["debate_id"]
+            with client.websocket_connect(f"/ws/debates/{debate_id}") as ws:
+                assert ws.receive_json()["type"] == "debate_started"
+
+            deadline = time.monotonic() + 5
+            while debate_service.get_session(debate_id) is not None:
+                assert time.monotonic() < deadline, "session not evicted after the grace"
+                time.sleep(0.02)
+
     def test_error_path_emits_clean_error_event(self, client, make_mock_agent):
         def factory(pro_style, con_style):
             return make_mock_agent("PRO", fail=True), make_mock_agent("CON"), make_mock_agent("JUDGE")
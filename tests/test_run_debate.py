@@ -150,3 +150,87 @@ class TestEdgeCases:
         assert "MODERATOR" in speakers
         assert "PRO" in speakers
         assert "JUDGE" in speakers
+
+
+# ---------------------------------------------------------------------------
+# arun_debate — the async streaming CLI mode
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def streaming_controller(make_mock_agent):
+    import io
+    from rich.console import Console
+
+    pro, con, judge = make_mock_agent("PRO"), make_mock_agent("CON"), make_mock_agent("JUDGE")
+    controller = DebateController("Should AI be regulated?", pro, con, judge)
+    controller.console = Console(file=io.StringIO(), width=100)
+    return controller
+
+
+class TestArunDebate:
+    async def test_streams_every_turn_into_the_transcript(self, streaming_controller):
+        with patch("src.debate_controller.NUM_REBUTTAL_ROUNDS", 1), \
+             patch("builtins.input", return_value="2"):
+            transcript = await streaming_controller.arun_debate()
+
+        assert transcript[0] == {
+            "speaker": "MODERATOR", "content": "JUDGE-a JUDGE-b", "phase": "introduction",
+        }
+        audience = next(e for e in transcript if e["speaker"] == "AUDIENCE")
+        assert "CON" in audience["content"]
+        assert isinstance(streaming_controller.argument_scores, DebateScores)
+        assert streaming_controller.phase == DebatePhase.FINISHED
+
+    async def test_never_calls_the_blocking_methods(self, streaming_controller):
+        with patch("src.debate_controller.NUM_REBUTTAL_ROUNDS", 1), \
+             patch("builtins.input", return_value="1"):
+            await streaming_controller.arun_debate()
+        for agent in (streaming_controller.pro, streaming_controller.con, streaming_controller.judge):
+            agent.respond.assert_not_called()
+            agent.score_arguments.assert_not_called()
+
+    async def test_panels_report_ttft_and_rate(self, streaming_controller):
+        with patch("src.debate_controller.NUM_REBUTTAL_ROUNDS", 1), \
+             patch("builtins.input", return_value="1"):
+            await streaming_controller.arun_debate()
+        output = streaming_controller.console.file.getvalue()
+        assert "PRO-a PRO-b" in output
+        # The mock agents report no usage, so the rate stays in chunks.
+        assert "TTFT" in output and "chunks/s" in output and "tok/s" not in output
+
+
+class TestStreamingPanel:
+    def test_ttft_and_rate_use_reported_output_tokens(self):
+        from src.debate_controller import _StreamingPanel
+
+        panel = _StreamingPanel("PRO", "green")
+        assert panel.ttft is None and panel.tokens_per_second is None
+        assert "waiting" in panel.subtitle()
+
+        panel.append("a")
+        panel.append("b")
+        assert panel.finish(output_tokens=40) == "ab"
+        assert panel.ttft >= 0
+        panel.first_token_at = panel.end - 2.0  # 2s of generation
+        assert panel.tokens_per_second == pytest.approx(20.0)
+        assert "20.0 tok/s" in panel.subtitle()
+
+    def test_live_rate_is_labelled_chunks(self):
+        from src.debate_controller import _StreamingPanel
+
+        panel = _StreamingPanel("PRO", "green")
+        panel.append("a")
+        panel.first_token_at -= 0.5
+        assert panel.tokens_per_second is None
+        assert "chunks/s" in panel.subtitle() and "tok/s" not in panel.subtitle()
+
+    def test_rate_falls_back_to_chunk_count(self):
+        from src.debate_controller import _StreamingPanel
+
+        panel = _StreamingPanel("PRO", "green")
+        panel.append("a")
+        panel.finish(output_tokens=0)
+        panel.first_token_at = panel.end - 0.5
+        assert panel.tokens_per_second is None
+        assert panel.chunks_per_second == pytest.approx(2.0)
+        assert "2.0 chunks/s" in panel.subtitle()
@@ -0,0 +1,129 @@
+"""Tests for full-text search over past debates — the FTS5 index kept by
+``save_completed_debate``, the backfill, and ``GET /api/debates/search``.
+The DB is a throwaway SQLite per test (see ``conftest._test_db``)."""
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from api import db
+from api.services import debate_repository, debate_search
+
+
+def _save(debate_id, topic, *turns, summaries=()):
+    debate_repository.save_completed_debate(
+        debate_id=debate_id,
+        topic=topic,
+        pro_style="passionate",
+        con_style="academic",
+        transcript=[{"speaker": "PRO", "content": turn, "phase": "opening_pro"} for turn in turns],
+        argument_scores={
+            "pro_arguments": [{"summary": summary, "score": 7, "reason": "r"} for summary in summaries],
+            "con_arguments": [],
+            "winner": "PRO",
+        },
+        winner="PRO",
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+def _search(query, limit=20):
+    with db.SessionLocal() as session:
+        return debate_search.search(session, query, limit)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    from api.main import app
+    return TestClient(app)
+
+
+class TestIndex:
+    def test_finds_topic_transcript_and_argument_summaries(self):
+        _save("t", "Should cities ban cars?", "Traffic is terrible.")
+        _save("c", "Remote work", "Commuting by bicycle is healthier.")
+        _save("a", "School uniforms", "Uniforms are fine.", summaries=["Equality among pupils"])
+
+        assert [hit["id"] for hit in _search("cars")] == ["t"]
+        assert [hit["id"] for hit in _search("bicycle")] == ["c"]
+        assert [hit["id"] for hit in _search("pupils")] == ["a"]
+
+    def test_topic_match_ranks_above_a_transcript_mention(self):
+        _save("mention", "Space exploration", "Nuclear power could drive the rockets.")
+        _save("topic", "Is nuclear power safe?", "Yes.")
+        assert [hit["id"] for hit in _search("nuclear")] == ["topic", "mention"]
+
+    def test_stems_and_matches_the_last_word_as_a_prefix(self):
+        _save("s", "Taxes", "We should regulate carefully.")
+        assert [hit["id"] for hit in _search("regulation")] == ["s"]
+        assert [hit["id"] for hit in _search("caref")] == ["s"]
+
+    def test_every_word_is_required(self):
+        _save("both", "Cats", "Cats and dogs")
+        _save("one", "Cats", "Only cats")
+        assert [hit["id"] for hit in _search("cats dogs")] == ["both"]
+
+    def test_snippet_is_escaped_html_with_marked_hits(self):
+        _save("h", "Markup", "Use <script> tags with bananas sparingly.")
+        [hit] = _search("bananas")
+        assert "<mark>bananas</mark>" in hit["snippet"]
+        assert "&lt;script&gt;" in hit["snippet"]
+        assert hit["message_count"] == 1
+
+    def test_operators_and_quotes_are_plain_text(self):
+        _save("q", "Quotes", "He said NEAR the end.")
+        assert _search('"NEAR" AND (') == []
+        assert [hit["id"] for hit in _search("near")] == ["q"]
+        assert _search("   ") == []
+
+    def test_resaving_replaces_the_entry(self):
+        _save("r", "Draft", "apples")
+        _save("r", "Draft", "oranges")
+        assert _search("apples") == []
+        assert [hit["id"] for hit in _search("oranges")] == ["r"]
+
+
+class TestBackfill:
+    def test_indexes_only_missing_debates(self):
+        for i in range(5):
+            _save(f"b{i}", f"Topic {i}", "Renewable energy")
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM debates_fts WHERE rowid > 2"))
+        assert len(_search("renewable")) == 2
+
+        assert debate_search.backfill(batch_size=2) == 3
+        assert len(_search("renewable")) == 5
+        assert debate_search.backfill() == 0
+
+    def test_rebuild_reindexes_everything(self):
+        _save("x", "Topic", "Solar")
+        assert debate_search.backfill(rebuild=True) == 1
+        assert [hit["id"] for hit in _search("solar")] == ["x"]
+
+    def test_cli_command(self, capsys):
+        import main
+
+        _save("cli", "Topic", "Wind")
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM debates_fts"))
+        main.main(["search-backfill"])
+        assert "Indexed 1 debate(s)" in capsys.readouterr().out
+        assert [hit["id"] for hit in _search("wind")] == ["cli"]
+
+
+class TestSearchRoute:
+    def test_returns_ranked_hits_with_snippets(self, client):
+        _save("api", "Should we colonise Mars?", "Mars has water ice.")
+        resp = client.get("/api/debates/search", params={"q": "mars"})
+        assert resp.status_code == 200
+        [hit] = resp.json()
+        assert hit["id"] == "api"
+        assert "<mark>" in hit["snippet"]
+        assert hit["completed_at"].endswith("Z")
+        assert isinstance(hit["rank"], float)
+
+    def test_requires_a_query(self, client):
+        assert client.get("/api/debates/search").status_code == 422
+        assert client.get("/api/debates/search", params={"q": ""}).status_code == 422
@@ -0,0 +1,261 @@
+"""Tests for the pluggable session store — both backends honour the same
+contract (pending bound, FIFO admission, ownership, sweeping), and a SQLite
+file shared by two stores (standing in for two uvicorn workers) shares the
+generating-slot cap, the queue, and run ownership between them.
+"""
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from api import db
+from api.schemas.debate import WSMessageType
+from api.services.debate_service import DebateService, SessionLimitExceeded
+from api.services.session_store import (
+    InMemorySessionStore,
+    SessionRecord,
+    SqliteSessionStore,
+    build_session_store,
+)
+
+
+def _record(debate_id, *, age=0.0):
+    created = db.utcnow() - timedelta(seconds=age)
+    return SessionRecord(debate_id, "T", "passionate", "academic", created, created)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield InMemorySessionStore()
+    else:
+        store = SqliteSessionStore(str(tmp_path / "sessions.db"))
+        yield store
+        store.close()
+
+
+# ---------------------------------------------------------------------------
+# Store contract (both backends)
+# ---------------------------------------------------------------------------
+
+class TestSessionStoreContract:
+    def test_reserve_bounds_pending_sessions(self, store):
+        assert store.reserve(_record("a"), max_pending=2)
+        assert store.reserve(_record("b"), max_pending=2)
+        assert not store.reserve(_record("c"), max_pending=2)
+        assert store.count() == 2
+        assert store.get("c") is None
+
+    def test_active_sessions_do_not_count_as_pending(self, store):
+        store.reserve(_record("a"), max_pending=1)
+        assert store.admit("a", "w", max_active=5, now=db.utcnow()) == 0
+        assert store.reserve(_record("b"), max_pending=1)
+
+    def test_reserving_an_existing_id_is_a_noop(self, store):
+        assert store.reserve(_record("a"), max_pending=1)
+        assert store.reserve(_record("a"), max_pending=1)
+        assert store.count() == 1
+
+    def test_get_round_trips_the_record(self, store):
+        record = _record("a")
+        store.reserve(record, max_pending=5)
+        assert store.get("a") == record
+
+    def test_admission_is_fifo_under_the_active_cap(self, store):
+        now = db.utcnow()
+        for i, debate_id in enumerate(["a", "b", "c", "d"]):
+            store.reserve(_record(debate_id), max_pending=10)
+        assert store.admit("a", "w", max_active=2, now=now) == 0
+        assert store.admit("b", "w", max_active=2, now=now + timedelta(seconds=1)) == 0
+        assert store.admit("c", "w", max_active=2, now=now + timedelta(seconds=2)) == 1
+        assert store.admit("d", "w", max_active=2, now=now + timedelta(seconds=3)) == 2
+        assert store.queue_status() == (2, 2)
+
+        store.release("a")
+        # "d" re-checks first but "c" is still ahead of it.
+        assert store.admit("d", "w", max_active=2, now=now + timedelta(seconds=4)) == 1
+        assert store.admit("c", "w", max_active=2, now=now + timedelta(seconds=5)) == 0
+        assert store.queue_status() == (2, 1)
+
+    def test_positions_close_up_when_waiters_leave_from_the_middle(self, store):
+        now = db.utcnow()
+        for i, debate_id in enumerate("abcdef"):
+            store.reserve(_record(debate_id), max_pending=10)
+            assert store.admit(debate_id, "w", max_active=0,
+                               now=now + timedelta(seconds=i)) == i + 1
+        store.release("b")
+        store.release("d")
+        assert store.admit("f", "w", max_active=0, now=now) == 4
+        # One free slot goes to the head; then "e" waits behind "c".
+        assert store.admit("a", "w", max_active=1, now=now) == 0
+        store.release("a")
+        assert store.admit("e", "w", max_active=1, now=now) == 1
+        assert store.admit("c", "w", max_active=1, now=now) == 0
+        assert store.admit("e", "w", max_active=2, now=now) == 0
+        assert store.admit("f", "w", max_active=2, now=now) == 1
+        assert store.queue_status() == (2, 1)
+
+    def test_admission_is_owned(self, store):
+        store.reserve(_record("a"), max_pending=5)
+        assert store.admit("a", "worker-1", max_active=5, now=db.utcnow()) == 0
+        assert store.admit("a", "worker-1", max_active=5, now=db.utcnow()) == 0
+        assert store.admit("a", "worker-2", max_active=5, now=db.utcnow()) is None
+        admitted = store.get("a")
+        assert admitted.started and admitted.owner == "worker-1"
+
+    def test_admit_of_unknown_session_fails(self, store):
+        assert store.admit("missing", "w", max_active=5, now=db.utcnow()) is None
+
+    def test_release_frees_the_slot(self, store):
+        store.reserve(_record("a"), max_pending=1)
+        store.release("a")
+        store.release("a")  # idempotent
+        assert store.reserve(_record("b"), max_pending=1)
+
+    def test_sweep_drops_old_orphans_and_stale_runs_only(self, store):
+        now = db.utcnow()
+        store.reserve(_record("old-orphan", age=100), max_pending=10)
+        store.reserve(_record("fresh-orphan"), max_pending=10)
+        store.reserve(_record("stale-run", age=100), max_pending=10)
+        store.admit("stale-run", "w", max_active=10, now=now - timedelta(seconds=100))
+        store.reserve(_record("live-run", age=100), max_pending=10)
+        store.admit("live-run", "w", max_active=10, now=now - timedelta(seconds=100))
+        store.touch("live-run", now)
+        # An old session whose socket is still queueing is not an orphan.
+        store.reserve(_record("queued", age=100), max_pending=10)
+        store.admit("queued", "w", max_active=2, now=now)
+
+        swept = store.sweep(
+            unstarted_before=now - timedelta(seconds=50),
+            stale_before=now - timedelta(seconds=50),
+        )
+        assert sorted(swept) == ["old-orphan", "stale-run"]
+        assert store.get("fresh-orphan") is not None
+        assert store.get("live-run") is not None
+        assert store.get("queued") is not None
+
+    def test_counts_follow_every_transition(self, store):
+        now = db.utcnow()
+        for debate_id in "abcd":
+            store.reserve(_record(debate_id, age=100), max_pending=4)
+        store.admit("a", "w", max_active=1, now=now)
+        store.admit("b", "w", max_active=1, now=now)
+        assert store.queue_status() == (1, 1)
+        assert not store.reserve(_record("e"), max_pending=3)
+        store.release("b")
+        store.sweep(unstarted_before=now, stale_before=now - timedelta(seconds=50))
+        assert store.queue_status() == (1, 0)
+        assert store.count() == 1
+        assert store.reserve(_record("f"), max_pending=1)
+        store.release("a")
+        assert store.queue_status() == (0, 0)
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            build_session_store("redis")
+
+
+class _NoScanDict(dict):
+    def values(self):
+        raise AssertionError("the in-memory store walked every record")
+
+    items = values
+
+
+def test_in_memory_store_never_walks_the_records():
+    store = InMemorySessionStore()
+    store._records = _NoScanDict()
+    now = db.utcnow()
+    for debate_id in "abc":
+        assert store.reserve(_record(debate_id), max_pending=3)
+    assert not store.reserve(_record("d"), max_pending=3)
+    assert store.admit("a", "w", max_active=1, now=now) == 0
+    assert store.admit("b", "w", max_active=1, now=now) == 1
+    assert store.queue_status() == (1, 1)
+    store.release("a")
+    assert store.admit("b", "w", max_active=1, now=now) == 0
+
+
+# ---------------------------------------------------------------------------
+# Two workers over one SQLite file
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def two_workers(tmp_path):
+    path = str(tmp_path / "shared.db")
+    stores = [SqliteSessionStore(path), SqliteSessionStore(path)]
+    yield DebateService(stores[0], "worker-a"), DebateService(stores[1], "worker-b")
+    for store in stores:
+        store.close()
+
+
+async def _drain(svc, session):
+    events = []
+    async for event in svc.run_debate(session):
+        events.append(event)
+        if event["type"] == WSMessageType.VOTE_REQUIRED:
+            svc.submit_vote(session.debate_id, "PRO")
+    return events
+
+
+class TestSharedAcrossWorkers:
+    def test_pending_bound_is_global(self, two_workers, mock_build_agents):
+        a, b = two_workers
+        with patch("api.services.debate_service.ADMISSION_QUEUE_SIZE", 2):
+            a.create_debate("T", "passionate", "passionate")
+            b.create_debate("T", "passionate", "passionate")
+            with pytest.raises(SessionLimitExceeded):
+                a.create_debate("T", "passionate", "passionate")
+
+    async def test_debate_created_on_one_worker_is_driven_from_another(
+        self, two_workers, mock_build_agents
+    ):
+        a, b = two_workers
+        created = a.create_debate("Cross-worker", "aggressive", "academic")
+
+        remote = b.get_session(created.debate_id)
+        assert remote is not None and remote is not created
+        assert (remote.topic, remote.pro_style, remote.con_style) == (
+            "Cross-worker", "aggressive", "academic",
+        )
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            run = b.run_debate(remote)
+            first = await run.__anext__()
+            assert first["type"] == WSMessageType.DEBATE_STARTED
+            # The creating worker's copy loses the admission and backs off.
+            events = [e async for e in a.run_debate(created)]
+            assert [e["type"] for e in events] == [WSMessageType.ERROR]
+            assert created.debate_id not in a.sessions
+            await run.aclose()
+
+    async def test_finished_debate_frees_the_shared_slot(self, two_workers, mock_build_agents):
+        a, b = two_workers
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            session = a.create_debate("T", "passionate", "passionate")
+            remote = b.get_session(session.debate_id)
+            await _drain(b, remote)
+        assert b.store.count() == 0
+        assert a.store.queue_status() == (0, 0)
+
+    async def test_store_transactions_run_off_the_event_loop(self, two_workers, mock_build_agents):
+        a, _ = two_workers
+        loop_thread = threading.get_ident()
+        threads = []
+        for name in ("admit", "touch"):
+            method = getattr(a.store, name)
+
+            def spy(*args, _method=method):
+                threads.append(threading.get_ident())
+                return _method(*args)
+
+            setattr(a.store, name, spy)
+        with patch("api.services.debate_service.NUM_REBUTTAL_ROUNDS", 1):
+            await _drain(a, a.create_debate("T", "passionate", "passionate"))
+        assert threads and loop_thread not in threads
+
+    def test_orphan_created_elsewhere_is_swept(self, two_workers, mock_build_agents):
+        a, b = two_workers
+        a.store.reserve(_record("orphan", age=10_000), max_pending=10)
+        assert b.sweep_expired_sessions() == 1
+        assert a.get_session("orphan") is None
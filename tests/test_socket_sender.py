@@ -0,0 +1,137 @@
+"""Tests for the per-WebSocket send queue — ordered delivery, chunk coalescing
+for a slow client, disconnecting a stuck one, and high-water tracking. The
+socket is a stand-in whose sends can be held back."""
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from conftest import FakeSocket
+
+from api.services.socket_sender import (
+    CHUNKS_COALESCED,
+    SEND_QUEUE_HIGH_WATER,
+    SLOW_CONSUMERS_DISCONNECTED,
+    SocketSender,
+)
+
+
+def _chunk(text, speaker="PRO"):
+    return {"type": "message_chunk", "debate_id": "d", "data": {"speaker": speaker, "chunk": text}}
+
+
+def _frame(kind):
+    return {"type": kind, "debate_id": "d", "data": {}}
+
+
+@pytest.fixture
+def sockets():
+    senders = []
+
+    def make(socket, **kwargs):
+        sender = SocketSender(socket, **kwargs)
+        sender.start()
+        senders.append(sender)
+        return sender
+
+    yield make
+    for sender in senders:
+        sender.close()
+
+
+class TestSocketSender:
+    async def test_frames_are_sent_in_order(self, sockets):
+        socket = FakeSocket()
+        sender = sockets(socket)
+        frames = [_frame("message_start"), _chunk("a"), _chunk("b"), _frame("message_complete")]
+        for frame in frames:
+            sender.put(frame)
+        await sender.flush()
+        assert socket.sent == frames
+        assert len(sender) == 0 and sender.buffered_bytes == 0
+
+    async def test_put_never_waits_for_the_client(self, sockets):
+        socket = FakeSocket()
+        socket.gate.clear()
+        sender = sockets(socket, max_frames=8)
+        for i in range(1000):
+            sender.put(_chunk(f"{i} "))
+        # All 1000 chunks were accepted synchronously, into a bounded queue.
+        assert len(sender) <= 8
+        assert sender.buffered_bytes > 0
+
+    async def test_slow_client_gets_every_chunk_in_fewer_frames(self, sockets):
+        socket = FakeSocket()
+        socket.gate.clear()
+        sender = sockets(socket, max_frames=4)
+        before = CHUNKS_COALESCED.value
+        sender.put(_frame("message_start"))
+        texts = [f"w{i} " for i in range(50)]
+        for text in texts[:25]:
+            sender.put(_chunk(text))
+        sender.put(_chunk("con says", speaker="CON"))
+        for text in texts[25:]:
+            sender.put(_chunk(text))
+        sender.put(_frame("message_complete"))
+
+        socket.gate.set()
+        await sender.flush()
+        kinds = [f["type"] for f in socket.sent]
+        assert kinds[0] == "message_start" and kinds[-1] == "message_complete"
+        pro = "".join(f["data"]["chunk"] for f in socket.sent
+                      if f["type"] == "message_chunk" and f["data"]["speaker"] == "PRO")
+        assert pro == "".join(texts)
+        # Chunks of different speakers are never merged across each other.
+        speakers = [f["data"]["speaker"] for f in socket.sent if f["type"] == "message_chunk"]
+        assert speakers.index("CON") not in (0, len(speakers) - 1)
+        assert len(socket.sent) < 53
+        assert CHUNKS_COALESCED.value > before
+
+    async def test_coalesced_chunk_carries_the_last_seq_it_merged(self, sockets):
+        socket = FakeSocket()
+        socket.gate.clear()
+        sender = sockets(socket, max_frames=2)
+        for seq, text in enumerate(["a", "b", "c", "d"], start=1):
+            sender.put({**_chunk(text), "seq": seq})
+        socket.gate.set()
+        await sender.flush()
+        assert "".join(f["data"]["chunk"] for f in socket.sent) == "abcd"
+        assert socket.sent[-1]["seq"] == 4
+
+    async def test_stuck_client_is_disconnected(self, sockets):
+        socket = FakeSocket(hang=True)
+        sender = sockets(socket, send_timeout=0.05)
+        before = SLOW_CONSUMERS_DISCONNECTED.value
+        sender.put(_frame("debate_started"))
+        sender.put(_chunk("a"))
+        with pytest.raises(WebSocketDisconnect):
+            await asyncio.wait_for(sender.flush(), timeout=2)
+        assert socket.closed_with == 1008
+        assert SLOW_CONSUMERS_DISCONNECTED.value == before + 1
+        with pytest.raises(WebSocketDisconnect):
+            sender.put(_chunk("b"))
+
+    async def test_failed_send_surfaces_on_the_next_put(self, sockets):
+        class Gone(FakeSocket):
+            async def send_text(self, text):
+                raise RuntimeError("client disconnected")
+
+        sender = sockets(Gone())
+        sender.put(_frame("debate_started"))
+        with pytest.raises(WebSocketDisconnect):
+            await sender.flush()
+        with pytest.raises(WebSocketDisconnect):
+            sender.put(_frame("phase_change"))
+
+    async def test_high_water_is_observed_at_close(self):
+        socket = FakeSocket()
+        socket.gate.clear()
+        sender = SocketSender(socket)
+        sender.start()
+        for kind in ("a", "b", "c"):
+            sender.put(_frame(kind))
+        before = SEND_QUEUE_HIGH_WATER.count
+        sender.close()
+        sender.close()
+        assert sender.high_water == 3
+        assert SEND_QUEUE_HIGH_WATER.count == before + 1
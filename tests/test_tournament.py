@@ -0,0 +1,241 @@
+"""Tests for the style tournament — round-robin scheduling, incremental Elo,
+checkpoint/resume through the tournament repository, and the read endpoints.
+The LLM is mocked (see conftest fixtures); the DB is the per-test SQLite.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import db
+from api.services import tournament_repository
+from src.tournament import EloLeaderboard, Matchup, expected_score, round_robin, run_tournament
+
+STYLES = ["passionate", "academic", "humorous"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    from api.main import app
+    return TestClient(app)
+
+
+@pytest.fixture
+def agent_factory(make_mock_agent):
+    def factory(pro_style, con_style):
+        return make_mock_agent("PRO"), make_mock_agent("CON"), make_mock_agent("JUDGE")
+    return factory
+
+
+def _repository_checkpoint(tournament_id):
+    async def checkpoint(record, board):
+        tournament_repository.record_match(tournament_id, record, board.to_dict())
+    return checkpoint
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+class TestRoundRobin:
+    def test_every_ordered_pair_of_distinct_styles_per_topic(self):
+        matchups = round_robin(STYLES, ["T1", "T2"])
+        assert len(matchups) == 3 * 2 * 2
+        assert all(m.pro_style != m.con_style for m in matchups)
+        assert Matchup("academic", "passionate", "T1") in matchups
+        assert Matchup("passionate", "academic", "T1") in matchups
+
+    def test_duplicates_collapse_and_keys_are_unique(self):
+        matchups = round_robin(STYLES + ["academic"], ["T", "T"])
+        assert len(matchups) == 6
+        assert len({m.key for m in matchups}) == 6
+
+
+# ---------------------------------------------------------------------------
+# Elo
+# ---------------------------------------------------------------------------
+
+class TestEloLeaderboard:
+    def test_equal_ratings_expect_half(self):
+        assert expected_score(1500, 1500) == pytest.approx(0.5)
+
+    def test_win_moves_ratings_symmetrically(self):
+        board = EloLeaderboard(STYLES, k=32, initial=1500)
+        board.record("passionate", "academic", "PRO")
+        assert board.ratings["passionate"] == pytest.approx(1516)
+        assert board.ratings["academic"] == pytest.approx(1484)
+        assert board.ratings["humorous"] == 1500
+        assert sum(board.ratings.values()) == pytest.approx(4500)
+
+    def test_con_win_credits_the_con_style(self):
+        board = EloLeaderboard(STYLES)
+        board.record("passionate", "academic", "CON")
+        assert board.ratings["academic"] > board.ratings["passionate"]
+        assert board.record_counts["academic"]["wins"] == 1
+        assert board.record_counts["passionate"]["losses"] == 1
+
+    def test_tie_between_equals_changes_nothing_but_counts(self):
+        board = EloLeaderboard(STYLES)
+        board.record("passionate", "academic", "TIE")
+        assert board.ratings["passionate"] == board.ratings["academic"]
+        assert board.record_counts["passionate"]["ties"] == 1
+        assert board.win_matrix["passionate"]["academic"]["TIE"] == 1
+
+    def test_standings_rank_by_rating(self):
+        board = EloLeaderboard(STYLES)
+        board.record("humorous", "academic", "PRO")
+        assert board.standings()[0]["style"] == "humorous"
+        assert board.standings()[-1]["style"] == "academic"
+
+    def test_replay_reproduces_incremental_state(self):
+        results = [
+            {"pro_style": "passionate", "con_style": "academic", "winner": "PRO"},
+            {"pro_style": "academic", "con_style": "humorous", "winner": "CON"},
+            {"pro_style": "humorous", "con_style": "passionate", "winner": "TIE"},
+        ]
+        live = EloLeaderboard(STYLES)
+        for r in results:
+            live.record(r["pro_style"], r["con_style"], r["winner"])
+        assert EloLeaderboard.replay(STYLES, results).to_dict() == live.to_dict()
+
+    def test_unknown_winner_rejected(self):
+        with pytest.raises(ValueError):
+            EloLeaderboard(STYLES).record("passionate", "academic", "DRAW")
+
+
+# ---------------------------------------------------------------------------
+# Running + checkpointing
+# ---------------------------------------------------------------------------
+
+class TestRunTournament:
+    async def test_rates_every_result_and_checkpoints_it(self, agent_factory):
+        matchups = round_robin(STYLES, ["T"])
+        tournament_repository.ensure_tournament(
+            "t1", styles=STYLES, topics=["T"], total_matches=len(matchups)
+        )
+        board = EloLeaderboard(STYLES)
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            summary = await run_tournament(
+                matchups, board, _repository_checkpoint("t1"),
+                concurrency=3, agent_factory=agent_factory,
+            )
+
+        assert summary.completed == 6
+        # The mock judge always says PRO, so every style went 1-1 as each side.
+        assert board.games == 6
+        assert all(row["wins"] == 2 and row["losses"] == 2 for row in board.standings())
+        with db.SessionLocal() as s:
+            stored = tournament_repository.get_tournament(s, "t1")
+            assert stored.completed_matches == 6
+            assert stored.standings == board.to_dict()
+
+    async def test_checkpoints_land_in_rating_order(self, agent_factory):
+        # A checkpoint that finishes sooner the later it starts (as commits on
+        # worker threads can) must still persist results in rating order.
+        persisted, delays = [], iter([0.03, 0.02, 0.01, 0.0, 0.0, 0.0])
+
+        async def checkpoint(record, board):
+            games = board.games
+            await asyncio.sleep(next(delays))
+            persisted.append(games)
+
+        board = EloLeaderboard(STYLES)
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            await run_tournament(round_robin(STYLES, ["T"]), board, checkpoint,
+                                 concurrency=3, agent_factory=agent_factory)
+        assert persisted == [1, 2, 3, 4, 5, 6]
+
+    async def test_resume_skips_checkpointed_matchups(self, make_mock_agent):
+        matchups = round_robin(STYLES, ["T"])
+        tournament_repository.ensure_tournament(
+            "t2", styles=STYLES, topics=["T"], total_matches=len(matchups)
+        )
+        played = []
+
+        def factory(pro_style, con_style):
+            played.append((pro_style, con_style))
+            return make_mock_agent("PRO"), make_mock_agent("CON"), make_mock_agent("JUDGE")
+
+        first = EloLeaderboard(STYLES)
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            await run_tournament(matchups[:2], first, _repository_checkpoint("t2"),
+                                 agent_factory=factory)
+
+            # "Restart": rebuild the board from the checkpoint and run the lot.
+            results = tournament_repository.completed_results("t2")
+            resumed = EloLeaderboard.replay(STYLES, results)
+            assert resumed.to_dict() == first.to_dict()
+            summary = await run_tournament(
+                matchups, resumed, _repository_checkpoint("t2"),
+                completed_keys={r["matchup_key"] for r in results}, agent_factory=factory,
+            )
+
+        assert summary.skipped == 2
+        assert len(played) == 6  # each matchup played exactly once overall
+        assert resumed.games == 6
+
+    async def test_failed_matchup_is_checkpointed_but_not_rated(self, make_mock_agent):
+        def factory(pro_style, con_style):
+            fail = pro_style == "humorous"
+            return make_mock_agent("PRO", fail=fail), make_mock_agent("CON"), make_mock_agent("JUDGE")
+
+        matchups = round_robin(STYLES, ["T"])
+        tournament_repository.ensure_tournament(
+            "t3", styles=STYLES, topics=["T"], total_matches=len(matchups)
+        )
+        board = EloLeaderboard(STYLES)
+        with patch("src.batch_runner.NUM_REBUTTAL_ROUNDS", 1):
+            summary = await run_tournament(matchups, board, _repository_checkpoint("t3"),
+                                           agent_factory=factory)
+
+        assert summary.failed == 2
+        assert board.games == 4
+        assert len(tournament_repository.completed_results("t3")) == 4
+
+
+# ---------------------------------------------------------------------------
+# Read endpoints
+# ---------------------------------------------------------------------------
+
+class TestTournamentRoutes:
+    def _seed(self):
+        tournament_repository.ensure_tournament(
+            "api-t", styles=STYLES, topics=["T"], total_matches=6
+        )
+        board = EloLeaderboard(STYLES)
+        board.record("passionate", "academic", "PRO")
+        tournament_repository.record_match("api-t", {
+            "id": "k1", "pro_style": "passionate", "con_style": "academic",
+            "topic": "T", "status": "completed", "winner": "PRO",
+        }, board.to_dict())
+
+    def test_list_and_detail(self, client):
+        self._seed()
+        listing = client.get("/api/tournaments").json()
+        assert [t["id"] for t in listing] == ["api-t"]
+        assert listing[0]["completed_matches"] == 1
+
+        detail = client.get("/api/tournaments/api-t").json()
+        assert detail["standings"][0]["style"] == "passionate"
+        assert detail["win_matrix"]["passionate"]["academic"]["PRO"] == 1
+        assert detail["updated_at"].endswith("Z")
+
+    def test_detail_before_any_result_shows_initial_board(self, client):
+        tournament_repository.ensure_tournament(
+            "fresh", styles=STYLES, topics=["T"], total_matches=6
+        )
+        detail = client.get("/api/tournaments/fresh").json()
+        assert {row["rating"] for row in detail["standings"]} == {1500.0}
+
+    def test_matches_page(self, client):
+        self._seed()
+        matches = client.get("/api/tournaments/api-t/matches").json()
+        assert len(matches) == 1
+        assert matches[0]["winner"] == "PRO"
+        assert "transcript" not in matches[0]
+
+    def test_unknown_tournament_returns_404(self, client):
+        assert client.get("/api/tournaments/nope").status_code == 404
+        assert client.get("/api/tournaments/nope/matches").status_code == 404